@@ -0,0 +1,68 @@
+﻿using System;
+using Microsoft.EntityFrameworkCore.Migrations;
+
+#nullable disable
+
+namespace backend.Migrations
+{
+    /// <inheritdoc />
+    public partial class AddPlayerHandicapHistoryTable : Migration
+    {
+        /// <inheritdoc />
+        protected override void Up(MigrationBuilder migrationBuilder)
+        {
+            // Tenants that ran scripts/glm/backfill.py before this migration have an unmanaged copy of the
+            // table; its rows are derived data, rebuilt by running the backfill again
+            migrationBuilder.Sql("DROP TABLE IF EXISTS \"PlayerHandicapHistory\"");
+
+            migrationBuilder.CreateTable(
+                name: "PlayerHandicapHistory",
+                columns: table => new
+                {
+                    Id = table.Column<Guid>(type: "uuid", nullable: false, defaultValueSql: "gen_random_uuid()"),
+                    PlayerId = table.Column<Guid>(type: "uuid", nullable: false),
+                    SeasonId = table.Column<Guid>(type: "uuid", nullable: false),
+                    WeekNumber = table.Column<int>(type: "integer", nullable: false),
+                    AverageScore = table.Column<decimal>(type: "numeric", nullable: false),
+                    Handicap = table.Column<decimal>(type: "numeric", nullable: false),
+                    ScoreTotal = table.Column<decimal>(type: "numeric", nullable: false),
+                    RoundsCounted = table.Column<int>(type: "integer", nullable: false),
+                    ComputedAt = table.Column<DateTime>(type: "timestamp with time zone", nullable: false)
+                },
+                constraints: table =>
+                {
+                    table.PrimaryKey("PK_PlayerHandicapHistory", x => x.Id);
+                    table.ForeignKey(
+                        name: "FK_PlayerHandicapHistory_Players_PlayerId",
+                        column: x => x.PlayerId,
+                        principalTable: "Players",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Cascade);
+                    table.ForeignKey(
+                        name: "FK_PlayerHandicapHistory_Seasons_SeasonId",
+                        column: x => x.SeasonId,
+                        principalTable: "Seasons",
+                        principalColumn: "Id",
+                        onDelete: ReferentialAction.Cascade);
+                });
+
+            migrationBuilder.CreateIndex(
+                name: "IX_PlayerHandicapHistory_PlayerId_SeasonId_WeekNumber",
+                table: "PlayerHandicapHistory",
+                columns: new[] { "PlayerId", "SeasonId", "WeekNumber" },
+                unique: true);
+
+            migrationBuilder.CreateIndex(
+                name: "IX_PlayerHandicapHistory_SeasonId",
+                table: "PlayerHandicapHistory",
+                column: "SeasonId");
+        }
+
+        /// <inheritdoc />
+        protected override void Down(MigrationBuilder migrationBuilder)
+        {
+            migrationBuilder.DropTable(
+                name: "PlayerHandicapHistory");
+        }
+    }
+}
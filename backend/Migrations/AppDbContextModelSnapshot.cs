@@ -449,6 +449,47 @@ namespace backend.Migrations
                     b.ToTable("PlayerFlightAssignments");
                 });
 
+            modelBuilder.Entity("GolfLeagueManager.PlayerHandicapHistory", b =>
+                {
+                    b.Property<Guid>("Id")
+                        .ValueGeneratedOnAdd()
+                        .HasColumnType("uuid")
+                        .HasDefaultValueSql("gen_random_uuid()");
+
+                    b.Property<decimal>("AverageScore")
+                        .HasColumnType("numeric");
+
+                    b.Property<DateTime>("ComputedAt")
+                        .HasColumnType("timestamp with time zone");
+
+                    b.Property<decimal>("Handicap")
+                        .HasColumnType("numeric");
+
+                    b.Property<Guid>("PlayerId")
+                        .HasColumnType("uuid");
+
+                    b.Property<int>("RoundsCounted")
+                        .HasColumnType("integer");
+
+                    b.Property<decimal>("ScoreTotal")
+                        .HasColumnType("numeric");
+
+                    b.Property<Guid>("SeasonId")
+                        .HasColumnType("uuid");
+
+                    b.Property<int>("WeekNumber")
+                        .HasColumnType("integer");
+
+                    b.HasKey("Id");
+
+                    b.HasIndex("SeasonId");
+
+                    b.HasIndex("PlayerId", "SeasonId", "WeekNumber")
+                        .IsUnique();
+
+                    b.ToTable("PlayerHandicapHistory");
+                });
+
             modelBuilder.Entity("GolfLeagueManager.PlayerSeasonRecord", b =>
                 {
                     b.Property<Guid>("Id")
@@ -784,6 +825,25 @@ namespace backend.Migrations
                     b.Navigation("Season");
                 });
 
+            modelBuilder.Entity("GolfLeagueManager.PlayerHandicapHistory", b =>
+                {
+                    b.HasOne("GolfLeagueManager.Player", "Player")
+                        .WithMany()
+                        .HasForeignKey("PlayerId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.HasOne("GolfLeagueManager.Season", "Season")
+                        .WithMany()
+                        .HasForeignKey("SeasonId")
+                        .OnDelete(DeleteBehavior.Cascade)
+                        .IsRequired();
+
+                    b.Navigation("Player");
+
+                    b.Navigation("Season");
+                });
+
             modelBuilder.Entity("GolfLeagueManager.PlayerSeasonRecord", b =>
                 {
                     b.HasOne("GolfLeagueManager.Player", "Player")
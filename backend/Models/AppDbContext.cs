@@ -20,6 +20,7 @@ namespace GolfLeagueManager
         public DbSet<CourseHole> CourseHoles { get; set; }
         public DbSet<PlayerSessionAverage> PlayerSessionAverages { get; set; }
         public DbSet<PlayerSessionHandicap> PlayerSessionHandicaps { get; set; }
+        public DbSet<PlayerHandicapHistory> PlayerHandicapHistory { get; set; }
         public DbSet<PlayerSeasonRecord> PlayerSeasonRecords { get; set; }
         public DbSet<LeagueSettings> LeagueSettings { get; set; }
         public DbSet<LeagueRules> LeagueRules { get; set; }
@@ -257,6 +258,29 @@ namespace GolfLeagueManager
                     .IsUnique();
             });
 
+            // Configure PlayerHandicapHistory entity
+            modelBuilder.Entity<PlayerHandicapHistory>(entity =>
+            {
+                entity.Property(e => e.Id)
+                    .HasDefaultValueSql("gen_random_uuid()");
+
+                // Configure relationship with Player
+                entity.HasOne(phh => phh.Player)
+                    .WithMany()
+                    .HasForeignKey(phh => phh.PlayerId)
+                    .OnDelete(DeleteBehavior.Cascade);
+
+                // Configure relationship with Season
+                entity.HasOne(phh => phh.Season)
+                    .WithMany()
+                    .HasForeignKey(phh => phh.SeasonId)
+                    .OnDelete(DeleteBehavior.Cascade);
+
+                // One row per player/season/week (the backfill upserts on this key)
+                entity.HasIndex(phh => new { phh.PlayerId, phh.SeasonId, phh.WeekNumber })
+                    .IsUnique();
+            });
+
             // Configure PlayerSeasonRecord entity
             modelBuilder.Entity<PlayerSeasonRecord>(entity =>
             {
@@ -0,0 +1,28 @@
+using System.Text.Json.Serialization;
+
+namespace GolfLeagueManager
+{
+    /// <summary>
+    /// A player's average score and handicap after a given week of a season.
+    /// Materialized by scripts/glm/backfill.py; ScoreTotal and RoundsCounted are the running
+    /// state the backfill resumes from.
+    /// </summary>
+    public class PlayerHandicapHistory
+    {
+        public Guid Id { get; set; }
+        public Guid PlayerId { get; set; }
+        public Guid SeasonId { get; set; }
+        public int WeekNumber { get; set; } // Values as of the end of this week
+        public decimal AverageScore { get; set; }
+        public decimal Handicap { get; set; }
+        public decimal ScoreTotal { get; set; } // Running total of the rounds counted so far
+        public int RoundsCounted { get; set; }
+        public DateTime ComputedAt { get; set; } = DateTime.UtcNow;
+
+        // Navigation properties
+        [JsonIgnore]
+        public Player Player { get; set; } = null!;
+        [JsonIgnore]
+        public Season Season { get; set; } = null!;
+    }
+}
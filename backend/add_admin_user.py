@@ -2,6 +2,11 @@ import hashlib
 import base64
 import psycopg2
 import uuid
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
 
 # Settings from docker-compose
 PGUSER = 'golfuser'
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
 import psycopg2
-from collections import defaultdict
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.league import League
+from glm.profiling import run
 
 # Database connection parameters
 conn_params = {
@@ -12,83 +18,36 @@ conn_params = {
     'database': 'golfdb_southmoore'
 }
 
-def get_all_matchups():
-    """Get all matchups from the database with player names and week numbers"""
-    conn = psycopg2.connect(**conn_params)
-    cursor = conn.cursor()
-    
-    query = '''
-    SELECT 
-        w."WeekNumber",
-        pa."FirstName" || ' ' || pa."LastName" as PlayerA,
-        pb."FirstName" || ' ' || pb."LastName" as PlayerB,
-        pa."Id" as PlayerAId,
-        pb."Id" as PlayerBId
-    FROM "Matchups" m 
-    JOIN "Weeks" w ON m."WeekId" = w."Id" 
-    JOIN "Players" pa ON m."PlayerAId" = pa."Id" 
-    JOIN "Players" pb ON m."PlayerBId" = pb."Id" 
-    ORDER BY w."WeekNumber", pa."LastName", pb."LastName"
-    '''
-    
-    cursor.execute(query)
-    matchups = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return matchups
-
-def get_all_players():
-    """Get all players from the database"""
+def load_league():
+    """Players, weeks and matchups of the current season, loaded once and shared by both reports"""
     conn = psycopg2.connect(**conn_params)
-    cursor = conn.cursor()
-    
-    query = '''
-    SELECT "Id", "FirstName" || ' ' || "LastName" as FullName
-    FROM "Players"
-    ORDER BY "LastName", "FirstName"
-    '''
-    
-    cursor.execute(query)
-    players = cursor.fetchall()
-    
-    cursor.close()
-    conn.close()
-    
-    return players
+    try:
+        return League.from_db(conn)
+    finally:
+        conn.close()
 
-def analyze_round_robin():
+def analyze_round_robin(league):
     """Analyze if we have a perfect round-robin schedule"""
     print("🔍 Analyzing Round-Robin Schedule")
     print("=" * 50)
     
-    matchups = get_all_matchups()
-    players = get_all_players()
+    players = league.players
     
     print(f"Total players: {len(players)}")
-    print(f"Total matchups: {len(matchups)}")
+    print(f"Total matchups: {len(league.matchups)}")
     print()
     
-    # Create player ID to name mapping
-    player_names = {player_id: name for player_id, name in players}
-    player_ids = [player_id for player_id, name in players]
-    
-    # Track all pairings
-    pairings = set()
-    week_matchups = defaultdict(list)
-    
-    for week, player_a, player_b, player_a_id, player_b_id in matchups:
-        # Normalize pairing (always put smaller ID first to avoid duplicates)
-        pair = tuple(sorted([player_a_id, player_b_id]))
-        pairings.add(pair)
-        week_matchups[week].append((player_a, player_b))
+    # (smaller index, larger index) -> weeks the pair plays
+    pairings = league.pairings()
     
     # Print matchups by week
-    for week in sorted(week_matchups.keys()):
-        print(f"Week {week}:")
-        for player_a, player_b in week_matchups[week]:
-            print(f"  {player_a} vs {player_b}")
+    for week in league.weeks:
+        rows = league.matchups_in_week(week.index)
+        if not rows:
+            continue
+        print(f"Week {week.number}:")
+        for row in rows:
+            print(f"  {players[league.matchups.a[row]].name} vs {players[league.matchups.b[row]].name}")
         print()
     
     # Calculate expected number of unique pairings
@@ -101,21 +60,8 @@ def analyze_round_robin():
     print()
     
     # Check for missing pairings
-    all_possible_pairs = set()
-    for i in range(len(player_ids)):
-        for j in range(i + 1, len(player_ids)):
-            pair = tuple(sorted([player_ids[i], player_ids[j]]))
-            all_possible_pairs.add(pair)
-    
-    missing_pairs = all_possible_pairs - pairings
-    duplicate_tracking = defaultdict(int)
-    
-    # Count occurrences of each pairing
-    for week, player_a, player_b, player_a_id, player_b_id in matchups:
-        pair = tuple(sorted([player_a_id, player_b_id]))
-        duplicate_tracking[pair] += 1
-    
-    duplicates = [(pair, count) for pair, count in duplicate_tracking.items() if count > 1]
+    missing_pairs = [(i, j) for i in range(n_players) for j in range(i + 1, n_players) if (i, j) not in pairings]
+    duplicates = [(pair, len(weeks)) for pair, weeks in pairings.items() if len(weeks) > 1]
     
     print("🔍 Analysis Results:")
     print("-" * 30)
@@ -127,40 +73,23 @@ def analyze_round_robin():
         
         if missing_pairs:
             print(f"\n🚫 Missing pairings ({len(missing_pairs)}):")
-            for pair in missing_pairs:
-                player_a_name = player_names[pair[0]]
-                player_b_name = player_names[pair[1]]
-                print(f"  {player_a_name} vs {player_b_name}")
+            for i, j in missing_pairs:
+                print(f"  {players[i].name} vs {players[j].name}")
         
         if duplicates:
             print(f"\n🔄 Duplicate pairings ({len(duplicates)}):")
-            for pair, count in duplicates:
-                player_a_name = player_names[pair[0]]
-                player_b_name = player_names[pair[1]]
-                print(f"  {player_a_name} vs {player_b_name} (appears {count} times)")
+            for (i, j), count in duplicates:
+                print(f"  {players[i].name} vs {players[j].name} (appears {count} times)")
     
     return actual_pairings == expected_pairings and not missing_pairs and not duplicates
 
-def create_visual_matrix():
+def create_visual_matrix(league):
     """Create a visual matrix showing which players have played each other"""
-    players = get_all_players()
-    matchups = get_all_matchups()
-    
-    # Create player ID to index mapping
-    player_ids = [player_id for player_id, name in players]
-    player_names = [name for player_id, name in players]
-    id_to_index = {player_id: i for i, player_id in enumerate(player_ids)}
+    player_names = [player.name for player in league.players]
+    n = len(player_names)
     
-    # Create matrix
-    n = len(players)
-    matrix = [[0 for _ in range(n)] for _ in range(n)]
-    
-    # Fill matrix with matchup data
-    for week, player_a, player_b, player_a_id, player_b_id in matchups:
-        i = id_to_index[player_a_id]
-        j = id_to_index[player_b_id]
-        matrix[i][j] += 1
-        matrix[j][i] += 1  # Symmetric
+    # Symmetric player x player counts, rows indexed like league.players
+    matrix = league.pair_counts()
     
     print("\n📊 Visual Matrix (showing how many times each pair has played):")
     print("=" * 60)
@@ -187,10 +116,11 @@ def create_visual_matrix():
     print("1 = Played once (perfect)")
     print("2+ = Played multiple times (duplicate)")
 
-if __name__ == "__main__":
+def main():
     try:
-        is_perfect = analyze_round_robin()
-        create_visual_matrix()
+        league = load_league()
+        is_perfect = analyze_round_robin(league)
+        create_visual_matrix(league)
         
         if is_perfect:
             print("\n🎉 SUCCESS: The current schedule is a perfect round-robin!")
@@ -199,3 +129,7 @@ if __name__ == "__main__":
             
     except Exception as e:
         print(f"❌ Error: {e}")
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
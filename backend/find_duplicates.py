@@ -2,6 +2,12 @@
 
 import psycopg2
 from collections import defaultdict
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 # Database connection parameters
 conn_params = {
@@ -59,4 +65,4 @@ def find_duplicates():
         print(f"  {player_a_name} vs {player_b_name} - appears in weeks: {weeks}")
 
 if __name__ == "__main__":
-    find_duplicates()
+    sys.exit(run(lambda args: find_duplicates()))
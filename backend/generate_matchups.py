@@ -4,11 +4,16 @@ Generate golf league matchups for weeks 2-9, ensuring everyone plays each other
 Week 1 matchups are preserved and cannot be repeated.
 """
 
+import os
+import sys
 import psycopg2
-import uuid
 from itertools import combinations
 import random
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from glm.batch import matchup_writer
+from glm.profiling import run
+
 # Database connection
 DB_CONFIG = {
     'host': '192.168.6.67',
@@ -154,26 +159,12 @@ def generate_round_robin_schedule(players, weeks, week1_matchups):
 def insert_matchups(schedule):
     """Insert the generated matchups into the database"""
     conn = get_database_connection()
-    cur = conn.cursor()
     
     try:
-        for week_id, matchups in schedule.items():
-            for player_a_id, player_b_id in matchups:
-                matchup_id = str(uuid.uuid4())
-                
-                cur.execute('''
-                    INSERT INTO "Matchups" (
-                        "Id", "WeekId", "PlayerAId", "PlayerBId",
-                        "PlayerAScore", "PlayerBScore", "PlayerAPoints", "PlayerBPoints",
-                        "PlayerAHolePoints", "PlayerBHolePoints", "PlayerAMatchWin", "PlayerBMatchWin",
-                        "PlayerAAbsent", "PlayerBAbsent", "PlayerAAbsentWithNotice", "PlayerBAbsentWithNotice"
-                    ) VALUES (
-                        %s, %s, %s, %s,
-                        NULL, NULL, NULL, NULL,
-                        0, 0, FALSE, FALSE,
-                        FALSE, FALSE, FALSE, FALSE
-                    )
-                ''', (matchup_id, week_id, player_a_id, player_b_id))
+        with matchup_writer(conn) as writer:
+            for week_id, matchups in schedule.items():
+                for player_a_id, player_b_id in matchups:
+                    writer.add(week_id, player_a_id, player_b_id)
         
         conn.commit()
         print(f"\nSuccessfully inserted {sum(len(matchups) for matchups in schedule.values())} matchups")
@@ -183,7 +174,6 @@ def insert_matchups(schedule):
         print(f"Error inserting matchups: {e}")
         raise
     finally:
-        cur.close()
         conn.close()
 
 def main():
@@ -203,4 +193,4 @@ def main():
     print("\nMatchup generation complete!")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
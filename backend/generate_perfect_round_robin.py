@@ -4,9 +4,15 @@ Generate a perfect round-robin schedule for 10 players over 9 weeks.
 Each player plays each other player exactly once.
 """
 
+import os
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from glm.batch import BatchWriter
+from glm.profiling import run
 
 def connect_to_db():
     """Connect to PostgreSQL database"""
@@ -103,7 +109,9 @@ def insert_matchups(schedule, players, weeks):
         print(f"Deleted {deleted_count} existing matchups for weeks 2-9")
         
         # Insert new matchups
-        insert_count = 0
+        now = datetime.now()
+        writer = BatchWriter(conn, 'matchups', ('weekid', 'playeraid', 'playerbid'),
+                             id_column=None, constants={'createdat': now, 'updatedat': now})
         for round_idx, round_matches in enumerate(schedule):
             week = weeks[round_idx]  # weeks[0] = week 2, etc.
             week_number = week['weeknumber']
@@ -118,15 +126,12 @@ def insert_matchups(schedule, players, weeks):
                 p2 = next(p for p in players if p['id'] == player2_id)
                 print(f"  {p1['firstname']} {p1['lastname']} vs {p2['firstname']} {p2['lastname']}")
                 
-                # Insert matchup
-                cursor.execute("""
-                    INSERT INTO matchups (weekid, playeraid, playerbid, createdat, updatedat)
-                    VALUES (%s, %s, %s, NOW(), NOW())
-                """, (week_id, player1_id, player2_id))
-                insert_count += 1
+                # Queue matchup
+                writer.add(week_id, player1_id, player2_id)
         
+        writer.flush()
         conn.commit()
-        print(f"\nSuccessfully inserted {insert_count} new matchups")
+        print(f"\nSuccessfully inserted {writer.rows_written} new matchups")
         
     except Exception as e:
         conn.rollback()
@@ -215,4 +220,4 @@ def main():
         print(f"Error generating schedule: {e}")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
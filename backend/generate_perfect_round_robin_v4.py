@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
+import os
+import sys
 import psycopg2
 from itertools import combinations
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from glm.batch import matchup_writer
+from glm.profiling import run
+
 # Database connection parameters
 conn_params = {
     'host': '192.168.6.67',
@@ -159,9 +165,7 @@ def reorder_rounds_from_week1(complete_rounds, week1_round_index):
 def insert_matchups(schedule_weeks_2_to_9):
     """Insert the new matchups into the database for weeks 2-9"""
     conn = psycopg2.connect(**conn_params)
-    cursor = conn.cursor()
-    
-    total_inserted = 0
+    writer = matchup_writer(conn)
     
     for week_offset, pairs in enumerate(schedule_weeks_2_to_9):
         week_number = week_offset + 2  # Start from week 2
@@ -171,18 +175,13 @@ def insert_matchups(schedule_weeks_2_to_9):
             continue
         
         for player_a_id, player_b_id in pairs:
-            query = '''
-            INSERT INTO "Matchups" ("WeekId", "PlayerAId", "PlayerBId")
-            VALUES (%s, %s, %s)
-            '''
-            cursor.execute(query, (week_id, player_a_id, player_b_id))
-            total_inserted += 1
+            writer.add(week_id, player_a_id, player_b_id)
     
+    writer.flush()
     conn.commit()
-    cursor.close()
     conn.close()
     
-    return total_inserted
+    return writer.rows_written
 
 def main():
     print("🔄 Generating Perfect Round-Robin Schedule (Algorithm V4)")
@@ -248,7 +247,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        success = run(lambda args: main())
         if success:
             print("\n🎉 Perfect round-robin schedule generated successfully!")
             print("Run analyze_round_robin.py to verify the results.")
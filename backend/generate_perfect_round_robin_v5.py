@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
+import os
+import sys
 import psycopg2
 from itertools import combinations
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from glm.batch import matchup_writer
+from glm.profiling import run
+
 # Database connection parameters
 conn_params = {
     'host': '192.168.6.67',
@@ -162,9 +168,7 @@ def generate_remaining_schedule(players, week1_pairs):
 def insert_matchups(schedule):
     """Insert the new matchups into the database"""
     conn = psycopg2.connect(**conn_params)
-    cursor = conn.cursor()
-    
-    total_inserted = 0
+    writer = matchup_writer(conn)
     
     for week_number, pairs in schedule:
         week_id = get_week_id(week_number)
@@ -173,18 +177,13 @@ def insert_matchups(schedule):
             continue
         
         for player_a_id, player_b_id in pairs:
-            query = '''
-            INSERT INTO "Matchups" ("WeekId", "PlayerAId", "PlayerBId")
-            VALUES (%s, %s, %s)
-            '''
-            cursor.execute(query, (week_id, player_a_id, player_b_id))
-            total_inserted += 1
+            writer.add(week_id, player_a_id, player_b_id)
     
+    writer.flush()
     conn.commit()
-    cursor.close()
     conn.close()
     
-    return total_inserted
+    return writer.rows_written
 
 def main():
     print("🔄 Generating Custom Round-Robin Schedule (V5 - Backtracking)")
@@ -237,7 +236,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        success = run(lambda args: main())
         if success:
             print("\n🎉 Custom round-robin schedule generated successfully!")
             print("Run analyze_round_robin.py to verify the results.")
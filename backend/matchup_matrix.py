@@ -4,6 +4,13 @@ Create a visual matrix to show all golf league matchups across weeks 1-9
 """
 
 import psycopg2
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.league import League
+from glm.profiling import run
 
 # Database connection
 DB_CONFIG = {
@@ -21,59 +28,29 @@ def get_database_connection():
 def create_matchup_matrix():
     """Create a visual matrix showing all matchups"""
     conn = get_database_connection()
-    cur = conn.cursor()
     
-    # Get all players
-    cur.execute('SELECT "Id", "FirstName", "LastName" FROM "Players" ORDER BY "LastName"')
-    players = cur.fetchall()
-    player_names = [f"{row[1]} {row[2]}" for row in players]
-    player_ids = [row[0] for row in players]
+    # Players, weeks 1-9 and their matchups of the current season, integer indexed
+    league = League.from_db(conn, max_week=9)
+    player_names = [player.name for player in league.players]
     
     print("GOLF LEAGUE MATCHUP MATRIX")
     print("=" * 80)
-    print(f"Total Players: {len(players)}")
+    print(f"Total Players: {len(league.players)}")
     print()
     
-    # Get all matchups for weeks 1-9
-    cur.execute('''
-        SELECT 
-            w."WeekNumber",
-            pa."FirstName" || ' ' || pa."LastName" as player_a,
-            pb."FirstName" || ' ' || pb."LastName" as player_b
-        FROM "Matchups" m
-        JOIN "Weeks" w ON m."WeekId" = w."Id"
-        JOIN "Players" pa ON m."PlayerAId" = pa."Id"
-        JOIN "Players" pb ON m."PlayerBId" = pb."Id"
-        WHERE w."WeekNumber" <= 9
-        ORDER BY w."WeekNumber", pa."LastName"
-    ''')
-    
-    matchups = cur.fetchall()
-    
-    # Create a matrix to track who plays whom and in which week
-    matchup_matrix = {}
-    week_schedule = {}
-    
-    for week_num, player_a, player_b in matchups:
-        # Normalize the pairing (alphabetical order)
-        pair = tuple(sorted([player_a, player_b]))
-        
-        if pair not in matchup_matrix:
-            matchup_matrix[pair] = []
-        matchup_matrix[pair].append(week_num)
-        
-        # Track weekly schedule
-        if week_num not in week_schedule:
-            week_schedule[week_num] = []
-        week_schedule[week_num].append((player_a, player_b))
+    # (player index, player index) -> weeks they play each other
+    matchup_matrix = league.pairings()
     
     # Print week-by-week schedule
     print("WEEK-BY-WEEK SCHEDULE:")
     print("-" * 50)
-    for week in sorted(week_schedule.keys()):
-        print(f"Week {week}:")
-        for player_a, player_b in week_schedule[week]:
-            print(f"  {player_a} vs {player_b}")
+    for week in league.weeks:
+        rows = league.matchups_in_week(week.index)
+        if not rows:
+            continue
+        print(f"Week {week.number}:")
+        for row in rows:
+            print(f"  {player_names[league.matchups.a[row]]} vs {player_names[league.matchups.b[row]]}")
         print()
     
     # Create a player vs player matrix
@@ -97,7 +74,7 @@ def create_matchup_matrix():
             if i == j:
                 print("--".ljust(4), end="")  # Same player
             else:
-                pair = tuple(sorted([player_a, player_b]))
+                pair = (i, j) if i < j else (j, i)
                 if pair in matchup_matrix:
                     weeks = ",".join(map(str, matchup_matrix[pair]))
                     print(weeks.ljust(4), end="")
@@ -124,9 +101,8 @@ def create_matchup_matrix():
     missing_pairings = []
     for i, player_a in enumerate(player_names):
         for j, player_b in enumerate(player_names[i+1:], i+1):
-            pair = tuple(sorted([player_a, player_b]))
-            if pair not in matchup_matrix:
-                missing_pairings.append(pair)
+            if (i, j) not in matchup_matrix:
+                missing_pairings.append(tuple(sorted([player_a, player_b])))
     
     if missing_pairings:
         print("MISSING PAIRINGS (never play each other):")
@@ -140,24 +116,21 @@ def create_matchup_matrix():
     if repeated:
         print("REPEATED PAIRINGS:")
         print("-" * 20)
-        for (player_a, player_b), weeks in repeated:
+        for (i, j), weeks in repeated:
+            player_a, player_b = sorted([player_names[i], player_names[j]])
             weeks_str = ", ".join(map(str, weeks))
             print(f"  {player_a} vs {player_b} (Weeks: {weeks_str})")
         print()
     
     # Game count per player
-    player_game_count = {name: 0 for name in player_names}
-    for week_num, player_a, player_b in matchups:
-        player_game_count[player_a] += 1
-        player_game_count[player_b] += 1
+    player_game_count = dict(zip(player_names, league.games_per_player()))
     
     print("GAMES PER PLAYER:")
     print("-" * 20)
     for player, count in sorted(player_game_count.items()):
         print(f"  {player}: {count} games")
     
-    cur.close()
     conn.close()
 
 if __name__ == "__main__":
-    create_matchup_matrix()
+    sys.exit(run(lambda args: create_matchup_matrix()))
@@ -2,6 +2,12 @@
 
 import psycopg2
 from collections import defaultdict
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 # Database connection parameters
 conn_params = {
@@ -65,4 +71,4 @@ def quick_round_robin_check():
         return False
 
 if __name__ == "__main__":
-    quick_round_robin_check()
+    run(lambda args: quick_round_robin_check())
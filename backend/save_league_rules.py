@@ -8,6 +8,11 @@ import json
 import sys
 from datetime import datetime
 import uuid
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 # Comprehensive league rules content
 LEAGUE_RULES_CONTENT = """
@@ -413,4 +418,4 @@ def main():
     print(f"   • Season format and standings")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
@@ -1,6 +1,12 @@
 import csv
+import os
+import sys
 import psycopg2
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'scripts'))
+from glm.batch import matchup_writer
+from glm.profiling import run
+
 # Database connection info from docker-compose.yml
 DB_NAME = 'golfdb'
 DB_USER = 'golfuser'
@@ -23,9 +29,16 @@ def get_player_id(conn, name):
         else:
             raise Exception(f'Player not found: {name}')
 
+def get_existing_pairs(conn, week_id):
+    """Player pairs (either order) that already have a matchup in the week"""
+    with conn.cursor() as cur:
+        cur.execute('SELECT "PlayerAId", "PlayerBId" FROM "Matchups" WHERE "WeekId"=%s', (week_id,))
+        return {frozenset(row) for row in cur.fetchall()}
+
 def main():
     conn = psycopg2.connect(dbname=DB_NAME, user=DB_USER, password=DB_PASSWORD, host=DB_HOST, port=DB_PORT)
-    with open(CSV_PATH, newline='') as csvfile:
+    existing_pairs = get_existing_pairs(conn, WEEK_ID)
+    with open(CSV_PATH, newline='') as csvfile, matchup_writer(conn) as writer:
         reader = csv.DictReader(csvfile)
         for row in reader:
             if row['Week'] != '8':
@@ -39,20 +52,16 @@ def main():
                 print(f'Error parsing matchup {matchup}: {e}')
                 continue
             # Check if matchup already exists for this week and players (either order)
-            with conn.cursor() as cur:
-                cur.execute('''
-                    SELECT 1 FROM "Matchups" WHERE "WeekId"=%s AND (("PlayerAId"=%s AND "PlayerBId"=%s) OR ("PlayerAId"=%s AND "PlayerBId"=%s))
-                ''', (WEEK_ID, player_a_id, player_b_id, player_b_id, player_a_id))
-                if cur.fetchone():
-                    print(f'Already exists: {player_a} vs {player_b} (week 8)')
-                    continue
-                cur.execute('''
-                    INSERT INTO "Matchups" ("Id", "WeekId", "PlayerAId", "PlayerBId")
-                    VALUES (gen_random_uuid(), %s, %s, %s)
-                ''', (WEEK_ID, player_a_id, player_b_id))
-                print(f'Inserted: {player_a} vs {player_b} (week 8)')
-        conn.commit()
+            pair = frozenset((player_a_id, player_b_id))
+            if pair in existing_pairs:
+                print(f'Already exists: {player_a} vs {player_b} (week 8)')
+                continue
+            existing_pairs.add(pair)
+            writer.add(WEEK_ID, player_a_id, player_b_id)
+            print(f'Queued: {player_a} vs {player_b} (week 8)')
+    print(f'Inserted {writer.rows_written} matchups (week 8)')
+    conn.commit()
     conn.close()
 
 if __name__ == '__main__':
-    main()
+    sys.exit(run(lambda args: main()))
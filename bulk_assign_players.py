@@ -4,9 +4,14 @@ Bulk assign players to flights for Session 3 using the matchup data
 This script demonstrates how to assign all players from the week15_matchups.py file
 """
 
+import os
+import sys
 import requests
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from glm.profiling import run
+
 # Flight assignments from week15_matchups.py
 flight_assignments = {
     "1": [
@@ -153,7 +158,7 @@ def bulk_assign_players():
     print(f"Failed assignments: {failed_assignments}")
     print(f"{'='*50}")
 
-if __name__ == "__main__":
+def main():
     # Validate configuration
     if SEASON_ID == "YOUR_SEASON_ID_HERE":
         print("ERROR: Please set the SEASON_ID in the script before running")
@@ -161,3 +166,7 @@ if __name__ == "__main__":
         exit(1)
     
     bulk_assign_players()
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
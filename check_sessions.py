@@ -1,7 +1,20 @@
 #!/usr/bin/env python3
+import os
 import psycopg2
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
+
+def check_all_tenants():
+    """Session assignment counts for every tenant, queried concurrently"""
+    from glm.tenants import CHECKS, print_report, run_on_tenants
+
+    report = run_on_tenants(CHECKS['sessions'])
+    print_report(report)
+    return 1 if report.failed else 0
+
 def main():
     try:
         print('Connecting to database...')
@@ -80,4 +93,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == '__main__':
-    main()
+    sys.exit(run(lambda args: check_all_tenants() if '--all-tenants' in args else main()))
@@ -2,15 +2,24 @@
 
 import requests
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from glm.apicache import CachedSession
+from glm.profiling import run
 
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 SEASON_ID = "a57df491-9860-4c01-a883-ab68e838adb7"
 
+# Players, seasons, flights and weeks are served from an on-disk cache (scripts/glm/apicache.py)
+api = CachedSession()
+
 def get_players():
     """Get all players for the season"""
     try:
-        response = requests.get(f"{API_BASE_URL}/players/season/{SEASON_ID}")
+        response = api.get(f"{API_BASE_URL}/players/season/{SEASON_ID}")
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -21,7 +30,7 @@ def get_flight_assignments():
     """Get flight assignments for Session 3 (Week 15)"""
     try:
         # Use the standings API to get current session assignments
-        response = requests.get(f"{API_BASE_URL}/standings/session?seasonId={SEASON_ID}&sessionStartWeek=15")
+        response = api.get(f"{API_BASE_URL}/standings/session?seasonId={SEASON_ID}&sessionStartWeek=15")
         response.raise_for_status()
         standings = response.json()
         
@@ -46,7 +55,7 @@ def check_week15_matchups():
     
     # Get Week 15 data
     try:
-        response = requests.get(f"{API_BASE_URL}/weeks/season/{SEASON_ID}")
+        response = api.get(f"{API_BASE_URL}/weeks/season/{SEASON_ID}")
         response.raise_for_status()
         weeks = response.json()
         
@@ -169,4 +178,4 @@ def check_week15_matchups():
             print(f"- {full_name} (ID: {player_id[:8]}...) - NO FLIGHT ASSIGNMENT")
 
 if __name__ == "__main__":
-    check_week15_matchups()
+    sys.exit(run(lambda args: check_week15_matchups()))
@@ -6,15 +6,24 @@ Clear existing Session 3 matchups and import new ones from week15_matchups.py
 import requests
 import json
 from week15_matchups import generate_all_matchups
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from glm.apicache import CachedSession
+from glm.profiling import run
 
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 SEASON_ID = "a57df491-9860-4c01-a883-ab68e838adb7"  # 2025 season ID
 
+# Players, seasons, flights and weeks are served from an on-disk cache (scripts/glm/apicache.py)
+api = CachedSession()
+
 def get_session3_weeks():
     """Get all weeks for Session 3 (weeks 15-21)"""
     try:
-        response = requests.get(f"{API_BASE_URL}/weeks/season/{SEASON_ID}")
+        response = api.get(f"{API_BASE_URL}/weeks/season/{SEASON_ID}")
         response.raise_for_status()
         weeks = response.json()
         
@@ -28,7 +37,7 @@ def get_session3_weeks():
 def get_matchups_for_week(week_id):
     """Get all matchups for a specific week"""
     try:
-        response = requests.get(f"{API_BASE_URL}/matchups/week/{week_id}")
+        response = api.get(f"{API_BASE_URL}/matchups/week/{week_id}")
         if response.status_code == 200:
             return response.json()
         return []
@@ -39,7 +48,7 @@ def get_matchups_for_week(week_id):
 def delete_matchup(matchup_id):
     """Delete a single matchup"""
     try:
-        response = requests.delete(f"{API_BASE_URL}/matchups/{matchup_id}")
+        response = api.delete(f"{API_BASE_URL}/matchups/{matchup_id}")
         return response.status_code == 200 or response.status_code == 204
     except requests.RequestException as e:
         print(f"Error deleting matchup {matchup_id}: {e}")
@@ -71,7 +80,7 @@ def clear_session3_matchups():
 def get_all_players():
     """Get all players from the API"""
     try:
-        response = requests.get(f"{API_BASE_URL}/players")
+        response = api.get(f"{API_BASE_URL}/players")
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -81,7 +90,7 @@ def get_all_players():
 def get_flights_by_season():
     """Get all flights for the season"""
     try:
-        response = requests.get(f"{API_BASE_URL}/flights/season/{SEASON_ID}")
+        response = api.get(f"{API_BASE_URL}/flights/season/{SEASON_ID}")
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -126,7 +135,7 @@ def create_matchup(week_id, player1_id, player2_id, flight_id=None):
     }
     
     try:
-        response = requests.post(f"{API_BASE_URL}/matchups", json=matchup_data)
+        response = api.post(f"{API_BASE_URL}/matchups", json=matchup_data)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -225,4 +234,4 @@ def main():
     print("🎉 Session 3 matchup import completed successfully!")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
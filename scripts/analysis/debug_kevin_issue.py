@@ -5,6 +5,13 @@ Week 1: countsForHandicap = false, grossScore = 52 or 47
 Expected: average should be close to initial average, not the gross score
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
+
 def test_week1_calculation():
     print("Kevin K. Average Calculation Test - Week 1")
     print("=========================================")
@@ -64,6 +71,10 @@ def test_simple_vs_legacy():
     print(f"\nBoth methods should give {initial_avg}, not {week1_score}")
     print(f"The fact that we see 43.52 and 48.22 suggests these are the initial averages")
 
-if __name__ == "__main__":
+def main():
     test_week1_calculation()
     test_simple_vs_legacy()
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
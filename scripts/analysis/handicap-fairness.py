@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Compare SimpleAverage, LegacyLookupTable and WHS handicaps by how close net head-to-head matches get to 50/50.
+Usage: python3 handicap-fairness.py --snapshot DIR [--snapshot DIR ...] [--resamples N] [--json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.fairness import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Stream a score-entry dump (data/analysis/score_entries_data.json), intern its players and write the normalized, columnar form.
+Usage: python3 normalize-score-entries.py <dump.json> [--out normalized.json] [--verify]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.scoredump import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo projection of flight title, playoff and position probabilities for the current session.
+Usage: python3 project-season.py (--snapshot DIR | --tenant NAME) [--simulations N] [--playoff-spots N] [--json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.projection import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
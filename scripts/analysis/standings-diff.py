@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Recompute session standings offline from a tenant snapshot and diff them against /api/standings/session.
+Usage: python3 standings-diff.py (--snapshot DIR | --tenant NAME) [--week N] [--api [URL]] [--json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.standings import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
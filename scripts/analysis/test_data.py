@@ -1,36 +1,28 @@
 #!/usr/bin/env python3
 import json
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.scoredump import load
 
 print("Starting analysis...")
 
 try:
-    with open('score_entries_data.json', 'r') as f:
-        data = json.load(f)
+    # Streams the API dump (or reads the normalized form) with players interned once
+    data = load(sys.argv[1] if len(sys.argv) > 1 else 'score_entries_data.json')
     print(f"Loaded {len(data)} score entries")
     
     # Show sample data
     print("Sample entry:")
-    print(json.dumps(data[0], indent=2))
-    
-    # Group by player
-    players = {}
-    for entry in data:
-        player_id = entry['playerId']
-        if player_id not in players:
-            players[player_id] = []
-        players[player_id].append(entry)
+    print(json.dumps(next(data.records()), indent=2))
     
-    print(f"Found {len(players)} unique players")
+    print(f"Found {len(data.players)} unique players")
     
     # Show player with most entries
-    max_entries = 0
-    max_player = None
-    for player_id, entries in players.items():
-        if len(entries) > max_entries:
-            max_entries = len(entries)
-            max_player = player_id
-    
-    print(f"Player with most entries: {max_player} with {max_entries} entries")
+    max_player, max_entries = Counter(data.player).most_common(1)[0]
+    print(f"Player with most entries: {data.player_ids[max_player]} with {max_entries} entries")
     
 except Exception as e:
     print(f"Error: {e}")
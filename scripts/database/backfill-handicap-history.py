@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Backfill per-week average/handicap history (and optionally session averages) for every tenant, one transaction each.
+Usage: python3 backfill-handicap-history.py [--tenant NAME ...] [--season-id ID] [--from-week N] [--session-averages] [--dry-run]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.backfill import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -6,6 +6,11 @@ import hashlib
 import base64
 import uuid
 from datetime import datetime
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 def hash_password(password):
     """Hash password using SHA256 to match AuthController"""
@@ -76,7 +81,7 @@ def create_admin_user(tenant_name):
     
     return True
 
-if __name__ == "__main__":
+def main():
     if len(sys.argv) != 2:
         print("Usage: python3 create-admin-user.py <tenant_name>")
         sys.exit(1)
@@ -85,3 +90,7 @@ if __name__ == "__main__":
     
     if not create_admin_user(tenant_name):
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
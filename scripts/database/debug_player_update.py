@@ -3,9 +3,14 @@
 Debug script to investigate why initialAverageScore is not being set correctly.
 """
 
+import os
+import sys
 import requests
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 
@@ -85,4 +90,4 @@ def test_single_player_update():
         print(f"   Difference: {abs(week1_average - juan_after.get('initialAverageScore', 0))}")
 
 if __name__ == "__main__":
-    test_single_player_update()
+    sys.exit(run(lambda args: test_single_player_update()))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Validate a position template ("1 vs 2", ...) and expand it across every flight of a session in one bulk write.
+Usage: python3 expand-schedule.py --tenant NAME --session-start WEEK [--template FILE] [--positions FILE] [--replace] [--write]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.schedule import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -5,15 +5,20 @@ Generates matchups for an entire season using various strategies
 """
 
 import argparse
+import os
+import sys
 import psycopg2
 import json
 import random
 from itertools import combinations
 from collections import defaultdict
 from typing import List, Dict, Set, Tuple, Optional
-import uuid
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.batch import matchup_writer
+from glm.profiling import phase, run
+
 # Database connection settings
 DB_CONFIG = {
     'host': 'localhost',
@@ -140,15 +145,13 @@ class MatchupGenerator:
     
     def create_matchup(self, week_id: str, player_a_id: str, player_b_id: str) -> str:
         """Create a single matchup"""
-        matchup_id = str(uuid.uuid4())
-        
-        with self.conn.cursor() as cur:
-            cur.execute('''
-                INSERT INTO "Matchups" ("Id", "WeekId", "PlayerAId", "PlayerBId")
-                VALUES (%s, %s, %s, %s)
-            ''', (matchup_id, week_id, player_a_id, player_b_id))
-        
-        return matchup_id
+        return self.create_matchups([(week_id, player_a_id, player_b_id)])[0]
+    
+    def create_matchups(self, matchups: List[Tuple[str, str, str]]) -> List[str]:
+        """Create (week_id, player_a_id, player_b_id) matchups in batches, returning their IDs"""
+        with matchup_writer(self.conn) as writer:
+            writer.extend(matchups)
+        return writer.ids
     
     def generate_round_robin_matchups(self, players: List[Dict], weeks: List[Dict]) -> List[Tuple[str, str, str]]:
         """
@@ -265,7 +268,8 @@ class MatchupGenerator:
         # Clear existing matchups if requested
         cleared_count = 0
         if clear_existing:
-            cleared_count = self.clear_existing_matchups(season_id)
+            with phase('clear'):
+                cleared_count = self.clear_existing_matchups(season_id)
         
         # Get weeks for the season
         weeks = self.get_weeks_for_season(season_id)
@@ -299,23 +303,19 @@ class MatchupGenerator:
                 print(f"     - {player['full_name']}")
             
             # Generate matchups based on strategy
-            if strategy == "round_robin":
-                matchups = self.generate_round_robin_matchups(players, weeks)
-            elif strategy == "random":
-                matchups = self.generate_random_weekly_matchups(players, weeks)
-            elif strategy == "balanced":
-                matchups = self.generate_balanced_matchups(players, weeks)
-            else:
-                raise ValueError(f"Unknown strategy: {strategy}")
+            with phase('generate'):
+                if strategy == "round_robin":
+                    matchups = self.generate_round_robin_matchups(players, weeks)
+                elif strategy == "random":
+                    matchups = self.generate_random_weekly_matchups(players, weeks)
+                elif strategy == "balanced":
+                    matchups = self.generate_balanced_matchups(players, weeks)
+                else:
+                    raise ValueError(f"Unknown strategy: {strategy}")
             
             # Create the matchups in the database
-            flight_matchups_created = 0
-            for week_id, player_a_id, player_b_id in matchups:
-                try:
-                    self.create_matchup(week_id, player_a_id, player_b_id)
-                    flight_matchups_created += 1
-                except Exception as e:
-                    print(f"❌ Failed to create matchup: {e}")
+            with phase('write'):
+                flight_matchups_created = len(self.create_matchups(matchups))
             
             total_matchups_created += flight_matchups_created
             
@@ -328,7 +328,8 @@ class MatchupGenerator:
             print(f"   ✅ Created {flight_matchups_created} matchups for flight {flight['name']}")
         
         # Commit all changes
-        self.conn.commit()
+        with phase('commit'):
+            self.conn.commit()
         
         result = {
             'season_id': season_id,
@@ -494,4 +495,4 @@ def main():
         generator.disconnect()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Bulk-import hole scores from a Scores.csv file (one row per player and week) into one tenant, in one transaction.
+Usage: python3 import-hole-scores.py <tenant_name> <csv_file_path> [--season-id ID] [--format legacy] [--dry-run]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.scoreimport import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
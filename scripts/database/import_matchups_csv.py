@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 """
 Import matchups from CSV file to Golf League Manager database.
-Usage: python3 import_matchups_csv.py <tenant_name> <csv_file_path>
+Usage: python3 import_matchups_csv.py <tenant_name> <csv_file_path> [--format header|flights]
 """
 
 import sys
-import csv
 import psycopg2
-from uuid import uuid4
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.batch import matchup_writer
+from glm.csvformats import MATCHUP_FORMATS, CsvFormatError, read_csv
+from glm.profiling import phase, run
+
 # Database connection settings
 DB_CONFIG = {
     'host': 'localhost',
@@ -19,15 +22,19 @@ DB_CONFIG = {
 }
 
 def print_usage():
-    print("Usage: python3 import_matchups_csv.py <tenant_name> <csv_file_path>")
+    print("Usage: python3 import_matchups_csv.py <tenant_name> <csv_file_path> [--format header|flights]")
     print("")
     print("Examples:")
     print("  python3 import_matchups_csv.py southmoore /path/to/matchups.csv")
+    print("  python3 import_matchups_csv.py htlyons data/Matchupsfromweek12.csv")
     print("")
-    print("CSV Format:")
-    print("  Week,Player 1,Player 2")
-    print("  1,John Doe,Jane Smith")
-    print("  2,John Doe,Bob Johnson")
+    print("CSV Formats (detected automatically):")
+    print("  header:")
+    print("    Week,Player 1,Player 2")
+    print("    1,John Doe,Jane Smith")
+    print("    2,John Doe,Bob Johnson")
+    print("  flights:")
+    print("    12,July 9,Flight 1,John Doe vs Jane Smith")
 
 def get_database_connection(tenant_name):
     """Get database connection for the specified tenant."""
@@ -68,134 +75,99 @@ def get_weeks_map(cursor):
     
     return week_map
 
-def parse_csv_file(csv_file_path):
-    """Parse the CSV file and return matchup data."""
-    matchups = []
-    
+def open_csv_file(csv_file_path, csv_format=None):
+    """Open the CSV file and detect its format; matchups are read as the result is iterated."""
     try:
-        with open(csv_file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            # Check if required columns exist
-            required_columns = ['Week', 'Player 1', 'Player 2']
-            if not all(col in reader.fieldnames for col in required_columns):
-                print(f"❌ Error: CSV file must contain columns: {', '.join(required_columns)}")
-                return None
-            
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 because of header
-                try:
-                    week_number = int(row['Week'])
-                    player1_name = row['Player 1'].strip()
-                    player2_name = row['Player 2'].strip()
-                    
-                    if not player1_name or not player2_name:
-                        print(f"⚠️  Warning: Empty player name in row {row_num}, skipping")
-                        continue
-                    
-                    matchups.append({
-                        'week': week_number,
-                        'player1': player1_name,
-                        'player2': player2_name
-                    })
-                    
-                except ValueError as e:
-                    print(f"⚠️  Warning: Invalid data in row {row_num}: {e}")
-                    continue
-                    
+        return read_csv(csv_file_path, MATCHUP_FORMATS, csv_format)
     except FileNotFoundError:
         print(f"❌ Error: CSV file not found: {csv_file_path}")
-        return None
-    except Exception as e:
+    except (CsvFormatError, OSError, UnicodeDecodeError) as e:
         print(f"❌ Error reading CSV file: {e}")
-        return None
-    
-    return matchups
+    return None
 
-def clear_existing_matchups(cursor):
-    """Clear existing matchups from the database."""
-    cursor.execute('DELETE FROM "Matchups"')
-    deleted_count = cursor.rowcount
-    print(f"🗑️  Cleared {deleted_count} existing matchups")
+def clear_week_matchups(cursor, week_id):
+    """Clear existing matchups for one week."""
+    cursor.execute('DELETE FROM "Matchups" WHERE "WeekId" = %s', (week_id,))
+    return cursor.rowcount
 
 def import_matchups(cursor, matchups, player_map, week_map):
-    """Import matchups into the database."""
-    imported_count = 0
+    """
+    Import matchups into the database as they stream from the CSV.
+
+    Each week's existing matchups are cleared the first time the file
+    mentions that week, so a file starting at week 12 leaves weeks 1-11 alone.
+    """
     errors = []
+    read = 0
+    cleared = 0
+    seen_weeks = set()
     
-    for matchup in matchups:
-        week_number = matchup['week']
-        player1_name = matchup['player1']
-        player2_name = matchup['player2']
-        
-        # Check if week exists
-        if week_number not in week_map:
-            errors.append(f"Week {week_number} not found in database")
-            continue
-        
-        # Check if players exist
-        if player1_name not in player_map:
-            errors.append(f"Player '{player1_name}' not found in database")
-            continue
-        
-        if player2_name not in player_map:
-            errors.append(f"Player '{player2_name}' not found in database")
-            continue
-        
-        # Insert matchup
-        week_id = week_map[week_number]
-        player1_id = player_map[player1_name]
-        player2_id = player_map[player2_name]
-        
-        try:
-            cursor.execute('''
-                INSERT INTO "Matchups" (
-                    "Id", "WeekId", "PlayerAId", "PlayerBId", 
-                    "PlayerAHolePoints", "PlayerBHolePoints", 
-                    "PlayerAMatchWin", "PlayerBMatchWin",
-                    "PlayerAAbsent", "PlayerAAbsentWithNotice",
-                    "PlayerBAbsent", "PlayerBAbsentWithNotice"
-                ) VALUES (
-                    %s, %s, %s, %s, 
-                    0, 0, 
-                    false, false,
-                    false, false,
-                    false, false
-                )
-            ''', (str(uuid4()), week_id, player1_id, player2_id))
+    with matchup_writer(cursor.connection) as writer:
+        for matchup in matchups:
+            read += 1
+            week_number = matchup.week
+            player1_name = matchup.player1
+            player2_name = matchup.player2
+            
+            # Check if week exists
+            if week_number not in week_map:
+                errors.append(f"Line {matchup.line}: Week {week_number} not found in database")
+                continue
             
-            imported_count += 1
+            # Check if players exist
+            if player1_name not in player_map:
+                errors.append(f"Line {matchup.line}: Player '{player1_name}' not found in database")
+                continue
             
-        except psycopg2.Error as e:
-            errors.append(f"Error inserting matchup Week {week_number}: {player1_name} vs {player2_name} - {e}")
+            if player2_name not in player_map:
+                errors.append(f"Line {matchup.line}: Player '{player2_name}' not found in database")
+                continue
+            
+            if week_number not in seen_weeks:
+                seen_weeks.add(week_number)
+                cleared += clear_week_matchups(cursor, week_map[week_number])
+            
+            # Queue matchup
+            writer.add(week_map[week_number], player_map[player1_name], player_map[player2_name])
     
-    return imported_count, errors
+    return read, writer.rows_written, cleared, errors
 
 def main():
-    if len(sys.argv) != 3:
+    args = sys.argv[1:]
+    csv_format = None
+    if '--format' in args:
+        position = args.index('--format')
+        if position + 1 >= len(args) or args[position + 1] not in MATCHUP_FORMATS:
+            print_usage()
+            return 1
+        csv_format = args[position + 1]
+        del args[position:position + 2]
+    if len(args) != 2:
         print_usage()
         return 1
     
-    tenant_name = sys.argv[1]
-    csv_file_path = sys.argv[2]
+    tenant_name = args[0]
+    csv_file_path = args[1]
     
     print(f"🏌️  Golf League Manager - Matchup Import")
     print(f"📊 Tenant: {tenant_name}")
     print(f"📁 CSV File: {csv_file_path}")
     print("")
     
-    # Parse CSV file
-    print("📖 Parsing CSV file...")
-    matchups = parse_csv_file(csv_file_path)
+    # Open CSV file (rows are read while importing)
+    print("📖 Opening CSV file...")
+    matchups = open_csv_file(csv_file_path, csv_format)
     if not matchups:
         return 1
     
-    print(f"✅ Found {len(matchups)} matchups in CSV file")
+    print(f"✅ Format: {matchups.format.name} ({matchups.format.description})")
     print("")
     
     # Connect to database
     print("🔌 Connecting to database...")
     conn = get_database_connection(tenant_name)
     if not conn:
+        matchups.close()
         return 1
     
     try:
@@ -203,22 +175,24 @@ def main():
         
         # Get players and weeks
         print("👥 Loading players...")
-        player_map = get_players_map(cursor)
+        with phase('load players'):
+            player_map = get_players_map(cursor)
         print(f"✅ Found {len(player_map)} players in database")
         
         print("📅 Loading weeks...")
-        week_map = get_weeks_map(cursor)
+        with phase('load weeks'):
+            week_map = get_weeks_map(cursor)
         print(f"✅ Found {len(week_map)} weeks in database")
         print("")
         
-        # Clear existing matchups
-        print("🧹 Clearing existing matchups...")
-        clear_existing_matchups(cursor)
-        print("")
-        
-        # Import matchups
+        # Import matchups, clearing each week in the file first
         print("⬆️  Importing matchups...")
-        imported_count, errors = import_matchups(cursor, matchups, player_map, week_map)
+        with matchups, phase('import'):
+            read_count, imported_count, cleared_count, errors = import_matchups(cursor, matchups, player_map,
+                                                                                week_map)
+        
+        for line, problem in matchups.problems:
+            errors.append(f"Line {line}: {problem}")
         
         if errors:
             print(f"⚠️  {len(errors)} errors encountered:")
@@ -227,13 +201,15 @@ def main():
             print("")
         
         # Commit changes
-        conn.commit()
+        with phase('commit'):
+            conn.commit()
+        print(f"🗑️  Cleared {cleared_count} existing matchups in the imported weeks")
         print(f"✅ Successfully imported {imported_count} matchups!")
         
         # Show summary
         print("")
         print("📊 Import Summary:")
-        print(f"   - Total matchups in CSV: {len(matchups)}")
+        print(f"   - Total matchups in CSV: {read_count + len(matchups.problems)}")
         print(f"   - Successfully imported: {imported_count}")
         print(f"   - Errors: {len(errors)}")
         
@@ -247,4 +223,4 @@ def main():
         conn.close()
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run(lambda args: main()))
@@ -9,6 +9,10 @@ import psycopg2
 from uuid import uuid4
 import os
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.batch import BatchWriter
+from glm.profiling import run
+
 # Database connection settings
 DB_CONFIG = {
     'host': 'localhost',
@@ -102,21 +106,14 @@ def create_course_holes(cursor, course_id):
     
     print(f"🏌️  Creating {len(holes_data)} holes...")
     
-    for hole in holes_data:
-        hole_id = str(uuid4())
-        
-        cursor.execute('''
-            INSERT INTO "CourseHoles" (
-                "Id", "CourseId", "HoleNumber", "Par", "Yardage", "HandicapIndex"
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s
-            )
-        ''', (
-            hole_id, course_id, hole['hole_number'], 
-            hole['par'], hole['yardage'], hole['handicap']
-        ))
+    writer = BatchWriter(cursor.connection, 'CourseHoles',
+                         ('CourseId', 'HoleNumber', 'Par', 'Yardage', 'HandicapIndex'))
+    with writer:
+        for hole in holes_data:
+            writer.add(course_id, hole['hole_number'], hole['par'], hole['yardage'], hole['handicap'])
     
     print(f"✅ All {len(holes_data)} holes created successfully")
+    return writer.ids
 
 def main():
     if len(sys.argv) != 2:
@@ -191,4 +188,4 @@ def main():
         conn.close()
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run(lambda args: main()))
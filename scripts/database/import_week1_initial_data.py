@@ -12,11 +12,16 @@ Usage:
     python scripts/database/import_week1_initial_data.py
 """
 
+import os
+import sys
 import re
 import requests
 import json
 from typing import List, Dict, Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 DATA_FILE_PATH = "data/analysis/week1_initial_data.txt"
@@ -167,4 +172,4 @@ def main():
         print("\n💡 Tip: Players not found may need to be created first or have different names in the database.")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Scan tenant databases for absence, score and assignment inconsistencies.
+Usage: python3 integrity-scan.py [--tenant NAME ...] [--check NAME ...] [--format text|jsonl|csv] [--output FILE]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.integrity import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Place players into flights for a session (tiered or balanced) and replace its flight assignments.
+Usage: python3 place-flights.py --tenant NAME --session-start WEEK (--flights N | --flight-size N | --sizes A,B,...) [--mode tiered|balanced] [--by average|standings] [--write]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.placement import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Roll flight assignments into the next session for every tenant (copy or reseed), one transaction per tenant.
+Usage: python3 rollover-session.py [--tenant NAME ...] [--from-week N] [--to-week N] [--replace] [--reseed average|standings] [--dry-run]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.rollover import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -7,6 +7,11 @@ Usage: python3 set_default_course.py <tenant_name>
 import sys
 import psycopg2
 from datetime import datetime, timezone
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 # Database connection settings
 DB_CONFIG = {
@@ -177,4 +182,4 @@ def main():
         conn.close()
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run(lambda args: main()))
@@ -6,6 +6,11 @@ Usage: python3 show_league_config.py <tenant_name>
 
 import sys
 import psycopg2
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
 
 # Database connection settings
 DB_CONFIG = {
@@ -139,4 +144,4 @@ def main():
         conn.close()
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run(lambda args: main()))
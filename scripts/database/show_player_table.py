@@ -3,16 +3,23 @@
 Display all players' initial handicaps and average scores in a table format.
 
 This script queries the API and shows the current state of all players'
-initial handicaps and average scores after the Week 1 data import.
+initial handicaps and average scores after the Week 1 data import, with the
+LegacyLookupTable handicap of each current average.
 
 Usage:
     python scripts/database/show_player_table.py
 """
 
+import os
+import sys
 import requests
 import json
 from typing import List, Dict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.handicap import lookup_table_handicap
+from glm.profiling import run
+
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 
@@ -42,14 +49,17 @@ def display_players_table(players: List[Dict]):
     name_width = max(len(f"{p.get('firstName', '')} {p.get('lastName', '')}") for p in sorted_players)
     name_width = max(name_width, 20)  # Minimum width
     
+    # LegacyLookupTable handicap for every current average in one lookup
+    table_handicaps = lookup_table_handicap([p.get('currentAverageScore') or 0.0 for p in sorted_players])
+    
     # Print header
     print("\n🏌️ Golf League Manager - Player Initial Data")
-    print("=" * 80)
-    print(f"{'Player Name':<{name_width}} {'Phone':<15} {'Init Handicap':<13} {'Init Avg Score':<14} {'Curr Handicap':<13} {'Curr Avg Score':<14}")
-    print("-" * 80)
+    print("=" * 90)
+    print(f"{'Player Name':<{name_width}} {'Phone':<15} {'Init Handicap':<13} {'Init Avg Score':<14} {'Curr Handicap':<13} {'Curr Avg Score':<14} {'Table HC':<8}")
+    print("-" * 90)
     
     # Print each player
-    for player in sorted_players:
+    for player, table_handicap in zip(sorted_players, table_handicaps):
         name = f"{player.get('firstName', '')} {player.get('lastName', '')}"
         phone = player.get('phone', 'N/A')[:14]  # Truncate if too long
         init_handicap = player.get('initialHandicap', 0)
@@ -57,10 +67,10 @@ def display_players_table(players: List[Dict]):
         # Note: Current handicap is now calculated dynamically, not stored
         curr_avg = player.get('currentAverageScore', 0.0)
         
-        print(f"{name:<{name_width}} {phone:<15} {init_handicap:<13.1f} {init_avg:<14.2f} {'Dynamic':<13} {curr_avg:<14.2f}")
+        print(f"{name:<{name_width}} {phone:<15} {init_handicap:<13.1f} {init_avg:<14.2f} {'Dynamic':<13} {curr_avg:<14.2f} {table_handicap:<8.0f}")
     
     # Summary statistics
-    print("-" * 80)
+    print("-" * 90)
     total_players = len(sorted_players)
     avg_init_handicap = sum(p.get('initialHandicap', 0) for p in sorted_players) / total_players
     avg_init_score = sum(p.get('initialAverageScore', 0) for p in sorted_players) / total_players
@@ -104,4 +114,4 @@ def main():
     print(f"\n📝 Data fetched from: {API_BASE_URL}/players")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Export a tenant database to a memory-mappable columnar snapshot (numpy .npy per column).
+Usage: python3 snapshot-tenant.py <tenant> [--out data/snapshots]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.snapshot import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Run a query or built-in check against every tenant database concurrently.
+Usage: python3 tenant-fanout.py (--query SQL | --check health|sessions) [--tenant NAME ...] [--json]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.tenants import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
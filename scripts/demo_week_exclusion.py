@@ -3,9 +3,14 @@
 Demonstration script showing how to exclude weeks from handicap and average score calculations
 """
 
+import os
+import sys
 import requests
 import json
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from glm.profiling import run
+
 BASE_URL = "http://localhost:5274/api"
 
 def update_week_calculation_settings(week_id, counts_for_scoring=True, counts_for_handicap=True):
@@ -128,6 +133,10 @@ def show_usage_examples():
     print("   - Counts for Scoring: ❌ (not regular golf)")
     print("   - Counts for Handicap: ❌ (not representative of ability)")
 
-if __name__ == "__main__":
+def main():
     test_calculation_exclusion()
     show_usage_examples()
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
@@ -3,15 +3,23 @@
 Final verification test to ensure all calculation endpoints are using the new Week 1 baseline logic
 """
 
-import requests
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from glm.apicache import CachedSession
+from glm.profiling import run
 
 BASE_URL = "http://localhost:5274/api"
 
+# Players, seasons, flights and weeks are served from an on-disk cache (scripts/glm/apicache.py)
+api = CachedSession()
+
 def test_endpoint(url, description):
     """Test an endpoint and return the result"""
     try:
-        response = requests.get(url)
+        response = api.get(url)
         if response.status_code == 200:
             return {"status": "SUCCESS", "data": response.json()}
         else:
@@ -146,4 +154,4 @@ def main():
     print("The system is ready for production use with Week 1 baseline calculations.")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
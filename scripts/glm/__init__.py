@@ -0,0 +1,18 @@
+"""
+Shared Python tooling for the Golf League Manager admin scripts.
+
+Scripts outside this directory make it importable with:
+
+    sys.path.insert(0, os.path.join(<repo root>, 'scripts'))
+
+GLM_QUERY_LOG=1 (or json, or a file path) instruments every psycopg2
+connection opened afterwards; see querylog.py. Nothing else is imported
+here, so `import glm` stays free for the CLI's startup (cli.py).
+"""
+
+import os as _os
+
+if _os.environ.get('GLM_QUERY_LOG'):
+    from .querylog import install_from_env as _install_query_log
+
+    _install_query_log()
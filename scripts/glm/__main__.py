@@ -0,0 +1,7 @@
+"""`python3 -m glm` from scripts/ is the same as scripts/bin/glm"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,428 @@
+"""
+On-disk HTTP cache for the read-mostly API endpoints the admin scripts
+fetch over and over (check_week15_matchups.py, import_session3_matchups.py,
+final_verification_test.py, ...):
+
+    GET /api/players               GET /api/players/season/{id}
+    GET /api/seasons               GET /api/flights/season/{id}
+    GET /api/weeks/season/{id}
+
+CachedSession is a drop-in for requests.get/post/...: other URLs and
+methods pass straight through. A cacheable GET is keyed by tenant (the
+X-Tenant-Id header, else the host, since tenants are subdomains), a hash
+of the Authorization header (so one caller's responses are never served
+to another) and the full URL including query parameters, and is
+
+    fresh (younger than its TTL)    answered from disk, no request at all
+    stale with an ETag/Last-Modified  revalidated with If-None-Match /
+                                      If-Modified-Since; a 304 renews it,
+                                      keeping the stored Cache-Control
+                                      unless it sends a new one
+    stale without validators        fetched again
+
+TTLs come from Cache-Control max-age when the API sends one, else
+DEFAULT_TTLS; "no-store" responses are never written. Any POST/PUT/
+PATCH/DELETE through the session drops the tenant's cached entries for
+that resource (e.g. POST /api/players clears /api/players*). Entries are
+a .json metadata file plus the raw body; hits bump the body's mtime and
+the least recently used entries are evicted once the directory grows
+past max_bytes. Responses carry an X-GLM-Cache header: hit, revalidated,
+miss or bypass.
+
+Environment:
+    GLM_API_CACHE=0          disable (every request goes to the API)
+    GLM_API_CACHE_DIR        cache directory (default ~/.cache/glm/api)
+    GLM_API_CACHE_MAX_MB     size bound (default 64)
+    GLM_API_CACHE_TTL        seconds, overrides every default TTL
+
+Usage:
+    api = CachedSession()
+    players = api.get(f"{API_BASE_URL}/players").json()
+
+    python3 -m glm.apicache --stats              # from scripts/
+    python3 -m glm.apicache --clear [--tenant southmoore]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+CACHE_HEADER = 'X-GLM-Cache'
+TENANT_HEADER = 'X-Tenant-Id'
+AUTH_HEADER = 'Authorization'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                           'glm', 'api')
+
+# Path pattern -> TTL in seconds
+DEFAULT_TTLS: Tuple[Tuple[str, int], ...] = (
+    (r'/api/players/?', 600),
+    (r'/api/players/season/[^/]+/?', 600),
+    (r'/api/seasons/?', 3600),
+    (r'/api/flights/season/[^/]+/?', 600),
+    (r'/api/weeks/season/[^/]+/?', 600),
+)
+
+# Response headers kept with an entry
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+_UNSAFE = ('POST', 'PUT', 'PATCH', 'DELETE')
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+def _resource(path: str) -> str:
+    """"/api/players/season/x" -> "/api/players", the family a write invalidates"""
+    parts = [p for p in path.split('/') if p]
+    return '/' + '/'.join(parts[:2]) if parts[:1] == ['api'] else '/' + '/'.join(parts[:1])
+
+
+class ResponseCache:
+    """Directory of cached GET responses with LRU eviction by total size"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = directory or os.environ.get('GLM_API_CACHE_DIR') or DEFAULT_DIR
+        if max_bytes is None:
+            max_mb = os.environ.get('GLM_API_CACHE_MAX_MB')
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(tenant: str, url: str, auth: str = '') -> str:
+        """Entry key; `auth` is a fingerprint of the caller's credentials, never the credentials"""
+        return hashlib.sha256(f'{tenant}\n{auth}\n{url}'.encode()).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.directory, key)
+        return base + '.json', base + '.body'
+
+    def load_meta(self, key: str) -> Dict:
+        try:
+            with open(self._paths(key)[0]) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self, key: str) -> Optional[Tuple[Dict, bytes]]:
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if len(body) != meta.get('size'):   # torn write from a killed process
+            return None
+        return meta, body
+
+    def touch(self, key: str):
+        try:
+            os.utime(self._paths(key)[1])
+        except OSError:
+            pass
+
+    def store(self, key: str, meta: Dict, body: bytes):
+        """Write an entry (body first, metadata last, each via rename) and evict down to max_bytes"""
+        os.makedirs(self.directory, exist_ok=True)
+        meta = dict(meta, size=len(body))
+        meta_path, body_path = self._paths(key)
+        for path, data in ((body_path, body), (meta_path, json.dumps(meta).encode())):
+            partial = f'{path}.{os.getpid()}.tmp'
+            with open(partial, 'wb') as f:
+                f.write(data)
+            os.replace(partial, path)
+        self.evict()
+
+    def update(self, key: str, meta: Dict):
+        meta_path = self._paths(key)[0]
+        partial = f'{meta_path}.{os.getpid()}.tmp'
+        with open(partial, 'w') as f:
+            json.dump(meta, f)
+        os.replace(partial, meta_path)
+        self.touch(key)
+
+    def remove(self, key: str):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def entries(self) -> List[Tuple[str, float, int]]:
+        """(key, last used, bytes on disk) for every entry, least recently used first"""
+        found = []
+        try:
+            scan = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return []
+        sizes: Dict[str, int] = {}
+        used: Dict[str, float] = {}
+        for entry in scan:
+            key, _, kind = entry.name.partition('.')
+            if kind not in ('json', 'body'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            sizes[key] = sizes.get(key, 0) + stat.st_size
+            if kind == 'body':
+                used[key] = stat.st_mtime
+        for key, size in sizes.items():
+            found.append((key, used.get(key, 0.0), size))
+        return sorted(found, key=lambda e: e[1])
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for key, _, size in entries:
+            if total <= self.max_bytes:
+                break
+            self.remove(key)
+            total -= size
+            removed += 1
+        return removed
+
+    def invalidate(self, tenant: Optional[str] = None, prefix: Optional[str] = None) -> int:
+        """Remove entries for a tenant and/or whose URL path starts with prefix (everything by default)"""
+        removed = 0
+        for key, _, _ in self.entries():
+            if tenant is not None or prefix is not None:
+                meta = self.load_meta(key)
+                if tenant is not None and meta.get('tenant') != tenant:
+                    continue
+                if prefix is not None and not urlsplit(meta.get('url', '')).path.startswith(prefix):
+                    continue
+            self.remove(key)
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict:
+        entries = self.entries()
+        now = time.time()
+        tenants: Dict[str, int] = {}
+        fresh = 0
+        for key, _, _ in entries:
+            meta = self.load_meta(key)
+            if not meta:
+                continue
+            tenants[meta.get('tenant', '?')] = tenants.get(meta.get('tenant', '?'), 0) + 1
+            fresh += meta.get('expires_at', 0) > now
+        return {
+            'directory': self.directory,
+            'entries': len(entries),
+            'fresh': fresh,
+            'bytes': sum(size for _, _, size in entries),
+            'max_bytes': self.max_bytes,
+            'tenants': tenants,
+        }
+
+
+class CachedSession:
+    """
+    requests-compatible session that serves the read-mostly endpoints from
+    a ResponseCache. `tenant` overrides the X-Tenant-Id/host tenant key;
+    `enabled=False` (or GLM_API_CACHE=0) makes it a plain session.
+    """
+
+    def __init__(self, session=None, cache: Optional[ResponseCache] = None, tenant: Optional[str] = None,
+                 enabled: Optional[bool] = None, ttls: Sequence[Tuple[str, int]] = DEFAULT_TTLS):
+        import requests
+
+        self.session = session or requests.Session()
+        self.cache = cache or ResponseCache()
+        self.tenant = tenant
+        if enabled is None:
+            enabled = os.environ.get('GLM_API_CACHE', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+        self.enabled = enabled
+        override = os.environ.get('GLM_API_CACHE_TTL')
+        self._ttls = [(re.compile(pattern + '$'), int(override) if override else ttl) for pattern, ttl in ttls]
+        self.counts = {'hit': 0, 'revalidated': 0, 'miss': 0, 'bypass': 0}
+
+    @property
+    def headers(self):
+        return self.session.headers
+
+    def _ttl(self, path: str) -> Optional[int]:
+        for pattern, ttl in self._ttls:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    def _header(self, name: str, headers: Optional[Dict]) -> Optional[str]:
+        """A request header, from the call's headers first, then the session's"""
+        for source in (headers or {}, self.session.headers):
+            for header, value in source.items():
+                if header.lower() == name.lower() and value:
+                    return value
+        return None
+
+    def _tenant(self, url: str, headers: Optional[Dict]) -> str:
+        if self.tenant:
+            return self.tenant
+        return self._header(TENANT_HEADER, headers) or urlsplit(url).hostname or ''
+
+    def _auth(self, headers: Optional[Dict]) -> str:
+        token = self._header(AUTH_HEADER, headers)
+        return hashlib.sha256(token.encode()).hexdigest()[:16] if token else ''
+
+    def _response(self, meta: Dict, body: bytes, state: str):
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        response = requests.Response()
+        response.status_code = meta['status']
+        response._content = body
+        response.url = meta['url']
+        response.encoding = meta.get('encoding')
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response.headers[CACHE_HEADER] = state
+        return response
+
+    @staticmethod
+    def _expiry(headers, ttl: int) -> Optional[float]:
+        """Expiry timestamp for a response, or None when it must not be stored"""
+        control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in control:
+            return None
+        if 'no-cache' in control:
+            return time.time()
+        match = _MAX_AGE.search(control)
+        return time.time() + (int(match.group(1)) if match else ttl)
+
+    def get(self, url: str, params=None, headers: Optional[Dict] = None, **kwargs):
+        import requests
+
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        ttl = self._ttl(urlsplit(full_url).path) if self.enabled else None
+        # requests' auth= objects can't be fingerprinted; only the Authorization header is
+        if ttl is None or kwargs.get('stream') or kwargs.get('auth') is not None:
+            self.counts['bypass'] += 1
+            response = self.session.get(url, params=params, headers=headers, **kwargs)
+            response.headers[CACHE_HEADER] = 'bypass'
+            return response
+
+        tenant = self._tenant(full_url, headers)
+        key = self.cache.key(tenant, full_url, self._auth(headers))
+        cached = self.cache.load(key)
+        if cached is not None and cached[0]['expires_at'] > time.time():
+            self.counts['hit'] += 1
+            self.cache.touch(key)
+            return self._response(cached[0], cached[1], 'hit')
+
+        conditional = dict(headers or {})
+        if cached is not None:
+            meta = cached[0]
+            if meta.get('etag'):
+                conditional['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                conditional['If-Modified-Since'] = meta['last_modified']
+        response = self.session.get(full_url, headers=conditional, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            meta = dict(cached[0])
+            # A 304 may carry fresh validators and Cache-Control; without them the stored ones stand
+            meta['headers'] = dict(meta.get('headers', {}),
+                                   **{h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers})
+            meta['etag'] = meta['headers'].get('ETag')
+            meta['last_modified'] = meta['headers'].get('Last-Modified')
+            expires = self._expiry(meta['headers'], ttl) or time.time()
+            meta['expires_at'] = expires
+            meta['revalidated_at'] = time.time()
+            self.cache.update(key, meta)
+            self.counts['revalidated'] += 1
+            return self._response(meta, cached[1], 'revalidated')
+
+        self.counts['miss'] += 1
+        expires = self._expiry(response.headers, ttl) if response.status_code == 200 else None
+        if expires is None:
+            if cached is not None:
+                self.cache.remove(key)
+        else:
+            self.cache.store(key, {
+                'url': full_url,
+                'tenant': tenant,
+                'status': response.status_code,
+                'encoding': response.encoding,
+                'headers': {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'stored_at': time.time(),
+                'expires_at': expires,
+            }, response.content)
+        response.headers[CACHE_HEADER] = 'miss'
+        return response
+
+    def request(self, method: str, url: str, **kwargs):
+        if method.upper() == 'GET':
+            return self.get(url, **kwargs)
+        response = self.session.request(method, url, **kwargs)
+        if self.enabled and method.upper() in _UNSAFE:
+            self.cache.invalidate(self._tenant(url, kwargs.get('headers')), _resource(urlsplit(url).path))
+        return response
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def summary(self) -> str:
+        return ", ".join(f"{state}={n}" for state, n in self.counts.items())
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear the on-disk API response cache")
+    parser.add_argument('--dir', help=f'Cache directory (default {DEFAULT_DIR} or GLM_API_CACHE_DIR)')
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--stats', action='store_true', help='Show entries, size and tenants (default)')
+    action.add_argument('--clear', action='store_true', help='Remove cached responses')
+    action.add_argument('--evict', action='store_true', help='Evict down to the size bound now')
+    parser.add_argument('--tenant', help='With --clear: only this tenant (X-Tenant-Id value or host)')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    cache = ResponseCache(args.dir)
+    if args.clear:
+        print(f"🗑️  Removed {cache.invalidate(tenant=args.tenant)} cached response(s) from {cache.directory}")
+        return 0
+    if args.evict:
+        print(f"🗑️  Evicted {cache.evict()} cached response(s) from {cache.directory}")
+        return 0
+
+    stats = cache.stats()
+    if args.json:
+        print(json.dumps(stats, indent=2))
+        return 0
+    print(f"📦 {stats['directory']}: {stats['entries']} response(s), {stats['fresh']} fresh, "
+          f"{stats['bytes'] / 1024:,.1f} of {stats['max_bytes'] / (1024 * 1024):,.0f} MB")
+    for tenant, n in sorted(stats['tenants'].items()):
+        print(f"   {tenant:<30} {n}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,425 @@
+"""
+Materialized per-week average/handicap history, backfilled for every tenant.
+
+Replaces the update_session*_averages*.sh revisions (ad-hoc SQL per
+session). For each tenant, in its own transaction:
+
+  * one query pulls every player's 9-hole gross per CountsForScoring week
+    from HoleScores; glm.handicap replays the whole season at once
+    (continue_average over all players per week), so every player's
+    average and handicap after every week comes out of a single pass
+  * the rows are COPYed into a temp staging table and merged into
+    "PlayerHandicapHistory" with one INSERT ... ON CONFLICT DO UPDATE that
+    only touches rows whose values changed; rows for weeks that no longer
+    count are deleted
+  * --from-week N resumes from the stored running total/rounds of the
+    last scored week before N and only rewrites weeks >= N (falling back to
+    a full replay when that state is missing)
+  * --session-averages also upserts PlayerSessionAverages with the average
+    each player carried into every session start
+
+"PlayerHandicapHistory" is an EF Core table (PlayerHandicapHistory model,
+AddPlayerHandicapHistoryTable migration); a tenant whose migrations have
+not been applied fails instead of getting an unmanaged copy. Rows stop at
+the last week anyone has a score for; later weeks get theirs once played.
+
+Usage (from scripts/):
+    python3 -m glm.backfill --dry-run
+    python3 -m glm.backfill --tenant southmoore --from-week 12 --session-averages
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import db, handicap, profiling
+from .batch import stage_rows
+
+HISTORY_EXISTS_SQL = 'SELECT 1 FROM "PlayerHandicapHistory" WHERE 1 = 0'
+
+HISTORY_STAGING = 'glm_handicap_history'
+HISTORY_COLUMNS = (('PlayerId', 'uuid'), ('WeekNumber', 'integer'), ('AverageScore', 'numeric'),
+                   ('Handicap', 'numeric'), ('ScoreTotal', 'numeric'), ('RoundsCounted', 'integer'))
+
+SESSION_STAGING = 'glm_session_averages'
+SESSION_COLUMNS = (('PlayerId', 'uuid'), ('SessionStartWeekNumber', 'integer'), ('SessionInitialAverage', 'numeric'))
+
+WEEKS_SQL = '''
+    SELECT "WeekNumber", "CountsForScoring", "CountsForHandicap", "SessionStart"
+    FROM "Weeks" WHERE "SeasonId" = %(season)s
+    ORDER BY "WeekNumber"
+'''
+
+# Players with a season record or a matchup this season; initial average from the record, else the player
+PLAYERS_SQL = '''
+    SELECT p."Id", COALESCE(r."InitialAverageScore", p."InitialAverageScore", 0)
+    FROM "Players" p
+    LEFT JOIN "PlayerSeasonRecords" r ON r."PlayerId" = p."Id" AND r."SeasonId" = %(season)s
+    WHERE r."Id" IS NOT NULL OR EXISTS (
+        SELECT 1 FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+        WHERE w."SeasonId" = %(season)s AND p."Id" IN (m."PlayerAId", m."PlayerBId"))
+    ORDER BY p."Id"
+'''
+
+GROSS_SQL = '''
+    SELECT w."WeekNumber", m."PlayerAId", SUM(h."PlayerAScore")
+    FROM "HoleScores" h
+    JOIN "Matchups" m ON m."Id" = h."MatchupId"
+    JOIN "Weeks" w ON w."Id" = m."WeekId"
+    WHERE w."SeasonId" = %(season)s AND w."CountsForScoring" AND w."WeekNumber" >= %(from_week)s
+      AND m."PlayerAId" IS NOT NULL AND h."PlayerAScore" > 0
+    GROUP BY w."WeekNumber", m."PlayerAId"
+    UNION ALL
+    SELECT w."WeekNumber", m."PlayerBId", SUM(h."PlayerBScore")
+    FROM "HoleScores" h
+    JOIN "Matchups" m ON m."Id" = h."MatchupId"
+    JOIN "Weeks" w ON w."Id" = m."WeekId"
+    WHERE w."SeasonId" = %(season)s AND w."CountsForScoring" AND w."WeekNumber" >= %(from_week)s
+      AND m."PlayerBId" IS NOT NULL AND h."PlayerBScore" > 0
+    GROUP BY w."WeekNumber", m."PlayerBId"
+'''
+
+SETTINGS_SQL = '''
+    SELECT "HandicapMethod", "AverageMethod", "CoursePar"
+    FROM "LeagueSettings" WHERE "SeasonId" = %(season)s
+    LIMIT 1
+'''
+
+STATE_SQL = '''
+    SELECT "PlayerId", "ScoreTotal", "RoundsCounted" FROM "PlayerHandicapHistory"
+    WHERE "SeasonId" = %(season)s AND "WeekNumber" = %(week)s
+'''
+
+MERGE_HISTORY_SQL = f'''
+    INSERT INTO "PlayerHandicapHistory"
+        ("Id", "PlayerId", "SeasonId", "WeekNumber", "AverageScore", "Handicap",
+         "ScoreTotal", "RoundsCounted", "ComputedAt")
+    SELECT gen_random_uuid(), s."PlayerId", %(season)s::uuid, s."WeekNumber", s."AverageScore", s."Handicap",
+           s."ScoreTotal", s."RoundsCounted", now()
+    FROM "{HISTORY_STAGING}" s
+    WHERE TRUE
+    ON CONFLICT ("PlayerId", "SeasonId", "WeekNumber") DO UPDATE SET
+        "AverageScore" = EXCLUDED."AverageScore",
+        "Handicap" = EXCLUDED."Handicap",
+        "ScoreTotal" = EXCLUDED."ScoreTotal",
+        "RoundsCounted" = EXCLUDED."RoundsCounted",
+        "ComputedAt" = EXCLUDED."ComputedAt"
+    WHERE "PlayerHandicapHistory"."AverageScore" IS DISTINCT FROM EXCLUDED."AverageScore"
+       OR "PlayerHandicapHistory"."Handicap" IS DISTINCT FROM EXCLUDED."Handicap"
+       OR "PlayerHandicapHistory"."ScoreTotal" IS DISTINCT FROM EXCLUDED."ScoreTotal"
+       OR "PlayerHandicapHistory"."RoundsCounted" IS DISTINCT FROM EXCLUDED."RoundsCounted"
+'''
+
+# History rows from `from_week` on that the replay no longer produces (week un-scored, player dropped)
+DELETE_STALE_SQL = f'''
+    DELETE FROM "PlayerHandicapHistory"
+    WHERE "SeasonId" = %(season)s AND "WeekNumber" >= %(from_week)s
+      AND NOT EXISTS (
+        SELECT 1 FROM "{HISTORY_STAGING}" s
+        WHERE s."PlayerId" = "PlayerHandicapHistory"."PlayerId"
+          AND s."WeekNumber" = "PlayerHandicapHistory"."WeekNumber")
+'''
+
+MERGE_SESSION_SQL = f'''
+    INSERT INTO "PlayerSessionAverages"
+        ("Id", "PlayerId", "SeasonId", "SessionStartWeekNumber", "SessionInitialAverage",
+         "CreatedDate", "ModifiedDate")
+    SELECT gen_random_uuid(), s."PlayerId", %(season)s::uuid, s."SessionStartWeekNumber",
+           s."SessionInitialAverage", now(), now()
+    FROM "{SESSION_STAGING}" s
+    WHERE TRUE
+    ON CONFLICT ("PlayerId", "SeasonId", "SessionStartWeekNumber") DO UPDATE SET
+        "SessionInitialAverage" = EXCLUDED."SessionInitialAverage",
+        "ModifiedDate" = EXCLUDED."ModifiedDate"
+    WHERE "PlayerSessionAverages"."SessionInitialAverage" IS DISTINCT FROM EXCLUDED."SessionInitialAverage"
+'''
+
+
+@dataclass
+class SeasonReplay:
+    """Every player's state after every played CountsForScoring week >= from_week"""
+    player_ids: List[str]
+    week_numbers: np.ndarray        # (w,)
+    averages: np.ndarray            # (p, w)
+    handicaps: np.ndarray           # (p, w)
+    totals: np.ndarray              # (p, w) running total (initial average included)
+    rounds: np.ndarray              # (p, w)
+    start_averages: np.ndarray      # (p,) average carried into the first replayed week
+
+
+@dataclass
+class Backfill:
+    tenant: str
+    season_id: Optional[str] = None
+    mode: str = 'full'              # full, incremental, nothing
+    from_week: int = 0
+    players: int = 0
+    weeks: int = 0
+    written: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    session_averages: int = 0
+    detail: str = ''
+
+
+def load_settings(conn, season_id: str) -> Dict:
+    """HandicapMethod/AverageMethod/CoursePar for the season (LeagueSettings defaults when missing)"""
+    with conn.cursor() as cur:
+        cur.execute(SETTINGS_SQL, {'season': season_id})
+        row = cur.fetchone()
+    if row is None:
+        return {'HandicapMethod': handicap.SIMPLE_AVERAGE, 'AverageMethod': handicap.SIMPLE, 'CoursePar': 36}
+    return {'HandicapMethod': int(row[0]), 'AverageMethod': int(row[1]), 'CoursePar': int(row[2] or 36)}
+
+
+def load_weeks(conn, season_id: str) -> List[Tuple[int, bool, bool, bool]]:
+    """(WeekNumber, CountsForScoring, CountsForHandicap, SessionStart) per distinct week number"""
+    with conn.cursor() as cur:
+        cur.execute(WEEKS_SQL, {'season': season_id})
+        rows = cur.fetchall()
+    weeks: Dict[int, Tuple[int, bool, bool, bool]] = {}
+    for number, scoring, counts, session_start in rows:
+        # Duplicate week rows (cleanup_duplicate_weeks.sh) count once, flags OR'ed
+        seen = weeks.get(int(number), (int(number), False, False, False))
+        weeks[int(number)] = (int(number), seen[1] or bool(scoring), seen[2] or bool(counts),
+                              seen[3] or bool(session_start))
+    return list(weeks.values())
+
+
+def load_players(conn, season_id: str) -> Tuple[List[str], np.ndarray]:
+    """(player ids, initial averages) for everyone in the season"""
+    with conn.cursor() as cur:
+        cur.execute(PLAYERS_SQL, {'season': season_id})
+        rows = cur.fetchall()
+    initial: Dict[str, float] = {}
+    for player_id, average in rows:
+        initial.setdefault(str(player_id), float(average or 0))
+    return list(initial), np.array(list(initial.values()), dtype=np.float64)
+
+
+def load_gross(conn, season_id: str, player_ids: Sequence[str], week_numbers: Sequence[int],
+               from_week: int) -> np.ndarray:
+    """(players, weeks) 9-hole gross from HoleScores, 0 where a player has no score"""
+    player_index = {p: i for i, p in enumerate(player_ids)}
+    week_index = {w: i for i, w in enumerate(week_numbers)}
+    gross = np.zeros((len(player_ids), len(week_numbers)))
+    with conn.cursor() as cur:
+        cur.execute(GROSS_SQL, {'season': season_id, 'from_week': from_week})
+        rows = cur.fetchall()
+    rows = [(player_index.get(str(p)), week_index.get(int(w)), float(s or 0)) for w, p, s in rows]
+    rows = [r for r in rows if r[0] is not None and r[1] is not None]
+    if rows:
+        players, weeks, scores = (np.array(column) for column in zip(*rows))
+        np.add.at(gross, (players.astype(int), weeks.astype(int)), scores)
+    return gross
+
+
+def stored_state(conn, season_id: str, week: int, player_ids: Sequence[str]
+                 ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Running (total, rounds) stored for `week`, or None unless every player has a row"""
+    with conn.cursor() as cur:
+        cur.execute(STATE_SQL, {'season': season_id, 'week': week})
+        state = {str(p): (float(t), int(r)) for p, t, r in cur.fetchall()}
+    if any(p not in state for p in player_ids):
+        return None
+    total = np.array([state[p][0] for p in player_ids], dtype=np.float64)
+    rounds = np.array([state[p][1] for p in player_ids], dtype=np.float64)
+    return handicap.round_half_away(total, 2), rounds
+
+
+def require_history_table(conn):
+    """Fail unless the EF migration creating "PlayerHandicapHistory" has been applied"""
+    try:
+        with conn.cursor() as cur:
+            cur.execute(HISTORY_EXISTS_SQL)
+    except Exception as e:
+        conn.rollback()
+        raise RuntimeError('"PlayerHandicapHistory" does not exist; apply the EF Core migrations '
+                           '(AddPlayerHandicapHistoryTable) to this tenant first') from e
+
+
+def replay(initial_total: np.ndarray, initial_rounds: np.ndarray, gross: np.ndarray,
+           counts_for_handicap: Sequence[bool], settings: Dict) -> Tuple[np.ndarray, ...]:
+    """
+    (averages, handicaps, totals, rounds), each (players, weeks): the state
+    after every week, continuing from (initial_total, initial_rounds).
+    """
+    total, rounds = initial_total, initial_rounds
+    shape = gross.shape
+    averages, totals, counted = np.empty(shape), np.empty(shape), np.empty(shape)
+    for week, counts in enumerate(counts_for_handicap):
+        total, rounds = handicap.continue_average(total, rounds, gross[:, week], bool(counts),
+                                                  settings['AverageMethod'])
+        averages[:, week] = handicap.current_average(total, rounds)
+        totals[:, week], counted[:, week] = total, rounds
+    handicaps = handicap.handicap_from_average(averages, settings['HandicapMethod'], settings['CoursePar'])
+    return averages, handicaps, totals, counted
+
+
+def replay_season(conn, season_id: str, from_week: Optional[int] = None
+                  ) -> Tuple[Optional[SeasonReplay], str, int]:
+    """
+    Replay a season from `from_week` (None = the start). Returns (replay,
+    mode, from_week); mode is 'incremental' when stored state was reused.
+    """
+    settings = load_settings(conn, season_id)
+    player_ids, initial = load_players(conn, season_id)
+    scored = [(number, counts) for number, scoring, counts, _ in load_weeks(conn, season_id) if scoring]
+    if not player_ids or not scored:
+        return None, 'nothing', from_week or 0
+
+    total, rounds = initial.copy(), np.ones(len(player_ids))
+    mode = 'full'
+    earlier = [number for number, _ in scored if from_week is not None and number < from_week]
+    if earlier:
+        state = stored_state(conn, season_id, earlier[-1], player_ids)
+        if state is not None:
+            (total, rounds), mode = state, 'incremental'
+    if mode == 'full':
+        from_week = scored[0][0]
+
+    replayed = [(number, counts) for number, counts in scored if number >= from_week]
+    week_numbers = np.array([number for number, _ in replayed], dtype=np.int64)
+    gross = load_gross(conn, season_id, player_ids, week_numbers, from_week)
+    # Weeks after the last one with any score have not been played yet
+    played = np.flatnonzero((gross > 0).any(axis=0))
+    last = int(played[-1]) + 1 if len(played) else 0
+    replayed, week_numbers, gross = replayed[:last], week_numbers[:last], gross[:, :last]
+    start_averages = handicap.current_average(total, rounds)
+    averages, handicaps, totals, counted = replay(total, rounds, gross, [c for _, c in replayed], settings)
+    return SeasonReplay(player_ids, week_numbers, averages, handicaps, totals, counted, start_averages), mode, from_week
+
+
+def session_initial_averages(result: SeasonReplay, session_starts: Sequence[int], from_week: int
+                             ) -> List[Tuple[str, int, float]]:
+    """
+    (player, session start, average carried into it) for each session
+    starting after `from_week`: the average after the last replayed week
+    before the start.
+    """
+    rows = []
+    for start in session_starts:
+        if start <= from_week:
+            continue
+        last = int(np.searchsorted(result.week_numbers, start)) - 1
+        averages = result.averages[:, last] if last >= 0 else result.start_averages
+        rows.extend((p, start, float(a)) for p, a in zip(result.player_ids, averages))
+    return rows
+
+
+def write_history(conn, season_id: str, result: SeasonReplay, from_week: int) -> Tuple[int, int, int]:
+    """Merge the replay into "PlayerHandicapHistory"; returns (written, unchanged, deleted)"""
+    p, w = result.averages.shape
+    players = np.repeat(np.arange(p), w)
+    weeks = np.tile(np.arange(w), p)
+    rows = zip((result.player_ids[i] for i in players), result.week_numbers[weeks].tolist(),
+               result.averages.ravel().tolist(), result.handicaps.ravel().tolist(),
+               handicap.round_half_away(result.totals, 2).ravel().tolist(),
+               result.rounds.ravel().astype(int).tolist())
+    staged = stage_rows(conn, HISTORY_STAGING, HISTORY_COLUMNS, rows)
+
+    params = {'season': season_id, 'from_week': from_week}
+    with conn.cursor() as cur:
+        cur.execute(MERGE_HISTORY_SQL, params)
+        written = cur.rowcount
+        cur.execute(DELETE_STALE_SQL, params)
+        deleted = cur.rowcount
+    return written, staged - written, deleted
+
+
+def write_session_averages(conn, season_id: str, rows: Sequence[Tuple[str, int, float]]) -> int:
+    """Upsert PlayerSessionAverages.SessionInitialAverage; returns the rows inserted or changed"""
+    if not rows:
+        return 0
+    stage_rows(conn, SESSION_STAGING, SESSION_COLUMNS, rows)
+    with conn.cursor() as cur:
+        cur.execute(MERGE_SESSION_SQL, {'season': season_id})
+        return cur.rowcount
+
+
+def backfill(conn, tenant: str, season_id: Optional[str] = None, from_week: Optional[int] = None,
+             session_averages: bool = False, dry_run: bool = False) -> Backfill:
+    """Replay one tenant's season and merge it into the history tables (the caller commits)"""
+    from .rollover import latest_season
+
+    require_history_table(conn)
+    season_id = season_id or latest_season(conn)
+    if season_id is None:
+        return Backfill(tenant, mode='nothing', detail='no seasons')
+    with profiling.phase('replay'):
+        result, mode, from_week = replay_season(conn, season_id, from_week)
+    summary = Backfill(tenant, season_id, mode, from_week)
+    if result is None:
+        summary.detail = 'no players or scoring weeks'
+        return summary
+    summary.players, summary.weeks = result.averages.shape
+
+    with profiling.phase('merge'):
+        summary.written, summary.unchanged, summary.deleted = write_history(conn, season_id, result, from_week)
+        if session_averages:
+            starts = [number for number, _, _, session_start in load_weeks(conn, season_id) if session_start]
+            summary.session_averages = write_session_averages(
+                conn, season_id, session_initial_averages(result, starts, from_week if mode == 'incremental' else 0))
+    if dry_run:
+        conn.rollback()
+    return summary
+
+
+def backfill_tenants(tenants: Optional[Sequence[str]] = None, concurrency: int = 8,
+                     connect: Callable = db.connect, **options):
+    """Run backfill() against every tenant, one transaction each; returns the fan-out report"""
+    from .tenants import run_on_tenants
+
+    def run(conn, tenant: str) -> Dict:
+        return asdict(backfill(conn, tenant, **options))
+
+    return run_on_tenants(run, tenants=tenants, concurrency=concurrency, connect=connect)
+
+
+def print_backfills(report, dry_run: bool = False):
+    verb = "Would backfill" if dry_run else "Backfilled"
+    print(f"🏌️  {verb} {len(report.results)} tenant(s) in {report.elapsed_ms:.0f} ms")
+    for r in report.results:
+        if not r.ok:
+            print(f"❌ {r.tenant:<20} {r.error}")
+            continue
+        result = r.result
+        if result['mode'] == 'nothing':
+            print(f"➖ {r.tenant:<20} {result['detail']}")
+            continue
+        sessions = f", session averages {result['session_averages']}" if result['session_averages'] else ''
+        print(f"{'🔍' if dry_run else '✅'} {r.tenant:<20} {result['mode']} from week {result['from_week']}: "
+              f"{result['players']} players × {result['weeks']} weeks, changed {result['written']}, "
+              f"unchanged {result['unchanged']}, deleted {result['deleted']}{sessions}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from .tenants import DEFAULT_CONCURRENCY
+
+    parser = argparse.ArgumentParser(description="Backfill per-week average/handicap history for every tenant")
+    parser.add_argument('--tenant', action='append', help='Tenant to backfill (repeatable, default: all)')
+    parser.add_argument('--season-id', help='Season (default: latest per tenant)')
+    parser.add_argument('--from-week', type=int,
+                        help='Only recompute weeks from N on, resuming from the stored history (default: full replay)')
+    parser.add_argument('--session-averages', action='store_true',
+                        help='Also upsert PlayerSessionAverages for every session start (overwrites manual values)')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change and roll back')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    report = backfill_tenants(args.tenant, args.concurrency, season_id=args.season_id, from_week=args.from_week,
+                              session_averages=args.session_averages, dry_run=args.dry_run)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, default=str))
+    else:
+        print_backfills(report, args.dry_run)
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
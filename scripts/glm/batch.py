@@ -0,0 +1,216 @@
+"""
+Batched INSERT writer for the bulk paths in the admin scripts.
+
+Rows are buffered in memory and flushed with one psycopg2 execute_values
+statement (or one COPY ... FROM STDIN) per batch instead of one
+cursor.execute per row, so a full season of matchups is a handful of
+round trips. Ids are generated client-side with uuid4, the same way the
+scripts already did, so they can be handed back to the caller.
+"""
+
+import io
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from psycopg2.extras import execute_values
+except ImportError:  # Only needed for the Postgres flush paths
+    execute_values = None
+
+DEFAULT_BATCH_SIZE = 1000
+METHODS = ('values', 'copy')
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table/column name the way EF Core created it ("PlayerAId")"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _is_psycopg2(conn) -> bool:
+    conn = getattr(conn, 'wrapped', conn)   # glm.querylog.InstrumentedConnection
+    return execute_values is not None and type(conn).__module__.startswith('psycopg2')
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    text = str(value)
+    return (text.replace('\\', '\\\\')
+                .replace('\t', '\\t')
+                .replace('\n', '\\n')
+                .replace('\r', '\\r'))
+
+
+class BatchWriter:
+    """
+    Accumulate rows for one table and write them in batches.
+
+    Args:
+        conn: Open DB-API connection. psycopg2 connections use execute_values
+            or COPY; anything else falls back to executemany.
+        table: Table name, e.g. "Matchups".
+        columns: Columns for the values passed to add().
+        batch_size: Rows per flushed statement.
+        method: "values" (INSERT ... VALUES via execute_values) or "copy".
+        id_column: Primary key filled with a fresh uuid4 per row. Pass None
+            to leave the key to the database (no ids are returned then).
+        constants: Column -> value applied to every row, e.g. the absence
+            flags on a new matchup.
+
+    The writer never commits; the calling script owns the transaction.
+    """
+
+    def __init__(self, conn, table: str, columns: Sequence[str],
+                 batch_size: int = DEFAULT_BATCH_SIZE, method: str = 'values',
+                 id_column: Optional[str] = 'Id',
+                 constants: Optional[Dict[str, Any]] = None):
+        if method not in METHODS:
+            raise ValueError(f"Unknown batch method: {method} (expected one of {', '.join(METHODS)})")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.conn = conn
+        self.table = table
+        self.batch_size = batch_size
+        self.method = method
+        self.id_column = id_column
+        self.constants = dict(constants or {})
+
+        self._value_columns = list(columns)
+        self.columns = ([id_column] if id_column else []) + self._value_columns + list(self.constants)
+        self._constant_values = tuple(self.constants.values())
+
+        self._rows: List[tuple] = []
+        self._pending_ids: List[str] = []
+        self.ids: List[str] = []
+        self.rows_written = 0
+        self.statements = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self._rows.clear()
+            self._pending_ids.clear()
+        return False
+
+    def add(self, *values) -> Optional[str]:
+        """Queue one row (values in `columns` order) and return its id"""
+        if len(values) != len(self._value_columns):
+            raise ValueError(f"Expected {len(self._value_columns)} values for {self.table}, got {len(values)}")
+
+        row_id = None
+        if self.id_column:
+            row_id = str(uuid.uuid4())
+            self._pending_ids.append(row_id)
+            values = (row_id,) + values
+
+        self._rows.append(tuple(values) + self._constant_values)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+        return row_id
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> List[str]:
+        """Queue many rows and return their ids in order"""
+        return [self.add(*row) for row in rows]
+
+    def flush(self) -> List[str]:
+        """Write every queued row and return the ids that were written"""
+        if not self._rows:
+            return []
+
+        rows, self._rows = self._rows, []
+        ids, self._pending_ids = self._pending_ids, []
+
+        if not _is_psycopg2(self.conn):
+            self._flush_executemany(rows)
+        elif self.method == 'copy':
+            self._flush_copy(rows)
+        else:
+            self._flush_values(rows)
+
+        self.statements += 1
+        self.rows_written += len(rows)
+        self.ids.extend(ids)
+        return ids
+
+    def _column_list(self) -> str:
+        return ', '.join(quote_identifier(c) for c in self.columns)
+
+    def _flush_values(self, rows: List[tuple]):
+        query = f'INSERT INTO {quote_identifier(self.table)} ({self._column_list()}) VALUES %s'
+        with self.conn.cursor() as cur:
+            execute_values(cur, query, rows, page_size=len(rows))
+
+    def _flush_copy(self, rows: List[tuple]):
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(_copy_value(v) for v in row))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        query = f'COPY {quote_identifier(self.table)} ({self._column_list()}) FROM STDIN'
+        with self.conn.cursor() as cur:
+            cur.copy_expert(query, buffer)
+
+    def _flush_executemany(self, rows: List[tuple]):
+        placeholders = ', '.join(['%s'] * len(self.columns))
+        query = f'INSERT INTO {quote_identifier(self.table)} ({self._column_list()}) VALUES ({placeholders})'
+        cur = self.conn.cursor()
+        try:
+            cur.executemany(query, rows)
+        finally:
+            cur.close()
+
+
+def write_rows(conn, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+               **options) -> List[str]:
+    """Write all rows through a BatchWriter and return the generated ids"""
+    with BatchWriter(conn, table, columns, **options) as writer:
+        writer.extend(rows)
+    return writer.ids
+
+
+def stage_rows(conn, table: str, columns: Sequence[Tuple[str, str]], rows: Iterable[Sequence[Any]],
+               **options) -> int:
+    """
+    Load rows into a fresh TEMP table (columns are (name, SQL type)) with
+    COPY, for set-based merges into the real tables; returns the row count.
+    """
+    definition = ', '.join(f'{quote_identifier(name)} {kind}' for name, kind in columns)
+    with conn.cursor() as cur:
+        cur.execute(f'DROP TABLE IF EXISTS {quote_identifier(table)}')
+        cur.execute(f'CREATE TEMP TABLE {quote_identifier(table)} ({definition})')
+    options.setdefault('method', 'copy')
+    with BatchWriter(conn, table, [name for name, _ in columns], id_column=None, **options) as writer:
+        writer.extend(rows)
+    return writer.rows_written
+
+
+# Column values EF Core gives a freshly scheduled matchup
+MATCHUP_COLUMNS = ('WeekId', 'PlayerAId', 'PlayerBId')
+NEW_MATCHUP_DEFAULTS = {
+    'PlayerAScore': None,
+    'PlayerBScore': None,
+    'PlayerAPoints': None,
+    'PlayerBPoints': None,
+    'PlayerAHolePoints': 0,
+    'PlayerBHolePoints': 0,
+    'PlayerAMatchWin': False,
+    'PlayerBMatchWin': False,
+    'PlayerAAbsent': False,
+    'PlayerBAbsent': False,
+    'PlayerAAbsentWithNotice': False,
+    'PlayerBAbsentWithNotice': False,
+}
+
+
+def matchup_writer(conn, **options) -> BatchWriter:
+    """BatchWriter for new "Matchups" rows; add(week_id, player_a_id, player_b_id)"""
+    return BatchWriter(conn, 'Matchups', MATCHUP_COLUMNS, constants=NEW_MATCHUP_DEFAULTS, **options)
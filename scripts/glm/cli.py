@@ -0,0 +1,180 @@
+"""
+Single entry point for the admin tooling: `glm <command> <action> [args]`.
+
+Commands group the existing tools; each action names the module (or
+legacy script) that implements it, and that module is only imported when
+the action runs. `glm --help`, `glm audit --help` and the dispatch itself
+touch nothing but this file, so psycopg2, numpy and requests load only
+for the command that needs them and startup stays in the tens of
+milliseconds.
+
+    schedule  expand | place | generate
+    audit     integrity | standings
+    import    scores | matchups | course
+    rollover  (runs glm.rollover directly)
+    report    projection | fairness | loadtest
+    tenant    fanout | snapshot | backfill | fixture | admin-user
+
+Actions backed by a glm module call its main(argv); actions backed by a
+script under scripts/ run it with runpy and the remaining arguments in
+sys.argv. Those scripts mostly take positional arguments, so -h/--help
+for them is answered here from the action's help line and the script's
+docstring rather than read as a tenant name. Everything else after the
+action is passed through untouched, so
+`glm audit integrity --tenant southmoore --format jsonl` is
+`integrity-scan.py --tenant southmoore --format jsonl`. The profiling
+switches (--profile, --trace-memory, --timings, --diagnostics-out; see
+profiling.py) are taken out first, wherever they appear.
+
+Usage:
+    scripts/bin/glm --help
+    scripts/bin/glm audit integrity --tenant southmoore
+    scripts/bin/glm import scores southmoore backend/Business/Scores.csv --dry-run
+    scripts/bin/glm --timings --profile schedule expand --tenant southmoore --session-start 15
+    python3 -m glm rollover --dry-run                     # from scripts/
+"""
+
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+PROG = 'glm'
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Action(NamedTuple):
+    target: str       # "glm.module" (main(argv)) or a path under scripts/ (run as __main__)
+    help: str
+
+
+class Command(NamedTuple):
+    help: str
+    actions: Dict[str, Action]
+    default: Optional[str] = None   # action run when the command takes no action name
+
+
+COMMANDS: Dict[str, Command] = {
+    'schedule': Command("Build and place season schedules", {
+        'expand': Action('glm.schedule', "Expand a position template across every flight of a session"),
+        'place': Action('glm.placement', "Place a session's players into flights and pick flight leaders"),
+        'generate': Action('database/generate-season-matchups.py', "Generate a whole season's matchups by strategy"),
+    }),
+    'audit': Command("Check tenant data for inconsistencies", {
+        'integrity': Action('glm.integrity', "Scan every tenant for absence, score and assignment problems"),
+        'standings': Action('glm.standings', "Recompute session standings offline and diff against the API"),
+    }),
+    'import': Command("Load CSV data into a tenant", {
+        'scores': Action('glm.scoreimport', "Bulk-import Scores.csv-style hole scores"),
+        'matchups': Action('database/import_matchups_csv.py', "Import matchups from a CSV file"),
+        'course': Action('database/import_southmoore_course.py', "Import the Southmoore course and holes"),
+    }),
+    'rollover': Command("Roll flight assignments into the next session for every tenant", {
+        'run': Action('glm.rollover', "Copy or reseed flight assignments (default action)"),
+    }, default='run'),
+    'report': Command("Simulations and reports", {
+        'projection': Action('glm.projection', "Project flight title, playoff and position odds"),
+        'fairness': Action('glm.fairness', "Compare handicap methods by net match fairness"),
+        'loadtest': Action('glm.loadtest', "Load test the league-night API endpoints"),
+    }),
+    'tenant': Command("Work across tenant databases", {
+        'fanout': Action('glm.tenants', "Run a query or health/session check against every tenant"),
+        'snapshot': Action('glm.snapshot', "Export a tenant to a columnar snapshot"),
+        'backfill': Action('glm.backfill', "Backfill per-week handicap history"),
+        'fixture': Action('glm.fixtures', "Generate a synthetic SQLite league"),
+        'admin-user': Action('database/create-admin-user.py', "Create an admin user in a tenant"),
+    }),
+}
+
+HELP_FLAGS = ('-h', '--help')
+
+
+def _usage(stream=sys.stdout):
+    print(f"usage: {PROG} <command> [<action>] [args...]\n", file=stream)
+    print("Golf League Manager admin tooling. Commands:", file=stream)
+    for name, command in COMMANDS.items():
+        print(f"  {name:<10} {command.help}", file=stream)
+    print(f"\nRun '{PROG} <command> --help' for its actions and "
+          f"'{PROG} <command> <action> --help' for an action's options.", file=stream)
+
+
+def _command_usage(name: str, command: Command, stream=sys.stdout):
+    action = '[<action>]' if command.default else '<action>'
+    print(f"usage: {PROG} {name} {action} [args...]\n", file=stream)
+    print(f"{command.help}. Actions:", file=stream)
+    for action_name, action in command.actions.items():
+        print(f"  {action_name:<12} {action.help}", file=stream)
+
+
+def _script_usage(prog: str, action: Action, stream=sys.stdout):
+    import ast
+
+    path = os.path.join(SCRIPTS_DIR, action.target)
+    print(f"usage: {prog} [args...]\n", file=stream)
+    print(f"{action.help}. Runs scripts/{action.target}.", file=stream)
+    with open(path, encoding='utf-8') as f:
+        doc = ast.get_docstring(ast.parse(f.read(), path))
+    if doc:
+        print(f"\n{doc}", file=stream)
+
+
+def run_action(prog: str, action: Action, argv: List[str]) -> int:
+    """Import (or load) the action's implementation and run it with argv"""
+    if not action.target.startswith('glm.') and any(arg in HELP_FLAGS for arg in argv):
+        _script_usage(prog, action)
+        return 0
+    # argparse names itself after basename(sys.argv[0]); "glm audit integrity" reads right in --help
+    saved = sys.argv
+    sys.argv = [prog] + argv
+    try:
+        if action.target.startswith('glm.'):
+            import importlib
+            return importlib.import_module(action.target).main(argv) or 0
+        import runpy
+        path = os.path.join(SCRIPTS_DIR, action.target)
+        sys.argv[0] = path
+        runpy.run_path(path, run_name='__main__')
+        return 0
+    except SystemExit as exit:
+        code = exit.code
+        if code is None or isinstance(code, int):
+            return code or 0
+        print(code, file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = saved
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import profiling
+
+    options, args = profiling.parse_switches(sys.argv[1:] if argv is None else argv)
+
+    if not args or args[0] in HELP_FLAGS:
+        _usage()
+        return 0 if args else 2
+
+    name, rest = args[0], args[1:]
+    command = COMMANDS.get(name)
+    if command is None:
+        print(f"{PROG}: unknown command '{name}' (choose from {', '.join(COMMANDS)})", file=sys.stderr)
+        return 2
+
+    if rest and rest[0] in command.actions:
+        action_name, rest = rest[0], rest[1:]
+    elif command.default and not (rest and rest[0] in HELP_FLAGS and len(command.actions) > 1):
+        action_name = command.default
+    elif not rest or rest[0] in HELP_FLAGS:
+        _command_usage(name, command)
+        return 0 if rest else 2
+    else:
+        print(f"{PROG} {name}: unknown action '{rest[0]}' (choose from {', '.join(command.actions)})",
+              file=sys.stderr)
+        return 2
+
+    prog = f"{PROG} {name}" if action_name == command.default else f"{PROG} {name} {action_name}"
+    action = command.actions[action_name]
+    return profiling.execute(options, lambda args: run_action(prog, action, args), rest, prog)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
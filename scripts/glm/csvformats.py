@@ -0,0 +1,271 @@
+"""
+Streaming CSV readers with format auto-detection.
+
+Each layout the league's spreadsheets come in is a CsvFormat registered in
+a per-kind registry (MATCHUP_FORMATS, SCORE_FORMATS). read_csv() peeks at the first
+non-empty row, picks the first format whose detect() accepts it (or the
+one named), and yields that format's records one row at a time, so an
+import never holds the whole file. Rows a format cannot use are skipped
+and collected as problems (line, message) on the returned stream.
+
+Matchup layouts:
+
+    header    Week,Player 1,Player 2            (import_matchups_csv.py)
+              1,John Doe,Jane Smith
+    flights   12,July 9,Flight 1,George Hutson vs John Perry
+              (no header; data/Matchupsfromweek12.csv)
+
+Hole-score layouts:
+
+    legacy    Week,Front/Back,First Name,Last Name,Hole 1..Hole 18,Hole Total
+              (backend/Business/Scores.csv; one nine populated per row,
+              hole sum checked against Hole Total)
+
+New layouts are a subclass with detect()/records() registered with
+@register(MATCHUP_FORMATS) (or SCORE_FORMATS).
+"""
+
+import csv
+import re
+from dataclasses import dataclass
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+Row = Tuple[int, List[str]]     # (line number, fields)
+
+_VERSUS = re.compile(r'^(.*?)\s+(?:vs\.?|v\.?)\s+(.*)$', re.IGNORECASE)
+_FLIGHT = re.compile(r'^\s*flight\s+(\S+)\s*$', re.IGNORECASE)
+
+
+class CsvFormatError(ValueError):
+    """The file matches no registered format (or not the one asked for)"""
+
+
+@dataclass
+class MatchupRecord:
+    line: int
+    week: int
+    player1: str
+    player2: str
+    flight: Optional[str] = None
+    date: Optional[str] = None
+
+
+@dataclass
+class HoleScoreRecord:
+    line: int
+    week: int
+    first_name: str
+    last_name: str
+    first_hole: int                 # 1 (front nine) or 10 (back nine)
+    holes: List[Optional[int]]      # 9 scores in hole order, None = blank or 0
+
+    @property
+    def gross(self) -> int:
+        return sum(h for h in self.holes if h)
+
+
+class CsvFormat:
+    """One CSV layout: detect() looks at the first non-empty row, records() parses every row"""
+
+    name = ''
+    description = ''
+
+    def detect(self, first: List[str]) -> bool:
+        raise NotImplementedError
+
+    def records(self, rows: Iterator[Row], problems: List[Tuple[int, str]]) -> Iterator:
+        raise NotImplementedError
+
+
+def register(registry: Dict[str, CsvFormat]):
+    """Class decorator adding a format to a registry (detection tries them in registration order)"""
+    def add(cls):
+        registry[cls.name] = cls()
+        return cls
+    return add
+
+
+def split_versus(text: str) -> Optional[Tuple[str, str]]:
+    """"A vs B" -> ("A", "B")"""
+    match = _VERSUS.match(text.strip())
+    if not match or not match.group(1).strip() or not match.group(2).strip():
+        return None
+    return match.group(1).strip(), match.group(2).strip()
+
+
+MATCHUP_FORMATS: Dict[str, CsvFormat] = {}
+
+
+@register(MATCHUP_FORMATS)
+class HeaderMatchups(CsvFormat):
+    name = 'header'
+    description = 'Week,Player 1,Player 2 with a header row'
+    required = ('week', 'player 1', 'player 2')
+
+    def detect(self, first: List[str]) -> bool:
+        header = {field.strip().lower() for field in first}
+        return all(column in header for column in self.required)
+
+    def records(self, rows: Iterator[Row], problems: List[Tuple[int, str]]) -> Iterator[MatchupRecord]:
+        _, header = next(rows)
+        index = {field.strip().lower(): i for i, field in enumerate(header)}
+        missing = [column for column in self.required if column not in index]
+        if missing:
+            raise CsvFormatError(f"CSV header is missing columns: {', '.join(missing)}")
+        week, first, second = (index[column] for column in self.required)
+        flight = index.get('flight')
+        for line, fields in rows:
+            try:
+                player1, player2 = fields[first].strip(), fields[second].strip()
+                if not player1 or not player2:
+                    problems.append((line, "empty player name"))
+                    continue
+                yield MatchupRecord(line, int(fields[week]), player1, player2,
+                                    fields[flight].strip() if flight is not None and flight < len(fields) else None)
+            except (ValueError, IndexError) as e:
+                problems.append((line, f"invalid row: {e}"))
+
+
+@register(MATCHUP_FORMATS)
+class FlightMatchups(CsvFormat):
+    name = 'flights'
+    description = 'week,date,Flight N,"A vs B" without a header'
+
+    def detect(self, first: List[str]) -> bool:
+        return (len(first) >= 4 and first[0].strip().isdigit() and bool(_FLIGHT.match(first[2]))
+                and split_versus(first[3]) is not None)
+
+    def records(self, rows: Iterator[Row], problems: List[Tuple[int, str]]) -> Iterator[MatchupRecord]:
+        for line, fields in rows:
+            if len(fields) < 4:
+                problems.append((line, f"expected 4 fields, got {len(fields)}"))
+                continue
+            players = split_versus(fields[3])
+            flight = _FLIGHT.match(fields[2])
+            if players is None or not fields[0].strip().isdigit():
+                problems.append((line, f"cannot read {','.join(fields)!r}"))
+                continue
+            yield MatchupRecord(line, int(fields[0]), players[0], players[1],
+                                flight.group(1) if flight else fields[2].strip(), fields[1].strip() or None)
+
+
+SCORE_FORMATS: Dict[str, CsvFormat] = {}
+
+_NINES = {'front': 1, 'back': 10}
+
+
+@register(SCORE_FORMATS)
+class LegacyHoleScores(CsvFormat):
+    name = 'legacy'
+    description = 'Week,Front/Back,First Name,Last Name,Hole 1..Hole 18,Hole Total with a header row'
+    required = ('week', 'first name', 'last name') + tuple(f'hole {n}' for n in range(1, 19)) + ('hole total',)
+
+    def detect(self, first: List[str]) -> bool:
+        header = {field.strip().lower() for field in first}
+        return all(column in header for column in self.required)
+
+    def records(self, rows: Iterator[Row], problems: List[Tuple[int, str]]) -> Iterator[HoleScoreRecord]:
+        _, header = next(rows)
+        index = {field.strip().lower(): i for i, field in enumerate(header)}
+        missing = [column for column in self.required if column not in index]
+        if missing:
+            raise CsvFormatError(f"CSV header is missing columns: {', '.join(missing)}")
+        holes = [index[f'hole {n}'] for n in range(1, 19)]
+        nine_column = index.get('front/back')
+        for line, fields in rows:
+            try:
+                values = [fields[i].strip() if i < len(fields) else '' for i in holes]
+                scores = [int(v) if v else None for v in values]
+                front, back = any(values[:9]), any(values[9:])
+                if front == back:
+                    problems.append((line, "expected exactly one nine of hole scores" if front
+                                     else "no hole scores"))
+                    continue
+                first_hole = 1 if front else 10
+                nine = fields[nine_column].strip().lower() if nine_column is not None else ''
+                if nine and _NINES.get(nine) != first_hole:
+                    problems.append((line, f"Front/Back is {nine!r} but holes {first_hole}-{first_hole + 8} "
+                                           f"are filled in"))
+                    continue
+                if any(s is not None and s < 0 for s in scores):
+                    problems.append((line, "negative hole score"))
+                    continue
+                # Absent players' rows have every hole 0 (Hole Total may still carry a value): no scores
+                absent = not any(scores[first_hole - 1:first_hole + 8])
+                total = int(fields[index['hole total']]) if not absent else 0
+                if sum(s or 0 for s in scores) != total:
+                    problems.append((line, f"hole sum {sum(s or 0 for s in scores)} != Hole Total {total}"))
+                    continue
+                first_name, last_name = fields[index['first name']].strip(), fields[index['last name']].strip()
+                if not first_name and not last_name:
+                    problems.append((line, "empty player name"))
+                    continue
+                yield HoleScoreRecord(line, int(fields[index['week']]), first_name, last_name, first_hole,
+                                      [s or None for s in scores[first_hole - 1:first_hole + 8]])
+            except (ValueError, IndexError) as e:
+                problems.append((line, f"invalid row: {e}"))
+
+
+def _rows(stream: TextIO) -> Iterator[Row]:
+    reader = csv.reader(stream)
+    for fields in reader:
+        if any(field.strip() for field in fields):
+            yield reader.line_num, fields
+
+
+class CsvStream:
+    """
+    Iterable of one format's records from an open file; `problems` fills as
+    it is consumed. Use as a context manager to close a file opened by path.
+    """
+
+    def __init__(self, stream: TextIO, registry: Dict[str, CsvFormat], format: Optional[str] = None,
+                 owns_stream: bool = False):
+        self.problems: List[Tuple[int, str]] = []
+        self._stream = stream
+        self._owns_stream = owns_stream
+        rows = _rows(stream)
+        first = next(rows, None)
+        if first is None:
+            self.close()
+            raise CsvFormatError("CSV file is empty")
+
+        if format is not None:
+            self.format = registry.get(format)
+            if self.format is None:
+                self.close()
+                raise CsvFormatError(f"Unknown format: {format} (expected one of {', '.join(registry)})")
+        else:
+            self.format = next((f for f in registry.values() if f.detect(first[1])), None)
+            if self.format is None:
+                self.close()
+                expected = "; ".join(f"{f.name}: {f.description}" for f in registry.values())
+                raise CsvFormatError(f"Unrecognised CSV layout (first row {','.join(first[1])!r}); "
+                                     f"expected {expected}")
+        self._records = self.format.records(chain([first], rows), self.problems)
+
+    def __iter__(self):
+        return self._records
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._owns_stream:
+            self._stream.close()
+
+
+def read_csv(source: Union[str, TextIO], registry: Dict[str, CsvFormat] = MATCHUP_FORMATS,
+             format: Optional[str] = None) -> CsvStream:
+    """
+    Detect the format of `source` (a path or a text stream); records stream
+    as the result is iterated.
+    """
+    if isinstance(source, str):
+        return CsvStream(open(source, 'r', newline='', encoding='utf-8-sig'), registry, format, owns_stream=True)
+    return CsvStream(source, registry, format)
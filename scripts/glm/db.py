@@ -0,0 +1,39 @@
+"""
+Database connection settings shared by the glm tooling.
+
+Defaults match docker-compose.yml; the usual libpq variables (PGHOST,
+PGPORT, PGUSER, PGPASSWORD) override them.
+"""
+
+import os
+from typing import Optional
+
+# Database connection settings
+DB_CONFIG = {
+    'host': os.environ.get('PGHOST', 'localhost'),
+    'port': int(os.environ.get('PGPORT', 5432)),
+    'user': os.environ.get('PGUSER', 'golfuser'),
+    'password': os.environ.get('PGPASSWORD', 'golfpassword'),
+}
+
+TENANT_PREFIX = 'golfdb_'
+MAINTENANCE_DATABASE = 'postgres'
+
+
+def tenant_database(tenant: str) -> str:
+    """Database name for a tenant ("southmoore" -> "golfdb_southmoore")"""
+    return tenant if tenant.startswith(TENANT_PREFIX) else f"{TENANT_PREFIX}{tenant}"
+
+
+def tenant_name(database: str) -> str:
+    """Tenant name for a database ("golfdb_southmoore" -> "southmoore")"""
+    return database[len(TENANT_PREFIX):] if database.startswith(TENANT_PREFIX) else database
+
+
+def connect(tenant: Optional[str] = None, database: Optional[str] = None, **overrides):
+    """Open a psycopg2 connection to a tenant (or an explicit database)"""
+    import psycopg2
+
+    params = dict(DB_CONFIG, **overrides)
+    params['database'] = database or (tenant_database(tenant) if tenant else MAINTENANCE_DATABASE)
+    return psycopg2.connect(**params)
@@ -0,0 +1,376 @@
+"""
+Handicap-method fairness simulator.
+
+Replays historical seasons under every HandicapCalculationMethod /
+AverageCalculationMethod combination and plays every pair of players who
+were out on the same night head to head, with strokes from each method's
+handicap as of the previous week. A fair method gives the player
+receiving strokes a 50% chance of winning the match (ties count half)
+at every handicap spread.
+
+Reported per method:
+  * receiver win share per stroke difference (1..9)
+  * fairness: match-weighted mean |share - 0.5| over all spreads (lower is fairer)
+  * the same measures over bootstrap resamples, where each player's rounds
+    are redrawn with replacement from their own rounds on the same nine
+    (attendance kept), with a 95% interval
+
+WHS uses differentials as in CalculateAndUpdateCurrentHandicapAsync
+(glm.handicap.whs_history) and ignores the average method, so it is
+listed once. Resamples run vectorized in chunks across a process pool.
+
+Usage:
+    python3 scripts/analysis/handicap-fairness.py --snapshot data/snapshots/southmoore --resamples 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import handicap as handicap_rules
+from .scoring import HOLES, MISSING, PointsRules, hole_arrays, score_matches, stroke_counts
+from .strokes import load_snapshot_course
+
+METHODS: List[Tuple[str, int, int]] = [
+    ('SimpleAverage/Simple', handicap_rules.SIMPLE_AVERAGE, handicap_rules.SIMPLE),
+    ('SimpleAverage/LegacyWeighted', handicap_rules.SIMPLE_AVERAGE, handicap_rules.LEGACY_WEIGHTED),
+    ('LegacyLookupTable/Simple', handicap_rules.LEGACY_LOOKUP_TABLE, handicap_rules.SIMPLE),
+    ('LegacyLookupTable/LegacyWeighted', handicap_rules.LEGACY_LOOKUP_TABLE, handicap_rules.LEGACY_WEIGHTED),
+    ('WHS', handicap_rules.WORLD_HANDICAP_SYSTEM, handicap_rules.SIMPLE),
+]
+SPREADS = HOLES + 1   # stroke differences 0..9 (0 is not scored for fairness)
+# Count columns per (method, spread)
+MATCHES, RECEIVER_WINS, TIES, RECEIVER_POINTS, TOTAL_POINTS = range(5)
+CHUNK_SIZE = 50
+
+
+@dataclass
+class SeasonHistory:
+    """One season's rounds as (players, weeks, 9) hole scores over its CountsForScoring weeks"""
+    season_id: str
+    name: str
+    week_numbers: np.ndarray
+    nines: np.ndarray
+    counts_for_handicap: np.ndarray
+    special: np.ndarray
+    holes: np.ndarray                # (p, w, 9) int16, MISSING where not played
+    initial_average: np.ndarray
+    initial_handicap: np.ndarray
+    stroke_tables: np.ndarray        # CourseStrokeTables.stacked
+    rules: PointsRules = PointsRules()
+    course_par: float = 36
+    course_rating: float = 35.0
+    slope: float = 113.0
+    max_rounds: int = 20
+
+    @property
+    def present(self) -> np.ndarray:
+        """(p, w) complete nine-hole round entered"""
+        return (self.holes >= 0).all(axis=2)
+
+
+@dataclass
+class MethodFairness:
+    method: str
+    matches: int
+    receiver_share: float
+    fairness: float
+    points_share: float
+    share_by_spread: Dict[int, float]
+    bootstrap_share: Optional[float] = None
+    bootstrap_share_interval: Optional[Tuple[float, float]] = None
+    bootstrap_fairness: Optional[float] = None
+    bootstrap_fairness_interval: Optional[Tuple[float, float]] = None
+
+
+@dataclass
+class FairnessReport:
+    seasons: List[str]
+    resamples: int
+    elapsed_seconds: float
+    methods: List[MethodFairness] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def load_histories(snapshot, season_ids: Optional[Sequence[str]] = None) -> List[SeasonHistory]:
+    """Every season (or the given ones) in a glm.snapshot.Snapshot that has hole scores"""
+    tables, _ = load_snapshot_course(snapshot)
+    seasons = snapshot['Seasons']
+    rows = range(len(seasons)) if not season_ids else [seasons.index_of(s) for s in season_ids]
+    names = seasons.text('Name')
+
+    matchups, weeks, players = snapshot['Matchups'], snapshot['Weeks'], snapshot['Players']
+    holes = snapshot['HoleScores']
+    a_holes, b_holes, _ = hole_arrays(holes['MatchupId'], holes['HoleNumber'], holes['HoleHandicap'],
+                                      holes['PlayerAScore'], holes['PlayerBScore'], len(matchups))
+    m_week = np.asarray(matchups['WeekId'])
+    m_players = (np.asarray(matchups['PlayerAId']), np.asarray(matchups['PlayerBId']))
+    settings = snapshot['LeagueSettings']
+    psr = snapshot['PlayerSeasonRecords']
+
+    histories = []
+    for season in rows:
+        if season < 0:
+            raise ValueError("Season is not in the snapshot")
+        week_rows = np.nonzero((np.asarray(weeks['SeasonId']) == season) & np.asarray(weeks['CountsForScoring']))[0]
+        week_rows = week_rows[np.argsort(np.asarray(weeks['WeekNumber'])[week_rows], kind='stable')]
+        slot = np.full(len(weeks), -1)
+        slot[week_rows] = np.arange(len(week_rows))
+
+        in_season = (m_week >= 0) & (slot[np.maximum(m_week, 0)] >= 0)
+        player_rows = np.unique(np.concatenate([side[in_season] for side in m_players]))
+        player_rows = player_rows[player_rows >= 0]
+        position = np.full(len(players), -1)
+        position[player_rows] = np.arange(len(player_rows))
+
+        season_holes = np.full((len(player_rows), len(week_rows), HOLES), MISSING, dtype=np.int16)
+        for side, scores in zip(m_players, (a_holes, b_holes)):
+            keep = in_season & (side >= 0)
+            season_holes[position[side[keep]], slot[m_week[keep]]] = scores[keep]
+        if not (season_holes >= 0).all(axis=2).any():
+            continue
+
+        initial_average = np.nan_to_num(np.asarray(players['InitialAverageScore'], dtype=np.float64)[player_rows])
+        initial_handicap = handicap_rules.average_handicap(initial_average)
+        record_rows = np.nonzero((np.asarray(psr['SeasonId']) == season) & (np.asarray(psr['PlayerId']) >= 0))[0]
+        recorded = position[np.asarray(psr['PlayerId'])[record_rows]]
+        known = recorded >= 0
+        initial_average[recorded[known]] = np.asarray(psr['InitialAverageScore'])[record_rows][known]
+        initial_handicap[recorded[known]] = np.nan_to_num(np.asarray(psr['InitialHandicap'])[record_rows][known])
+
+        history = SeasonHistory(
+            seasons.ids[season], names[season] or '', np.asarray(weeks['WeekNumber'])[week_rows],
+            np.asarray(weeks['NineHoles'])[week_rows], np.asarray(weeks['CountsForHandicap'])[week_rows],
+            np.asarray(weeks['SpecialPointsAwarded'])[week_rows] > 0, season_holes,
+            initial_average, initial_handicap, tables.stacked)
+        setting_rows = np.nonzero(np.asarray(settings['SeasonId']) == season)[0]
+        if len(setting_rows):
+            s = setting_rows[0]
+            history.rules = PointsRules(int(settings['HoleWinPoints'][s]), int(settings['HoleHalvePoints'][s]),
+                                        int(settings['MatchWinBonus'][s]), int(settings['MatchTiePoints'][s]))
+            history.course_par = float(settings['CoursePar'][s])
+            history.course_rating = float(settings['CourseRating'][s])
+            history.slope = float(settings['SlopeRating'][s]) or 113.0
+            history.max_rounds = int(settings['MaxRoundsForHandicap'][s]) or 20
+        histories.append(history)
+    return histories
+
+
+def scoring_handicaps(history: SeasonHistory, holes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Per-method (n, w) handicaps used to score each week, for holes shaped
+    (n, w, 9) (n = resamples x players, flattened).
+
+    Week i uses the handicap as of week i - 1; the first week uses its own,
+    as GetPlayerScoringHandicapAsync does for week 1.
+    """
+    n = holes.shape[0]
+    initial_average = np.resize(history.initial_average, n)
+    initial_handicap = np.resize(history.initial_handicap, n)
+    gross = np.where(holes >= 0, holes, 0).sum(axis=2)
+
+    result = {}
+    for label, handicap_method, average_method in METHODS:
+        if handicap_method == handicap_rules.WORLD_HANDICAP_SYSTEM:
+            as_of = handicap_rules.whs_season_history(initial_handicap, gross, history.counts_for_handicap,
+                                                      history.special, history.course_par, history.course_rating,
+                                                      history.slope, history.max_rounds)
+        else:
+            averages, _, _ = handicap_rules.average_history(initial_average, gross, history.counts_for_handicap,
+                                                            average_method)
+            as_of = handicap_rules.handicap_from_average(averages, handicap_method, history.course_par)
+        previous = np.maximum(np.arange(as_of.shape[1]) - 1, 0)
+        result[label] = as_of[:, previous]
+    return result
+
+
+def evaluate(history: SeasonHistory, holes: np.ndarray) -> np.ndarray:
+    """
+    Head-to-head counts for holes shaped (s, p, w, 9).
+
+    Returns (s, methods, SPREADS, 5) counts: matches, receiver wins, ties,
+    receiver points and total points per stroke difference.
+    """
+    s, p, w, _ = holes.shape
+    counts = np.zeros((s, len(METHODS), SPREADS, 5), dtype=np.int64)
+    handicaps = {label: h.reshape(s, p, w) for label, h in
+                 scoring_handicaps(history, holes.reshape(s * p, w, HOLES)).items()}
+    first, second = np.triu_indices(p, 1)
+    present = (holes >= 0).all(axis=3)
+
+    for week in range(w):
+        if history.special[week]:
+            continue
+        sample, pair = np.nonzero(present[:, first, week] & present[:, second, week])
+        if not len(sample):
+            continue
+        a, b = first[pair], second[pair]
+        a_scores, b_scores = holes[sample, a, week], holes[sample, b, week]
+        for m, (label, _, _) in enumerate(METHODS):
+            strokes, a_receives = stroke_counts(handicaps[label][sample, a, week], handicaps[label][sample, b, week])
+            result = score_matches(a_scores, b_scores, rules=history.rules, strokes=strokes, a_receives=a_receives,
+                                   stroke_holes=history.stroke_tables[history.nines[week], strokes])
+            receiver_wins = np.where(a_receives, result.a_match_win, result.b_match_win)
+            ties = ~result.a_match_win & ~result.b_match_win
+            receiver_points = np.where(a_receives, result.a_points, result.b_points)
+            cell = sample * SPREADS + strokes
+            for column, values in enumerate((None, receiver_wins, ties, receiver_points,
+                                             result.a_points + result.b_points)):
+                totals = np.bincount(cell, values, minlength=s * SPREADS)
+                counts[:, m, :, column] += totals.reshape(s, SPREADS).astype(np.int64)
+    return counts
+
+
+def resample(history: SeasonHistory, rng, resamples: int) -> np.ndarray:
+    """(resamples, p, w, 9) seasons with each round redrawn from the player's rounds on that nine"""
+    present = history.present
+    holes = np.full((resamples,) + history.holes.shape, MISSING, dtype=np.int16)
+    for nine in np.unique(history.nines):
+        weeks = np.nonzero(history.nines == nine)[0]
+        rounds = [history.holes[i, weeks[present[i, weeks]]] for i in range(len(present))]
+        counts = np.array([len(r) for r in rounds])
+        if not counts.any():
+            continue
+        pool = np.zeros((len(rounds), counts.max(), HOLES), dtype=np.int16)
+        for i, r in enumerate(rounds):
+            pool[i, :len(r)] = r
+        picks = (rng.random((resamples, len(rounds), len(weeks))) * counts[None, :, None]).astype(np.int64)
+        drawn = pool[np.arange(len(rounds))[None, :, None], picks]
+        holes[:, :, weeks] = np.where(present[None, :, weeks, None], drawn, MISSING)
+    return holes
+
+
+_worker_histories: Optional[List[SeasonHistory]] = None
+
+
+def _init_worker(histories: List[SeasonHistory]):
+    global _worker_histories
+    _worker_histories = histories
+
+
+def _resample_chunk(args) -> np.ndarray:
+    resamples, seed = args
+    return _simulate(_worker_histories, resamples, seed)
+
+
+def _simulate(histories: List[SeasonHistory], resamples: int, seed) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((resamples, len(METHODS), SPREADS, 5), dtype=np.int64)
+    for start in range(0, resamples, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, resamples - start)
+        for history in histories:
+            counts[start:start + n] += evaluate(history, resample(history, rng, n))
+    return counts
+
+
+def fairness_measures(counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (receiver share, fairness, points share, share by spread) from
+    (..., SPREADS, 5) counts; stroke difference 0 is left out.
+    """
+    scored = counts[..., 1:, :]
+    matches = scored[..., MATCHES]
+    by_spread = (scored[..., RECEIVER_WINS] + scored[..., TIES] / 2) / np.maximum(matches, 1)
+    total_matches = np.maximum(matches.sum(axis=-1), 1)
+    share = (scored[..., RECEIVER_WINS].sum(axis=-1) + scored[..., TIES].sum(axis=-1) / 2) / total_matches
+    fairness = (np.abs(by_spread - 0.5) * matches).sum(axis=-1) / total_matches
+    points = scored[..., RECEIVER_POINTS].sum(axis=-1) / np.maximum(scored[..., TOTAL_POINTS].sum(axis=-1), 1)
+    return share, fairness, points, by_spread
+
+
+def run(histories: List[SeasonHistory], resamples: int = 1000, workers: Optional[int] = None,
+        seed: Optional[int] = None) -> FairnessReport:
+    """Historical replay plus `resamples` bootstrap seasons across a process pool"""
+    start = time.perf_counter()
+    historical = sum(evaluate(h, h.holes[None])[0] for h in histories)
+
+    boot = None
+    if resamples:
+        workers = workers or os.cpu_count() or 1
+        chunks = min(resamples, workers * 4) if workers > 1 else 1
+        sizes = [resamples // chunks + (i < resamples % chunks) for i in range(chunks)]
+        seeds = np.random.SeedSequence(seed).spawn(chunks)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(histories,)) as pool:
+                boot = np.concatenate(list(pool.map(_resample_chunk, zip(sizes, seeds))))
+        else:
+            boot = _simulate(histories, resamples, seeds[0])
+
+    share, fairness, points, by_spread = fairness_measures(historical)
+    report = FairnessReport([h.name or h.season_id for h in histories], resamples, 0.0)
+    if boot is not None:
+        boot_share, boot_fairness, _, _ = fairness_measures(boot)
+    for m, (label, _, _) in enumerate(METHODS):
+        result = MethodFairness(
+            label, int(historical[m, 1:, MATCHES].sum()), round(float(share[m]), 4), round(float(fairness[m]), 4),
+            round(float(points[m]), 4),
+            {spread + 1: round(float(v), 4) for spread, v in enumerate(by_spread[m])
+             if historical[m, spread + 1, MATCHES]})
+        if boot is not None:
+            result.bootstrap_share = round(float(boot_share[:, m].mean()), 4)
+            result.bootstrap_share_interval = tuple(round(float(v), 4)
+                                                    for v in np.percentile(boot_share[:, m], [2.5, 97.5]))
+            result.bootstrap_fairness = round(float(boot_fairness[:, m].mean()), 4)
+            result.bootstrap_fairness_interval = tuple(round(float(v), 4)
+                                                       for v in np.percentile(boot_fairness[:, m], [2.5, 97.5]))
+        report.methods.append(result)
+    report.elapsed_seconds = round(time.perf_counter() - start, 2)
+    return report
+
+
+def print_report(report: FairnessReport):
+    print(f"⚖️  Handicap fairness over {', '.join(report.seasons)} "
+          f"({report.resamples:,} resamples, {report.elapsed_seconds}s)")
+    print("   receiver share = how often the player getting strokes wins (ties half); 50% is fair\n")
+    print(f"   {'method':<34}{'matches':>8}{'share':>8}{'unfair':>8}{'points':>8}   bootstrap share (95%)")
+    for r in sorted(report.methods, key=lambda r: r.fairness):
+        interval = (f"{r.bootstrap_share:.3f} ({r.bootstrap_share_interval[0]:.3f}-"
+                    f"{r.bootstrap_share_interval[1]:.3f})") if r.bootstrap_share is not None else ""
+        print(f"   {r.method:<34}{r.matches:>8}{r.receiver_share:>8.3f}{r.fairness:>8.3f}"
+              f"{r.points_share:>8.3f}   {interval}")
+    print(f"\n   {'share by stroke difference':<34}" + "".join(f"{s:>6}" for s in range(1, SPREADS)))
+    for r in report.methods:
+        print(f"   {r.method:<34}" + "".join(
+            f"{r.share_by_spread[s]:>6.2f}" if s in r.share_by_spread else f"{'-':>6}" for s in range(1, SPREADS)))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import snapshot as snapshots
+
+    parser = argparse.ArgumentParser(description="Compare how close each handicap method gets net matches to 50/50")
+    parser.add_argument('--snapshot', action='append', required=True,
+                        help='Snapshot directory written by snapshot-tenant.py (repeatable)')
+    parser.add_argument('--season-id', action='append', dest='season_ids',
+                        help='Limit to this season (repeatable; default: every season)')
+    parser.add_argument('--resamples', type=int, default=1000, help='Bootstrap seasons (0 = historical only)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores)')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    histories = []
+    for path in args.snapshot:
+        histories.extend(load_histories(snapshots.open_snapshot(path), args.season_ids))
+    if not histories:
+        print("❌ No seasons with hole scores found")
+        return 1
+
+    report = run(histories, args.resamples, args.workers, args.seed)
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
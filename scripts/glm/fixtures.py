@@ -0,0 +1,520 @@
+"""
+In-process stand-in for a tenant database, plus synthetic league generators.
+
+FixtureConnection wraps sqlite3 so code written against psycopg2 runs
+unchanged: %s / %(name)s placeholders are translated, "::type" casts
+are dropped, ILIKE becomes LIKE, NOW() and gen_random_uuid() exist and
+cursors work as context managers. The tables mirror the EF Core schema
+(quoted PascalCase names), so scheduling, import and audit code can be
+run and timed without a PostgreSQL server:
+
+    from glm.fixtures import connect_fixture, generate_league
+
+    conn = connect_fixture()
+    league = generate_league(conn, players=64, flights=8, weeks=21, seed=7)
+"""
+
+import argparse
+import math
+import os
+import random
+import re
+import sqlite3
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .batch import MATCHUP_COLUMNS, NEW_MATCHUP_DEFAULTS, BatchWriter, write_rows
+
+# EF Core tables (column, SQLite type); "Id" TEXT PRIMARY KEY is added to each
+SCHEMA: Dict[str, List[Tuple[str, str]]] = {
+    'Seasons': [('Name', 'TEXT'), ('Year', 'INTEGER'), ('SeasonNumber', 'INTEGER'),
+                ('StartDate', 'TEXT'), ('EndDate', 'TEXT')],
+    'LeagueSettings': [('SeasonId', 'TEXT'), ('LeagueName', 'TEXT'), ('HandicapMethod', 'INTEGER'),
+                       ('AverageMethod', 'INTEGER'), ('LegacyInitialWeight', 'INTEGER'),
+                       ('CoursePar', 'INTEGER'), ('CourseRating', 'REAL'), ('SlopeRating', 'REAL'),
+                       ('MaxRoundsForHandicap', 'INTEGER'), ('ScoringMethod', 'INTEGER'),
+                       ('PointsSystem', 'INTEGER'), ('HoleWinPoints', 'INTEGER'),
+                       ('HoleHalvePoints', 'INTEGER'), ('MatchWinBonus', 'INTEGER'),
+                       ('MatchTiePoints', 'INTEGER'), ('UseSessionHandicaps', 'BOOLEAN'),
+                       ('AllowHandicapUpdates', 'BOOLEAN'), ('CustomRules', 'TEXT'),
+                       ('CreatedDate', 'TEXT'), ('ModifiedDate', 'TEXT')],
+    'Players': [('FirstName', 'TEXT'), ('LastName', 'TEXT'), ('Email', 'TEXT'), ('Phone', 'TEXT'),
+                ('ImageUrl', 'TEXT'), ('InitialHandicap', 'REAL'), ('InitialAverageScore', 'REAL'),
+                ('CurrentAverageScore', 'REAL')],
+    'PlayerSeasonRecords': [('PlayerId', 'TEXT'), ('SeasonId', 'TEXT'), ('InitialAverageScore', 'REAL'),
+                            ('CurrentAverageScore', 'REAL'), ('InitialHandicap', 'REAL'),
+                            ('CurrentHandicap', 'REAL'), ('CreatedAt', 'TEXT'), ('UpdatedAt', 'TEXT')],
+    'PlayerSessionAverages': [('PlayerId', 'TEXT'), ('SeasonId', 'TEXT'),
+                              ('SessionStartWeekNumber', 'INTEGER'), ('SessionInitialAverage', 'REAL'),
+                              ('CreatedDate', 'TEXT'), ('ModifiedDate', 'TEXT')],
+    'PlayerSessionHandicaps': [('PlayerId', 'TEXT'), ('SeasonId', 'TEXT'),
+                               ('SessionStartWeekNumber', 'INTEGER'), ('SessionInitialHandicap', 'REAL'),
+                               ('CreatedDate', 'TEXT'), ('ModifiedDate', 'TEXT')],
+    'PlayerHandicapHistory': [('PlayerId', 'TEXT'), ('SeasonId', 'TEXT'), ('WeekNumber', 'INTEGER'),
+                              ('AverageScore', 'REAL'), ('Handicap', 'REAL'), ('ScoreTotal', 'REAL'),
+                              ('RoundsCounted', 'INTEGER'), ('ComputedAt', 'TEXT')],
+    'Flights': [('Name', 'TEXT'), ('MaxPlayers', 'INTEGER'), ('Description', 'TEXT'),
+                ('IsActive', 'BOOLEAN'), ('CreatedAt', 'TEXT'), ('UpdatedAt', 'TEXT'), ('SeasonId', 'TEXT')],
+    'PlayerFlightAssignments': [('PlayerId', 'TEXT'), ('FlightId', 'TEXT'), ('SeasonId', 'TEXT'),
+                                ('SessionStartWeekNumber', 'INTEGER'), ('IsFlightLeader', 'BOOLEAN'),
+                                ('HandicapAtAssignment', 'REAL'), ('AssignmentDate', 'TEXT')],
+    'Weeks': [('WeekNumber', 'INTEGER'), ('Date', 'TEXT'), ('Name', 'TEXT'), ('IsActive', 'BOOLEAN'),
+              ('CountsForScoring', 'BOOLEAN'), ('CountsForHandicap', 'BOOLEAN'),
+              ('SessionStart', 'BOOLEAN'), ('NineHoles', 'INTEGER'), ('SpecialPointsAwarded', 'INTEGER'),
+              ('SpecialCircumstanceNote', 'TEXT'), ('SeasonId', 'TEXT')],
+    'Matchups': [('WeekId', 'TEXT'), ('PlayerAId', 'TEXT'), ('PlayerBId', 'TEXT'),
+                 ('PlayerAScore', 'INTEGER'), ('PlayerBScore', 'INTEGER'), ('PlayerAPoints', 'INTEGER'),
+                 ('PlayerBPoints', 'INTEGER'), ('PlayerAHolePoints', 'INTEGER'),
+                 ('PlayerBHolePoints', 'INTEGER'), ('PlayerAMatchWin', 'BOOLEAN'),
+                 ('PlayerBMatchWin', 'BOOLEAN'), ('PlayerAAbsent', 'BOOLEAN'), ('PlayerBAbsent', 'BOOLEAN'),
+                 ('PlayerAAbsentWithNotice', 'BOOLEAN'), ('PlayerBAbsentWithNotice', 'BOOLEAN')],
+    'HoleScores': [('MatchupId', 'TEXT'), ('HoleNumber', 'INTEGER'), ('Par', 'INTEGER'),
+                   ('HoleHandicap', 'INTEGER'), ('PlayerAScore', 'INTEGER'), ('PlayerBScore', 'INTEGER'),
+                   ('PlayerAMatchPoints', 'INTEGER'), ('PlayerBMatchPoints', 'INTEGER')],
+    'ScoreEntries': [('PlayerId', 'TEXT'), ('WeekId', 'TEXT'), ('Score', 'INTEGER'),
+                     ('PointsEarned', 'INTEGER')],
+    'Courses': [('Name', 'TEXT'), ('Location', 'TEXT'), ('TotalPar', 'INTEGER'),
+                ('TotalYardage', 'INTEGER'), ('SlopeRating', 'REAL'), ('CourseRating', 'REAL')],
+    'CourseHoles': [('CourseId', 'TEXT'), ('HoleNumber', 'INTEGER'), ('Par', 'INTEGER'),
+                    ('Yardage', 'INTEGER'), ('HandicapIndex', 'INTEGER')],
+    'Users': [('Username', 'TEXT'), ('PasswordHash', 'TEXT'), ('IsAdmin', 'BOOLEAN'), ('PlayerId', 'TEXT')],
+    'LeagueRules': [('SeasonId', 'TEXT'), ('Content', 'TEXT'), ('CreatedAt', 'TEXT'),
+                    ('CreatedBy', 'TEXT'), ('UpdatedAt', 'TEXT'), ('UpdatedBy', 'TEXT')],
+}
+
+# Same indexes EF Core creates for the foreign keys the tooling filters on
+INDEXES = [
+    ('Weeks', ('SeasonId',)),
+    ('Matchups', ('WeekId',)),
+    ('HoleScores', ('MatchupId',)),
+    ('ScoreEntries', ('PlayerId',)),
+    ('PlayerFlightAssignments', ('SeasonId', 'SessionStartWeekNumber')),
+    ('PlayerSeasonRecords', ('PlayerId', 'SeasonId')),
+    ('CourseHoles', ('CourseId',)),
+]
+
+# Unique indexes from AppDbContext that upserts (ON CONFLICT) rely on
+UNIQUE_INDEXES = [
+    ('PlayerSessionAverages', ('PlayerId', 'SeasonId', 'SessionStartWeekNumber')),
+    ('PlayerSessionHandicaps', ('PlayerId', 'SeasonId', 'SessionStartWeekNumber')),
+    ('PlayerHandicapHistory', ('PlayerId', 'SeasonId', 'WeekNumber')),
+]
+
+# Southmoore white tees (scripts/database/import_southmoore_course.py): (hole, par, yardage, handicap)
+SOUTHMOORE_HOLES = [
+    (1, 4, 381, 3), (2, 4, 354, 5), (3, 3, 104, 17), (4, 5, 452, 7), (5, 3, 154, 13),
+    (6, 5, 469, 1), (7, 4, 320, 15), (8, 4, 352, 9), (9, 4, 364, 11),
+    (10, 4, 373, 4), (11, 4, 274, 14), (12, 3, 135, 18), (13, 4, 264, 16), (14, 5, 478, 6),
+    (15, 4, 413, 2), (16, 3, 173, 12), (17, 4, 335, 10), (18, 4, 351, 8),
+]
+
+FIRST_NAMES = ['Adam', 'Ben', 'Chris', 'Dan', 'Ed', 'Frank', 'Greg', 'Hank', 'Ian', 'Jack',
+               'Ken', 'Luke', 'Mark', 'Nick', 'Owen', 'Paul', 'Rob', 'Sam', 'Tom', 'Walt']
+LAST_NAMES = ['Adams', 'Baker', 'Clark', 'Davis', 'Evans', 'Foster', 'Green', 'Harris', 'Irwin',
+              'Jones', 'King', 'Lewis', 'Miller', 'Nash', 'Owens', 'Parker', 'Quinn', 'Reed',
+              'Smith', 'Turner', 'Walker', 'Young']
+
+_PYFORMAT_NAMED = re.compile(r'%\((\w+)\)s')
+_CAST = re.compile(r'::\s*\w+(\[\])?')
+_ILIKE = re.compile(r'\bILIKE\b', re.IGNORECASE)
+
+
+def translate_sql(query: str) -> str:
+    """Rewrite the PostgreSQL dialect used by the scripts into SQLite"""
+    query = _PYFORMAT_NAMED.sub(r':\1', query)
+    query = query.replace('%s', '?').replace('%%', '%')
+    query = _CAST.sub('', query)
+    return _ILIKE.sub('LIKE', query)
+
+
+def _adapt(value):
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _adapt_params(params):
+    if params is None:
+        return ()
+    if isinstance(params, dict):
+        return {k: _adapt(v) for k, v in params.items()}
+    return tuple(_adapt(v) for v in params)
+
+
+class FixtureCursor:
+    """psycopg2-shaped cursor over sqlite3"""
+
+    def __init__(self, connection: 'FixtureConnection'):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def execute(self, query: str, params=None):
+        self.connection.statements += 1
+        self._cursor.execute(translate_sql(query), _adapt_params(params))
+        return self
+
+    def executemany(self, query: str, seq_of_params):
+        self.connection.statements += 1
+        self._cursor.executemany(translate_sql(query), (_adapt_params(p) for p in seq_of_params))
+        return self
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: Optional[int] = None):
+        return self._cursor.fetchmany(size) if size else self._cursor.fetchmany()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def close(self):
+        self._cursor.close()
+
+
+class FixtureConnection:
+    """
+    DB-API connection with the psycopg2 behaviour the scripts rely on.
+
+    `statements` counts every execute/executemany so benchmarks can compare
+    round trips between implementations.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self.raw = sqlite3.connect(path)
+        self.raw.create_function('now', 0, lambda: datetime.now().isoformat())
+        self.raw.create_function('gen_random_uuid', 0, lambda: str(uuid.uuid4()))
+        self.statements = 0
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Like psycopg2: leaving the block ends the transaction but keeps the connection open
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def cursor(self) -> FixtureCursor:
+        return FixtureCursor(self)
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def close(self):
+        self.raw.close()
+        self.closed = True
+
+
+def create_schema(conn: FixtureConnection):
+    """Create every EF Core table (and the foreign key indexes) if missing"""
+    for table, columns in SCHEMA.items():
+        body = ', '.join(['"Id" TEXT PRIMARY KEY'] + [f'"{name}" {kind}' for name, kind in columns])
+        conn.raw.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({body})')
+    for unique, indexes in (('', INDEXES), ('UNIQUE ', UNIQUE_INDEXES)):
+        for table, columns in indexes:
+            name = f'IX_{table}_' + '_'.join(columns)
+            column_list = ', '.join(f'"{c}"' for c in columns)
+            conn.raw.execute(f'CREATE {unique}INDEX IF NOT EXISTS "{name}" ON "{table}" ({column_list})')
+    conn.commit()
+
+
+def connect_fixture(path: str = ':memory:') -> FixtureConnection:
+    """Open a fixture database (in memory by default) with the schema created"""
+    conn = FixtureConnection(path)
+    create_schema(conn)
+    return conn
+
+
+def tenant_connector(directory: str) -> Callable:
+    """
+    A drop-in for db.connect that opens <directory>/golfdb_<tenant>.sqlite3,
+    e.g. tenants.run_on_tenants(sql, tenants=[...], connect=tenant_connector(tmp)).
+    """
+    from . import db
+
+    def connect(tenant: Optional[str] = None, database: Optional[str] = None, **_):
+        name = database or db.tenant_database(tenant or db.MAINTENANCE_DATABASE)
+        return connect_fixture(os.path.join(directory, f'{name}.sqlite3'))
+
+    return connect
+
+
+@dataclass
+class SyntheticLeague:
+    """Ids of everything generate_league() created"""
+    season_id: str
+    course_id: str
+    player_ids: List[str]
+    flight_ids: List[str]
+    week_ids: Dict[int, str]
+    session_starts: List[int]
+    matchup_ids: List[str] = field(default_factory=list)
+    skill: Dict[str, float] = field(default_factory=dict)
+    hole_scores: int = 0
+
+
+def round_robin(players: Sequence[str]) -> List[List[Tuple[str, str]]]:
+    """Circle-method rounds; with an odd count the player paired with None has a bye"""
+    players = list(players)
+    if len(players) % 2:
+        players.append(None)
+    n = len(players)
+    rounds = []
+    for r in range(n - 1):
+        pairs = [(players[i], players[n - 1 - i]) for i in range(n // 2)]
+        rounds.append([(a, b) if r % 2 == 0 else (b, a) for a, b in pairs if a and b])
+        players = [players[0]] + [players[-1]] + players[1:-1]
+    return rounds
+
+
+def _simple_handicap(average: float, course_par: int = 36) -> int:
+    return max(0, min(36, int(Decimal(average - course_par).quantize(Decimal('1'), 'ROUND_HALF_UP'))))
+
+
+def _play_hole(rng: random.Random, par: int, over_par_per_hole: float) -> int:
+    """Gross score for one hole; over_par_per_hole is the player's mean strokes over par"""
+    strokes = par + int(rng.gauss(over_par_per_hole, 0.9) + 0.5)
+    return max(par - 1, min(par + 5, strokes))
+
+
+def _write_scored(played: List[Tuple], handicap: Dict[str, int], holes: Dict[int, Tuple[int, int]],
+                  matchups: BatchWriter, hole_writer: BatchWriter, league: SyntheticLeague):
+    """Score a session's completed matchups in one vectorized pass and queue them"""
+    from .scoring import score_matches, stroke_counts
+    from .strokes import BACK, FRONT, CourseStrokeTables
+
+    tables = CourseStrokeTables({number: handicap for number, (_, handicap) in holes.items()})
+    strokes, a_receives = stroke_counts([handicap[a] for _, a, _, _, _, _ in played],
+                                        [handicap[b] for _, _, b, _, _, _ in played])
+    nines = [FRONT if nine[0] == 1 else BACK for _, _, _, nine, _, _ in played]
+    results = score_matches(
+        [a_holes for _, _, _, _, a_holes, _ in played],
+        [b_holes for _, _, _, _, _, b_holes in played],
+        strokes=strokes, a_receives=a_receives, stroke_holes=tables.allocate(strokes, nines))
+
+    for i, (week_id, a, b, nine, a_holes, b_holes) in enumerate(played):
+        matchup_id = matchups.add(
+            week_id, a, b, sum(a_holes), sum(b_holes),
+            int(results.a_points[i]), int(results.b_points[i]),
+            int(results.a_hole_total[i]), int(results.b_hole_total[i]),
+            bool(results.a_match_win[i]), bool(results.b_match_win[i]), False, False, False, False)
+        league.matchup_ids.append(matchup_id)
+        for j, h in enumerate(nine):
+            hole_writer.add(matchup_id, h, holes[h][0], holes[h][1], a_holes[j], b_holes[j],
+                            int(results.a_hole_points[i, j]), int(results.b_hole_points[i, j]))
+
+
+def generate_league(conn, players: int = 32, flights: int = 4, weeks: int = 20,
+                    session_length: int = 7, scored_weeks: Optional[int] = None,
+                    absence_rate: float = 0.05, seed: int = 0, year: int = 2025,
+                    score: bool = True, batch_size: int = 1000) -> SyntheticLeague:
+    """
+    Populate `conn` with a complete synthetic season.
+
+    Players are split into flights by skill at each session start (weeks
+    1, 1 + session_length, ...), play a round robin inside their flight,
+    and the first `scored_weeks` weeks (default: all) get hole-by-hole
+    scores on alternating front/back nines. With `score` the completed
+    matchups get their match-play points (glm.scoring, using the session's
+    HandicapAtAssignment); matchups with an absence, or everything when
+    `score` is False, are left as entered but not yet recalculated.
+    """
+    rng = random.Random(seed)
+    now = datetime(year, 4, 1, 12, 0, 0)
+    scored_weeks = weeks if scored_weeks is None else scored_weeks
+
+    season_id = str(uuid.uuid4())
+    start = date(year, 4, 2)
+    write_rows(conn, 'Seasons', ('Id', 'Name', 'Year', 'SeasonNumber', 'StartDate', 'EndDate'),
+               [(season_id, str(year), year, 1, start, start + timedelta(weeks=weeks))], id_column=None)
+    write_rows(conn, 'LeagueSettings',
+               ('SeasonId', 'LeagueName', 'HandicapMethod', 'AverageMethod', 'LegacyInitialWeight',
+                'CoursePar', 'CourseRating', 'SlopeRating', 'MaxRoundsForHandicap', 'ScoringMethod',
+                'PointsSystem', 'HoleWinPoints', 'HoleHalvePoints', 'MatchWinBonus', 'MatchTiePoints',
+                'UseSessionHandicaps', 'AllowHandicapUpdates', 'CreatedDate'),
+               [(season_id, 'Synthetic League', 1, 0, 4, 36, 35.0, 113, 20, 0, 0, 2, 1, 2, 1, True, True, now)])
+
+    course_id = write_rows(conn, 'Courses',
+                           ('Name', 'Location', 'TotalPar', 'TotalYardage', 'SlopeRating', 'CourseRating'),
+                           [('Southmoore Golf Course', 'Bath, PA', 71, 5746, 128, 70.4)])[0]
+    write_rows(conn, 'CourseHoles', ('CourseId', 'HoleNumber', 'Par', 'Yardage', 'HandicapIndex'),
+               [(course_id,) + hole for hole in SOUTHMOORE_HOLES])
+    holes = {number: (par, handicap) for number, par, _, handicap in SOUTHMOORE_HOLES}
+
+    # Players, with a hidden skill (expected 9-hole gross) that drives their scores
+    skill: Dict[str, float] = {}
+    with BatchWriter(conn, 'Players', ('FirstName', 'LastName', 'Email', 'Phone', 'InitialHandicap',
+                                       'InitialAverageScore', 'CurrentAverageScore'),
+                     batch_size=batch_size) as writer:
+        for i in range(players):
+            first, last = rng.choice(FIRST_NAMES), LAST_NAMES[i % len(LAST_NAMES)]
+            if i >= len(LAST_NAMES):
+                last = f"{last}{i // len(LAST_NAMES) + 1}"
+            average = round(min(60.0, max(37.0, rng.gauss(46.0, 4.5))), 1)
+            player_id = writer.add(first, last, f"{first.lower()}.{last.lower()}@example.com", None,
+                                   _simple_handicap(average), average, average)
+            skill[player_id] = average
+    player_ids = writer.ids
+
+    write_rows(conn, 'PlayerSeasonRecords',
+               ('PlayerId', 'SeasonId', 'InitialAverageScore', 'CurrentAverageScore', 'InitialHandicap',
+                'CurrentHandicap', 'CreatedAt', 'UpdatedAt'),
+               [(p, season_id, skill[p], skill[p], _simple_handicap(skill[p]), _simple_handicap(skill[p]),
+                 now, now) for p in player_ids], batch_size=batch_size)
+
+    flight_size = math.ceil(players / flights)
+    flight_ids = write_rows(conn, 'Flights',
+                            ('Name', 'MaxPlayers', 'Description', 'IsActive', 'CreatedAt', 'UpdatedAt', 'SeasonId'),
+                            [(f"Flight {i + 1}", flight_size, None, True, now, now, season_id)
+                             for i in range(flights)])
+
+    session_starts = list(range(1, weeks + 1, session_length))
+    week_ids: Dict[int, str] = {}
+    with BatchWriter(conn, 'Weeks', ('WeekNumber', 'Date', 'Name', 'IsActive', 'CountsForScoring',
+                                     'CountsForHandicap', 'SessionStart', 'NineHoles', 'SeasonId'),
+                     batch_size=batch_size) as writer:
+        for week in range(1, weeks + 1):
+            week_ids[week] = writer.add(week, start + timedelta(weeks=week - 1), f"Week {week}", True,
+                                        True, True, week in session_starts, 1 if week % 2 else 2, season_id)
+
+    league = SyntheticLeague(season_id, course_id, player_ids, flight_ids, week_ids, session_starts,
+                             skill=skill)
+
+    assignments = BatchWriter(conn, 'PlayerFlightAssignments',
+                              ('PlayerId', 'FlightId', 'SeasonId', 'SessionStartWeekNumber',
+                               'IsFlightLeader', 'HandicapAtAssignment', 'AssignmentDate'),
+                              batch_size=batch_size)
+    matchups = BatchWriter(conn, 'Matchups', MATCHUP_COLUMNS + tuple(NEW_MATCHUP_DEFAULTS),
+                           batch_size=batch_size)
+    hole_writer = BatchWriter(conn, 'HoleScores',
+                              ('MatchupId', 'HoleNumber', 'Par', 'HoleHandicap', 'PlayerAScore',
+                               'PlayerBScore', 'PlayerAMatchPoints', 'PlayerBMatchPoints'),
+                              batch_size=batch_size)
+
+    with assignments, matchups, hole_writer:
+        for s, session_start in enumerate(session_starts):
+            session_end = session_starts[s + 1] if s + 1 < len(session_starts) else weeks + 1
+            # Re-flight every session on current form, with a little noise
+            ranked = sorted(player_ids, key=lambda p: skill[p] + rng.uniform(-1.5, 1.5))
+            groups = [ranked[i * flight_size:(i + 1) * flight_size] for i in range(flights)]
+            handicap = {p: _simple_handicap(skill[p]) for p in player_ids}
+            played: List[Tuple] = []
+
+            for flight_id, group in zip(flight_ids, groups):
+                for position, player_id in enumerate(group):
+                    assignments.add(player_id, flight_id, season_id, session_start, position == 0,
+                                    float(handicap[player_id]), now)
+
+                rounds = round_robin(group)
+                for offset, week in enumerate(range(session_start, session_end)):
+                    week_id = week_ids[week]
+                    nine = range(1, 10) if week % 2 else range(10, 19)
+                    for a, b in rounds[offset % len(rounds)] if rounds else []:
+                        if week > scored_weeks:
+                            league.matchup_ids.append(
+                                matchups.add(week_id, a, b, *NEW_MATCHUP_DEFAULTS.values()))
+                            continue
+
+                        a_absent = rng.random() < absence_rate
+                        b_absent = rng.random() < absence_rate
+                        a_holes = [None if a_absent else _play_hole(rng, holes[h][0], (skill[a] - 36) / 9)
+                                   for h in nine]
+                        b_holes = [None if b_absent else _play_hole(rng, holes[h][0], (skill[b] - 36) / 9)
+                                   for h in nine]
+                        if score and not (a_absent or b_absent):
+                            played.append((week_id, a, b, nine, a_holes, b_holes))
+                            continue
+
+                        matchup_id = matchups.add(
+                            week_id, a, b,
+                            None if a_absent else sum(a_holes), None if b_absent else sum(b_holes),
+                            None, None, 0, 0, False, False, a_absent, b_absent,
+                            a_absent and rng.random() < 0.5, b_absent and rng.random() < 0.5)
+                        league.matchup_ids.append(matchup_id)
+                        for h, a_score, b_score in zip(nine, a_holes, b_holes):
+                            hole_writer.add(matchup_id, h, holes[h][0], holes[h][1], a_score, b_score, 0, 0)
+
+            if played:
+                _write_scored(played, handicap, holes, matchups, hole_writer, league)
+
+            # Drift skill a little between sessions so flights change
+            for player_id in player_ids:
+                skill[player_id] = min(60.0, max(36.0, skill[player_id] + rng.gauss(0, 0.6)))
+
+    league.hole_scores = hole_writer.rows_written
+    conn.commit()
+    return league
+
+
+def table_counts(conn) -> Dict[str, int]:
+    """Row count of every fixture table"""
+    counts = {}
+    with conn.cursor() as cur:
+        for table in SCHEMA:
+            cur.execute(f'SELECT COUNT(*) FROM "{table}"')
+            counts[table] = cur.fetchone()[0]
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic league into a SQLite fixture database")
+    parser.add_argument('--out', default=':memory:', help='SQLite file to write (default: in memory, timing only)')
+    parser.add_argument('--players', type=int, default=32)
+    parser.add_argument('--flights', type=int, default=4)
+    parser.add_argument('--weeks', type=int, default=20)
+    parser.add_argument('--session-length', type=int, default=7)
+    parser.add_argument('--scored-weeks', type=int, help='Weeks with hole scores (default: all)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    conn = connect_fixture(args.out)
+    try:
+        generate_league(conn, players=args.players, flights=args.flights, weeks=args.weeks,
+                        session_length=args.session_length, scored_weeks=args.scored_weeks, seed=args.seed)
+        elapsed = time.perf_counter() - start
+        for table, count in table_counts(conn).items():
+            if count:
+                print(f"   {table:<25} {count:>8}")
+        print(f"✅ Generated in {elapsed:.2f}s with {conn.statements} statements ({args.out})")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,384 @@
+"""
+Average-score and handicap rules (mirrors AverageScoreService and
+HandicapService.GetPlayerHandicapUpToWeekAsync), vectorized over players.
+
+  * SimpleAverage average: (initial + sum of scores) / (1 + rounds), over
+    CountsForHandicap weeks with a score > 0, rounded to 2 places
+  * LegacyWeighted average: the initial average counts as one week and a
+    non-handicap week adds the running average as a phantom score
+  * handicap: round(average - par) away from zero, capped 0..36, for
+    SimpleAverage and (as in the live scoring path) WorldHandicapSystem;
+    LegacyLookupTable maps the truncated average through the old table
+  * WorldHandicapSystem index: best k of the last MaxRoundsForHandicap
+    differentials, kept in a per-player order-statistics tree
+  * matches are scored with the handicap as of the previous week
+
+Scores are 9-hole gross totals; 0 means no score that week.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+# HandicapCalculationMethod
+WORLD_HANDICAP_SYSTEM, SIMPLE_AVERAGE, LEGACY_LOOKUP_TABLE = 0, 1, 2
+# AverageCalculationMethod
+SIMPLE, LEGACY_WEIGHTED = 0, 1
+
+HANDICAP_METHODS = {WORLD_HANDICAP_SYSTEM: 'WHS', SIMPLE_AVERAGE: 'SimpleAverage',
+                    LEGACY_LOOKUP_TABLE: 'LegacyLookupTable'}
+AVERAGE_METHODS = {SIMPLE: 'Simple', LEGACY_WEIGHTED: 'LegacyWeighted'}
+
+MIN_HANDICAP, MAX_HANDICAP = 0, 36
+
+# HandicapService.CalculateHandicapFromLookupTable: truncated average -> handicap
+LEGACY_LOOKUP: Dict[int, int] = {
+    36: 0, 37: 1, 38: 2, 39: 3, 40: 4, 41: 5, 42: 5, 43: 6, 44: 6, 45: 7, 46: 7, 47: 8,
+    48: 9, 49: 10, 50: 11, 51: 11, 52: 12, 53: 13, 54: 13, 55: 14, 56: 14, 57: 15,
+    58: 16, 59: 17, 60: 17,
+}
+LEGACY_MIN_AVERAGE, LEGACY_MAX_AVERAGE, LEGACY_MAX_HANDICAP = 36, 61, 18
+
+
+def lookup_boundaries(table: Dict[int, int], min_average: int = LEGACY_MIN_AVERAGE,
+                      max_average: int = LEGACY_MAX_AVERAGE, max_handicap: int = LEGACY_MAX_HANDICAP
+                      ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    A whole-number lookup table as sorted step boundaries: handicaps[i] is
+    the handicap for averages in [boundaries[i - 1], boundaries[i]).
+    Averages at or below min_average get handicaps[0] = 0, from max_average
+    up max_handicap; whole numbers missing from the table also get it.
+    """
+    steps = {a: table.get(a, max_handicap) for a in range(min_average + 1, max_average)}
+    steps[max_average] = max_handicap
+    boundaries, handicaps = [], [0]
+    for average in sorted(steps):
+        if steps[average] != handicaps[-1]:
+            boundaries.append(average)
+            handicaps.append(steps[average])
+    return np.array(boundaries, dtype=np.float64), np.array(handicaps, dtype=np.int16)
+
+
+# 18 boundaries for the 19 handicaps 0..18
+LEGACY_BOUNDARIES, LEGACY_HANDICAPS = lookup_boundaries(LEGACY_LOOKUP)
+
+
+def round_half_away(values, decimals: int = 0):
+    """Math.Round(x, decimals, MidpointRounding.AwayFromZero) for floats or arrays"""
+    scale = 10.0 ** decimals
+    scaled = np.round(np.asarray(values, dtype=np.float64) * scale, 6)
+    return np.sign(scaled) * np.floor(np.abs(scaled) + 0.5) / scale
+
+
+def effective_par(course_par: float) -> float:
+    """An 18-hole par (> 45) is halved for 9-hole play"""
+    return course_par / 2.0 if course_par > 45 else float(course_par)
+
+
+def average_handicap(average, course_par: float = 36):
+    """SimpleAverage (and WHS fallback) handicap: average - par, rounded and capped"""
+    handicap = round_half_away(np.asarray(average, dtype=np.float64) - effective_par(course_par))
+    return np.clip(handicap, MIN_HANDICAP, MAX_HANDICAP)
+
+
+def lookup_table_handicap(average, boundaries: np.ndarray = LEGACY_BOUNDARIES,
+                          handicaps: np.ndarray = LEGACY_HANDICAPS):
+    """
+    LegacyLookupTable handicap for any shape of averages. The backend
+    truncates the average, and trunc(a) >= b exactly when a >= b for whole
+    boundaries, so one searchsorted over the raw averages is the lookup.
+    """
+    average = np.asarray(average, dtype=np.float64)
+    return handicaps[np.searchsorted(boundaries, average, side='right')].astype(np.float64)
+
+
+def handicap_from_average(average, method: int = SIMPLE_AVERAGE, course_par: float = 36):
+    """Handicap for an average under a HandicapCalculationMethod"""
+    if method == LEGACY_LOOKUP_TABLE:
+        return lookup_table_handicap(average)
+    if method in (SIMPLE_AVERAGE, WORLD_HANDICAP_SYSTEM):
+        return average_handicap(average, course_par)
+    raise ValueError(f"Unknown handicap method: {method}")
+
+
+def average_history(initial, scores, counts_for_handicap, method: int = SIMPLE
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Week-by-week averages for many players at once.
+
+    Args:
+        initial: (p,) initial average per player.
+        scores: (p, w) gross per CountsForScoring week in week order, 0 = none.
+        counts_for_handicap: (w,) Week.CountsForHandicap.
+        method: AverageCalculationMethod.
+
+    Returns (averages, total, rounds): averages[:, i] is the average up to
+    and including week i; total/rounds are the running state after the
+    last week, so continue_average() can extend it.
+    """
+    initial = np.asarray(initial, dtype=np.float64)
+    scores = np.asarray(scores, dtype=np.float64).reshape(len(initial), -1)
+    total = initial.copy()
+    rounds = np.ones(len(initial))
+    averages = np.empty(scores.shape)
+    for week, counts in enumerate(np.asarray(counts_for_handicap, dtype=bool)):
+        total, rounds = continue_average(total, rounds, scores[:, week], bool(counts), method)
+        averages[:, week] = current_average(total, rounds)
+    return averages, total, rounds
+
+
+def continue_average(total, rounds, score, counts_for_handicap: bool, method: int = SIMPLE):
+    """Advance (total, rounds) by one week; score 0 = no score"""
+    score = np.asarray(score, dtype=np.float64)
+    if counts_for_handicap:
+        played = score > 0
+        return total + np.where(played, score, 0), rounds + played
+    if method == LEGACY_WEIGHTED:
+        # Phantom week at the running average
+        return round_half_away(total + current_average(total, rounds), 2), rounds + 1
+    return total, rounds
+
+
+def current_average(total, rounds):
+    return round_half_away(np.asarray(total) / np.asarray(rounds), 2)
+
+
+def differentials_to_use(count):
+    """HandicapService.GetDifferentialsCount, vectorized"""
+    count = np.asarray(count)
+    return np.select([count >= 20, count == 19, count >= 17, count >= 15, count >= 12, count >= 9,
+                      count >= 6, count >= 3], [8, 7, 6, 5, 4, 3, 2, 1], 0)
+
+
+def whs_index(rounds, counts, course_rating: float = 35.0, slope: float = 113.0):
+    """
+    HandicapService.CalculateHandicapIndex for many players.
+
+    rounds is (p, r) gross scores padded with NaN after each player's
+    `counts` rounds. The lowest differentials are averaged, times 0.96,
+    rounded to a whole number and capped 0..36; 0 below three rounds.
+    """
+    differentials = (np.asarray(rounds, dtype=np.float64) - int(course_rating)) * 113.0 / slope
+    ordered = np.sort(np.where(np.isnan(differentials), np.inf, differentials), axis=1)
+    use = differentials_to_use(counts)
+    best = np.arange(ordered.shape[1])[None, :] < use[:, None]
+    mean = np.where(best, ordered, 0).sum(axis=1) / np.maximum(use, 1)
+    return np.where(use > 0, np.clip(round_half_away(mean * 0.96), MIN_HANDICAP, MAX_HANDICAP), 0.0)
+
+
+class LowestRounds:
+    """
+    Order-statistics tree over whole-stroke rounds, one per player, for
+    HandicapService's "best k of the last n" without re-sorting.
+
+    Each player has a Fenwick tree of round counts and stroke sums indexed
+    by gross score. A differential is increasing in the score, so the k
+    lowest differentials are the k lowest rounds. add(), remove() and
+    lowest_sum() are O(log V) (V = highest score + 1) and vectorized over
+    players: every call touches one round per listed player.
+    """
+
+    def __init__(self, players: int, max_score: int):
+        self.size = 1 << int(max(int(max_score) + 1, 1)).bit_length()
+        self.counts = np.zeros((players, self.size + 1), dtype=np.int32)
+        self.sums = np.zeros((players, self.size + 1), dtype=np.int64)
+        self.total = np.zeros(players, dtype=np.int64)
+
+    def _update(self, players, scores, sign: int):
+        players = np.asarray(players, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.int64)
+        if scores.size and (scores.min() < 0 or scores.max() >= self.size):
+            raise ValueError(f"Round scores must be whole strokes in 0..{self.size - 1}")
+        self.total[players] += sign
+        index = scores + 1
+        while len(index):
+            self.counts[players, index] += sign
+            self.sums[players, index] += sign * scores
+            index = index + (index & -index)
+            inside = index <= self.size
+            players, scores, index = players[inside], scores[inside], index[inside]
+
+    def add(self, players, scores):
+        self._update(players, scores, 1)
+
+    def remove(self, players, scores):
+        self._update(players, scores, -1)
+
+    def lowest_sum(self, players, k) -> np.ndarray:
+        """Sum of each listed player's k lowest rounds (k <= that player's round count)"""
+        players = np.asarray(players, dtype=np.int64)
+        remaining = np.asarray(k, dtype=np.int64) * np.ones(len(players), dtype=np.int64)
+        position = np.zeros(len(players), dtype=np.int64)
+        total = np.zeros(len(players), dtype=np.int64)
+        step = self.size
+        while step:
+            candidate = position + step
+            take = (candidate <= self.size) & (self.counts[players, np.minimum(candidate, self.size)] < remaining)
+            remaining = remaining - np.where(take, self.counts[players, np.minimum(candidate, self.size)], 0)
+            total = total + np.where(take, self.sums[players, np.minimum(candidate, self.size)], 0)
+            position = np.where(take, candidate, position)
+            step >>= 1
+        # position is the highest score below the k-th lowest round, so the rest score `position`
+        return total + remaining * position
+
+
+def _whs_from_lowest(lowest_sum, use, course_rating: float, slope: float):
+    """CalculateHandicapIndex from the sum of the `use` lowest rounds"""
+    use = np.asarray(use)
+    mean = (np.asarray(lowest_sum, dtype=np.float64) - use * int(course_rating)) * 113.0 / slope / np.maximum(use, 1)
+    return np.where(use > 0, np.clip(round_half_away(mean * 0.96), MIN_HANDICAP, MAX_HANDICAP), 0.0)
+
+
+def whs_history(initial_handicap, scores, counts_for_handicap, course_par: float = 36,
+                course_rating: float = 35.0, slope: float = 113.0, max_rounds: int = 20) -> np.ndarray:
+    """
+    Week-by-week WHS handicap (CalculateAndUpdateCurrentHandicapAsync over
+    GetRecentPlayerScoresForSeasonAsync's rounds) for many players.
+
+    scores is (p, w) gross per CountsForScoring, non-special week, 0 = none.
+    A non-handicap week adds the last valid handicap + CoursePar as a
+    round. Players keep their initial handicap until they have three
+    rounds (the backend returns 0 there, which would dominate early weeks).
+
+    One pass over the weeks: every round goes into a LowestRounds over all
+    of the player's rounds (the valid handicap) and one over the last
+    max_rounds (the index), so each week is O(p log V) instead of a sort.
+    """
+    initial_handicap = np.asarray(initial_handicap, dtype=np.float64)
+    scores = np.rint(np.asarray(scores, dtype=np.float64).reshape(len(initial_handicap), -1)).astype(np.int64)
+    p, weeks = scores.shape
+    highest = max(int(scores.max(initial=0)), int(MAX_HANDICAP + course_par))
+    every, window = LowestRounds(p, highest), LowestRounds(p, highest)
+    rounds = np.zeros((p, weeks), dtype=np.int64)
+    count = np.zeros(p, dtype=np.int64)
+    valid = initial_handicap.copy()
+    history = np.empty((p, weeks))
+    players = np.arange(p)
+
+    for week, counts in enumerate(np.asarray(counts_for_handicap, dtype=bool)):
+        if counts:
+            rows = players[scores[:, week] > 0]
+            new = scores[rows, week]
+        else:
+            rows = players
+            new = np.trunc(valid + course_par).astype(np.int64)
+        rounds[rows, count[rows]] = new
+        every.add(rows, new)
+        window.add(rows, new)
+        leaving = rows[count[rows] >= max_rounds]
+        window.remove(leaving, rounds[leaving, count[leaving] - max_rounds])
+        count[rows] += 1
+
+        if counts:
+            refresh = rows[count[rows] >= 3]
+            use = differentials_to_use(count[refresh])
+            valid[refresh] = _whs_from_lowest(every.lowest_sum(refresh, use), use, course_rating, slope)
+
+        windowed = np.minimum(count, max_rounds)
+        use = differentials_to_use(windowed)
+        index = _whs_from_lowest(window.lowest_sum(players, use), use, course_rating, slope)
+        history[:, week] = np.where(windowed >= 3, index, initial_handicap)
+    return history
+
+
+def whs_season_history(initial_handicap, scores, counts_for_handicap, special, course_par: float = 36,
+                       course_rating: float = 35.0, slope: float = 113.0, max_rounds: int = 20) -> np.ndarray:
+    """
+    whs_history over every CountsForScoring week: special-points weeks are
+    left out of the rounds and carry the previous week's index over.
+    """
+    initial_handicap = np.asarray(initial_handicap, dtype=np.float64)
+    regular = ~np.asarray(special, dtype=bool)
+    as_of = whs_history(initial_handicap, np.asarray(scores)[:, regular], np.asarray(counts_for_handicap)[regular],
+                        course_par, course_rating, slope, max_rounds)
+    carried = np.cumsum(regular) - 1
+    return np.where(carried >= 0, as_of[:, np.maximum(carried, 0)], initial_handicap[:, None])
+
+
+def snapshot_weekly_gross(snapshot, season_row: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (players, weeks) gross totals from HoleScores for one season of a
+    glm.snapshot.Snapshot, over its CountsForScoring weeks in week order.
+    Returns (gross, week_rows); players are the snapshot's Players rows.
+    """
+    weeks = snapshot['Weeks']
+    week_rows = np.nonzero((np.asarray(weeks['SeasonId']) == season_row) & np.asarray(weeks['CountsForScoring']))[0]
+    week_rows = week_rows[np.argsort(np.asarray(weeks['WeekNumber'])[week_rows], kind='stable')]
+    slot = np.full(len(weeks), -1)
+    slot[week_rows] = np.arange(len(week_rows))
+
+    matchups, holes = snapshot['Matchups'], snapshot['HoleScores']
+    m_week = np.asarray(matchups['WeekId'])
+    h_matchup = np.asarray(holes['MatchupId'])
+    valid = h_matchup >= 0
+    h_matchup = h_matchup[valid]
+    h_slot = np.where(m_week[h_matchup] >= 0, slot[m_week[h_matchup]], -1)
+
+    gross = np.zeros((len(snapshot['Players']), len(week_rows)))
+    for side, player_column in (('PlayerAScore', 'PlayerAId'), ('PlayerBScore', 'PlayerBId')):
+        score = np.asarray(holes[side])[valid]
+        player = np.asarray(matchups[player_column])[h_matchup]
+        keep = (h_slot >= 0) & (score > 0) & (player >= 0)
+        np.add.at(gross, (player[keep], h_slot[keep]), score[keep])
+    return gross, week_rows
+
+
+def snapshot_initial_averages(snapshot, season_row: int) -> np.ndarray:
+    """PlayerSeasonRecords.InitialAverageScore per Players row, falling back to Players.InitialAverageScore"""
+    players, records = snapshot['Players'], snapshot['PlayerSeasonRecords']
+    initial = np.nan_to_num(np.asarray(players['InitialAverageScore'], dtype=np.float64))
+    rows = np.nonzero((np.asarray(records['SeasonId']) == season_row) & (np.asarray(records['PlayerId']) >= 0))[0]
+    initial[np.asarray(records['PlayerId'])[rows]] = np.asarray(records['InitialAverageScore'])[rows]
+    return initial
+
+
+def snapshot_settings(snapshot, season_row: int) -> Dict:
+    """The season's LeagueSettings row as a dict (LeagueSettings defaults when missing)"""
+    settings = snapshot['LeagueSettings']
+    rows = np.nonzero(np.asarray(settings['SeasonId']) == season_row)[0]
+    result = {'HandicapMethod': SIMPLE_AVERAGE, 'AverageMethod': SIMPLE, 'CoursePar': 36, 'CourseRating': 35.0,
+              'SlopeRating': 113.0, 'MaxRoundsForHandicap': 20, 'HoleWinPoints': 2, 'HoleHalvePoints': 1,
+              'MatchWinBonus': 2, 'MatchTiePoints': 1}
+    if len(rows):
+        for column in result:
+            result[column] = type(result[column])(settings[column][rows[0]])
+    return result
+
+
+def snapshot_initial_handicaps(snapshot, season_row: int) -> np.ndarray:
+    """PlayerSeasonRecords.InitialHandicap per Players row, else the handicap of the initial average"""
+    records = snapshot['PlayerSeasonRecords']
+    initial = average_handicap(snapshot_initial_averages(snapshot, season_row),
+                               snapshot_settings(snapshot, season_row)['CoursePar'])
+    rows = np.nonzero((np.asarray(records['SeasonId']) == season_row) & (np.asarray(records['PlayerId']) >= 0))[0]
+    initial[np.asarray(records['PlayerId'])[rows]] = np.nan_to_num(np.asarray(records['InitialHandicap'])[rows])
+    return initial
+
+
+def snapshot_whs_history(snapshot, season_row: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (history, week_rows): the WHS index after every CountsForScoring week
+    for every Players row of a season, in one pass.
+    """
+    settings = snapshot_settings(snapshot, season_row)
+    gross, week_rows = snapshot_weekly_gross(snapshot, season_row)
+    weeks = snapshot['Weeks']
+    special = np.nan_to_num(np.asarray(weeks['SpecialPointsAwarded'], dtype=np.float64))[week_rows] > 0
+    history = whs_season_history(snapshot_initial_handicaps(snapshot, season_row), gross,
+                                 np.asarray(weeks['CountsForHandicap'])[week_rows], special,
+                                 settings['CoursePar'], settings['CourseRating'],
+                                 settings['SlopeRating'] or 113.0, settings['MaxRoundsForHandicap'] or 20)
+    return history, week_rows
+
+
+def snapshot_averages(snapshot, season_row: int, up_to_week: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(average, handicap) per Players row as of `up_to_week`, under the season's settings"""
+    settings = snapshot_settings(snapshot, season_row)
+    gross, week_rows = snapshot_weekly_gross(snapshot, season_row)
+    weeks = snapshot['Weeks']
+    included = np.asarray(weeks['WeekNumber'])[week_rows] <= up_to_week
+    _, total, rounds = average_history(snapshot_initial_averages(snapshot, season_row), gross[:, included],
+                                       np.asarray(weeks['CountsForHandicap'])[week_rows][included],
+                                       settings['AverageMethod'])
+    average = current_average(total, rounds)
+    return average, handicap_from_average(average, settings['HandicapMethod'], settings['CoursePar'])
@@ -0,0 +1,275 @@
+"""
+Rule-based integrity scanner for matchups, hole scores and assignments.
+
+Every check is a set-based SQL branch; the selected branches are UNIONed
+into a single statement so each tenant is scanned in one pass, and
+tenants are scanned concurrently through glm.tenants. Findings are
+streamed to the report as they are fetched.
+
+Checks:
+    absent_with_score           absent player with a gross score or hole scores (the debug_jay.py case)
+    notice_without_absence      AbsentWithNotice set while Absent is not
+    absence_points              absent player's points differ from MatchPlayService's rule
+                                (special week, even one worth 0: special / 2; notice: notice points; else 0)
+    hole_total_mismatch         sum of hole scores differs from the matchup's gross score
+    missing_hole_rows           scored matchup without 9 distinct hole rows
+    wrong_nine                  hole rows outside the week's front/back nine
+    duplicate_week_assignment   player in more than one matchup in the same week
+    duplicate_flight_assignment player assigned to more than one flight for the same session
+    duplicate_week              same week number twice in a season
+
+Usage:
+    python3 scripts/database/integrity-scan.py                     # every tenant
+    python3 scripts/database/integrity-scan.py --tenant southmoore --format jsonl --output scan.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, Optional, Sequence, TextIO
+
+from . import db
+
+FETCH_SIZE = 500
+
+# Shared building blocks: one row per matchup side, and hole aggregates per matchup
+BASE_CTES = '''
+    sides AS (
+        SELECT m."Id" AS matchup_id, w."Id" AS week_id, w."WeekNumber" AS week_number,
+               w."SeasonId" AS season_id, w."NineHoles" AS nine, w."SpecialPointsAwarded" AS special,
+               'A' AS side, m."PlayerAId" AS player_id, m."PlayerAScore" AS gross,
+               m."PlayerAPoints" AS points, m."PlayerAAbsent" AS absent,
+               m."PlayerAAbsentWithNotice" AS notice
+        FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+        UNION ALL
+        SELECT m."Id", w."Id", w."WeekNumber", w."SeasonId", w."NineHoles", w."SpecialPointsAwarded",
+               'B', m."PlayerBId", m."PlayerBScore", m."PlayerBPoints", m."PlayerBAbsent",
+               m."PlayerBAbsentWithNotice"
+        FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+    ),
+    holes AS (
+        SELECT h."MatchupId" AS matchup_id, COUNT(DISTINCT h."HoleNumber") AS distinct_holes,
+               MIN(h."HoleNumber") AS first_hole, MAX(h."HoleNumber") AS last_hole,
+               SUM(h."PlayerAScore") AS a_total, COUNT(h."PlayerAScore") AS a_entered,
+               SUM(h."PlayerBScore") AS b_total, COUNT(h."PlayerBScore") AS b_entered
+        FROM "HoleScores" h
+        GROUP BY h."MatchupId"
+    ),
+    side_holes AS (
+        SELECT s.*,
+               CASE WHEN s.side = 'A' THEN h.a_total ELSE h.b_total END AS hole_total,
+               COALESCE(CASE WHEN s.side = 'A' THEN h.a_entered ELSE h.b_entered END, 0) AS holes_entered,
+               CASE WHEN COALESCE(ls."HoleWinPoints" * 9 + ls."MatchWinBonus", 20) / 5 < 1 THEN 1
+                    ELSE COALESCE(ls."HoleWinPoints" * 9 + ls."MatchWinBonus", 20) / 5 END AS notice_points
+        FROM sides s
+        LEFT JOIN holes h ON h.matchup_id = s.matchup_id
+        LEFT JOIN "LeagueSettings" ls ON ls."SeasonId" = s.season_id
+    )
+'''
+
+# Check name -> SELECT producing (check_name, week_number, matchup_id, player_id, expected, actual)
+CHECKS: Dict[str, str] = {
+    'absent_with_score': '''
+        SELECT 'absent_with_score', week_number, matchup_id, player_id,
+               'no score', CAST(COALESCE(gross, hole_total) AS TEXT)
+        FROM side_holes
+        WHERE absent AND (COALESCE(gross, 0) > 0 OR holes_entered > 0)
+    ''',
+    'notice_without_absence': '''
+        SELECT 'notice_without_absence', week_number, matchup_id, player_id,
+               'absent', 'not absent'
+        FROM side_holes
+        WHERE notice AND NOT absent
+    ''',
+    'absence_points': '''
+        SELECT 'absence_points', week_number, matchup_id, player_id,
+               CAST(expected_points AS TEXT), CAST(points AS TEXT)
+        FROM (
+            SELECT sh.*,
+                   CASE WHEN special IS NOT NULL THEN special / 2
+                        WHEN notice THEN notice_points
+                        ELSE 0 END AS expected_points
+            FROM side_holes sh
+            WHERE absent AND points IS NOT NULL
+        ) a
+        WHERE points <> expected_points
+    ''',
+    'hole_total_mismatch': '''
+        SELECT 'hole_total_mismatch', week_number, matchup_id, player_id,
+               CAST(hole_total AS TEXT), CAST(gross AS TEXT)
+        FROM side_holes
+        WHERE NOT absent AND holes_entered > 0 AND (gross IS NULL OR gross <> hole_total)
+    ''',
+    'missing_hole_rows': '''
+        SELECT 'missing_hole_rows', w."WeekNumber", m."Id", NULL::uuid,
+               '9', CAST(COALESCE(h.distinct_holes, 0) AS TEXT)
+        FROM "Matchups" m
+        JOIN "Weeks" w ON w."Id" = m."WeekId"
+        LEFT JOIN holes h ON h.matchup_id = m."Id"
+        WHERE (h.matchup_id IS NOT NULL AND h.distinct_holes <> 9)
+           OR (h.matchup_id IS NULL AND (COALESCE(m."PlayerAScore", 0) > 0 OR COALESCE(m."PlayerBScore", 0) > 0))
+    ''',
+    'wrong_nine': '''
+        SELECT 'wrong_nine', w."WeekNumber", m."Id", NULL::uuid,
+               CASE WHEN w."NineHoles" = 2 THEN 'holes 10-18' ELSE 'holes 1-9' END,
+               'holes ' || CAST(h.first_hole AS TEXT) || '-' || CAST(h.last_hole AS TEXT)
+        FROM "Matchups" m
+        JOIN "Weeks" w ON w."Id" = m."WeekId"
+        JOIN holes h ON h.matchup_id = m."Id"
+        WHERE (w."NineHoles" = 2 AND h.first_hole < 10) OR (w."NineHoles" <> 2 AND h.last_hole > 9)
+    ''',
+    'duplicate_week_assignment': '''
+        SELECT 'duplicate_week_assignment', week_number, NULL::uuid, player_id,
+               '1 matchup', CAST(COUNT(*) AS TEXT) || ' matchups'
+        FROM sides
+        GROUP BY week_id, week_number, player_id
+        HAVING COUNT(*) > 1
+    ''',
+    'duplicate_flight_assignment': '''
+        SELECT 'duplicate_flight_assignment', pfa."SessionStartWeekNumber", NULL::uuid, pfa."PlayerId",
+               '1 flight', CAST(COUNT(*) AS TEXT) || ' assignments'
+        FROM "PlayerFlightAssignments" pfa
+        GROUP BY pfa."SeasonId", pfa."SessionStartWeekNumber", pfa."PlayerId"
+        HAVING COUNT(*) > 1
+    ''',
+    'duplicate_week': '''
+        SELECT 'duplicate_week', w."WeekNumber", NULL::uuid, NULL::uuid,
+               '1 week', CAST(COUNT(*) AS TEXT) || ' weeks'
+        FROM "Weeks" w
+        GROUP BY w."SeasonId", w."WeekNumber"
+        HAVING COUNT(*) > 1
+    ''',
+}
+
+
+@dataclass
+class Finding:
+    tenant: str
+    check: str
+    week_number: Optional[int]
+    matchup_id: Optional[str]
+    player_id: Optional[str]
+    player: str
+    expected: Optional[str]
+    actual: Optional[str]
+
+
+def build_query(checks: Optional[Sequence[str]] = None) -> str:
+    """One statement running every selected check"""
+    names = list(checks or CHECKS)
+    unknown = [n for n in names if n not in CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown check(s): {', '.join(unknown)}")
+    union = '\n        UNION ALL\n'.join(CHECKS[n] for n in names)
+    return f'''
+        WITH {BASE_CTES},
+        findings (check_name, week_number, matchup_id, player_id, expected, actual) AS (
+            {union}
+        )
+        SELECT f.check_name, f.week_number, f.matchup_id, f.player_id,
+               p."FirstName", p."LastName", f.expected, f.actual
+        FROM findings f
+        LEFT JOIN "Players" p ON p."Id" = f.player_id
+        ORDER BY f.check_name, f.week_number
+    '''
+
+
+def scan(conn, tenant: str = '', checks: Optional[Sequence[str]] = None) -> Iterator[Finding]:
+    """Run the selected checks against one database, yielding findings as they are fetched"""
+    with conn.cursor() as cur:
+        cur.execute(build_query(checks))
+        while True:
+            rows = cur.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for check, week, matchup_id, player_id, first, last, expected, actual in rows:
+                name = f"{first or ''} {last or ''}".strip()
+                yield Finding(tenant, check, week, str(matchup_id) if matchup_id else None,
+                              str(player_id) if player_id else None, name, expected, actual)
+
+
+class ReportWriter:
+    """Thread-safe sink that writes findings as they arrive"""
+
+    def __init__(self, stream: TextIO, fmt: str = 'text'):
+        self.stream = stream
+        self.format = fmt
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._csv = None
+        if fmt == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=list(Finding.__dataclass_fields__))
+            self._csv.writeheader()
+
+    def write(self, finding: Finding):
+        with self._lock:
+            self.counts[(finding.tenant, finding.check)] += 1
+            if self.format == 'jsonl':
+                self.stream.write(json.dumps(asdict(finding)) + '\n')
+            elif self._csv is not None:
+                self._csv.writerow(asdict(finding))
+            else:
+                where = f"week {finding.week_number}" if finding.week_number is not None else ""
+                who = finding.player or (f"matchup {finding.matchup_id}" if finding.matchup_id else "")
+                self.stream.write(f"❌ [{finding.tenant}] {finding.check:<28} {where:<8} {who:<24} "
+                                  f"expected {finding.expected}, found {finding.actual}\n")
+            self.stream.flush()
+
+
+def scan_tenants(writer: ReportWriter, tenants: Optional[Sequence[str]] = None,
+                 checks: Optional[Sequence[str]] = None, concurrency: int = 8,
+                 connect: Callable = db.connect):
+    """Scan every tenant concurrently, streaming findings into `writer`; returns the fan-out report"""
+    from .tenants import run_on_tenants
+
+    def scan_tenant(conn, tenant: str) -> int:
+        found = 0
+        for finding in scan(conn, tenant, checks):
+            writer.write(finding)
+            found += 1
+        return found
+
+    return run_on_tenants(scan_tenant, tenants=tenants, concurrency=concurrency, connect=connect)
+
+
+def print_summary(writer: ReportWriter, report, stream: TextIO = sys.stderr):
+    print(f"\n📋 Integrity scan of {len(report.results)} tenant(s) in {report.elapsed_ms:.0f} ms", file=stream)
+    for result in report.results:
+        if not result.ok:
+            print(f"❌ {result.tenant}: {result.error}", file=stream)
+            continue
+        counts = {check: n for (tenant, check), n in writer.counts.items() if tenant == result.tenant}
+        status = "✅" if not counts else "⚠️ "
+        detail = ", ".join(f"{check}={n}" for check, n in sorted(counts.items())) or "clean"
+        print(f"{status} {result.tenant:<20} {detail}", file=stream)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scan tenant databases for absence, score and assignment inconsistencies")
+    parser.add_argument('--tenant', action='append', dest='tenants',
+                        help='Limit to this tenant (repeatable); default is every golfdb_* database')
+    parser.add_argument('--check', action='append', dest='checks', choices=sorted(CHECKS),
+                        help='Run only this check (repeatable)')
+    parser.add_argument('--format', choices=('text', 'jsonl', 'csv'), default='text')
+    parser.add_argument('--output', help='Write findings to this file instead of stdout')
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    stream = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = ReportWriter(stream, args.format)
+        report = scan_tenants(writer, args.tenants, args.checks, args.concurrency)
+    finally:
+        if args.output:
+            stream.close()
+
+    print_summary(writer, report)
+    return 1 if writer.counts or report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
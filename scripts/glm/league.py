@@ -0,0 +1,517 @@
+"""
+Compact in-memory league model shared by the analysis tools.
+
+Players, weeks and flights are small __slots__ records addressed by a
+dense integer index, with UUID -> index maps (player_index, week_index,
+flight_index) for joining API or database rows. Matchups and flight
+assignments are stored column-wise in array('i'/'h') columns holding
+those indexes, so a season is a few flat arrays instead of the tuples,
+dicts of dicts and name strings matchup_matrix.py, analyze_round_robin.py
+and week15_matchups.py used to build:
+
+    league.matchups.week[m]      week index          league.assignments.player[r]
+    league.matchups.a[m], .b[m]  player indexes      league.assignments.flight[r]
+    league.matchups.a_score[m]   gross (NULL = -1)   league.assignments.session[r]   start week
+    league.matchups.a_points[m]  points (NULL = -1)  league.assignments.position[r]  NULL if unknown
+    league.matchups.flight[m]    flight index (NULL unless the source says)
+
+Loaders:
+    League.from_db(conn, season_id=None, max_week=None)    a tenant database (latest season by default)
+    League.from_api(base_url, season_id=None, tenant=None)  the REST API, through glm.apicache
+    League.from_snapshot(path_or_snapshot, season_id=None)  a glm.snapshot directory (requires numpy)
+    League.from_template(flights, schedule)                 a position template such as week15_matchups.py's
+
+Records without a UUID are interned by name, or by an explicit key:
+template players are keyed by flight and position, so vacant seats
+("Player N") and namesakes in different flights stay separate players.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+NULL = -1
+
+
+class Player:
+    __slots__ = ('index', 'id', 'first_name', 'last_name')
+
+    def __init__(self, index: int, id: Optional[str], first_name: str, last_name: str):
+        self.index = index
+        self.id = id
+        self.first_name = first_name
+        self.last_name = last_name
+
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+    def __repr__(self):
+        return f"Player({self.index}, {self.name!r})"
+
+
+class Week:
+    __slots__ = ('index', 'id', 'number', 'date', 'session_start', 'counts_for_scoring')
+
+    def __init__(self, index: int, id: Optional[str], number: int, date=None, session_start: bool = False,
+                 counts_for_scoring: bool = True):
+        self.index = index
+        self.id = id
+        self.number = number
+        self.date = date
+        self.session_start = session_start
+        self.counts_for_scoring = counts_for_scoring
+
+    def __repr__(self):
+        return f"Week({self.index}, number={self.number})"
+
+
+class Flight:
+    __slots__ = ('index', 'id', 'name')
+
+    def __init__(self, index: int, id: Optional[str], name: str):
+        self.index = index
+        self.id = id
+        self.name = name
+
+    def __repr__(self):
+        return f"Flight({self.index}, {self.name!r})"
+
+
+class MatchupColumns:
+    """One row per matchup; player and week columns hold indexes into the league"""
+
+    __slots__ = ('ids', 'week', 'flight', 'a', 'b', 'a_score', 'b_score', 'a_points', 'b_points')
+
+    def __init__(self):
+        self.ids: List[Optional[str]] = []
+        self.week = array('i')
+        self.flight = array('i')
+        self.a = array('i')
+        self.b = array('i')
+        self.a_score = array('h')
+        self.b_score = array('h')
+        self.a_points = array('h')
+        self.b_points = array('h')
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    def nbytes(self) -> int:
+        return sum(c.itemsize * len(c) for c in (self.week, self.flight, self.a, self.b, self.a_score,
+                                                 self.b_score, self.a_points, self.b_points))
+
+
+class AssignmentColumns:
+    """One row per flight assignment (player, flight, session start week, position, leader)"""
+
+    __slots__ = ('player', 'flight', 'session', 'position', 'leader')
+
+    def __init__(self):
+        self.player = array('i')
+        self.flight = array('i')
+        self.session = array('h')
+        self.position = array('h')
+        self.leader = array('b')
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    def nbytes(self) -> int:
+        return sum(c.itemsize * len(c) for c in (self.player, self.flight, self.session, self.position,
+                                                 self.leader))
+
+
+def _nullable(value) -> int:
+    return NULL if value is None else int(value)
+
+
+class League:
+    """Players, weeks, flights, matchups and assignments of one season, integer indexed"""
+
+    def __init__(self, season_id: Optional[str] = None):
+        self.season_id = season_id
+        self.players: List[Player] = []
+        self.weeks: List[Week] = []
+        self.flights: List[Flight] = []
+        self.player_index: Dict[str, int] = {}
+        self.week_index: Dict[str, int] = {}
+        self.flight_index: Dict[str, int] = {}
+        self.matchups = MatchupColumns()
+        self.assignments = AssignmentColumns()
+        self._week_numbers: Dict[int, int] = {}
+        self._names: Optional[Dict[str, int]] = None
+        self._by_week: Optional[Dict[int, List[int]]] = None
+
+    # -- building ---------------------------------------------------------
+
+    def add_player(self, id: Optional[str], first_name: str, last_name: str = '', key: Optional[str] = None) -> int:
+        """Intern a player by UUID (else by key, else by name); returns its index"""
+        if id is not None:
+            key = str(id)
+        elif key is None:
+            key = f"{first_name} {last_name}".strip()
+        index = self.player_index.get(key)
+        if index is None:
+            index = self.player_index[key] = len(self.players)
+            self.players.append(Player(index, str(id) if id is not None else None, first_name, last_name))
+            self._names = None
+        return index
+
+    def add_week(self, id: Optional[str], number: int, date=None, session_start: bool = False,
+                 counts_for_scoring: bool = True) -> int:
+        key = str(id) if id is not None else str(number)
+        index = self.week_index.get(key)
+        if index is None:
+            index = self.week_index[key] = len(self.weeks)
+            self.weeks.append(Week(index, str(id) if id is not None else None, int(number), date,
+                                   bool(session_start), bool(counts_for_scoring)))
+            self._week_numbers.setdefault(int(number), index)
+        return index
+
+    def add_flight(self, id: Optional[str], name: str) -> int:
+        key = str(id) if id is not None else name
+        index = self.flight_index.get(key)
+        if index is None:
+            index = self.flight_index[key] = len(self.flights)
+            self.flights.append(Flight(index, str(id) if id is not None else None, name))
+        return index
+
+    def add_matchup(self, week: int, a: int, b: int, a_score: Optional[int] = None, b_score: Optional[int] = None,
+                    a_points: Optional[int] = None, b_points: Optional[int] = None,
+                    id: Optional[str] = None, flight: Optional[int] = None) -> int:
+        m = self.matchups
+        m.ids.append(str(id) if id is not None else None)
+        m.week.append(week)
+        m.flight.append(_nullable(flight))
+        m.a.append(a)
+        m.b.append(b)
+        m.a_score.append(_nullable(a_score))
+        m.b_score.append(_nullable(b_score))
+        m.a_points.append(_nullable(a_points))
+        m.b_points.append(_nullable(b_points))
+        self._by_week = None
+        return len(m) - 1
+
+    def assign(self, player: int, flight: int, session_start: int, position: Optional[int] = None,
+               leader: bool = False) -> int:
+        r = self.assignments
+        r.player.append(player)
+        r.flight.append(flight)
+        r.session.append(int(session_start))
+        r.position.append(_nullable(position))
+        r.leader.append(1 if leader else 0)
+        return len(r) - 1
+
+    # -- lookups ----------------------------------------------------------
+
+    def player(self, id: str) -> Player:
+        return self.players[self.player_index[str(id)]]
+
+    def player_by_name(self, name: str) -> Optional[Player]:
+        if self._names is None:
+            self._names = {}
+            for p in self.players:
+                self._names.setdefault(p.name, p.index)
+        index = self._names.get(name)
+        return None if index is None else self.players[index]
+
+    def week_by_number(self, number: int) -> Optional[Week]:
+        index = self._week_numbers.get(number)
+        return None if index is None else self.weeks[index]
+
+    def matchups_in_week(self, week: int, flight: Optional[int] = None) -> List[int]:
+        """Matchup rows of a week index (optionally only one flight index), in load order"""
+        if self._by_week is None:
+            self._by_week = {}
+            for row, w in enumerate(self.matchups.week):
+                self._by_week.setdefault(w, []).append(row)
+        rows = self._by_week.get(week, [])
+        if flight is not None:
+            rows = [row for row in rows if self.matchups.flight[row] == flight]
+        return rows
+
+    def roster(self, flight: int, session_start: int) -> List[int]:
+        """Player indexes assigned to a flight for a session, by position (unknown positions last)"""
+        r = self.assignments
+        rows = [i for i in range(len(r)) if r.flight[i] == flight and r.session[i] == session_start]
+        rows.sort(key=lambda i: (r.position[i] == NULL, r.position[i]))
+        return [r.player[i] for i in rows]
+
+    def position_of(self, player: int, flight: int) -> Optional[int]:
+        r = self.assignments
+        for i in range(len(r)):
+            if r.player[i] == player and r.flight[i] == flight:
+                return None if r.position[i] == NULL else r.position[i]
+        return None
+
+    # -- analysis ---------------------------------------------------------
+
+    def pairings(self) -> Dict[Tuple[int, int], List[int]]:
+        """(lower, higher player index) -> week numbers they meet in, in matchup order"""
+        pairs: Dict[Tuple[int, int], List[int]] = {}
+        m = self.matchups
+        for row in range(len(m)):
+            a, b = m.a[row], m.b[row]
+            pairs.setdefault((a, b) if a < b else (b, a), []).append(self.weeks[m.week[row]].number)
+        return pairs
+
+    def pair_counts(self) -> List[array]:
+        """Symmetric players x players matrix of how often each pair meets"""
+        n = len(self.players)
+        counts = [array('h', bytes(2 * n)) for _ in range(n)]
+        m = self.matchups
+        for a, b in zip(m.a, m.b):
+            counts[a][b] += 1
+            counts[b][a] += 1
+        return counts
+
+    def games_per_player(self) -> array:
+        games = array('i', bytes(4 * len(self.players)))
+        for a, b in zip(self.matchups.a, self.matchups.b):
+            games[a] += 1
+            games[b] += 1
+        return games
+
+    def iter_matchups(self) -> Iterator[Tuple[Week, Player, Player]]:
+        m = self.matchups
+        for row in range(len(m)):
+            yield self.weeks[m.week[row]], self.players[m.a[row]], self.players[m.b[row]]
+
+    def nbytes(self) -> int:
+        """Bytes held by the matchup and assignment columns"""
+        return self.matchups.nbytes() + self.assignments.nbytes()
+
+    # -- loaders ----------------------------------------------------------
+
+    @classmethod
+    def from_db(cls, conn, season_id: Optional[str] = None, max_week: Optional[int] = None) -> 'League':
+        """Load a season (default: latest) from a tenant connection; max_week drops later weeks"""
+        from .rollover import latest_season
+
+        season_id = season_id or latest_season(conn)
+        league = cls(season_id)
+        params = {'season': season_id, 'max_week': max_week}
+        with conn.cursor() as cur:
+            cur.execute(PLAYERS_SQL)
+            for player_id, first_name, last_name in cur.fetchall():
+                league.add_player(player_id, first_name or '', last_name or '')
+            if season_id is None:
+                return league
+            cur.execute(WEEKS_SQL, params)
+            for week_id, number, date, session_start, counts in cur.fetchall():
+                league.add_week(week_id, number, date, session_start, counts)
+            cur.execute(FLIGHTS_SQL, params)
+            for flight_id, name in cur.fetchall():
+                league.add_flight(flight_id, name or '')
+            cur.execute(MATCHUPS_SQL, params)
+            for row in cur.fetchall():
+                league._add_matchup_row(*row)
+            cur.execute(ASSIGNMENTS_SQL, params)
+            for player_id, flight_id, session_start, leader in cur.fetchall():
+                league._add_assignment_row(player_id, flight_id, session_start, leader)
+        return league
+
+    @classmethod
+    def from_api(cls, base_url: str, season_id: Optional[str] = None, tenant: Optional[str] = None,
+                 session=None) -> 'League':
+        """
+        Load a season from the REST API (base_url like http://localhost:5274/api).
+        Players, seasons, weeks and flights go through glm.apicache unless a
+        session is passed.
+        """
+        if session is None:
+            from .apicache import CachedSession
+            session = CachedSession(tenant=tenant)
+        headers = {'X-Tenant-Id': tenant} if tenant else {}
+        base_url = base_url.rstrip('/')
+
+        def get(path: str):
+            response = session.get(f"{base_url}{path}", headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+        if season_id is None:
+            seasons = get('/seasons')
+            if seasons:
+                season_id = max(seasons, key=lambda s: (s.get('year', 0), s.get('seasonNumber', 0)))['id']
+        league = cls(season_id)
+        players = sorted(get('/players'), key=lambda p: (p.get('lastName', ''), p.get('firstName', ''), p['id']))
+        for p in players:
+            league.add_player(p['id'], p.get('firstName', ''), p.get('lastName', ''))
+        if season_id is None:
+            return league
+        for w in sorted(get(f'/weeks/season/{season_id}'), key=lambda w: w['weekNumber']):
+            league.add_week(w['id'], w['weekNumber'], w.get('date'), w.get('sessionStart', False),
+                            w.get('countsForScoring', True))
+        for f in sorted(get(f'/flights/season/{season_id}'), key=lambda f: f.get('name', '')):
+            league.add_flight(f['id'], f.get('name', ''))
+        matchups = [m for m in get(f'/matchups/season/{season_id}') if m['weekId'] in league.week_index]
+        matchups.sort(key=lambda m: (league.weeks[league.week_index[m['weekId']]].number,
+                                     league._sort_name(m['playerAId'])))
+        for m in matchups:
+            league._add_matchup_row(m['id'], m['weekId'], m['playerAId'], m['playerBId'], m.get('playerAScore'),
+                                    m.get('playerBScore'), m.get('playerAPoints'), m.get('playerBPoints'))
+        for r in get('/player-flight-assignments'):
+            if r.get('seasonId') == season_id:
+                league._add_assignment_row(r['playerId'], r['flightId'], r['sessionStartWeekNumber'],
+                                           r.get('isFlightLeader', False))
+        return league
+
+    @classmethod
+    def from_snapshot(cls, snapshot, season_id: Optional[str] = None) -> 'League':
+        """Load a season (default: latest) from a glm.snapshot directory or Snapshot"""
+        import numpy as np
+
+        if isinstance(snapshot, str):
+            from .snapshot import open_snapshot
+            snapshot = open_snapshot(snapshot)
+
+        seasons = snapshot['Seasons']
+        if season_id is None:
+            keys = list(zip(seasons['Year'].tolist(), seasons['SeasonNumber'].tolist()))
+            season = max(range(len(keys)), key=lambda i: keys[i]) if keys else NULL
+        else:
+            season = seasons.index_of(season_id)
+        league = cls(seasons.ids[season] if season >= 0 else None)
+
+        players = snapshot['Players']
+        first, last = players.text('FirstName'), players.text('LastName')
+        order = sorted(range(len(players)), key=lambda i: (last[i] or '', first[i] or '', players.ids[i]))
+        for i in order:
+            league.add_player(players.ids[i], first[i] or '', last[i] or '')
+        if season < 0:
+            return league
+        # snapshot row -> league index
+        player_of = np.full(len(players), NULL, dtype=np.int32)
+        player_of[order] = np.arange(len(order), dtype=np.int32)
+
+        weeks = snapshot['Weeks']
+        rows = np.nonzero(np.asarray(weeks['SeasonId']) == season)[0]
+        rows = rows[np.argsort(np.asarray(weeks['WeekNumber'])[rows], kind='stable')]
+        week_of = np.full(len(weeks), NULL, dtype=np.int32)
+        for i in rows.tolist():
+            week_of[i] = league.add_week(weeks.ids[i], int(weeks['WeekNumber'][i]), weeks['Date'][i].item(),
+                                         bool(weeks['SessionStart'][i]), bool(weeks['CountsForScoring'][i]))
+
+        flights = snapshot['Flights']
+        names = flights.text('Name')
+        flight_of = np.full(len(flights), NULL, dtype=np.int32)
+        rows = np.nonzero(np.asarray(flights['SeasonId']) == season)[0].tolist()
+        for i in sorted(rows, key=lambda i: names[i] or ''):
+            flight_of[i] = league.add_flight(flights.ids[i], names[i] or '')
+
+        m = snapshot['Matchups']
+        week = week_of[np.asarray(m['WeekId'])]
+        a, b = np.asarray(m['PlayerAId']), np.asarray(m['PlayerBId'])
+        keep = np.nonzero((week >= 0) & (a >= 0) & (b >= 0))[0]
+        numbers = np.array([w.number for w in league.weeks], dtype=np.int32)
+        # week number, then player A by name (league indexes are already in name order)
+        keep = keep[np.lexsort((player_of[a[keep]], numbers[week[keep]]))]
+        columns = league.matchups
+        columns.ids = [m.ids[i] for i in keep.tolist()]
+        columns.week = array('i', week[keep].tobytes())
+        columns.flight = array('i', [NULL]) * len(keep)
+        columns.a = array('i', player_of[a[keep]].tobytes())
+        columns.b = array('i', player_of[b[keep]].tobytes())
+        for name, column in (('a_score', 'PlayerAScore'), ('b_score', 'PlayerBScore'),
+                             ('a_points', 'PlayerAPoints'), ('b_points', 'PlayerBPoints')):
+            setattr(columns, name, array('h', np.asarray(m[column], dtype=np.int16)[keep].tobytes()))
+
+        pfa = snapshot['PlayerFlightAssignments']
+        for i in np.nonzero(np.asarray(pfa['SeasonId']) == season)[0].tolist():
+            player, flight = int(pfa['PlayerId'][i]), int(pfa['FlightId'][i])
+            if player >= 0 and flight >= 0 and flight_of[flight] >= 0:
+                league.assign(int(player_of[player]), int(flight_of[flight]), int(pfa['SessionStartWeekNumber'][i]),
+                              leader=bool(pfa['IsFlightLeader'][i]))
+        return league
+
+    @classmethod
+    def from_template(cls, flights: Dict[str, Dict[int, str]], schedule: Sequence[Dict]) -> 'League':
+        """
+        Build a session from position rosters ({flight: {position: "First Last"}})
+        and a schedule of {"week", "date", "matchups": ["1 vs 2", ...]}, as in
+        week15_matchups.py. Players are keyed by (flight, position); a position
+        without a player becomes "Player N" in that flight. Matchups carry
+        their flight index.
+        """
+        from .schedule import parse_pairing
+
+        league = cls()
+        session_start = min((w['week'] for w in schedule), default=0)
+        seats: List[Dict[int, int]] = []
+
+        def seat(flight: int, position: int) -> int:
+            if position not in seats[flight]:
+                name = flights[league.flights[flight].name].get(position)
+                first, last = name.partition(' ')[::2] if name else ('Player', str(position))
+                key = f"{league.flights[flight].name}#{position}"
+                seats[flight][position] = player = league.add_player(None, first, last, key=key)
+                league.assign(player, flight, session_start, position)
+            return seats[flight][position]
+
+        for flight_name, positions in flights.items():
+            flight = league.add_flight(None, flight_name)
+            seats.append({})
+            for position in sorted(positions):
+                seat(flight, position)
+
+        for week_data in schedule:
+            week = league.add_week(None, week_data['week'], week_data.get('date'),
+                                   session_start=week_data['week'] == session_start)
+            for flight in range(len(league.flights)):
+                for pairing in week_data['matchups']:
+                    a, b = parse_pairing(pairing)
+                    league.add_matchup(week, seat(flight, a), seat(flight, b), flight=flight)
+        return league
+
+    def _sort_name(self, player_id: str) -> Tuple[str, str]:
+        index = self.player_index.get(str(player_id))
+        if index is None:
+            return ('', '')
+        return (self.players[index].last_name, self.players[index].first_name)
+
+    def _add_matchup_row(self, matchup_id, week_id, a_id, b_id, a_score=None, b_score=None, a_points=None,
+                         b_points=None):
+        week = self.week_index.get(str(week_id))
+        a = self.player_index.get(str(a_id))
+        b = self.player_index.get(str(b_id))
+        if week is None or a is None or b is None:   # dangling reference, as the JOINs used to drop
+            return
+        self.add_matchup(week, a, b, a_score, b_score, a_points, b_points, matchup_id)
+
+    def _add_assignment_row(self, player_id, flight_id, session_start, leader=False):
+        player = self.player_index.get(str(player_id))
+        flight = self.flight_index.get(str(flight_id))
+        if player is not None and flight is not None:
+            self.assign(player, flight, session_start, leader=bool(leader))
+
+
+PLAYERS_SQL = 'SELECT "Id", "FirstName", "LastName" FROM "Players" ORDER BY "LastName", "FirstName", "Id"'
+
+WEEKS_SQL = '''
+    SELECT "Id", "WeekNumber", "Date", "SessionStart", "CountsForScoring"
+    FROM "Weeks"
+    WHERE "SeasonId" = %(season)s
+      AND (%(max_week)s IS NULL OR "WeekNumber" <= %(max_week)s)
+    ORDER BY "WeekNumber"
+'''
+
+FLIGHTS_SQL = 'SELECT "Id", "Name" FROM "Flights" WHERE "SeasonId" = %(season)s ORDER BY "Name"'
+
+MATCHUPS_SQL = '''
+    SELECT m."Id", m."WeekId", m."PlayerAId", m."PlayerBId",
+           m."PlayerAScore", m."PlayerBScore", m."PlayerAPoints", m."PlayerBPoints"
+    FROM "Matchups" m
+    JOIN "Weeks" w ON w."Id" = m."WeekId"
+    JOIN "Players" pa ON pa."Id" = m."PlayerAId"
+    WHERE w."SeasonId" = %(season)s
+      AND (%(max_week)s IS NULL OR w."WeekNumber" <= %(max_week)s)
+    ORDER BY w."WeekNumber", pa."LastName", pa."FirstName"
+'''
+
+ASSIGNMENTS_SQL = '''
+    SELECT "PlayerId", "FlightId", "SessionStartWeekNumber", "IsFlightLeader"
+    FROM "PlayerFlightAssignments"
+    WHERE "SeasonId" = %(season)s
+    ORDER BY "SessionStartWeekNumber"
+'''
@@ -0,0 +1,302 @@
+"""
+Load generator for the league-night API endpoints.
+
+Replays a weighted mix of the heaviest GETs against a running backend:
+
+    standings  GET /standings/session?seasonId=..&weekId=..
+    average    GET /averagescore/player/{id}/season/{id}/uptoweek/{n}
+    scorecard  GET /scorecard/{matchupId}/complete
+
+The workload (season, weeks, players, matchups) is discovered from the
+API itself, so the same run works against any tenant. Each worker thread
+keeps its own keep-alive session. Latency percentiles (p50/p95/p99) and
+throughput are reported per endpoint.
+
+Usage:
+    python3 scripts/testing/load-test-api.py --concurrency 16 --duration 30
+    python3 scripts/testing/load-test-api.py --mix standings=6,average=3,scorecard=1 --requests 2000
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+API_BASE_URL = "http://localhost:5274/api"
+DEFAULT_MIX = {'standings': 4, 'average': 4, 'scorecard': 2}
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class EndpointStats:
+    name: str
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+    def record(self, elapsed_ms: float, status: Optional[int]):
+        self.latencies_ms.append(elapsed_ms)
+        if status is None or status >= 400:
+            self.errors += 1
+        key = status if status is not None else 0
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+
+    def summary(self, wall_seconds: float) -> Dict:
+        values = sorted(self.latencies_ms)
+        result = {
+            'requests': len(values),
+            'errors': self.errors,
+            'throughput_rps': round(len(values) / wall_seconds, 1) if wall_seconds else 0.0,
+            'mean_ms': round(sum(values) / len(values), 1) if values else 0.0,
+            'max_ms': round(values[-1], 1) if values else 0.0,
+            'statuses': dict(sorted(self.statuses.items())),
+        }
+        for p in PERCENTILES:
+            result[f'p{p}_ms'] = round(percentile(values, p), 1)
+        return result
+
+
+@dataclass
+class Workload:
+    """Ids discovered from the API that requests are generated from"""
+    season_id: str
+    weeks: List[Tuple[str, int]]
+    player_ids: List[str]
+    matchup_ids: List[str]
+
+    def request(self, endpoint: str, rng: random.Random) -> str:
+        """Path (relative to the API base) for one request of `endpoint`"""
+        if endpoint == 'standings':
+            week_id, _ = rng.choice(self.weeks)
+            return f"/standings/session?seasonId={self.season_id}&weekId={week_id}"
+        if endpoint == 'average':
+            _, week_number = rng.choice(self.weeks)
+            return (f"/averagescore/player/{rng.choice(self.player_ids)}"
+                    f"/season/{self.season_id}/uptoweek/{week_number}")
+        if endpoint == 'scorecard':
+            return f"/scorecard/{rng.choice(self.matchup_ids)}/complete"
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """"standings=4,average=4,scorecard=2" -> weights"""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown endpoint in mix: {name} (expected {', '.join(DEFAULT_MIX)})")
+        mix[name] = int(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def new_session(headers: Dict[str, str], cookies=None):
+    import requests
+
+    session = requests.Session()
+    session.headers.update(headers)
+    if cookies is not None:
+        session.cookies.update(cookies)
+    return session
+
+
+def login(base_url: str, username: str, password: str, headers: Dict[str, str]):
+    """Log in once and return the JWT cookie jar to share across workers"""
+    session = new_session(headers)
+    response = session.post(f"{base_url}/auth/login", json={'username': username, 'password': password})
+    response.raise_for_status()
+    return session.cookies
+
+
+def discover_workload(session, base_url: str, season_id: Optional[str] = None,
+                      max_week: Optional[int] = None) -> Workload:
+    """Find the season, its weeks, players and matchups through the API"""
+    if season_id is None:
+        response = session.get(f"{base_url}/seasons/active")
+        if response.status_code != 200:
+            response = session.get(f"{base_url}/seasons")
+        response.raise_for_status()
+        seasons = response.json()
+        if isinstance(seasons, list):
+            if not seasons:
+                raise RuntimeError("No seasons returned by the API")
+            seasons = seasons[0]
+        season_id = seasons['id']
+
+    response = session.get(f"{base_url}/weeks/season/{season_id}")
+    response.raise_for_status()
+    weeks = [(w['id'], w['weekNumber']) for w in response.json()
+             if max_week is None or w['weekNumber'] <= max_week]
+
+    response = session.get(f"{base_url}/players")
+    response.raise_for_status()
+    player_ids = [p['id'] for p in response.json()]
+
+    response = session.get(f"{base_url}/matchups/season/{season_id}")
+    response.raise_for_status()
+    matchup_ids = [m['id'] for m in response.json()]
+
+    if not weeks or not player_ids:
+        raise RuntimeError(f"Season {season_id} has no weeks or players to load test")
+    return Workload(season_id, weeks, player_ids, matchup_ids)
+
+
+def run_load(workload: Workload, base_url: str, mix: Dict[str, int], concurrency: int = 8,
+             total_requests: Optional[int] = None, duration: Optional[float] = None,
+             headers: Optional[Dict[str, str]] = None, cookies=None, seed: Optional[int] = None,
+             session_factory: Callable = new_session, timeout: float = 30.0) -> Tuple[Dict[str, EndpointStats], float]:
+    """
+    Issue requests from `concurrency` threads until `total_requests` have been
+    sent or `duration` seconds have passed. Returns (stats per endpoint, wall seconds).
+    """
+    if not workload.matchup_ids:
+        mix = {k: v for k, v in mix.items() if k != 'scorecard'}
+    if not mix:
+        raise ValueError("Request mix is empty")
+    if total_requests is None and duration is None:
+        total_requests = 500
+
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    stats = {name: EndpointStats(name) for name in names}
+    lock = threading.Lock()
+    issued = [0]
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_slot() -> bool:
+        with lock:
+            if total_requests is not None and issued[0] >= total_requests:
+                return False
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            issued[0] += 1
+            return True
+
+    def worker(index: int):
+        rng = random.Random(None if seed is None else seed + index)
+        session = session_factory(headers or {}, cookies)
+        local: List[Tuple[str, float, Optional[int]]] = []
+        try:
+            while next_slot():
+                endpoint = rng.choices(names, weights)[0]
+                url = base_url + workload.request(endpoint, rng)
+                start = time.perf_counter()
+                try:
+                    response = session.get(url, timeout=timeout)
+                    response.content  # include body transfer in the latency
+                    status = response.status_code
+                except Exception:
+                    status = None
+                local.append((endpoint, (time.perf_counter() - start) * 1000, status))
+        finally:
+            session.close()
+        with lock:
+            for endpoint, elapsed_ms, status in local:
+                stats[endpoint].record(elapsed_ms, status)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+    return stats, time.perf_counter() - start
+
+
+def build_report(stats: Dict[str, EndpointStats], wall_seconds: float, concurrency: int) -> Dict:
+    endpoints = {name: s.summary(wall_seconds) for name, s in stats.items()}
+    overall = EndpointStats('all')
+    for s in stats.values():
+        overall.latencies_ms.extend(s.latencies_ms)
+        overall.errors += s.errors
+    return {
+        'concurrency': concurrency,
+        'wall_seconds': round(wall_seconds, 2),
+        'endpoints': endpoints,
+        'total': overall.summary(wall_seconds),
+    }
+
+
+def print_report(report: Dict):
+    print(f"\n📊 {report['total']['requests']} requests in {report['wall_seconds']}s "
+          f"at concurrency {report['concurrency']}")
+    header = f"{'endpoint':<12}{'reqs':>7}{'err':>6}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(report['endpoints'].items()) + [('total', report['total'])]
+    for name, r in rows:
+        print(f"{name:<12}{r['requests']:>7}{r['errors']:>6}{r['throughput_rps']:>8}"
+              f"{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}{r['max_ms']:>9}")
+    print("(latencies in ms)")
+    if report['total']['errors']:
+        print(f"⚠️  {report['total']['errors']} request(s) failed")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the standings, average-score and scorecard endpoints")
+    parser.add_argument('--base-url', default=API_BASE_URL, help=f'API base URL (default {API_BASE_URL})')
+    parser.add_argument('--tenant', help='Tenant id sent as X-Tenant-Id')
+    parser.add_argument('--username', help='Log in first (needed unless auth is disabled)')
+    parser.add_argument('--password')
+    parser.add_argument('--season-id', help='Season to test (default: the active season)')
+    parser.add_argument('--max-week', type=int, help='Only request weeks up to this number')
+    parser.add_argument('--mix', default=','.join(f'{k}={v}' for k, v in DEFAULT_MIX.items()),
+                        help='Endpoint weights (default %(default)s)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument('--requests', type=int, dest='total_requests', help='Total requests to send (default 500)')
+    limit.add_argument('--duration', type=float, help='Seconds to run for instead of a request count')
+    parser.add_argument('--warmup', type=int, default=20, help='Untimed requests sent first (default 20)')
+    parser.add_argument('--seed', type=int, help='Seed for a reproducible request sequence')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    base_url = args.base_url.rstrip('/')
+    headers = {'X-Tenant-Id': args.tenant} if args.tenant else {}
+    mix = parse_mix(args.mix)
+
+    cookies = None
+    if args.username:
+        cookies = login(base_url, args.username, args.password or '', headers)
+
+    session = new_session(headers, cookies)
+    try:
+        workload = discover_workload(session, base_url, args.season_id, args.max_week)
+    finally:
+        session.close()
+
+    if not args.json:
+        print(f"🏌️  Season {workload.season_id}: {len(workload.weeks)} weeks, "
+              f"{len(workload.player_ids)} players, {len(workload.matchup_ids)} matchups")
+
+    if args.warmup:
+        run_load(workload, base_url, mix, concurrency=min(args.concurrency, args.warmup),
+                 total_requests=args.warmup, headers=headers, cookies=cookies, seed=args.seed)
+
+    stats, wall = run_load(workload, base_url, mix, concurrency=args.concurrency,
+                           total_requests=args.total_requests, duration=args.duration,
+                           headers=headers, cookies=cookies, seed=args.seed)
+    report = build_report(stats, wall, args.concurrency)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if report['total']['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
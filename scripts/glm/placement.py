@@ -0,0 +1,379 @@
+"""
+Flight placement for a new session, replacing hand-typed rosters like
+bulk_assign_players.py's flight_assignments.
+
+Players are ranked by current average (lower is stronger, as of the week
+before the session starts) or by the previous session's standings
+(previous flight, then session points), then placed into fixed-size flights:
+
+    tiered     Flight 1 gets the strongest players, Flight 2 the next, ...
+               with --movers N, the top N of each previous flight move up
+               and the bottom N move down (standings only)
+    balanced   serpentine draft by average, then deterministic pairwise
+               swaps until every flight's mean average is as even as it gets
+
+Flight leaders are the strongest player of each flight (`best`), the
+previous session's leader when still in the same flight (`keep`, falling
+back to best), or nobody (`none`). Ties always break on last name, first
+name, then id, so the same inputs give the same flights.
+
+The result replaces the session's PlayerFlightAssignments in one
+transaction: one DELETE and one batched INSERT.
+
+Usage:
+    python3 scripts/database/place-flights.py --tenant southmoore --session-start 15 --flight-size 8
+    python3 scripts/database/place-flights.py --tenant southmoore --session-start 15 --by standings --movers 2 --write
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+MODES = ('tiered', 'balanced')
+RANKINGS = ('average', 'standings')
+LEADERS = ('best', 'keep', 'none')
+MAX_SWAP_PASSES = 50
+
+ASSIGNMENT_COLUMNS = ('PlayerId', 'FlightId', 'SeasonId', 'SessionStartWeekNumber',
+                      'IsFlightLeader', 'HandicapAtAssignment', 'AssignmentDate')
+
+
+@dataclass
+class Candidate:
+    id: str
+    first_name: str
+    last_name: str
+    average: float
+    handicap: float
+    points: int = 0
+    previous_flight: Optional[int] = None   # index into the season's flights, in flight_order
+    previous_leader: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.first_name} {self.last_name}".strip()
+
+    @property
+    def tie_break(self) -> Tuple[str, str, str]:
+        return (self.last_name, self.first_name, self.id)
+
+
+@dataclass
+class Placement:
+    player_id: str
+    name: str
+    flight_id: str
+    flight: str
+    position: int
+    is_leader: bool
+    average: float
+    handicap: float
+
+
+def flight_order(name: str) -> Tuple:
+    """Sort key putting "Flight 2" before "Flight 10": numbers in the name compare as numbers"""
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part.lower())
+                 for part in re.split(r'(\d+)', name or '') if part)
+
+
+def flight_sizes(players: int, flights: Optional[int] = None, flight_size: Optional[int] = None,
+                 sizes: Optional[Sequence[int]] = None) -> List[int]:
+    """
+    Sizes of each flight. Explicit `sizes` must add up to `players`;
+    otherwise players are spread over `flights` flights (or as many
+    `flight_size` flights as needed) as evenly as possible, bigger ones first.
+    """
+    if sizes:
+        if sum(sizes) != players:
+            raise ValueError(f"Flight sizes add up to {sum(sizes)} but there are {players} players")
+        return list(sizes)
+    if flights is None:
+        if not flight_size:
+            raise ValueError("Give the number of flights, a flight size or explicit sizes")
+        flights = -(-players // flight_size)
+    flights = max(1, min(flights, players))
+    base, extra = divmod(players, flights)
+    return [base + (i < extra) for i in range(flights)]
+
+
+def rank(candidates: Sequence[Candidate], by: str = 'average') -> List[int]:
+    """Candidate indexes, strongest first"""
+    if by == 'average':
+        key = lambda i: (candidates[i].average, candidates[i].tie_break)
+    elif by == 'standings':
+        unplaced = max((c.previous_flight for c in candidates if c.previous_flight is not None), default=0) + 1
+        key = lambda i: (unplaced if candidates[i].previous_flight is None else candidates[i].previous_flight,
+                         -candidates[i].points, candidates[i].average, candidates[i].tie_break)
+    else:
+        raise ValueError(f"Unknown ranking: {by}")
+    return sorted(range(len(candidates)), key=key)
+
+
+def apply_movers(order: List[int], candidates: Sequence[Candidate], movers: int) -> List[int]:
+    """Swap the bottom `movers` of each previous flight with the top `movers` of the next"""
+    groups: Dict[Optional[int], List[int]] = {}
+    for i in order:
+        groups.setdefault(candidates[i].previous_flight, []).append(i)
+    keys = sorted(k for k in groups if k is not None) + ([None] if None in groups else [])
+    tiers = [list(groups[k]) for k in keys]
+    for upper, lower in zip(tiers, tiers[1:]):
+        n = min(movers, len(upper), len(lower))
+        if n:
+            upper[-n:], lower[:n] = lower[:n], upper[-n:]
+    return [i for tier in tiers for i in tier]
+
+
+def tiered(order: Sequence[int], sizes: Sequence[int]) -> List[List[int]]:
+    bounds = np.cumsum([0] + list(sizes))
+    return [list(order[bounds[f]:bounds[f + 1]]) for f in range(len(sizes))]
+
+
+def balanced(order: Sequence[int], strength: np.ndarray, sizes: Sequence[int]) -> List[List[int]]:
+    """Serpentine draft, then swaps that bring flight mean strengths closest together"""
+    groups: List[List[int]] = [[] for _ in sizes]
+    forward = True
+    queue = list(order)
+    while queue:
+        for f in (range(len(sizes)) if forward else reversed(range(len(sizes)))):
+            if queue and len(groups[f]) < sizes[f]:
+                groups[f].append(queue.pop(0))
+        forward = not forward
+
+    if len(groups) < 2:
+        return groups
+    values = [np.array([strength[i] for i in g]) for g in groups]
+    sums = np.array([v.sum() for v in values])
+    counts = np.array([len(v) for v in values], dtype=np.float64)
+    target = sums.sum() / counts.sum()
+
+    for _ in range(MAX_SWAP_PASSES):
+        improved = False
+        for a in range(len(groups)):
+            for b in range(a + 1, len(groups)):
+                # delta[i, j]: strength moving from a to b when a's i-th swaps with b's j-th
+                delta = values[a][:, None] - values[b][None, :]
+                before = (sums[a] / counts[a] - target) ** 2 + (sums[b] / counts[b] - target) ** 2
+                after = ((sums[a] - delta) / counts[a] - target) ** 2 + ((sums[b] + delta) / counts[b] - target) ** 2
+                gain = before - after
+                i, j = np.unravel_index(np.argmax(gain), gain.shape)
+                if gain[i, j] > 1e-9:
+                    groups[a][i], groups[b][j] = groups[b][j], groups[a][i]
+                    values[a][i], values[b][j] = values[b][j], values[a][i]
+                    sums[a] -= delta[i, j]
+                    sums[b] += delta[i, j]
+                    improved = True
+        if not improved:
+            break
+    return groups
+
+
+def place(candidates: Sequence[Candidate], flights: Sequence[Tuple[str, str]], sizes: Sequence[int],
+          mode: str = 'tiered', by: str = 'average', leader: str = 'best', movers: int = 0) -> List[Placement]:
+    """Assign every candidate to one of `flights` ((id, name), strongest flight first)"""
+    if len(sizes) > len(flights):
+        raise ValueError(f"{len(sizes)} flights needed but the season only has {len(flights)}")
+    order = rank(candidates, by)
+    if movers and by == 'standings':
+        order = apply_movers(order, candidates, movers)
+
+    if mode == 'tiered':
+        groups = tiered(order, sizes)
+    elif mode == 'balanced':
+        groups = balanced(order, np.array([c.average for c in candidates]), sizes)
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+    placements = []
+    for f, group in enumerate(groups):
+        group = sorted(group, key=lambda i: (candidates[i].average, candidates[i].tie_break))
+        leader_index = None
+        if leader == 'keep':
+            leader_index = next((i for i in group if candidates[i].previous_leader
+                                 and candidates[i].previous_flight == f), None)
+        if leader in ('best', 'keep') and leader_index is None and group:
+            leader_index = group[0]
+        flight_id, flight_name = flights[f]
+        for position, i in enumerate(group, 1):
+            c = candidates[i]
+            placements.append(Placement(c.id, c.name, flight_id, flight_name, position, i == leader_index,
+                                        round(float(c.average), 2), float(c.handicap)))
+    return placements
+
+
+def load_candidates(snapshot, session_start: int, season_id: Optional[str] = None,
+                    players: Union[str, Iterable[str]] = 'previous'
+                    ) -> Tuple[str, List[Candidate], List[Tuple[str, str]]]:
+    """
+    (season id, candidates, flights) for a session from a glm.snapshot.Snapshot.
+
+    `players` is 'previous' (everyone in the previous session's flights,
+    falling back to the season's PlayerSeasonRecords), 'season', or an
+    explicit collection of player ids.
+    """
+    from . import handicap
+    from .standings import StandingsEngine, load_season_from_snapshot
+
+    season = load_season_from_snapshot(snapshot, season_id)
+    season_row = snapshot['Seasons'].index_of(season.season_id)
+    engine = StandingsEngine(season)
+    average, player_handicap = handicap.snapshot_averages(snapshot, season_row, session_start - 1)
+
+    flights = sorted(season.flights.items(), key=lambda f: (flight_order(f[1]), f[0]))
+    flight_index = {flight_id: i for i, (flight_id, _) in enumerate(flights)}
+    previous_start = max((w.number for w in season.weeks if w.session_start and w.number < session_start),
+                         default=None)
+    previous = {}
+    if previous_start is not None:
+        previous = {p: f for p, f, s in season.assignments if s == previous_start and f in flight_index}
+    points = engine.session_totals(session_start - 1) if previous_start is not None else {}
+
+    leaders = set()
+    pfa = snapshot['PlayerFlightAssignments']
+    seasons_column = np.asarray(pfa['SeasonId'])
+    for row in np.nonzero((seasons_column == season_row) & np.asarray(pfa['IsFlightLeader']))[0]:
+        if int(pfa['SessionStartWeekNumber'][row]) == previous_start and pfa['PlayerId'][row] >= 0:
+            leaders.add(snapshot['Players'].ids[pfa['PlayerId'][row]])
+
+    if not isinstance(players, str):
+        player_ids = sorted(set(players))
+    elif players == 'previous' and previous:
+        player_ids = sorted(previous)
+    else:
+        records = snapshot['PlayerSeasonRecords']
+        rows = np.nonzero((np.asarray(records['SeasonId']) == season_row) & (np.asarray(records['PlayerId']) >= 0))[0]
+        player_ids = sorted({snapshot['Players'].ids[r] for r in np.asarray(records['PlayerId'])[rows]})
+
+    index = {pid: i for i, pid in enumerate(snapshot['Players'].ids)}
+    candidates = []
+    for pid in player_ids:
+        first, last = season.players.get(pid, ('', ''))
+        i = index[pid]
+        candidates.append(Candidate(pid, first, last, float(average[i]), float(player_handicap[i]),
+                                    points.get(pid, 0), flight_index.get(previous.get(pid)), pid in leaders))
+    return season.season_id, candidates, [(flight_id, name) for flight_id, name in flights]
+
+
+def existing_assignments(conn, season_id: str, session_start: int) -> Dict[str, Tuple[str, bool]]:
+    """player -> (flight, leader) currently stored for a session"""
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT "PlayerId", "FlightId", "IsFlightLeader" FROM "PlayerFlightAssignments"
+            WHERE "SeasonId" = %s AND "SessionStartWeekNumber" = %s
+        ''', (season_id, session_start))
+        return {str(p): (str(f), bool(leader)) for p, f, leader in cur.fetchall()}
+
+
+def write_assignments(conn, season_id: str, session_start: int, placements: Sequence[Placement]) -> int:
+    """Replace a session's PlayerFlightAssignments (caller commits)"""
+    from .batch import BatchWriter
+
+    with conn.cursor() as cur:
+        cur.execute('''
+            DELETE FROM "PlayerFlightAssignments"
+            WHERE "SeasonId" = %s AND "SessionStartWeekNumber" = %s
+        ''', (season_id, session_start))
+    assigned_at = datetime.utcnow()
+    with BatchWriter(conn, 'PlayerFlightAssignments', ASSIGNMENT_COLUMNS) as writer:
+        for p in placements:
+            writer.add(p.player_id, p.flight_id, season_id, session_start, p.is_leader, p.handicap, assigned_at)
+    return writer.rows_written
+
+
+def print_placements(placements: Sequence[Placement], existing: Optional[Dict[str, Tuple[str, bool]]] = None):
+    flight = None
+    for p in placements:
+        if p.flight != flight:
+            flight = p.flight
+            members = [q for q in placements if q.flight == flight]
+            mean = sum(q.average for q in members) / len(members)
+            print(f"\n🏆 {flight} ({len(members)} players, mean average {mean:.2f})")
+        change = ""
+        if existing is not None:
+            before = existing.get(p.player_id)
+            change = "  (new)" if before is None else "" if before[0] == p.flight_id else "  (moved)"
+        leader = " ⭐" if p.is_leader else ""
+        print(f"   {p.position:>2}. {p.name:<24} avg {p.average:>6.2f}  hcp {p.handicap:>4.0f}{leader}{change}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import db, snapshot as snapshots
+
+    parser = argparse.ArgumentParser(description="Place players into flights for a session and write the assignments")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshot', help='Snapshot directory (preview only)')
+    source.add_argument('--tenant', help='Tenant to read from and write to')
+    parser.add_argument('--season-id', help='Season (default: latest)')
+    parser.add_argument('--session-start', type=int, required=True, help='First week of the session being placed')
+    size = parser.add_mutually_exclusive_group(required=True)
+    size.add_argument('--flights', type=int, help='Number of flights')
+    size.add_argument('--flight-size', type=int, help='Players per flight')
+    size.add_argument('--sizes', help='Explicit sizes, strongest flight first, e.g. 8,8,8,10')
+    parser.add_argument('--mode', choices=MODES, default='tiered')
+    parser.add_argument('--by', choices=RANKINGS, default='average', help='Rank by current average or standings')
+    parser.add_argument('--movers', type=int, default=0, help='Players moving up/down per flight (--by standings)')
+    parser.add_argument('--leader', choices=LEADERS, default='best')
+    parser.add_argument('--players', choices=('previous', 'season'), default='previous',
+                        help='Place the previous session\'s players (default) or everyone with a season record')
+    parser.add_argument('--write', action='store_true', help='Replace the session\'s assignments (default: preview)')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.snapshot and args.write:
+        parser.error('--write needs --tenant')
+
+    conn = None
+    # an on-the-fly snapshot holds player names; it is removed with the directory
+    with tempfile.TemporaryDirectory(prefix='glm-placement-') as out_dir:
+        try:
+            if args.snapshot:
+                snap = snapshots.open_snapshot(args.snapshot)
+            else:
+                conn = db.connect(tenant=args.tenant)
+                snapshots.export_snapshot(conn, out_dir, tenant=db.tenant_name(args.tenant))
+                snap = snapshots.open_snapshot(out_dir)
+
+            season_id, candidates, flights = load_candidates(snap, args.session_start, args.season_id, args.players)
+            if not candidates:
+                print("❌ No players to place")
+                return 1
+            try:
+                sizes = flight_sizes(len(candidates), args.flights, args.flight_size,
+                                     [int(s) for s in args.sizes.split(',')] if args.sizes else None)
+                placements = place(candidates, flights, sizes, args.mode, args.by, args.leader, args.movers)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return 1
+            existing = existing_assignments(conn, season_id, args.session_start) if conn is not None else None
+
+            if args.json:
+                print(json.dumps([asdict(p) for p in placements], indent=2))
+            else:
+                print(f"🏌️  Session starting week {args.session_start}: {len(candidates)} players, "
+                      f"{args.mode} by {args.by}, flights of {', '.join(map(str, sizes))}")
+                print_placements(placements, existing)
+
+            if args.write:
+                written = write_assignments(conn, season_id, args.session_start, placements)
+                conn.commit()
+                print(f"\n✅ Replaced {len(existing)} assignment(s) with {written}")
+            elif conn is not None and not args.json:
+                print("\n(preview only; add --write to save)")
+            return 0
+        except Exception:
+            if conn is not None:
+                conn.rollback()
+            raise
+        finally:
+            if conn is not None:
+                conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,372 @@
+"""
+Profiling switches shared by every admin command.
+
+run(main) strips these switches from the command line (anywhere before a
+bare "--"), runs main(rest) under the requested tools and prints a
+summary to stderr when it returns or exits:
+
+    --profile[=N]         cProfile; top N functions (default 25) sorted by
+                          --profile-sort (default cumulative), and the raw
+                          stats dumped to --profile-out for pstats/snakeviz
+                          (default data/profiles/<command>-<timestamp>.pstats)
+    --trace-memory[=N]    tracemalloc; peak and current traced memory and the
+                          top N allocation sites (default 10)
+    --timings             wall clock per phase() block (and per phase memory
+                          delta when --trace-memory is on)
+    --diagnostics-out F   append the run as one JSON line to F ("-" for
+                          stderr), so runs can be compared over time
+
+Phases are marked in the commands with
+
+    with profiling.phase('hole scores'):
+        ...
+
+which also groups GLM_QUERY_LOG statements (querylog.py) under the same
+name. Nested phases are reported as "outer/inner"; blocks entered from
+worker threads (tenant fan-out) are summed per name. cProfile only sees
+the main thread, so per-tenant work done on the fan-out pool shows up in
+--timings but not in --profile.
+
+The scripts/ wrappers call sys.exit(run(main)), legacy scripts wrap their
+__main__ block the same way, and bin/glm accepts the switches before or
+after the command. Scripts that do their work at module level run under
+the switches through main() below, e.g.
+
+    scripts/bin/glm --timings --diagnostics-out runs.jsonl import scores southmoore Scores.csv
+    python3 scripts/database/expand-schedule.py --tenant southmoore --session-start 15 --profile=40
+    python3 -m glm.profiling --timings analysis/simple_week_check.py     # from scripts/
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_PROFILE_TOP = 25
+DEFAULT_MEMORY_TOP = 10
+DEFAULT_PROFILE_SORT = 'cumulative'
+DEFAULT_PROFILE_DIR = os.path.join('data', 'profiles')
+PROFILE_SORTS = ('cumulative', 'tottime', 'calls', 'ncalls', 'time', 'filename', 'name')
+
+_FLAGS = ('--profile', '--trace-memory', '--timings')
+_VALUED = ('--profile-out', '--profile-sort', '--diagnostics-out')
+
+
+class Options:
+    """Parsed profiling switches"""
+
+    def __init__(self):
+        self.profile_top: Optional[int] = None
+        self.profile_sort = DEFAULT_PROFILE_SORT
+        self.profile_out: Optional[str] = None
+        self.memory_top: Optional[int] = None
+        self.timings = False
+        self.diagnostics_out: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        # --diagnostics-out alone still records wall time and exit code
+        return (self.profile_top is not None or self.memory_top is not None or self.timings
+                or self.diagnostics_out is not None)
+
+
+def parse_switches(argv: Sequence[str]) -> Tuple[Options, List[str]]:
+    """Split argv into profiling Options and the command's own arguments"""
+    options, rest = Options(), []
+    args = list(argv)
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '--':
+            rest.extend(args[i:])
+            break
+        name, has_value, value = arg.partition('=')
+        if name in _VALUED:
+            if not has_value:
+                if i + 1 >= len(args):
+                    raise SystemExit(f"{name} needs a value")
+                i += 1
+                value = args[i]
+            if name == '--profile-sort' and value not in PROFILE_SORTS:
+                raise SystemExit(f"--profile-sort must be one of {', '.join(PROFILE_SORTS)}")
+            setattr(options, name[2:].replace('-', '_'), value)
+        elif name in _FLAGS:
+            if name == '--timings':
+                if has_value:
+                    raise SystemExit("--timings takes no value")
+                options.timings = True
+            else:
+                default = DEFAULT_PROFILE_TOP if name == '--profile' else DEFAULT_MEMORY_TOP
+                try:
+                    top = int(value) if has_value else default
+                except ValueError:
+                    raise SystemExit(f"{name}=N needs a number, got {value!r}")
+                if name == '--profile':
+                    options.profile_top = top
+                else:
+                    options.memory_top = top
+        else:
+            rest.append(arg)
+        i += 1
+    return options, rest
+
+
+class Timings:
+    """Wall clock (and optional traced-memory delta) per phase name, summed across threads"""
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.phases: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def phase(self, name: str):
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(name)
+        path = '/'.join(stack)
+        with self._lock:   # registered on entry so outer phases list before their inner ones
+            entry = self.phases.setdefault(path, {'phase': path, 'calls': 0, 'wall_ms': 0.0})
+        memory_before = self._traced() if self.memory else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            memory_delta = self._traced() - memory_before if self.memory else None
+            stack.pop()
+            with self._lock:
+                entry['calls'] += 1
+                entry['wall_ms'] += elapsed
+                if memory_delta is not None:
+                    entry['memory_delta_bytes'] = entry.get('memory_delta_bytes', 0) + memory_delta
+
+    @staticmethod
+    def _traced() -> int:
+        import tracemalloc
+        return tracemalloc.get_traced_memory()[0]
+
+    def summary(self) -> List[Dict]:
+        return [dict(p, wall_ms=round(p['wall_ms'], 3)) for p in self.phases.values()]
+
+
+_timings: Optional[Timings] = None
+
+
+@contextmanager
+def phase(name: str):
+    """Time the block as `name` under --timings and group its GLM_QUERY_LOG statements"""
+    # querylog is only in sys.modules when GLM_QUERY_LOG is set (or a command imported it)
+    queries = sys.modules.get(f'{__package__}.querylog')
+    with queries.phase(name) if queries is not None else nullcontext():
+        if _timings is None:
+            yield
+        else:
+            with _timings.phase(name):
+                yield
+
+
+def _profile_section(profiler, options: Options, command: str, started: float) -> Dict:
+    import pstats
+
+    path = options.profile_out
+    if not path:
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(started))
+        slug = ''.join(c if c.isalnum() or c in '-_' else '-' for c in command).strip('-') or 'glm'
+        path = os.path.join(DEFAULT_PROFILE_DIR, f'{slug}-{stamp}.pstats')
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(options.profile_sort)
+    top = []
+    for func in stats.fcn_list[:options.profile_top]:
+        primitive, calls, tottime, cumtime, _ = stats.stats[func]
+        filename, line, function = func
+        top.append({
+            'function': function,
+            'file': filename,
+            'line': line,
+            'calls': calls,
+            'primitive_calls': primitive,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+        })
+    return {'sort': options.profile_sort, 'total_calls': stats.total_calls,
+            'total_ms': round(stats.total_tt * 1000, 3), 'stats_file': path, 'top': top}
+
+
+def _memory_section(options: Options) -> Dict:
+    import tracemalloc
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+    tracemalloc.stop()
+    top = [{'location': f'{s.traceback[0].filename}:{s.traceback[0].lineno}',
+            'size_bytes': s.size, 'count': s.count}
+           for s in snapshot.statistics('lineno')[:options.memory_top]]
+    return {'peak_bytes': peak, 'current_bytes': current, 'top': top}
+
+
+def _megabytes(n: int) -> str:
+    return f"{n / (1024 * 1024):,.1f} MB"
+
+
+def print_report(report: Dict, stream=sys.stderr):
+    """Human-readable summary of a run() report"""
+    print(f"\n⏱️  {report['command']}: {report['wall_ms']:.1f} ms wall, exit {report['exit_code']}", file=stream)
+
+    timings = report.get('timings')
+    if timings is not None:
+        print(f"\n{'Phase':<40} {'Calls':>6} {'Wall ms':>10} {'%':>6}" +
+              (f" {'Δ memory':>12}" if any('memory_delta_bytes' in p for p in timings) else ''), file=stream)
+        for p in timings:
+            share = 100 * p['wall_ms'] / report['wall_ms'] if report['wall_ms'] else 0
+            memory = f" {_megabytes(p['memory_delta_bytes']):>12}" if 'memory_delta_bytes' in p else ''
+            print(f"{p['phase'][:40]:<40} {p['calls']:>6} {p['wall_ms']:>10.1f} {share:>5.1f}%{memory}", file=stream)
+        if not timings:
+            print("(no phases recorded; the command has no profiling.phase() blocks)", file=stream)
+
+    profile = report.get('profile')
+    if profile is not None:
+        print(f"\n🔬 cProfile: {profile['total_calls']:,} calls, {profile['total_ms']:.1f} ms, "
+              f"top {len(profile['top'])} by {profile['sort']} (stats: {profile['stats_file']})", file=stream)
+        print(f"{'Calls':>10} {'Tot ms':>10} {'Cum ms':>10}  Function", file=stream)
+        for f in profile['top']:
+            calls = f"{f['calls']}" if f['calls'] == f['primitive_calls'] else f"{f['calls']}/{f['primitive_calls']}"
+            print(f"{calls:>10} {f['tottime_ms']:>10.1f} {f['cumtime_ms']:>10.1f}  "
+                  f"{f['function']} ({os.path.basename(f['file'])}:{f['line']})", file=stream)
+
+    memory = report.get('memory')
+    if memory is not None:
+        print(f"\n🧠 tracemalloc: peak {_megabytes(memory['peak_bytes'])}, "
+              f"current {_megabytes(memory['current_bytes'])}", file=stream)
+        for m in memory['top']:
+            print(f"{_megabytes(m['size_bytes']):>12} {m['count']:>9,} blocks  {m['location']}", file=stream)
+
+
+def _write_report(report: Dict, destination: str):
+    import json
+
+    line = json.dumps(report, default=str)
+    if destination == '-':
+        print(line, file=sys.stderr)
+        return
+    directory = os.path.dirname(destination)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(destination, 'a') as f:
+        f.write(line + '\n')
+    print(f"📝 Diagnostics appended to {destination}", file=sys.stderr)
+
+
+def run(main: Callable[[List[str]], Optional[int]], argv: Optional[Sequence[str]] = None,
+        command: Optional[str] = None) -> int:
+    """
+    Run main(args) with the profiling switches in argv (default
+    sys.argv[1:]) applied; returns main's exit code. Switches taken from
+    sys.argv are removed from it too, for scripts whose main() reads it.
+    """
+    if argv is None:
+        options, sys.argv[1:] = parse_switches(sys.argv[1:])
+        return execute(options, main, sys.argv[1:], command or os.path.basename(sys.argv[0]))
+    options, rest = parse_switches(argv)
+    return execute(options, main, rest, command or os.path.basename(sys.argv[0]))
+
+
+def execute(options: Options, main: Callable[[List[str]], Optional[int]], args: List[str],
+            command: str) -> int:
+    """Run main(args) under already parsed Options and report as `command`"""
+    global _timings
+
+    if not options.enabled:
+        return main(args) or 0
+
+    profiler = None
+    if options.memory_top is not None:
+        import tracemalloc
+        tracemalloc.start()
+    if options.timings:
+        _timings = Timings(memory=options.memory_top is not None)
+    if options.profile_top is not None:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    started = time.time()
+    start = time.perf_counter()
+    exit_code, error = 0, None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            exit_code = main(args) or 0
+        finally:
+            if profiler is not None:
+                profiler.disable()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except BaseException as e:
+        exit_code, error = 1, f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        report = {
+            'command': command,
+            'argv': args,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(started)),
+            'python': sys.version.split()[0],
+            'pid': os.getpid(),
+            'exit_code': exit_code,
+            'error': error,
+            'wall_ms': round((time.perf_counter() - start) * 1000, 3),
+        }
+        if _timings is not None:
+            report['timings'] = _timings.summary()
+            _timings = None
+        if options.memory_top is not None:
+            report['memory'] = _memory_section(options)
+        if profiler is not None:
+            report['profile'] = _profile_section(profiler, options, command, started)
+        print_report(report)
+        if options.diagnostics_out:
+            _write_report(report, options.diagnostics_out)
+    return exit_code
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    python3 -m glm.profiling [switches] SCRIPT [args...] (from scripts/):
+    run a script that has no entry point of its own, such as the
+    module-level analyses under analysis/, as __main__ under the switches.
+    """
+    options, rest = parse_switches(sys.argv[1:] if argv is None else argv)
+    if not rest or rest[0] in ('-h', '--help'):
+        print("usage: python3 -m glm.profiling [switches] SCRIPT [args...]",
+              file=sys.stdout if rest else sys.stderr)
+        return 0 if rest else 2
+    script = rest[0]
+
+    def run_script(args: List[str]) -> int:
+        import runpy
+        saved_argv, saved_path = sys.argv, list(sys.path)
+        sys.argv = [script] + args
+        sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+        try:
+            runpy.run_path(script, run_name='__main__')
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+        return 0
+
+    return execute(options, run_script, rest[1:], os.path.basename(script))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+Monte Carlo projection of the current session's flight standings.
+
+Answers "who can still win the flight?" by playing the session's
+remaining scheduled matchups many times over:
+
+  * each player's hole scores are drawn from their own strokes-over-par
+    history (HoleScores); players with fewer than MIN_HISTORY_HOLES holes
+    draw from the league's residuals centred on their current average
+  * strokes come from the handicap as of the previous week, recomputed
+    after every simulated week with the season's AverageMethod and
+    HandicapMethod (glm.handicap), and matches are scored with glm.scoring
+  * special weeks award SpecialPointsAwarded to everyone; everybody is
+    assumed to show up
+  * final positions use the standings order (session total, then last name)
+
+Simulations are split into chunks that run on every core through a
+process pool; each worker returns position counts, not per-season data.
+
+Usage:
+    python3 scripts/analysis/project-season.py --snapshot data/snapshots/southmoore --simulations 100000
+    python3 scripts/analysis/project-season.py --tenant southmoore --playoff-spots 2 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from . import handicap as handicap_rules
+from .scoring import HOLES, PointsRules, score_matches, stroke_counts
+from .standings import StandingsEngine, load_season_from_snapshot
+from .strokes import FRONT, load_snapshot_course
+
+MIN_HISTORY_HOLES = 18
+BATCH_SIZE = 5000
+DEFAULT_PLAYOFF_SPOTS = 2
+
+
+@dataclass
+class RemainingWeek:
+    number: int
+    nine: int
+    counts_for_handicap: bool
+    special_points: Optional[int]
+    pairs: np.ndarray          # (k, 2) player indexes, A then B
+
+
+@dataclass
+class ProjectionModel:
+    """Everything a worker needs to simulate the rest of a session (picklable)"""
+    player_ids: List[str]
+    names: List[str]
+    flights: List[Tuple[str, np.ndarray]]   # (flight name, player indexes in tie-break order)
+    base_points: np.ndarray                 # (p,) session points so far
+    average_total: np.ndarray               # (p,) running average state
+    average_rounds: np.ndarray
+    over_par: np.ndarray                    # (p, k) strokes-over-par samples per player
+    over_par_count: np.ndarray              # (p,) valid samples in each row
+    pars: np.ndarray                        # (19,) par by hole number, index 0 unused
+    stroke_tables: np.ndarray               # CourseStrokeTables.stacked
+    weeks: List[RemainingWeek]
+    rules: PointsRules = PointsRules()
+    handicap_method: int = handicap_rules.SIMPLE_AVERAGE
+    average_method: int = handicap_rules.SIMPLE
+    course_par: float = 36
+    session_start: int = 1
+    last_played_week: int = 0
+
+    def max_remaining(self) -> np.ndarray:
+        """Most points each player can still earn"""
+        best = np.zeros(len(self.player_ids), dtype=np.int64)
+        match_max = self.rules.hole_win * HOLES + self.rules.match_win_bonus
+        for week in self.weeks:
+            np.add.at(best, week.pairs.ravel(), week.special_points or match_max)
+        return best
+
+
+@dataclass
+class PlayerProjection:
+    id: str
+    name: str
+    flight: str
+    points: int
+    max_points: int
+    expected_points: float
+    title: float
+    playoff: float
+    positions: List[float]
+    alive: bool
+
+
+@dataclass
+class Projection:
+    simulations: int
+    session_start: int
+    last_played_week: int
+    remaining_weeks: List[int]
+    elapsed_seconds: float
+    players: List[PlayerProjection] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def build_model(snapshot, season_id: Optional[str] = None, session_start: Optional[int] = None) -> ProjectionModel:
+    """Projection inputs for the session with unplayed matchups (or `session_start`) from a snapshot"""
+    season = load_season_from_snapshot(snapshot, season_id)
+    engine = StandingsEngine(season)
+    season_row = snapshot['Seasons'].index_of(season.season_id)
+
+    settings = snapshot['LeagueSettings']
+    settings_rows = np.nonzero(np.asarray(settings['SeasonId']) == season_row)[0]
+    if len(settings_rows):
+        s = settings_rows[0]
+        points_rules = PointsRules(int(settings['HoleWinPoints'][s]), int(settings['HoleHalvePoints'][s]),
+                                   int(settings['MatchWinBonus'][s]), int(settings['MatchTiePoints'][s]))
+        handicap_method, average_method = int(settings['HandicapMethod'][s]), int(settings['AverageMethod'][s])
+        course_par = float(settings['CoursePar'][s])
+    else:
+        points_rules, course_par = PointsRules(), 36.0
+        handicap_method, average_method = handicap_rules.SIMPLE_AVERAGE, handicap_rules.SIMPLE
+
+    tables, pars = load_snapshot_course(snapshot)
+
+    # Week rows of this season in week order, with per-player gross totals from HoleScores
+    weeks = snapshot['Weeks']
+    week_rows = np.nonzero(np.asarray(weeks['SeasonId']) == season_row)[0]
+    week_rows = week_rows[np.argsort(np.asarray(weeks['WeekNumber'])[week_rows], kind='stable')]
+    week_numbers = np.asarray(weeks['WeekNumber'])[week_rows]
+
+    players = snapshot['Players']
+    player_ids = players.ids
+    index = {pid: i for i, pid in enumerate(player_ids)}
+    p = len(player_ids)
+
+    matchups = snapshot['Matchups']
+    m_week = np.asarray(matchups['WeekId'])
+    m_a, m_b = np.asarray(matchups['PlayerAId']), np.asarray(matchups['PlayerBId'])
+    week_slot = np.full(len(weeks), -1)
+    week_slot[week_rows] = np.arange(len(week_rows))
+
+    holes = snapshot['HoleScores']
+    h_matchup = np.asarray(holes['MatchupId'])
+    valid = h_matchup >= 0
+    h_matchup = h_matchup[valid]
+    h_slot = week_slot[m_week[h_matchup]]
+    in_season = h_slot >= 0
+    gross = np.zeros((p, len(week_rows)))
+    samples: List[List[int]] = [[] for _ in range(p)]
+    for side, players_col in (('PlayerAScore', m_a), ('PlayerBScore', m_b)):
+        score = np.asarray(holes[side])[valid]
+        entered = in_season & (score >= 0) & (players_col[h_matchup] >= 0)
+        who = players_col[h_matchup][entered]
+        np.add.at(gross, (who, h_slot[entered]), score[entered])
+        over = score[entered] - np.asarray(holes['Par'])[valid][entered]
+        for player, value in zip(who.tolist(), over.tolist()):
+            samples[player].append(value)
+
+    # Average state up to the last played week
+    played_matchups = (np.asarray(matchups['PlayerAPoints']) >= 0) | (np.asarray(matchups['PlayerBPoints']) >= 0) \
+        | np.asarray(matchups['PlayerAAbsent']) | np.asarray(matchups['PlayerBAbsent'])
+    played_slots = week_slot[m_week[played_matchups & (m_week >= 0)]]
+    played_slots = played_slots[played_slots >= 0]
+    last_slot = int(played_slots.max()) if len(played_slots) else -1
+    last_played = int(week_numbers[last_slot]) if last_slot >= 0 else 0
+
+    psr = snapshot['PlayerSeasonRecords']
+    initial = np.nan_to_num(np.asarray(players['InitialAverageScore'], dtype=np.float64), nan=0.0)
+    psr_rows = np.nonzero((np.asarray(psr['SeasonId']) == season_row) & (np.asarray(psr['PlayerId']) >= 0))[0]
+    initial[np.asarray(psr['PlayerId'])[psr_rows]] = np.asarray(psr['InitialAverageScore'])[psr_rows]
+    counts_for_scoring = np.asarray(weeks['CountsForScoring'])[week_rows]
+    counts_for_handicap = np.asarray(weeks['CountsForHandicap'])[week_rows]
+    done = counts_for_scoring & (np.arange(len(week_rows)) <= last_slot)
+    _, average_total, average_rounds = handicap_rules.average_history(
+        initial, gross[:, done], counts_for_handicap[done], average_method)
+
+    # Score samples: own history, else league residuals shifted to the player's average
+    own = [np.array(s, dtype=np.int8) for s in samples]
+    residuals = np.concatenate([s - s.mean() for s in own if len(s) >= MIN_HISTORY_HOLES] or [np.zeros(1)])
+    width = max([len(residuals)] + [len(s) for s in own])
+    over_par = np.zeros((p, width), dtype=np.int8)
+    over_par_count = np.zeros(p, dtype=np.int64)
+    current = handicap_rules.current_average(average_total, average_rounds)
+    for i, s in enumerate(own):
+        if len(s) < MIN_HISTORY_HOLES:
+            s = np.rint(residuals + (current[i] - handicap_rules.effective_par(course_par)) / HOLES).astype(np.int8)
+        over_par[i, :len(s)] = s
+        over_par_count[i] = len(s)
+
+    # Session to project and the points already banked in it
+    if session_start is None:
+        session_start = engine.session_start(last_played + 1)
+    base = engine.session_totals(last_played) if last_played >= session_start else {}
+    base_points = np.zeros(p, dtype=np.int64)
+    for player, points in base.items():
+        base_points[index[player]] = points
+
+    next_starts = [w.number for w in season.weeks if w.session_start and w.number > session_start]
+    session_end = min(next_starts) if next_starts else None
+    remaining = []
+    for slot, row in enumerate(week_rows):
+        number = int(week_numbers[slot])
+        if number <= last_played or number < session_start or (session_end and number >= session_end):
+            continue
+        rows = np.nonzero((m_week == row) & (m_a >= 0) & (m_b >= 0))[0]
+        if not len(rows):
+            continue
+        special = int(weeks['SpecialPointsAwarded'][row])
+        remaining.append(RemainingWeek(number, int(weeks['NineHoles'][row]) or FRONT,
+                                       bool(counts_for_handicap[slot] and counts_for_scoring[slot]),
+                                       special if special > 0 else None,
+                                       np.stack([m_a[rows], m_b[rows]], axis=1)))
+
+    flights = []
+    members_by_flight: Dict[str, List[int]] = {}
+    for player, flight, start in season.assignments:
+        if start == session_start and flight in season.flights:
+            members_by_flight.setdefault(flight, []).append(index[player])
+    last_names = players.text('LastName')
+    first_names = players.text('FirstName')
+    for flight, name in sorted(season.flights.items(), key=lambda f: f[1]):
+        members = sorted(members_by_flight.get(flight, []),
+                         key=lambda i: (last_names[i] or '', first_names[i] or ''))
+        if members:
+            flights.append((name, np.array(members)))
+
+    names = [f"{first_names[i] or ''} {last_names[i] or ''}".strip() for i in range(p)]
+    return ProjectionModel(player_ids, names, flights, base_points, average_total, average_rounds,
+                           over_par, over_par_count, pars, tables.stacked, remaining, points_rules,
+                           handicap_method, average_method, course_par, session_start, last_played)
+
+
+def simulate(model: ProjectionModel, simulations: int, seed=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Play the remaining weeks `simulations` times.
+
+    Returns (position_counts, points_sum): position_counts[player, rank]
+    over all simulations (rank 0 = flight winner) and the summed final
+    points per player.
+    """
+    rng = np.random.default_rng(seed)
+    p = len(model.player_ids)
+    width = max((len(m) for _, m in model.flights), default=1)
+    position_counts = np.zeros((p, width), dtype=np.int64)
+    points_sum = np.zeros(p, dtype=np.float64)
+
+    for start in range(0, simulations, BATCH_SIZE):
+        n = min(BATCH_SIZE, simulations - start)
+        points = np.tile(model.base_points, (n, 1))
+        total = np.tile(model.average_total, (n, 1))
+        rounds = np.tile(model.average_rounds, (n, 1))
+
+        for week in model.weeks:
+            a, b = week.pairs[:, 0], week.pairs[:, 1]
+            if week.special_points:
+                points[:, a] += week.special_points
+                points[:, b] += week.special_points
+                continue
+
+            handicap = handicap_rules.handicap_from_average(handicap_rules.current_average(total, rounds),
+                                                   model.handicap_method, model.course_par)
+            hole_numbers = np.arange(1, HOLES + 1) + (0 if week.nine == FRONT else HOLES)
+            a_scores = model.pars[hole_numbers] + _draw(model, rng, a, n)
+            b_scores = model.pars[hole_numbers] + _draw(model, rng, b, n)
+            strokes, a_receives = stroke_counts(handicap[:, a].ravel(), handicap[:, b].ravel())
+            result = score_matches(a_scores.reshape(-1, HOLES), b_scores.reshape(-1, HOLES),
+                                   rules=model.rules, strokes=strokes, a_receives=a_receives,
+                                   stroke_holes=model.stroke_tables[week.nine, strokes])
+            np.add.at(points, (slice(None), a), result.a_points.reshape(n, -1))
+            np.add.at(points, (slice(None), b), result.b_points.reshape(n, -1))
+
+            gross = np.zeros((n, p))
+            gross[:, a] = a_scores.sum(axis=2)
+            gross[:, b] = b_scores.sum(axis=2)
+            total, rounds = handicap_rules.continue_average(total, rounds, gross, week.counts_for_handicap,
+                                                   model.average_method)
+
+        points_sum += points.sum(axis=0)
+        for _, members in model.flights:
+            # Stable sort keeps the last-name order among players on equal points
+            order = np.argsort(-points[:, members], axis=1, kind='stable')
+            ranks = np.empty_like(order)
+            np.put_along_axis(ranks, order, np.arange(len(members))[None, :], axis=1)
+            for j, player in enumerate(members):
+                position_counts[player, :len(members)] += np.bincount(ranks[:, j], minlength=len(members))
+
+    return position_counts, points_sum
+
+
+def _draw(model: ProjectionModel, rng, players: np.ndarray, n: int) -> np.ndarray:
+    """(n, k, 9) strokes over par resampled from each player's history"""
+    counts = model.over_par_count[players]
+    picks = (rng.random((n, len(players), HOLES)) * counts[None, :, None]).astype(np.int64)
+    return model.over_par[players[None, :, None], picks]
+
+
+_worker_model: Optional[ProjectionModel] = None
+
+
+def _init_worker(model: ProjectionModel):
+    global _worker_model
+    _worker_model = model
+
+
+def _simulate_chunk(args):
+    simulations, seed = args
+    return simulate(_worker_model, simulations, seed)
+
+
+def project(model: ProjectionModel, simulations: int = 100_000, workers: Optional[int] = None,
+            playoff_spots: int = DEFAULT_PLAYOFF_SPOTS, seed: Optional[int] = None) -> Projection:
+    """Run the simulations across a process pool and summarize each player's outlook"""
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    chunks = min(simulations, workers * 4) if workers > 1 else 1
+    sizes = [simulations // chunks + (i < simulations % chunks) for i in range(chunks)]
+    seeds = np.random.SeedSequence(seed).spawn(chunks)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(model,)) as pool:
+            parts = list(pool.map(_simulate_chunk, zip(sizes, seeds)))
+    else:
+        parts = [simulate(model, size, s) for size, s in zip(sizes, seeds)]
+    position_counts = sum(part[0] for part in parts)
+    points_sum = sum(part[1] for part in parts)
+
+    max_points = model.base_points + model.max_remaining()
+    result = Projection(simulations, model.session_start, model.last_played_week,
+                        [w.number for w in model.weeks], round(time.perf_counter() - start, 2))
+    for flight, members in model.flights:
+        leader = model.base_points[members].max()
+        for player in members:
+            share = position_counts[player, :len(members)] / simulations
+            result.players.append(PlayerProjection(
+                model.player_ids[player], model.names[player], flight,
+                int(model.base_points[player]), int(max_points[player]),
+                round(float(points_sum[player]) / simulations, 1),
+                round(float(share[0]), 4), round(float(share[:playoff_spots].sum()), 4),
+                [round(float(s), 4) for s in share], bool(max_points[player] >= leader)))
+    result.players.sort(key=lambda r: (r.flight, -r.expected_points))
+    return result
+
+
+def print_projection(result: Projection, playoff_spots: int):
+    print(f"🎲 {result.simulations:,} simulated finishes of the session starting week {result.session_start} "
+          f"(played through week {result.last_played_week}, remaining {result.remaining_weeks or 'none'}) "
+          f"in {result.elapsed_seconds}s")
+    flight = None
+    for r in result.players:
+        if r.flight != flight:
+            flight = r.flight
+            print(f"\n🏆 {flight}")
+            print(f"   {'player':<22}{'pts':>5}{'max':>5}{'exp':>7}{'win %':>8}{f'top {playoff_spots} %':>9}")
+        status = "" if r.alive else "  (eliminated)"
+        print(f"   {r.name:<22}{r.points:>5}{r.max_points:>5}{r.expected_points:>7}"
+              f"{r.title * 100:>8.1f}{r.playoff * 100:>9.1f}{status}")
+
+
+def _project(args: argparse.Namespace, snap) -> int:
+    model = build_model(snap, args.season_id, args.session_start)
+    result = project(model, args.simulations, args.workers, args.playoff_spots, args.seed)
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print_projection(result, args.playoff_spots)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import db, snapshot as snapshots
+
+    parser = argparse.ArgumentParser(description="Project flight title, playoff and position probabilities")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshot', help='Snapshot directory written by snapshot-tenant.py')
+    source.add_argument('--tenant', help='Tenant to snapshot on the fly')
+    parser.add_argument('--season-id', help='Season to use (default: latest)')
+    parser.add_argument('--session-start', type=int, help='Session start week to project (default: current session)')
+    parser.add_argument('--simulations', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, help='Worker processes (default: all cores)')
+    parser.add_argument('--playoff-spots', type=int, default=DEFAULT_PLAYOFF_SPOTS)
+    parser.add_argument('--seed', type=int, help='Seed for a reproducible projection')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        return _project(args, snapshots.open_snapshot(args.snapshot))
+    # the on-the-fly snapshot holds player names; it only lives as long as the projection
+    with tempfile.TemporaryDirectory(prefix='glm-projection-') as out_dir:
+        conn = db.connect(tenant=args.tenant)
+        try:
+            snapshots.export_snapshot(conn, out_dir, tenant=db.tenant_name(args.tenant))
+        finally:
+            conn.close()
+        return _project(args, snapshots.open_snapshot(out_dir))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Opt-in query instrumentation for the psycopg2 scripts.
+
+Set GLM_QUERY_LOG and every connection opened after `glm` is imported
+(psycopg2.connect is wrapped, so glm.db.connect and the scripts' own
+connect calls alike) records each statement's normalized shape, duration
+and row count per phase, and a summary is printed when the script exits:
+
+    GLM_QUERY_LOG=1          table on stderr (also: "table")
+    GLM_QUERY_LOG=json       JSON on stderr
+    GLM_QUERY_LOG=out.json   JSON written to that file
+
+Shapes are the SQL with literals and placeholders replaced by "?" and
+VALUES/IN lists collapsed, so `WHERE "WeekNumber" = 3` and `= 4` count as
+one query. A shape executed REPEAT_THRESHOLD or more times in one phase is
+flagged as a likely N+1 (e.g. get_week_id() inside insert_matchups' loop).
+
+Phases are marked with `with profiling.phase('load players'):` (which
+also times them under --timings; querylog.phase() groups statements
+only); statements outside any phase are grouped under "main". When GLM_QUERY_LOG is unset
+nothing is wrapped and phase() costs one attribute check. instrument(conn)
+wraps any DB-API connection explicitly (e.g. a glm.fixtures connection).
+"""
+
+import atexit
+import json
+import os
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, TextIO, Tuple
+
+ENV_VAR = 'GLM_QUERY_LOG'
+REPEAT_THRESHOLD = 5
+DEFAULT_PHASE = 'main'
+SHAPE_WIDTH = 70
+
+# Quoted identifiers are kept; string/number literals and placeholders become ?
+_TOKENS = re.compile(r'''("(?:[^"]|"")*")|('(?:[^']|'')*')|(%\(\w+\)s|%s|\$\d+)|(\b\d+(?:\.\d+)?\b)''')
+_COMMENTS = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_GROUPS = re.compile(r'(\(\?\.\.\.\))(?:\s*,\s*\(\?\.\.\.\))+')
+
+
+def normalize(query) -> str:
+    """SQL text -> its shape: literals and placeholders as ?, lists collapsed, whitespace squeezed"""
+    if isinstance(query, bytes):
+        query = query.decode('utf-8', 'replace')
+    text = _COMMENTS.sub(' ', str(query))
+    text = _TOKENS.sub(lambda m: m.group(1) or '?', text)
+    text = _LIST.sub('(?...)', text)
+    text = _GROUPS.sub(r'\1, ...', text)
+    return ' '.join(text.split())
+
+
+@dataclass
+class QueryStats:
+    phase: str
+    shape: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    errors: int = 0
+    repeated: bool = False
+
+
+class QueryLog:
+    """Per-(phase, shape) statistics, shared by every instrumented connection in the process"""
+
+    def __init__(self, repeat_threshold: int = REPEAT_THRESHOLD):
+        self.repeat_threshold = repeat_threshold
+        self.stats: Dict[Tuple[str, str], QueryStats] = {}
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def current_phase(self) -> str:
+        stack = getattr(self._local, 'phases', None)
+        return stack[-1] if stack else DEFAULT_PHASE
+
+    @contextmanager
+    def phase(self, name: str):
+        stack = self._local.__dict__.setdefault('phases', [])
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+
+    def record(self, query, elapsed_ms: float, rows: int, error: bool = False, single: bool = True):
+        key = (self.current_phase, normalize(query))
+        if ', ...' in key[1]:   # multi-row VALUES (execute_values pages) is already batched
+            single = False
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = QueryStats(*key)
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += max(rows, 0)
+            stats.errors += error
+            # executemany/COPY batches are one round trip on purpose; only single statements count
+            if single and stats.calls >= self.repeat_threshold:
+                stats.repeated = True
+
+    def summary(self) -> Dict:
+        stats = sorted(self.stats.values(), key=lambda s: -s.total_ms)
+        return {
+            'statements': sum(s.calls for s in stats),
+            'query_ms': round(sum(s.total_ms for s in stats), 3),
+            'wall_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'phases': sorted({s.phase for s in stats}),
+            'queries': [dict(asdict(s), total_ms=round(s.total_ms, 3), max_ms=round(s.max_ms, 3)) for s in stats],
+            'repeated': [{'phase': s.phase, 'shape': s.shape, 'calls': s.calls} for s in stats if s.repeated],
+        }
+
+    def print_table(self, stream: TextIO = sys.stderr):
+        summary = self.summary()
+        print(f"\n🔎 Query log: {summary['statements']} statement(s), {summary['query_ms']:.1f} ms in the database "
+              f"({summary['wall_ms']:.0f} ms wall), phases: {', '.join(summary['phases']) or '-'}", file=stream)
+        if not summary['queries']:
+            return
+        print(f"{'Phase':<16} {'Calls':>6} {'Total ms':>9} {'Max ms':>8} {'Rows':>7}  Statement", file=stream)
+        print("-" * (55 + SHAPE_WIDTH), file=stream)
+        for q in summary['queries']:
+            shape = q['shape'] if len(q['shape']) <= SHAPE_WIDTH else q['shape'][:SHAPE_WIDTH - 3] + '...'
+            flag = ' ⚠️' if q['repeated'] else ''
+            print(f"{q['phase'][:16]:<16} {q['calls']:>6} {q['total_ms']:>9.1f} {q['max_ms']:>8.1f} "
+                  f"{q['rows']:>7}  {shape}{flag}", file=stream)
+        for r in summary['repeated']:
+            print(f"⚠️  Possible N+1 in '{r['phase']}': ran {r['calls']} times: {r['shape'][:200]}", file=stream)
+
+    def report(self, destination: str):
+        """Write the summary to `destination` (a GLM_QUERY_LOG value)"""
+        if destination.lower() in ('1', 'true', 'yes', 'table'):
+            self.print_table()
+        elif destination.lower() == 'json':
+            print(json.dumps(self.summary(), indent=2), file=sys.stderr)
+        else:
+            with open(destination, 'w') as f:
+                json.dump(self.summary(), f, indent=2)
+            print(f"🔎 Query log written to {destination}", file=sys.stderr)
+
+
+class InstrumentedCursor:
+    """Cursor proxy timing execute/executemany/copy_* into a QueryLog"""
+
+    def __init__(self, cursor, log: QueryLog):
+        self.wrapped = cursor
+        self._log = log
+
+    def _timed(self, query, call, single: bool = True):
+        text = self._text(query)
+        start = time.perf_counter()
+        try:
+            result = call()
+        except Exception:
+            self._log.record(text, (time.perf_counter() - start) * 1000, 0, error=True, single=single)
+            raise
+        rows = getattr(self.wrapped, 'rowcount', -1)
+        self._log.record(text, (time.perf_counter() - start) * 1000, rows if isinstance(rows, int) else -1,
+                         single=single)
+        return result
+
+    def _text(self, query):
+        if hasattr(query, 'as_string'):   # psycopg2.sql.Composed
+            try:
+                return query.as_string(self.wrapped)
+            except Exception:
+                return repr(query)
+        return query
+
+    def execute(self, query, *args, **kwargs):
+        return self._timed(query, lambda: self.wrapped.execute(query, *args, **kwargs))
+
+    def executemany(self, query, *args, **kwargs):
+        return self._timed(query, lambda: self.wrapped.executemany(query, *args, **kwargs), single=False)
+
+    def copy_expert(self, sql, *args, **kwargs):
+        return self._timed(sql, lambda: self.wrapped.copy_expert(sql, *args, **kwargs), single=False)
+
+    def copy_from(self, file, table, *args, **kwargs):
+        return self._timed(f'COPY {table} FROM STDIN',
+                           lambda: self.wrapped.copy_from(file, table, *args, **kwargs), single=False)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def __iter__(self):
+        return iter(self.wrapped)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wrapped.close()
+        return False
+
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors are InstrumentedCursor; everything else passes through"""
+
+    def __init__(self, conn, log: QueryLog):
+        self.wrapped = conn
+        self._log = log
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self.wrapped.cursor(*args, **kwargs), self._log)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def __enter__(self):
+        self.wrapped.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self.wrapped.__exit__(exc_type, exc, tb)
+
+
+_log: Optional[QueryLog] = None
+
+
+def active() -> Optional[QueryLog]:
+    """The process-wide QueryLog, or None when instrumentation is off"""
+    return _log
+
+
+def instrument(conn):
+    """Wrap a connection when instrumentation is on (returned unchanged otherwise)"""
+    if _log is None or isinstance(conn, InstrumentedConnection):
+        return conn
+    return InstrumentedConnection(conn, _log)
+
+
+@contextmanager
+def phase(name: str):
+    """Group the statements run inside the block under `name`"""
+    if _log is None:
+        yield
+        return
+    with _log.phase(name):
+        yield
+
+
+def enable(destination: Optional[str] = 'table', repeat_threshold: int = REPEAT_THRESHOLD) -> QueryLog:
+    """
+    Start recording: wrap psycopg2.connect (when installed) and, with a
+    destination, report at interpreter exit.
+    """
+    global _log
+    if _log is not None:
+        return _log
+    _log = QueryLog(repeat_threshold)
+    try:
+        import psycopg2
+    except ImportError:
+        psycopg2 = None
+    if psycopg2 is not None and not getattr(psycopg2.connect, '_glm_instrumented', False):
+        connect = psycopg2.connect
+
+        def instrumented_connect(*args, **kwargs):
+            return instrument(connect(*args, **kwargs))
+
+        instrumented_connect._glm_instrumented = True
+        psycopg2.connect = instrumented_connect
+    if destination:
+        atexit.register(_log.report, destination)
+    return _log
+
+
+def install_from_env():
+    """Called on `import glm`: enable() when GLM_QUERY_LOG is set"""
+    destination = os.environ.get(ENV_VAR, '').strip()
+    if destination and destination.lower() not in ('0', 'false', 'no', 'off'):
+        enable(destination)
@@ -0,0 +1,297 @@
+"""
+Session rollover for flight assignments, for every tenant at once.
+
+Replaces copy_session_assignments.py (prompted, deleted, then inserted row
+by row). For each tenant, in its own transaction:
+
+  * the source session is the latest SessionStartWeekNumber with
+    assignments (or --from-week), the target the next SessionStart week
+    after it (or --to-week)
+  * a target that already has assignments is left alone unless --replace
+  * the copy is a single INSERT ... SELECT with gen_random_uuid() ids, or,
+    with --reseed, a fresh glm.placement run over the source session's
+    players (flight sizes kept from the source unless given)
+
+--dry-run prints what would change per player (new / moved / leader /
+dropped) and writes nothing.
+
+Usage:
+    python3 scripts/database/rollover-session.py --dry-run
+    python3 scripts/database/rollover-session.py --tenant southmoore --from-week 1 --to-week 8 --replace
+    python3 scripts/database/rollover-session.py --reseed standings --movers 2
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from . import db
+
+COPY_SQL = '''
+    INSERT INTO "PlayerFlightAssignments"
+        ("Id", "PlayerId", "FlightId", "SeasonId", "SessionStartWeekNumber",
+         "IsFlightLeader", "HandicapAtAssignment", "AssignmentDate")
+    SELECT gen_random_uuid(), "PlayerId", "FlightId", "SeasonId", %(target)s,
+           "IsFlightLeader", "HandicapAtAssignment", now()
+    FROM "PlayerFlightAssignments"
+    WHERE "SeasonId" = %(season)s AND "SessionStartWeekNumber" = %(source)s
+'''
+
+DELETE_SQL = '''
+    DELETE FROM "PlayerFlightAssignments"
+    WHERE "SeasonId" = %(season)s AND "SessionStartWeekNumber" = %(target)s
+'''
+
+# Latest session with assignments (before the target, if one was given)
+SOURCE_SESSION_SQL = '''
+    SELECT MAX("SessionStartWeekNumber") FROM "PlayerFlightAssignments"
+    WHERE "SeasonId" = %(season)s
+      AND (%(source)s IS NULL OR "SessionStartWeekNumber" = %(source)s)
+      AND (%(target)s IS NULL OR "SessionStartWeekNumber" < %(target)s)
+'''
+
+NEXT_SESSION_SQL = '''
+    SELECT MIN("WeekNumber") FROM "Weeks"
+    WHERE "SeasonId" = %(season)s AND "SessionStart" AND "WeekNumber" > %(source)s
+'''
+
+RESEED_RANKINGS = ('average', 'standings')
+
+
+@dataclass
+class Change:
+    player_id: str
+    kind: str                      # new, moved, leader, dropped
+    before: Optional[str] = None   # flight id
+    after: Optional[str] = None
+    player: str = ''               # names, filled in for display
+    before_flight: str = ''
+    after_flight: str = ''
+
+
+@dataclass
+class Rollover:
+    tenant: str
+    season_id: Optional[str] = None
+    source: Optional[int] = None
+    target: Optional[int] = None
+    status: str = 'copied'         # copied, reseeded, skipped, nothing
+    detail: str = ''
+    replaced: int = 0
+    written: int = 0
+    unchanged: int = 0
+    changes: List[Change] = field(default_factory=list)
+
+
+def latest_season(conn) -> Optional[str]:
+    with conn.cursor() as cur:
+        cur.execute('SELECT "Id" FROM "Seasons" ORDER BY "Year" DESC, "SeasonNumber" DESC LIMIT 1')
+        row = cur.fetchone()
+        return str(row[0]) if row else None
+
+
+def resolve_sessions(conn, season_id: str, source: Optional[int] = None,
+                     target: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+    """(source, target) session start weeks; either is None when there is nothing to roll over"""
+    params = {'season': season_id, 'source': source, 'target': target}
+    with conn.cursor() as cur:
+        cur.execute(SOURCE_SESSION_SQL, params)
+        found = cur.fetchone()[0]
+        if found is None:
+            return None, target
+        if target is None:
+            cur.execute(NEXT_SESSION_SQL, dict(params, source=found))
+            row = cur.fetchone()
+            target = row[0] if row else None
+    return int(found), (int(target) if target is not None else None)
+
+
+def name_changes(conn, changes: Sequence[Change]):
+    """Fill in player and flight names on `changes`"""
+    if not changes:
+        return
+    with conn.cursor() as cur:
+        cur.execute('SELECT "Id", "FirstName", "LastName" FROM "Players"')
+        players = {str(i): f"{first or ''} {last or ''}".strip() for i, first, last in cur.fetchall()}
+        cur.execute('SELECT "Id", "Name" FROM "Flights"')
+        flights = {str(i): name for i, name in cur.fetchall()}
+    for c in changes:
+        c.player = players.get(c.player_id, c.player_id)
+        c.before_flight = flights.get(c.before, c.before or '')
+        c.after_flight = flights.get(c.after, c.after or '')
+
+
+def diff(planned: Dict[str, Tuple[str, bool]], existing: Dict[str, Tuple[str, bool]]) -> Tuple[List[Change], int]:
+    """Per-player changes from `existing` to `planned` (player -> (flight, leader)) and the unchanged count"""
+    changes = []
+    unchanged = 0
+    for player_id in sorted(set(planned) | set(existing)):
+        after, before = planned.get(player_id), existing.get(player_id)
+        if before is None:
+            changes.append(Change(player_id, 'new', after=after[0]))
+        elif after is None:
+            changes.append(Change(player_id, 'dropped', before=before[0]))
+        elif after[0] != before[0]:
+            changes.append(Change(player_id, 'moved', before[0], after[0]))
+        elif after[1] != before[1]:
+            changes.append(Change(player_id, 'leader', before[0], after[0]))
+        else:
+            unchanged += 1
+    return changes, unchanged
+
+
+def reseed(conn, tenant: str, season_id: str, source: int, target: int, by: str = 'average',
+           mode: str = 'tiered', movers: int = 0, leader: str = 'best',
+           sizes: Optional[Sequence[int]] = None, flights: Optional[int] = None,
+           flight_size: Optional[int] = None):
+    """glm.placement placements for the target session, from a snapshot of this tenant"""
+    from . import placement, snapshot as snapshots
+
+    source_rows = placement.existing_assignments(conn, season_id, source)
+    out_dir = tempfile.mkdtemp(prefix=f'glm-rollover-{tenant}-')
+    try:
+        snapshots.export_snapshot(conn, out_dir, tenant=tenant)
+        _, candidates, season_flights = placement.load_candidates(snapshots.open_snapshot(out_dir), target,
+                                                                  season_id, players=source_rows)
+        if not sizes and not flights and not flight_size:
+            order = {flight_id: i for i, (flight_id, _) in enumerate(season_flights)}
+            per_flight = Counter(flight for flight, _ in source_rows.values())
+            sizes = [n for _, n in sorted(per_flight.items(), key=lambda f: order.get(f[0], len(order)))]
+        sizes = placement.flight_sizes(len(candidates), flights, flight_size, sizes)
+        return placement.place(candidates, season_flights, sizes, mode, by, leader, movers)
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def rollover(conn, tenant: str, season_id: Optional[str] = None, source: Optional[int] = None,
+             target: Optional[int] = None, replace: bool = False, dry_run: bool = False,
+             reseed_by: Optional[str] = None, **placement_options) -> Rollover:
+    """Roll one tenant's assignments into the next session (the caller commits)"""
+    from . import placement
+
+    season_id = season_id or latest_season(conn)
+    if season_id is None:
+        return Rollover(tenant, status='nothing', detail='no seasons')
+    source, target = resolve_sessions(conn, season_id, source, target)
+    result = Rollover(tenant, season_id, source, target)
+    if source is None or target is None:
+        result.status = 'nothing'
+        result.detail = 'no source session' if source is None else f'no session starts after week {source}'
+        return result
+
+    existing = placement.existing_assignments(conn, season_id, target)
+    placements = None
+    if reseed_by:
+        placements = reseed(conn, tenant, season_id, source, target, reseed_by, **placement_options)
+        planned = {p.player_id: (p.flight_id, p.is_leader) for p in placements}
+        result.status = 'reseeded'
+    else:
+        planned = placement.existing_assignments(conn, season_id, source)
+    result.changes, result.unchanged = diff(planned, existing)
+    name_changes(conn, result.changes)
+
+    if existing and not replace:
+        result.status = 'skipped'
+        result.detail = f'week {target} already has {len(existing)} assignment(s); use --replace'
+        return result
+    if dry_run:
+        return result
+
+    params = {'season': season_id, 'source': source, 'target': target}
+    with conn.cursor() as cur:
+        if existing:
+            cur.execute(DELETE_SQL, params)
+            result.replaced = len(existing)
+        if placements is None:
+            cur.execute(COPY_SQL, params)
+            result.written = cur.rowcount
+    if placements is not None:
+        result.written = placement.write_assignments(conn, season_id, target, placements)
+    return result
+
+
+def rollover_tenants(tenants: Optional[Sequence[str]] = None, concurrency: int = 8,
+                     connect: Callable = db.connect, **options):
+    """Run rollover() against every tenant, one transaction each; returns the fan-out report"""
+    from .tenants import run_on_tenants
+
+    def run(conn, tenant: str) -> Dict:
+        return asdict(rollover(conn, tenant, **options))
+
+    return run_on_tenants(run, tenants=tenants, concurrency=concurrency, connect=connect)
+
+
+def print_rollovers(report, dry_run: bool = False, verbose: bool = False):
+    verb = "Would roll over" if dry_run else "Rolled over"
+    print(f"🏌️  {verb} {len(report.results)} tenant(s) in {report.elapsed_ms:.0f} ms")
+    for r in report.results:
+        if not r.ok:
+            print(f"❌ {r.tenant:<20} {r.error}")
+            continue
+        result = r.result
+        counts = Counter(c['kind'] for c in result['changes'])
+        summary = ", ".join(f"{kind}={n}" for kind, n in sorted(counts.items())) or "no changes"
+        if result['status'] == 'nothing':
+            print(f"➖ {r.tenant:<20} {result['detail']}")
+            continue
+        sessions = f"week {result['source']} → {result['target']}"
+        if result['status'] == 'skipped':
+            print(f"⚠️  {r.tenant:<20} {sessions}: {result['detail']} ({summary})")
+        elif dry_run:
+            print(f"🔍 {r.tenant:<20} {sessions} ({result['status']}): {summary}, unchanged={result['unchanged']}")
+        else:
+            print(f"✅ {r.tenant:<20} {sessions} ({result['status']}): wrote {result['written']}, "
+                  f"replaced {result['replaced']} ({summary})")
+        if verbose:
+            for c in result['changes']:
+                print(f"     {c['kind']:<8} {c['player']:<24} {c['before_flight'] or '-'} → {c['after_flight'] or '-'}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import placement
+    from .tenants import DEFAULT_CONCURRENCY
+
+    parser = argparse.ArgumentParser(description="Roll flight assignments into the next session for every tenant")
+    parser.add_argument('--tenant', action='append', help='Tenant to roll over (repeatable, default: all)')
+    parser.add_argument('--season-id', help='Season (default: latest per tenant)')
+    parser.add_argument('--from-week', type=int, help='Source session start week (default: latest with assignments)')
+    parser.add_argument('--to-week', type=int, help='Target session start week (default: next SessionStart week)')
+    parser.add_argument('--replace', action='store_true', help='Replace assignments already in the target session')
+    parser.add_argument('--dry-run', action='store_true', help='Show the per-tenant diff without writing')
+    parser.add_argument('--reseed', choices=RESEED_RANKINGS,
+                        help='Re-place players by current average or standings instead of copying flights')
+    parser.add_argument('--mode', choices=placement.MODES, default='tiered', help='Placement mode for --reseed')
+    parser.add_argument('--movers', type=int, default=0, help='Players moving up/down per flight (--reseed standings)')
+    parser.add_argument('--leader', choices=placement.LEADERS, default='keep', help='Flight leaders for --reseed')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--flights', type=int, help='Number of flights for --reseed (default: as in the source)')
+    size.add_argument('--flight-size', type=int, help='Players per flight for --reseed')
+    size.add_argument('--sizes', help='Explicit flight sizes for --reseed, e.g. 8,8,8,10')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every player change')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.reseed:
+        options = {'mode': args.mode, 'movers': args.movers, 'leader': args.leader, 'flights': args.flights,
+                   'flight_size': args.flight_size,
+                   'sizes': [int(s) for s in args.sizes.split(',')] if args.sizes else None}
+    report = rollover_tenants(args.tenant, args.concurrency, season_id=args.season_id, source=args.from_week,
+                              target=args.to_week, replace=args.replace, dry_run=args.dry_run,
+                              reseed_by=args.reseed, **options)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, default=str))
+    else:
+        print_rollovers(report, args.dry_run, args.verbose)
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
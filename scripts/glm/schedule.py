@@ -0,0 +1,379 @@
+"""
+Position-template schedules, expanded across every flight of a session.
+
+A template says who plays whom by flight position, one list of pairings
+per week of the session, e.g. week15_matchups.py's
+
+    [["1 vs 2", "3 vs 8", "4 vs 7", "5 vs 6"],
+     ["1 vs 5", "2 vs 4", "3 vs 6", "7 vs 8"], ...]
+
+It is valid when every week uses each position 1..n exactly once. The
+session's flight assignments give each flight a position map (position ->
+player: by HandicapAtAssignment, then name, or from a --positions file),
+and expansion is one fancy-index of the (flights × n) map by the
+(weeks × pairs × 2) template. Flights whose size has no template get a
+circle-method round robin; odd flights use one more position as a bye. The whole session is written with one
+matchup_writer (and, with --replace, one DELETE) in a single transaction;
+sessions that already have hole scores are never regenerated.
+
+Template files are JSON: either the list above or {"weeks": [...]};
+pairings may also be [a, b] lists.
+
+Usage:
+    python3 scripts/database/expand-schedule.py --tenant southmoore --session-start 15
+    python3 scripts/database/expand-schedule.py --tenant southmoore --session-start 15 --template session.json --replace --write
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Session 3 of 2025 (weeks 15-21) from week15_matchups.py: a full round robin for 8 players
+EIGHT_PLAYER = [
+    ["1 vs 2", "3 vs 8", "4 vs 7", "5 vs 6"],
+    ["1 vs 5", "2 vs 4", "3 vs 6", "7 vs 8"],
+    ["1 vs 3", "2 vs 7", "4 vs 5", "6 vs 8"],
+    ["1 vs 6", "2 vs 8", "3 vs 4", "5 vs 7"],
+    ["1 vs 8", "2 vs 5", "3 vs 7", "4 vs 6"],
+    ["1 vs 4", "2 vs 3", "5 vs 8", "6 vs 7"],
+    ["1 vs 7", "2 vs 6", "3 vs 5", "4 vs 8"],
+]
+
+_PAIRING = re.compile(r'^\s*(\d+)\s*(?:vs\.?|v|-)\s*(\d+)\s*$', re.IGNORECASE)
+
+Pairing = Union[str, Sequence[int]]
+
+
+class TemplateError(ValueError):
+    """A template that does not use every position exactly once per week"""
+
+    def __init__(self, problems: List[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+@dataclass
+class Template:
+    pairs: np.ndarray    # (weeks, n // 2, 2) positions, 1-based
+
+    @property
+    def positions(self) -> int:
+        return self.pairs.shape[1] * 2
+
+    @property
+    def weeks(self) -> int:
+        return self.pairs.shape[0]
+
+    def repeated_pairings(self) -> List[Tuple[int, int]]:
+        """Position pairs that meet more than once"""
+        flat = np.sort(self.pairs.reshape(-1, 2), axis=1)
+        unique, counts = np.unique(flat, axis=0, return_counts=True)
+        return [tuple(int(p) for p in pair) for pair in unique[counts > 1]]
+
+
+@dataclass
+class FlightPositions:
+    flight_id: str
+    name: str
+    player_ids: List[str]     # index 0 is position 1
+    names: List[str]
+
+
+@dataclass
+class SessionWeek:
+    id: str
+    number: int
+
+
+def parse_pairing(pairing: Pairing) -> Tuple[int, int]:
+    if isinstance(pairing, str):
+        match = _PAIRING.match(pairing)
+        if not match:
+            raise TemplateError([f"Cannot parse pairing {pairing!r} (expected e.g. '1 vs 2')"])
+        return int(match.group(1)), int(match.group(2))
+    a, b = pairing
+    return int(a), int(b)
+
+
+def build_template(weeks: Sequence[Sequence[Pairing]]) -> Template:
+    """Parse and validate a template: every week uses positions 1..n exactly once"""
+    if not weeks:
+        raise TemplateError(["Template has no weeks"])
+    problems = []
+    parsed = [[parse_pairing(p) for p in week] for week in weeks]
+    sizes = {len(week) for week in parsed}
+    if len(sizes) != 1:
+        problems.append(f"Weeks have different numbers of pairings: {sorted(sizes)}")
+        raise TemplateError(problems)
+
+    pairs = np.array(parsed, dtype=np.int16).reshape(len(parsed), -1, 2)
+    n = pairs.shape[1] * 2
+    expected = np.arange(1, n + 1)
+    for w, week in enumerate(np.sort(pairs.reshape(len(parsed), -1), axis=1)):
+        if not np.array_equal(week, expected):
+            values, counts = np.unique(week, return_counts=True)
+            missing = sorted(set(expected.tolist()) - set(values.tolist()))
+            twice = values[counts > 1].tolist()
+            outside = [int(v) for v in values if v < 1 or v > n]
+            detail = []
+            if missing:
+                detail.append(f"missing {missing}")
+            if twice:
+                detail.append(f"repeated {twice}")
+            if outside:
+                detail.append(f"out of range {outside}")
+            problems.append(f"Week {w + 1}: " + ", ".join(detail))
+    if problems:
+        raise TemplateError(problems)
+    return Template(pairs)
+
+
+def circle_template(n: int, weeks: Optional[int] = None) -> Template:
+    """Circle-method round robin for n (even) positions, n - 1 weeks by default"""
+    if n < 2 or n % 2:
+        raise TemplateError([f"A round robin needs an even number of positions, not {n}"])
+    positions = list(range(1, n + 1))
+    rounds = []
+    for _ in range(n - 1):
+        rounds.append([(positions[i], positions[n - 1 - i]) for i in range(n // 2)])
+        positions = [positions[0], positions[-1]] + positions[1:-1]
+    return build_template(rounds[:weeks] if weeks else rounds)
+
+
+def load_template(path: str) -> Template:
+    with open(path) as f:
+        data = json.load(f)
+    return build_template(data['weeks'] if isinstance(data, dict) else data)
+
+
+def expand(template_by_size: Dict[int, Template], flights: Sequence[FlightPositions],
+           weeks: Sequence[SessionWeek]) -> List[Tuple[str, str, str]]:
+    """
+    (week id, player A, player B) for every flight and week, cycling the
+    template when the session has more weeks than it does. A template with
+    one position more than the flight has players treats that position as
+    a bye (Matchups has no bye rows, so those pairings are dropped).
+    """
+    matchups = []
+    by_size: Dict[int, List[FlightPositions]] = {}
+    for flight in flights:
+        by_size.setdefault(len(flight.player_ids), []).append(flight)
+
+    for size, group in sorted(by_size.items()):
+        template = template_by_size.get(size)
+        if template is None or template.positions not in (size, size + 1):
+            raise TemplateError([f"No template for flights of {size} player(s): "
+                                 + ", ".join(f.name for f in group)])
+        bye = [None] * (template.positions - size)
+        players = np.array([f.player_ids + bye for f in group], dtype=object)  # (flights, n)
+        cycle = template.pairs[np.arange(len(weeks)) % template.weeks] - 1     # (weeks, pairs, 2)
+        expanded = players[:, cycle]                                           # (flights, weeks, pairs, 2)
+        for w, week in enumerate(weeks):
+            for a, b in expanded[:, w].reshape(-1, 2):
+                if a is not None and b is not None:
+                    matchups.append((week.id, a, b))
+    return matchups
+
+
+def templates_for(flights: Sequence[FlightPositions], template: Optional[Template] = None) -> Dict[int, Template]:
+    """
+    Template per flight size: the given one for its size (and the size
+    below, with a bye), a circle round robin for every other size.
+    """
+    templates = {}
+    for size in sorted({len(f.player_ids) for f in flights}):
+        if template is not None and template.positions in (size, size + 1):
+            templates[size] = template
+        elif size >= 2:
+            templates[size] = circle_template(size + size % 2)
+    return templates
+
+
+def load_session(conn, session_start: int, season_id: Optional[str] = None,
+                 positions: Optional[Dict[str, List[str]]] = None
+                 ) -> Tuple[str, List[FlightPositions], List[SessionWeek]]:
+    """
+    (season id, flights with position maps, session weeks) from a tenant.
+
+    Positions follow HandicapAtAssignment then last/first name unless
+    `positions` maps flight name -> ["First Last", ...] in position order.
+    """
+    with conn.cursor() as cur:
+        if season_id is None:
+            cur.execute('SELECT "Id" FROM "Seasons" ORDER BY "Year" DESC, "SeasonNumber" DESC LIMIT 1')
+            row = cur.fetchone()
+            if row is None:
+                raise ValueError("No seasons found")
+            season_id = str(row[0])
+
+        cur.execute('''
+            SELECT "Id", "WeekNumber", "SessionStart" FROM "Weeks"
+            WHERE "SeasonId" = %s AND "WeekNumber" >= %s
+            ORDER BY "WeekNumber"
+        ''', (season_id, session_start))
+        weeks = []
+        for week_id, number, starts in cur.fetchall():
+            if starts and number > session_start:
+                break
+            weeks.append(SessionWeek(str(week_id), int(number)))
+
+        cur.execute('''
+            SELECT pfa."FlightId", f."Name", pfa."PlayerId", p."FirstName", p."LastName"
+            FROM "PlayerFlightAssignments" pfa
+            JOIN "Flights" f ON f."Id" = pfa."FlightId"
+            JOIN "Players" p ON p."Id" = pfa."PlayerId"
+            WHERE pfa."SeasonId" = %s AND pfa."SessionStartWeekNumber" = %s
+            ORDER BY f."Name", pfa."HandicapAtAssignment", p."LastName", p."FirstName", pfa."PlayerId"
+        ''', (season_id, session_start))
+        rows = cur.fetchall()
+
+    flights: Dict[str, FlightPositions] = {}
+    for flight_id, flight_name, player_id, first, last in rows:
+        flight = flights.setdefault(str(flight_id), FlightPositions(str(flight_id), flight_name, [], []))
+        flight.player_ids.append(str(player_id))
+        flight.names.append(f"{first or ''} {last or ''}".strip())
+
+    if positions:
+        for flight in flights.values():
+            order = positions.get(flight.name) or positions.get(f"Flight {flight.name}")
+            if order is None:
+                continue
+            by_name = {name.lower(): (pid, name) for pid, name in zip(flight.player_ids, flight.names)}
+            unknown = [name for name in order if name.strip().lower() not in by_name]
+            if unknown or len(order) != len(flight.player_ids):
+                raise ValueError(f"Positions for {flight.name} do not match its assignments"
+                                 + (f" (unknown: {', '.join(unknown)})" if unknown else ""))
+            flight.player_ids, flight.names = map(list, zip(*(by_name[name.strip().lower()] for name in order)))
+    return season_id, list(flights.values()), weeks
+
+
+SESSION_MATCHUPS = '''
+    "WeekId" IN (SELECT "Id" FROM "Weeks" WHERE "SeasonId" = %s AND "WeekNumber" BETWEEN %s AND %s)
+'''
+
+
+def existing_matchups(conn, season_id: str, weeks: Sequence[SessionWeek]) -> Tuple[int, int]:
+    """(matchups, matchups with hole scores) already in the session's weeks"""
+    with conn.cursor() as cur:
+        cur.execute(f'''
+            SELECT COUNT(*),
+                   COUNT(*) FILTER (WHERE EXISTS (SELECT 1 FROM "HoleScores" h WHERE h."MatchupId" = m."Id"))
+            FROM "Matchups" m
+            WHERE m.{SESSION_MATCHUPS}
+        ''', (season_id, weeks[0].number, weeks[-1].number))
+        total, scored = cur.fetchone()
+    return int(total), int(scored or 0)
+
+
+def write_matchups(conn, season_id: str, weeks: Sequence[SessionWeek], matchups: Sequence[Tuple[str, str, str]],
+                   replace: bool = False) -> Tuple[int, int]:
+    """Insert the session's matchups (first deleting its existing ones with `replace`); caller commits"""
+    from .batch import matchup_writer
+
+    deleted = 0
+    if replace:
+        with conn.cursor() as cur:
+            cur.execute(f'DELETE FROM "Matchups" WHERE {SESSION_MATCHUPS}',
+                        (season_id, weeks[0].number, weeks[-1].number))
+            deleted = cur.rowcount
+    with matchup_writer(conn) as writer:
+        writer.extend(matchups)
+    return deleted, writer.rows_written
+
+
+def print_schedule(flights: Sequence[FlightPositions], weeks: Sequence[SessionWeek],
+                   matchups: Sequence[Tuple[str, str, str]]):
+    names = {pid: name for f in flights for pid, name in zip(f.player_ids, f.names)}
+    flight_of = {pid: f.name for f in flights for pid in f.player_ids}
+    position = {pid: i + 1 for f in flights for i, pid in enumerate(f.player_ids)}
+    by_week: Dict[str, List[Tuple[str, str]]] = {}
+    for week_id, a, b in matchups:
+        by_week.setdefault(week_id, []).append((a, b))
+    for week in weeks:
+        print(f"\n📅 Week {week.number}")
+        flight = None
+        for a, b in by_week.get(week.id, []):
+            if flight_of[a] != flight:
+                flight = flight_of[a]
+                print(f"   {flight}")
+            print(f"     {names[a]} ({position[a]}) vs {names[b]} ({position[b]})")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import db, profiling
+
+    parser = argparse.ArgumentParser(description="Expand a position template into a session's matchups")
+    parser.add_argument('--tenant', required=True)
+    parser.add_argument('--season-id', help='Season (default: latest)')
+    parser.add_argument('--session-start', type=int, required=True, help='First week of the session')
+    parser.add_argument('--template', help='Template JSON file (default: the 8-player session template)')
+    parser.add_argument('--positions', help='JSON {flight name: ["First Last", ...]} in position order')
+    parser.add_argument('--replace', action='store_true', help='Delete the session\'s unscored matchups first')
+    parser.add_argument('--write', action='store_true', help='Write the matchups (default: preview)')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Only print the summary')
+    args = parser.parse_args(argv)
+
+    try:
+        template = load_template(args.template) if args.template else build_template(EIGHT_PLAYER)
+    except (OSError, TemplateError) as e:
+        print(f"❌ Invalid template: {e}")
+        return 1
+    repeated = template.repeated_pairings()
+    if repeated:
+        print(f"⚠️  Template repeats pairings: {', '.join(f'{a} vs {b}' for a, b in repeated)}")
+
+    positions = None
+    if args.positions:
+        with open(args.positions) as f:
+            positions = json.load(f)
+
+    conn = db.connect(tenant=args.tenant)
+    try:
+        with profiling.phase('load'):
+            season_id, flights, weeks = load_session(conn, args.session_start, args.season_id, positions)
+        if not flights or not weeks:
+            print(f"❌ No flight assignments or weeks for the session starting week {args.session_start}")
+            return 1
+        templates = templates_for(flights, template)
+        for size in sorted(templates):
+            if templates[size] is not template:
+                print(f"ℹ️  Flights of {size} use a {templates[size].weeks}-week circle round robin")
+            if templates[size].positions > size:
+                print(f"ℹ️  Flights of {size} have a bye each week")
+        with profiling.phase('expand'):
+            matchups = expand(templates, flights, weeks)
+
+        if not args.quiet:
+            print_schedule(flights, weeks, matchups)
+        print(f"\n🏌️  Weeks {weeks[0].number}-{weeks[-1].number}: {len(matchups)} matchups "
+              f"across {len(flights)} flight(s)")
+
+        total, scored = existing_matchups(conn, season_id, weeks)
+        if scored:
+            print(f"❌ {scored} of the session's {total} matchup(s) already have hole scores; not regenerating")
+            return 1
+        if total and not args.replace:
+            print(f"⚠️  The session already has {total} matchup(s); use --replace to regenerate")
+            return 1 if args.write else 0
+        if not args.write:
+            print("(preview only; add --write to save)")
+            return 0
+        with profiling.phase('write'):
+            deleted, written = write_matchups(conn, season_id, weeks, matchups, args.replace)
+            conn.commit()
+        print(f"✅ Wrote {written} matchup(s)" + (f", removed {deleted}" if deleted else ""))
+        return 0
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
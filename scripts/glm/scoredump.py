@@ -0,0 +1,304 @@
+"""
+Streaming, normalized loader for /api/scoreentries dumps such as
+data/analysis/score_entries_data.json.
+
+The API dump is one JSON array in which every entry carries a full copy
+of its player:
+
+    [{"id": ..., "playerId": ..., "weekId": ..., "score": 40, "pointsEarned": 14,
+      "player": {"id": ..., "firstName": "George", ...}}, ...]
+
+iter_entries() decodes the array one entry at a time from a fixed-size
+read buffer (json.JSONDecoder.raw_decode, no json.load of the whole file).
+ScoreDump.from_entries() interns each player and week into a table the
+first time it appears and keeps the entries as compact columns:
+
+    player   array('i')  row in .players (and .player_ids)
+    week     array('i')  row in .week_ids
+    score    array('h')  gross score, NULL (-1) when the entry has none
+    points   array('h')  points earned, NULL when null
+
+export() writes the normalized form, a small JSON object with the player
+table once and one list per column; load() reads either layout back, and
+records() rebuilds the original API-shaped dicts for older tools.
+
+    {"format": "glm-score-entries", "version": 1,
+     "players": [{"id": ..., "firstName": ...}, ...], "weeks": [<uuid>, ...],
+     "entries": {"id": [...], "player": [...], "week": [...], "score": [...], "points": [...]}}
+
+Usage:
+    python3 scripts/analysis/normalize-score-entries.py data/analysis/score_entries_data.json \\
+        --out data/analysis/score_entries_normalized.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+FORMAT = 'glm-score-entries'
+FORMAT_VERSION = 1
+NULL = -1
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'\s*')
+_NUMBER_TAIL = re.compile(r'[\d.eE+-]*')
+
+
+class ScoreDumpError(ValueError):
+    """The file is neither an API score-entry dump nor the normalized form"""
+
+
+def _read_values(stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Yield the elements of the top-level JSON array in `stream`, one at a time"""
+    decode = json.JSONDecoder().raw_decode
+    buffer, position, eof = '', 0, False
+
+    def more() -> bool:
+        nonlocal buffer, position, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer, position = buffer[position:] + chunk, 0
+        return True
+
+    def next_char() -> Optional[str]:
+        nonlocal position
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if not more():
+                return None
+
+    if next_char() != '[':
+        raise ScoreDumpError("expected a JSON array of score entries")
+    position += 1
+    first = True
+    while True:
+        char = next_char()
+        if char is None:
+            raise ScoreDumpError("unterminated JSON array")
+        if char == ']':
+            return
+        if not first:
+            if char != ',':
+                raise ScoreDumpError(f"expected ',' between entries, found {char!r}")
+            position += 1
+            if next_char() is None:
+                raise ScoreDumpError("unterminated JSON array")
+        while True:
+            try:
+                value, end = decode(buffer, position)
+            except json.JSONDecodeError:
+                if not more():
+                    raise
+                continue
+            # a scalar running up to the buffer edge ("1." of "1.5") may continue in the next chunk
+            if (not eof and not isinstance(value, (dict, list))
+                    and _NUMBER_TAIL.match(buffer, end).end() == len(buffer) and more()):
+                continue
+            break
+        position = end
+        first = False
+        yield value
+
+
+def iter_entries(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict]:
+    """Stream the entries of an API dump without loading the whole file"""
+    with open(path, encoding='utf-8') as f:
+        yield from _read_values(f, chunk_size)
+
+
+class ScoreDump:
+    """Score entries as interned player/week tables plus int columns"""
+
+    def __init__(self):
+        self.players: List[Dict] = []
+        self.player_ids: List[str] = []
+        self.week_ids: List[str] = []
+        self.entry_ids: List[Optional[str]] = []
+        self.player = array('i')
+        self.week = array('i')
+        self.score = array('h')
+        self.points = array('h')
+        self.player_index: Dict[str, int] = {}
+        self.week_index: Dict[str, int] = {}
+        self.player_conflicts = 0   # entries whose embedded player differed from the interned copy
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    def intern_player(self, player_id: str, player: Optional[Dict] = None) -> int:
+        index = self.player_index.get(player_id)
+        if index is None:
+            index = self.player_index[player_id] = len(self.player_ids)
+            self.player_ids.append(player_id)
+            self.players.append(dict(player or {'id': player_id}))
+        elif player is not None and player != self.players[index]:
+            if len(self.players[index]) == 1:   # placeholder from an entry without a player object
+                self.players[index] = dict(player)
+            else:
+                self.player_conflicts += 1
+        return index
+
+    def intern_week(self, week_id: str) -> int:
+        index = self.week_index.get(week_id)
+        if index is None:
+            index = self.week_index[week_id] = len(self.week_ids)
+            self.week_ids.append(week_id)
+        return index
+
+    def add(self, entry_id: Optional[str], player_id: str, week_id: str, score: Optional[int],
+            points: Optional[int], player: Optional[Dict] = None):
+        self.entry_ids.append(entry_id)
+        self.player.append(self.intern_player(player_id, player))
+        self.week.append(self.intern_week(week_id))
+        self.score.append(NULL if score is None else int(score))
+        self.points.append(NULL if points is None else int(points))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict]) -> 'ScoreDump':
+        """Build from API-shaped entry dicts (e.g. iter_entries())"""
+        dump = cls()
+        for entry in entries:
+            player = entry.get('player')
+            player_id = entry.get('playerId') or (player or {}).get('id')
+            if player_id is None or entry.get('weekId') is None:
+                raise ScoreDumpError(f"score entry {entry.get('id')} has no playerId/weekId")
+            dump.add(entry.get('id'), player_id, entry['weekId'], entry.get('score'),
+                     entry.get('pointsEarned'), player)
+        return dump
+
+    @classmethod
+    def from_normalized(cls, data: Dict) -> 'ScoreDump':
+        if data.get('format') != FORMAT:
+            raise ScoreDumpError(f"not a {FORMAT} file")
+        if data.get('version') != FORMAT_VERSION:
+            raise ScoreDumpError(f"unsupported {FORMAT} version {data.get('version')}")
+        dump = cls()
+        for player in data['players']:
+            dump.intern_player(player['id'], player)
+        for week_id in data['weeks']:
+            dump.intern_week(week_id)
+        columns = data['entries']
+        dump.entry_ids = list(columns['id'])
+        dump.player = array('i', columns['player'])
+        dump.week = array('i', columns['week'])
+        dump.score = array('h', (NULL if v is None else v for v in columns['score']))
+        dump.points = array('h', (NULL if v is None else v for v in columns['points']))
+        if not (len(dump.entry_ids) == len(dump.player) == len(dump.week) == len(dump.score) == len(dump.points)):
+            raise ScoreDumpError("entry columns have different lengths")
+        return dump
+
+    def to_normalized(self) -> Dict:
+        return {
+            'format': FORMAT,
+            'version': FORMAT_VERSION,
+            'players': self.players,
+            'weeks': self.week_ids,
+            'entries': {
+                'id': self.entry_ids,
+                'player': self.player.tolist(),
+                'week': self.week.tolist(),
+                'score': [None if v == NULL else v for v in self.score],
+                'points': [None if v == NULL else v for v in self.points],
+            },
+        }
+
+    def records(self) -> Iterator[Dict]:
+        """The entries again in the API's shape (scoreless entries have no "score" key, as in the dump)"""
+        for i in range(len(self)):
+            player = self.players[self.player[i]]
+            entry = {'id': self.entry_ids[i], 'playerId': self.player_ids[self.player[i]],
+                     'weekId': self.week_ids[self.week[i]]}
+            if self.score[i] != NULL:
+                entry['score'] = self.score[i]
+            entry['pointsEarned'] = None if self.points[i] == NULL else self.points[i]
+            entry['player'] = player
+            yield entry
+
+    def player_name(self, index: int) -> str:
+        player = self.players[index]
+        return f"{player.get('firstName', '')} {player.get('lastName', '')}".strip() or self.player_ids[index]
+
+    def columns(self) -> Dict:
+        """The entry columns as numpy arrays sharing the array buffers (requires numpy)"""
+        import numpy as np
+
+        return {
+            'player': np.frombuffer(self.player, dtype=np.int32) if len(self) else np.empty(0, np.int32),
+            'week': np.frombuffer(self.week, dtype=np.int32) if len(self) else np.empty(0, np.int32),
+            'score': np.frombuffer(self.score, dtype=np.int16) if len(self) else np.empty(0, np.int16),
+            'points': np.frombuffer(self.points, dtype=np.int16) if len(self) else np.empty(0, np.int16),
+        }
+
+    def nbytes(self) -> int:
+        """Bytes held by the four entry columns"""
+        return sum(a.itemsize * len(a) for a in (self.player, self.week, self.score, self.points))
+
+
+def load(path: str, chunk_size: int = CHUNK_SIZE) -> ScoreDump:
+    """Load an API dump (streamed) or a normalized file, whichever `path` holds"""
+    with open(path, encoding='utf-8') as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        if head == '{':
+            f.seek(0)
+            return ScoreDump.from_normalized(json.load(f))
+        f.seek(0)
+        return ScoreDump.from_entries(_read_values(f, chunk_size))
+
+
+def export(dump: ScoreDump, path: str, indent: Optional[int] = None) -> int:
+    """Write the normalized form to `path` (via a temp file); returns its size in bytes"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = f'{path}.tmp'
+    with open(partial, 'w', encoding='utf-8') as f:
+        json.dump(dump.to_normalized(), f, indent=indent,
+                  separators=None if indent else (',', ':'), ensure_ascii=False)
+    os.replace(partial, path)
+    return os.path.getsize(path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Normalize a score-entry dump (players interned, columnar entries)")
+    parser.add_argument('input', help='API dump (JSON array) or normalized file')
+    parser.add_argument('--out', help='Write the normalized form here')
+    parser.add_argument('--indent', type=int, help='Pretty-print the output')
+    parser.add_argument('--verify', action='store_true', help='Check that the output reloads to the same entries')
+    args = parser.parse_args(argv)
+
+    try:
+        dump = load(args.input)
+    except (ScoreDumpError, json.JSONDecodeError) as e:
+        print(f"❌ {args.input}: {e}")
+        return 1
+    scored = sum(1 for v in dump.score if v != NULL)
+    print(f"📥 {args.input}: {len(dump)} entries ({scored} scored), {len(dump.players)} players, "
+          f"{len(dump.week_ids)} weeks; columns {dump.nbytes():,} bytes")
+    if dump.player_conflicts:
+        print(f"⚠️  {dump.player_conflicts} entries embedded a player that differs from its first copy (first kept)")
+
+    if args.out:
+        size = export(dump, args.out, args.indent)
+        original = os.path.getsize(args.input)
+        print(f"✅ Wrote {args.out}: {size:,} bytes ({100 * size / original:.0f}% of {original:,})")
+        if args.verify:
+            reloaded = load(args.out)
+            if list(reloaded.records()) != list(dump.records()):
+                print("❌ Normalized file does not reload to the same entries")
+                return 1
+            print("✅ Verified: normalized file reloads to the same entries")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
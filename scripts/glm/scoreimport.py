@@ -0,0 +1,330 @@
+"""
+Bulk hole-score import from the legacy Scores.csv layout.
+
+Replaces posting Scores.csv through ScoreImportService one score (and one
+SaveChanges) at a time. The file has one row per player and week with
+either the front or the back nine filled in; rows stream through
+glm.csvformats (SCORE_FORMATS), which checks each row's hole sum against
+its Hole Total. Then, in one transaction:
+
+  * players are resolved through a name index built with one query
+    (case, spacing and punctuation insensitive, "Kevin Kelhart JR" ==
+    "kevin kelhart jr."); ambiguous names are reported, never guessed
+  * each row is paired into that week's scheduled matchup for the player
+    (weeks of the chosen season only); a matchup whose opponent has no
+    row keeps the opponent's existing hole scores
+  * the matchups' HoleScores are replaced with one COPY (holes 1-9 or
+    10-18, par and hole handicap from CourseHoles), Matchups gross
+    totals are set with one UPDATE ... FROM a staging table, and
+    ScoreEntries are replaced per player and week the same way
+
+Match points are not scored here; recalculate them in the app (or with
+glm.scoring) after importing.
+
+Usage (from scripts/):
+    python3 -m glm.scoreimport southmoore ../backend/Business/Scores.csv --dry-run
+"""
+
+import argparse
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import db, profiling
+from .batch import BatchWriter, stage_rows
+from .csvformats import SCORE_FORMATS, CsvFormatError, HoleScoreRecord, read_csv
+
+MATCHUP_STAGING = 'glm_import_matchups'
+MATCHUP_STAGING_COLUMNS = (('MatchupId', 'uuid'), ('PlayerAScore', 'integer'), ('PlayerBScore', 'integer'))
+
+ENTRY_STAGING = 'glm_import_entries'
+ENTRY_STAGING_COLUMNS = (('PlayerId', 'uuid'), ('WeekId', 'uuid'), ('Score', 'integer'))
+
+HOLE_COLUMNS = ('MatchupId', 'HoleNumber', 'Par', 'HoleHandicap', 'PlayerAScore', 'PlayerBScore')
+NEW_HOLE_DEFAULTS = {'PlayerAMatchPoints': 0, 'PlayerBMatchPoints': 0}
+
+SEASON_MATCHUPS_SQL = '''
+    SELECT w."WeekNumber", m."WeekId", m."Id", m."PlayerAId", m."PlayerBId"
+    FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+    WHERE w."SeasonId" = %s
+'''
+
+# The course with the most holes; the backend looks HoleHandicap up by hole number alone
+COURSE_HOLES_SQL = '''
+    SELECT "HoleNumber", "Par", "HandicapIndex" FROM "CourseHoles"
+    WHERE "CourseId" = (
+        SELECT "CourseId" FROM "CourseHoles"
+        GROUP BY "CourseId" ORDER BY COUNT(*) DESC, "CourseId" LIMIT 1)
+'''
+
+EXISTING_HOLES_SQL = f'''
+    SELECT h."MatchupId", h."HoleNumber", h."PlayerAScore", h."PlayerBScore"
+    FROM "HoleScores" h JOIN "{MATCHUP_STAGING}" s ON s."MatchupId" = h."MatchupId"
+'''
+
+DELETE_HOLES_SQL = f'''
+    DELETE FROM "HoleScores" WHERE "MatchupId" IN (SELECT "MatchupId" FROM "{MATCHUP_STAGING}")
+'''
+
+UPDATE_MATCHUPS_SQL = f'''
+    UPDATE "Matchups" SET
+        "PlayerAScore" = COALESCE(s."PlayerAScore", "Matchups"."PlayerAScore"),
+        "PlayerBScore" = COALESCE(s."PlayerBScore", "Matchups"."PlayerBScore")
+    FROM "{MATCHUP_STAGING}" s
+    WHERE "Matchups"."Id" = s."MatchupId"
+'''
+
+DELETE_ENTRIES_SQL = f'''
+    DELETE FROM "ScoreEntries" WHERE EXISTS (
+        SELECT 1 FROM "{ENTRY_STAGING}" s
+        WHERE s."PlayerId" = "ScoreEntries"."PlayerId" AND s."WeekId" = "ScoreEntries"."WeekId")
+'''
+
+INSERT_ENTRIES_SQL = f'''
+    INSERT INTO "ScoreEntries" ("Id", "PlayerId", "WeekId", "Score", "PointsEarned")
+    SELECT gen_random_uuid(), s."PlayerId", s."WeekId", s."Score", 0
+    FROM "{ENTRY_STAGING}" s
+'''
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+
+
+def normalize_name(*parts: Optional[str]) -> str:
+    """'Kevin  Kelhart JR.' -> 'kevin kelhart jr'"""
+    return ' '.join(_PUNCTUATION.sub('', ' '.join(p or '' for p in parts)).lower().split())
+
+
+def player_index(conn) -> Dict[str, List[str]]:
+    """Normalized full name -> player ids (more than one id means the name is ambiguous)"""
+    index: Dict[str, List[str]] = defaultdict(list)
+    with conn.cursor() as cur:
+        cur.execute('SELECT "Id", "FirstName", "LastName" FROM "Players"')
+        for player_id, first_name, last_name in cur.fetchall():
+            index[normalize_name(first_name, last_name)].append(str(player_id))
+    return index
+
+
+def season_matchups(conn, season_id: str) -> Dict[Tuple[int, str], Tuple[str, str, bool]]:
+    """(week number, player id) -> (week id, matchup id, player is side A) for every matchup of the season"""
+    matchups = {}
+    with conn.cursor() as cur:
+        cur.execute(SEASON_MATCHUPS_SQL, (season_id,))
+        for week_number, week_id, matchup_id, player_a, player_b in cur.fetchall():
+            for player, is_a in ((player_a, True), (player_b, False)):
+                if player is not None:
+                    matchups.setdefault((int(week_number), str(player)), (str(week_id), str(matchup_id), is_a))
+    return matchups
+
+
+def course_holes(conn) -> Dict[int, Tuple[int, int]]:
+    """Hole number -> (par, hole handicap) for holes 1-18"""
+    with conn.cursor() as cur:
+        cur.execute(COURSE_HOLES_SQL)
+        holes = {int(number): (int(par), int(index)) for number, par, index in cur.fetchall()}
+    missing = [h for h in range(1, 19) if h not in holes]
+    if missing:
+        raise ValueError(f"CourseHoles is missing holes {missing} (run import_southmoore_course.py first)")
+    return holes
+
+
+@dataclass
+class Scorecard:
+    """Both players' holes for one matchup; None for a side the file has no row for"""
+    week_id: str
+    first_hole: int
+    a: Optional[List[Optional[int]]] = None
+    b: Optional[List[Optional[int]]] = None
+
+
+@dataclass
+class ScoreImport:
+    rows: int = 0
+    scorecards: int = 0
+    matchups: int = 0
+    hole_rows: int = 0
+    replaced_holes: int = 0
+    score_entries: int = 0
+    replaced_entries: int = 0
+    empty: int = 0
+    elapsed_ms: float = 0.0
+    problems: List[Tuple[int, str]] = field(default_factory=list)
+
+
+def pair_records(records: Iterable[HoleScoreRecord], players: Dict[str, List[str]],
+                 matchups: Dict[Tuple[int, str], Tuple[str, str, bool]], result: ScoreImport
+                 ) -> Tuple[Dict[str, Scorecard], Dict[Tuple[str, str], int]]:
+    """
+    Stream records into (matchup id -> Scorecard, (player, week id) ->
+    gross); rows that cannot be placed are added to result.problems.
+    """
+    cards: Dict[str, Scorecard] = {}
+    entries: Dict[Tuple[str, str], int] = {}
+    weeks = {week for week, _ in matchups}
+    for record in records:
+        result.rows += 1
+        if not any(record.holes):
+            result.empty += 1
+            continue
+        name = f"{record.first_name} {record.last_name}".strip()
+        ids = players.get(normalize_name(record.first_name, record.last_name), [])
+        if len(ids) != 1:
+            result.problems.append((record.line, f"Player '{name}' " +
+                                    ("not found" if not ids else f"matches {len(ids)} players")))
+            continue
+        placed = matchups.get((record.week, ids[0]))
+        if placed is None:
+            result.problems.append((record.line, f"No week {record.week} matchup for '{name}'" if record.week in weeks
+                                    else f"Week {record.week} has no matchups in the season"))
+            continue
+        week_id, matchup_id, is_a = placed
+        if (ids[0], week_id) in entries:
+            result.problems.append((record.line, f"Duplicate week {record.week} row for '{name}'"))
+            continue
+
+        card = cards.setdefault(matchup_id, Scorecard(week_id, record.first_hole))
+        if card.first_hole != record.first_hole:
+            result.problems.append((record.line, f"'{name}' played holes {record.first_hole}-{record.first_hole + 8} "
+                                                 f"but the opponent played {card.first_hole}-{card.first_hole + 8}"))
+            continue
+        if is_a:
+            card.a = record.holes
+        else:
+            card.b = record.holes
+        entries[(ids[0], week_id)] = record.gross
+        result.scorecards += 1
+    return cards, entries
+
+
+def keep_opponents(conn, cards: Dict[str, Scorecard]):
+    """Fill the side of each card the file had no row for from its current HoleScores (staging must be loaded)"""
+    kept: Dict[Tuple[str, bool], Dict[int, Optional[int]]] = defaultdict(dict)
+    with conn.cursor() as cur:
+        cur.execute(EXISTING_HOLES_SQL)
+        for matchup_id, hole_number, a_score, b_score in cur.fetchall():
+            kept[(str(matchup_id), True)][int(hole_number)] = a_score
+            kept[(str(matchup_id), False)][int(hole_number)] = b_score
+    for matchup_id, card in cards.items():
+        holes = range(card.first_hole, card.first_hole + 9)
+        if card.a is None:
+            card.a = [kept[(matchup_id, True)].get(h) for h in holes]
+        if card.b is None:
+            card.b = [kept[(matchup_id, False)].get(h) for h in holes]
+
+
+def _total(holes: Optional[List[Optional[int]]]) -> Optional[int]:
+    total = sum(h for h in holes or [] if h)
+    return total or None
+
+
+def import_scores(conn, records: Iterable[HoleScoreRecord], season_id: str,
+                  batch_size: int = 1000) -> ScoreImport:
+    """Import streamed hole-score records into one season (the caller commits or rolls back)"""
+    start = time.perf_counter()
+    result = ScoreImport()
+    with profiling.phase('pair'):
+        holes = course_holes(conn)
+        cards, entries = pair_records(records, player_index(conn), season_matchups(conn, season_id), result)
+    result.matchups = len(cards)
+    if cards:
+        with profiling.phase('hole scores'):
+            # Totals for the sides in the file only; COALESCE keeps the other side's total
+            stage_rows(conn, MATCHUP_STAGING, MATCHUP_STAGING_COLUMNS,
+                       ((m, _total(c.a), _total(c.b)) for m, c in cards.items()), batch_size=batch_size)
+            keep_opponents(conn, cards)
+            with conn.cursor() as cur:
+                cur.execute(DELETE_HOLES_SQL)
+                result.replaced_holes = cur.rowcount
+
+            with BatchWriter(conn, 'HoleScores', HOLE_COLUMNS, batch_size=batch_size, method='copy',
+                             constants=NEW_HOLE_DEFAULTS) as writer:
+                for matchup_id, card in cards.items():
+                    for offset, hole in enumerate(range(card.first_hole, card.first_hole + 9)):
+                        par, hole_handicap = holes[hole]
+                        writer.add(matchup_id, hole, par, hole_handicap, card.a[offset], card.b[offset])
+            result.hole_rows = writer.rows_written
+
+            with conn.cursor() as cur:
+                cur.execute(UPDATE_MATCHUPS_SQL)
+
+    if entries:
+        with profiling.phase('score entries'):
+            stage_rows(conn, ENTRY_STAGING, ENTRY_STAGING_COLUMNS,
+                       ((player, week, gross) for (player, week), gross in entries.items()), batch_size=batch_size)
+            with conn.cursor() as cur:
+                cur.execute(DELETE_ENTRIES_SQL)
+                result.replaced_entries = cur.rowcount
+                cur.execute(INSERT_ENTRIES_SQL)
+                result.score_entries = cur.rowcount
+    result.elapsed_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+def print_import(result: ScoreImport, dry_run: bool = False):
+    if result.problems:
+        print(f"⚠️  {len(result.problems)} row(s) skipped:")
+        for line, problem in sorted(result.problems):
+            print(f"   - Line {line}: {problem}")
+        print("")
+    verb = "Would import" if dry_run else "Imported"
+    print(f"{'🔍' if dry_run else '✅'} {verb} {result.scorecards} scorecards into {result.matchups} matchups "
+          f"in {result.elapsed_ms:.0f} ms")
+    print("📊 Import Summary:")
+    print(f"   - Valid rows read: {result.rows}")
+    print(f"   - Rows without scores: {result.empty}")
+    print(f"   - HoleScores written: {result.hole_rows} (replaced {result.replaced_holes})")
+    print(f"   - ScoreEntries written: {result.score_entries} (replaced {result.replaced_entries})")
+    print(f"   - Errors: {len(result.problems)}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from .rollover import latest_season
+
+    parser = argparse.ArgumentParser(description="Bulk-import hole scores from a Scores.csv file into one tenant")
+    parser.add_argument('tenant', help='Tenant name (database golfdb_<tenant>)')
+    parser.add_argument('csv_file', help='Scores CSV, e.g. backend/Business/Scores.csv')
+    parser.add_argument('--season-id', help='Season the weeks belong to (default: latest)')
+    parser.add_argument('--format', choices=list(SCORE_FORMATS), help='CSV layout (default: detected)')
+    parser.add_argument('--dry-run', action='store_true', help='Import, report and roll back')
+    args = parser.parse_args(argv)
+
+    print("🏌️  Golf League Manager - Hole Score Import")
+    print(f"📊 Tenant: {args.tenant}")
+    print(f"📁 CSV File: {args.csv_file}")
+    try:
+        records = read_csv(args.csv_file, SCORE_FORMATS, args.format)
+    except FileNotFoundError:
+        print(f"❌ Error: CSV file not found: {args.csv_file}")
+        return 1
+    except (CsvFormatError, OSError, UnicodeDecodeError) as e:
+        print(f"❌ Error reading CSV file: {e}")
+        return 1
+    print(f"✅ Format: {records.format.name} ({records.format.description})")
+
+    conn = db.connect(args.tenant)
+    try:
+        season_id = args.season_id or latest_season(conn)
+        if season_id is None:
+            print("❌ No seasons found")
+            return 1
+        with records:
+            result = import_scores(conn, records, season_id)
+        result.problems.extend(records.problems)
+        if args.dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+        print_import(result, args.dry_run)
+        return 0
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Error during import: {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Vectorized match-play scoring (mirrors MatchPlayScoringService.CalculateMatchPlayResult).
+
+A season is scored in one pass over (matches x 9) arrays instead of one
+API call per matchup:
+
+  * the higher handicap receives round(|hcpA - hcpB|) strokes (banker's
+    rounding, like C# Math.Round), one per hole on the hardest holes of
+    the nine being played, ranked by HoleHandicap (ties by hole number)
+  * lower net score wins the hole (HoleWinPoints), a halve gives both
+    players HoleHalvePoints; holes missing either score are skipped
+  * lower net total over the completed holes earns MatchWinBonus, a tie
+    gives both MatchTiePoints; no completed holes means no points at all
+
+Missing hole scores are any negative value (snapshot columns use -1).
+Absence and special-week rules (MatchPlayService) are not applied here.
+"""
+
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from . import strokes as strokes_tables
+
+HOLES = 9
+MISSING = -1
+# Sorts after any real HoleHandicap so padded slots never receive strokes first
+NO_HANDICAP = 99
+
+
+@dataclass(frozen=True)
+class PointsRules:
+    """Point values from LeagueSettings (defaults are the league's 2-1-2-1 system)"""
+    hole_win: int = 2
+    hole_halve: int = 1
+    match_win_bonus: int = 2
+    match_tie: int = 1
+
+    @classmethod
+    def from_settings(cls, settings: Dict) -> 'PointsRules':
+        """Build from a LeagueSettings row (dict keyed by column name)"""
+        return cls(int(settings['HoleWinPoints']), int(settings['HoleHalvePoints']),
+                   int(settings['MatchWinBonus']), int(settings['MatchTiePoints']))
+
+
+@dataclass
+class MatchResults:
+    """Per-hole and per-match outcome arrays, one row per match"""
+    a_hole_points: np.ndarray    # (m, 9) HoleScores.PlayerAMatchPoints
+    b_hole_points: np.ndarray    # (m, 9) HoleScores.PlayerBMatchPoints
+    a_net: np.ndarray            # (m,) net total over completed holes
+    b_net: np.ndarray
+    holes_played: np.ndarray     # (m,) holes with both scores entered
+    a_hole_total: np.ndarray     # (m,) Matchups.PlayerAHolePoints
+    b_hole_total: np.ndarray
+    a_points: np.ndarray         # (m,) Matchups.PlayerAPoints
+    b_points: np.ndarray
+    a_match_win: np.ndarray      # (m,) bool
+    b_match_win: np.ndarray
+
+    def __len__(self):
+        return len(self.a_points)
+
+
+def stroke_counts(handicap_a, handicap_b):
+    """
+    Strokes given per match and whether player A is the receiver.
+
+    Handicaps are rounded to 6 places before Math.Round-style banker's
+    rounding so float noise (10.3 - 6.8 = 3.5000000000000004) rounds like
+    the backend's decimals do.
+    """
+    handicap_a = np.asarray(handicap_a, dtype=np.float64)
+    handicap_b = np.asarray(handicap_b, dtype=np.float64)
+    difference = np.round(np.abs(handicap_a - handicap_b), 6)
+    strokes = np.minimum(np.round(difference), HOLES).astype(np.int16)
+    return strokes, handicap_a > handicap_b
+
+
+def allocate_strokes(strokes, hole_handicaps) -> np.ndarray:
+    """
+    (m, 9) 0/1 strokes per hole: the `strokes` hardest holes of each match.
+
+    hole_handicaps is (9,) for a single nine or (m, 9) per match, in hole
+    number order. Looked up in the precomputed glm.strokes tables.
+    """
+    return strokes_tables.allocate(strokes, hole_handicaps)
+
+
+def score_matches(a_scores, b_scores, handicap_a=None, handicap_b=None, hole_handicaps=None,
+                  rules: PointsRules = PointsRules(), strokes=None, a_receives=None,
+                  stroke_holes=None) -> MatchResults:
+    """
+    Score many matches at once.
+
+    Args:
+        a_scores, b_scores: (m, 9) gross hole scores, negative = not entered.
+        handicap_a, handicap_b: (m,) scoring handicaps; used to derive
+            `strokes`/`a_receives` when those are not given.
+        hole_handicaps: (9,) or (m, 9) HoleHandicap per hole.
+        rules: point values from LeagueSettings.
+        stroke_holes: precomputed (m, 9) 0/1 stroke allocation, e.g.
+            CourseStrokeTables.allocate(strokes, nines); skips the hole
+            handicap lookup when given.
+    """
+    a_scores = np.asarray(a_scores)
+    b_scores = np.asarray(b_scores)
+    if strokes is None or a_receives is None:
+        strokes, a_receives = stroke_counts(handicap_a, handicap_b)
+    a_receives = np.asarray(a_receives, dtype=bool)
+    if stroke_holes is None:
+        stroke_holes = allocate_strokes(strokes, hole_handicaps)
+
+    played = (a_scores >= 0) & (b_scores >= 0)
+    a_net = a_scores - stroke_holes * a_receives[:, None]
+    b_net = b_scores - stroke_holes * ~a_receives[:, None]
+
+    a_wins = played & (a_net < b_net)
+    b_wins = played & (b_net < a_net)
+    halves = played & (a_net == b_net)
+
+    a_hole_points = (a_wins * rules.hole_win + halves * rules.hole_halve).astype(np.int16)
+    b_hole_points = (b_wins * rules.hole_win + halves * rules.hole_halve).astype(np.int16)
+
+    a_net_total = np.where(played, a_net, 0).sum(axis=1)
+    b_net_total = np.where(played, b_net, 0).sum(axis=1)
+    holes_played = played.sum(axis=1)
+    completed = holes_played > 0
+
+    a_match_win = completed & (a_net_total < b_net_total)
+    b_match_win = completed & (b_net_total < a_net_total)
+    tied = completed & (a_net_total == b_net_total)
+
+    a_hole_total = a_hole_points.sum(axis=1)
+    b_hole_total = b_hole_points.sum(axis=1)
+    a_points = np.where(completed, a_hole_total + a_match_win * rules.match_win_bonus
+                        + tied * rules.match_tie, 0)
+    b_points = np.where(completed, b_hole_total + b_match_win * rules.match_win_bonus
+                        + tied * rules.match_tie, 0)
+
+    return MatchResults(a_hole_points, b_hole_points, a_net_total, b_net_total, holes_played,
+                        a_hole_total, b_hole_total, a_points, b_points, a_match_win, b_match_win)
+
+
+def score_match(a_holes: Sequence[Optional[int]], b_holes: Sequence[Optional[int]],
+                handicap_a, handicap_b, hole_handicaps: Sequence[int],
+                rules: PointsRules = PointsRules()) -> Dict:
+    """Score a single match (None = hole not entered); exact decimal stroke rounding"""
+    difference = abs(Decimal(str(handicap_a)) - Decimal(str(handicap_b)))
+    strokes = min(HOLES, int(difference.quantize(Decimal('1'), ROUND_HALF_EVEN)))
+    a_receives = Decimal(str(handicap_a)) > Decimal(str(handicap_b))
+
+    def row(values):
+        return [MISSING if v is None else v for v in values]
+
+    r = score_matches([row(a_holes)], [row(b_holes)], hole_handicaps=[list(hole_handicaps)], rules=rules,
+                      strokes=np.array([strokes]), a_receives=np.array([a_receives]))
+    return {
+        'PlayerAMatchPoints': r.a_hole_points[0].tolist(),
+        'PlayerBMatchPoints': r.b_hole_points[0].tolist(),
+        'PlayerAHolePoints': int(r.a_hole_total[0]),
+        'PlayerBHolePoints': int(r.b_hole_total[0]),
+        'PlayerAPoints': int(r.a_points[0]),
+        'PlayerBPoints': int(r.b_points[0]),
+        'PlayerAMatchWin': bool(r.a_match_win[0]),
+        'PlayerBMatchWin': bool(r.b_match_win[0]),
+    }
+
+
+def hole_arrays(match_index, hole_number, hole_handicap, a_score, b_score, matches: int):
+    """
+    Pivot HoleScores rows into (matches, 9) arrays.
+
+    match_index is each row's match row number (e.g. the snapshot's
+    HoleScores.MatchupId column); hole 1-9 and 10-18 both map to slots 0-8.
+    Matches with fewer than nine rows keep MISSING scores and NO_HANDICAP
+    in the empty slots. Returns (a, b, hole_handicaps).
+    """
+    match_index = np.asarray(match_index)
+    slot = (np.asarray(hole_number) - 1) % HOLES
+    keep = match_index >= 0
+
+    a = np.full((matches, HOLES), MISSING, dtype=np.int16)
+    b = np.full((matches, HOLES), MISSING, dtype=np.int16)
+    handicaps = np.full((matches, HOLES), NO_HANDICAP, dtype=np.int16)
+    a[match_index[keep], slot[keep]] = np.asarray(a_score)[keep]
+    b[match_index[keep], slot[keep]] = np.asarray(b_score)[keep]
+    handicaps[match_index[keep], slot[keep]] = np.asarray(hole_handicap)[keep]
+    return a, b, handicaps
+
+
+def snapshot_hole_arrays(snapshot):
+    """hole_arrays() for every matchup in a glm.snapshot.Snapshot, in Matchups row order"""
+    holes = snapshot['HoleScores']
+    return hole_arrays(holes['MatchupId'], holes['HoleNumber'], holes['HoleHandicap'],
+                       holes['PlayerAScore'], holes['PlayerBScore'], len(snapshot['Matchups']))
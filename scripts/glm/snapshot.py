@@ -0,0 +1,311 @@
+"""
+Columnar snapshot of a tenant database for offline analysis.
+
+A snapshot is a directory with a manifest.json and one .npy file per
+column, so analysis tools can np.load(..., mmap_mode='r') exactly the
+columns they need and never touch the production database:
+
+    <out>/<tenant>/manifest.json
+    <out>/<tenant>/Matchups/PlayerAId.npy     int32 row index into Players
+    <out>/<tenant>/Players/FirstName.npy      int32 code into FirstName.json
+    <out>/<tenant>/Players/Id.json            UUID of every row, in row order
+
+Ids are dictionary encoded: a table's own UUIDs live in Id.json and every
+foreign key is stored as the int32 row number of the referenced table
+(-1 when NULL or dangling). Text columns are stored as int32 codes into a
+JSON list of distinct values. Nullable integers use -1 for NULL.
+
+Usage:
+    python3 scripts/database/snapshot-tenant.py <tenant> [--out data/snapshots]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+NULL = -1
+FETCH_SIZE = 5000
+DEFAULT_OUTPUT_DIR = os.path.join('data', 'snapshots')
+
+# Column kinds -> numpy dtype of the stored column
+KIND_DTYPES = {
+    'ref': 'int32',
+    'text': 'int32',
+    'int': 'int32',
+    'small': 'int16',
+    'nullable': 'int16',
+    'float': 'float64',
+    'bool': 'bool',
+    'date': 'datetime64[s]',
+}
+
+# Exported tables in dependency order. Each column is (name, kind[, referenced table]).
+TABLES: List[Tuple[str, List[Tuple]]] = [
+    ('Seasons', [('Name', 'text'), ('Year', 'small'), ('SeasonNumber', 'small'),
+                 ('StartDate', 'date'), ('EndDate', 'date')]),
+    ('LeagueSettings', [('SeasonId', 'ref', 'Seasons'), ('HandicapMethod', 'small'),
+                        ('AverageMethod', 'small'), ('LegacyInitialWeight', 'small'),
+                        ('CoursePar', 'small'), ('CourseRating', 'float'), ('SlopeRating', 'float'),
+                        ('MaxRoundsForHandicap', 'small'), ('HoleWinPoints', 'small'),
+                        ('HoleHalvePoints', 'small'), ('MatchWinBonus', 'small'),
+                        ('MatchTiePoints', 'small')]),
+    ('Players', [('FirstName', 'text'), ('LastName', 'text'),
+                 ('InitialAverageScore', 'float'), ('CurrentAverageScore', 'float')]),
+    ('PlayerSeasonRecords', [('PlayerId', 'ref', 'Players'), ('SeasonId', 'ref', 'Seasons'),
+                             ('InitialAverageScore', 'float'), ('CurrentAverageScore', 'float'),
+                             ('InitialHandicap', 'float'), ('CurrentHandicap', 'float')]),
+    ('Flights', [('Name', 'text'), ('SeasonId', 'ref', 'Seasons'), ('MaxPlayers', 'small'),
+                 ('IsActive', 'bool')]),
+    ('Weeks', [('SeasonId', 'ref', 'Seasons'), ('WeekNumber', 'small'), ('Date', 'date'),
+               ('CountsForScoring', 'bool'), ('CountsForHandicap', 'bool'),
+               ('SessionStart', 'bool'), ('NineHoles', 'small'),
+               ('SpecialPointsAwarded', 'nullable')]),
+    ('PlayerFlightAssignments', [('PlayerId', 'ref', 'Players'), ('FlightId', 'ref', 'Flights'),
+                                 ('SeasonId', 'ref', 'Seasons'), ('SessionStartWeekNumber', 'small'),
+                                 ('IsFlightLeader', 'bool'), ('HandicapAtAssignment', 'float')]),
+    ('Matchups', [('WeekId', 'ref', 'Weeks'), ('PlayerAId', 'ref', 'Players'),
+                  ('PlayerBId', 'ref', 'Players'), ('PlayerAScore', 'nullable'),
+                  ('PlayerBScore', 'nullable'), ('PlayerAPoints', 'nullable'),
+                  ('PlayerBPoints', 'nullable'), ('PlayerAHolePoints', 'small'),
+                  ('PlayerBHolePoints', 'small'), ('PlayerAMatchWin', 'bool'),
+                  ('PlayerBMatchWin', 'bool'), ('PlayerAAbsent', 'bool'), ('PlayerBAbsent', 'bool'),
+                  ('PlayerAAbsentWithNotice', 'bool'), ('PlayerBAbsentWithNotice', 'bool')]),
+    ('HoleScores', [('MatchupId', 'ref', 'Matchups'), ('HoleNumber', 'small'), ('Par', 'small'),
+                    ('HoleHandicap', 'small'), ('PlayerAScore', 'nullable'),
+                    ('PlayerBScore', 'nullable'), ('PlayerAMatchPoints', 'small'),
+                    ('PlayerBMatchPoints', 'small')]),
+    ('ScoreEntries', [('PlayerId', 'ref', 'Players'), ('WeekId', 'ref', 'Weeks'),
+                      ('Score', 'nullable'), ('PointsEarned', 'small')]),
+    ('Courses', [('Name', 'text'), ('TotalPar', 'small'), ('CourseRating', 'float'),
+                 ('SlopeRating', 'float')]),
+    ('CourseHoles', [('CourseId', 'ref', 'Courses'), ('HoleNumber', 'small'), ('Par', 'small'),
+                     ('Yardage', 'small'), ('HandicapIndex', 'small')]),
+]
+
+TABLE_COLUMNS = dict(TABLES)
+
+
+def _np():
+    import numpy
+    return numpy
+
+
+def _encode(kind: str, values: List, ref_index: Optional[Dict[str, int]] = None):
+    """Encode one column; returns (array, dictionary or None)"""
+    np = _np()
+    dtype = KIND_DTYPES[kind]
+
+    if kind == 'ref':
+        return np.array([ref_index.get(str(v), NULL) if v is not None else NULL for v in values],
+                        dtype=dtype), None
+    if kind == 'text':
+        codes: Dict[str, int] = {}
+        encoded = [codes.setdefault(v, len(codes)) if v is not None else NULL for v in values]
+        return np.array(encoded, dtype=dtype), list(codes)
+    if kind == 'nullable':
+        return np.array([NULL if v is None else int(v) for v in values], dtype=dtype), None
+    if kind == 'float':
+        return np.array([float('nan') if v is None else float(v) for v in values], dtype=dtype), None
+    if kind == 'bool':
+        return np.array([bool(v) for v in values], dtype=dtype), None
+    if kind == 'date':
+        return np.array([_to_datetime64(v) for v in values], dtype=dtype), None
+    return np.array([0 if v is None else int(v) for v in values], dtype=dtype), None
+
+
+def _to_datetime64(value):
+    np = _np()
+    if value is None:
+        return np.datetime64('NaT')
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, 's')
+
+
+def _fetch_columns(conn, table: str, columns: Sequence[str]) -> Tuple[List[str], List[List]]:
+    """Read a table column-wise, fetching in chunks"""
+    names = ['Id'] + list(columns)
+    select = ', '.join(f'"{c}"' for c in names)
+    cur = conn.cursor()
+    try:
+        cur.execute(f'SELECT {select} FROM "{table}" ORDER BY "Id"')
+        data: List[List] = [[] for _ in names]
+        while True:
+            rows = cur.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                for i, value in enumerate(row):
+                    data[i].append(value)
+    finally:
+        cur.close()
+    return [str(v) for v in data[0]], data[1:]
+
+
+def export_snapshot(conn, out_dir: str, tenant: str = '',
+                    tables: Optional[Iterable[str]] = None) -> Dict:
+    """Write a snapshot of `conn` into out_dir and return the manifest"""
+    np = _np()
+    wanted = set(tables) if tables else None
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest = {
+        'format': FORMAT_VERSION,
+        'tenant': tenant,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'tables': {},
+    }
+    id_indexes: Dict[str, Dict[str, int]] = {}
+
+    for table, columns in TABLES:
+        if wanted is not None and table not in wanted:
+            continue
+        # Referenced tables must be present so foreign keys can be encoded
+        for column in columns:
+            if column[1] == 'ref' and column[2] not in id_indexes:
+                raise ValueError(f"{table}.{column[0]} references {column[2]}, which is not in the snapshot")
+
+        ids, data = _fetch_columns(conn, table, [c[0] for c in columns])
+        id_indexes[table] = {row_id: i for i, row_id in enumerate(ids)}
+
+        table_dir = os.path.join(out_dir, table)
+        os.makedirs(table_dir, exist_ok=True)
+        with open(os.path.join(table_dir, 'Id.json'), 'w') as f:
+            json.dump(ids, f)
+
+        column_info = {}
+        for column, values in zip(columns, data):
+            name, kind = column[0], column[1]
+            ref = column[2] if kind == 'ref' else None
+            array, dictionary = _encode(kind, values, id_indexes.get(ref))
+            np.save(os.path.join(table_dir, f'{name}.npy'), array, allow_pickle=False)
+            info = {'kind': kind, 'dtype': str(array.dtype)}
+            if ref:
+                info['references'] = ref
+            if dictionary is not None:
+                with open(os.path.join(table_dir, f'{name}.json'), 'w') as f:
+                    json.dump(dictionary, f)
+                info['distinct'] = len(dictionary)
+            column_info[name] = info
+
+        manifest['tables'][table] = {'rows': len(ids), 'columns': column_info}
+
+    with open(os.path.join(out_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+class SnapshotTable:
+    """One table of a snapshot; columns are loaded (memory-mapped) on first access"""
+
+    def __init__(self, path: str, name: str, info: Dict, mmap: bool = True):
+        self.path = path
+        self.name = name
+        self.rows = info['rows']
+        self.columns = info['columns']
+        self._mmap_mode = 'r' if mmap else None
+        self._arrays: Dict = {}
+        self._ids: Optional[List[str]] = None
+        self._id_index: Optional[Dict[str, int]] = None
+        self._dictionaries: Dict[str, List[str]] = {}
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, column: str):
+        if column not in self._arrays:
+            if column not in self.columns:
+                raise KeyError(f"{self.name} has no column {column}")
+            self._arrays[column] = _np().load(os.path.join(self.path, f'{column}.npy'),
+                                              mmap_mode=self._mmap_mode, allow_pickle=False)
+        return self._arrays[column]
+
+    @property
+    def ids(self) -> List[str]:
+        """UUID of every row, in row order"""
+        if self._ids is None:
+            with open(os.path.join(self.path, 'Id.json')) as f:
+                self._ids = json.load(f)
+        return self._ids
+
+    def index_of(self, row_id: str) -> int:
+        """Row number for a UUID (-1 if absent)"""
+        if self._id_index is None:
+            self._id_index = {row_id: i for i, row_id in enumerate(self.ids)}
+        return self._id_index.get(str(row_id), NULL)
+
+    def dictionary(self, column: str) -> List[str]:
+        """Distinct values of a text column, indexed by code"""
+        if column not in self._dictionaries:
+            with open(os.path.join(self.path, f'{column}.json')) as f:
+                self._dictionaries[column] = json.load(f)
+        return self._dictionaries[column]
+
+    def text(self, column: str) -> List[Optional[str]]:
+        """Decoded values of a text column"""
+        values = self.dictionary(column)
+        return [values[code] if code != NULL else None for code in self[column].tolist()]
+
+
+class Snapshot:
+    """Read side of a snapshot directory"""
+
+    def __init__(self, path: str, mmap: bool = True):
+        self.path = path
+        with open(os.path.join(path, 'manifest.json')) as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format {self.manifest.get('format')} in {path}")
+        self.tenant = self.manifest.get('tenant', '')
+        self._tables = {
+            name: SnapshotTable(os.path.join(path, name), name, info, mmap)
+            for name, info in self.manifest['tables'].items()
+        }
+
+    def __getitem__(self, table: str) -> SnapshotTable:
+        return self._tables[table]
+
+    def __contains__(self, table: str) -> bool:
+        return table in self._tables
+
+    @property
+    def tables(self) -> List[str]:
+        return list(self._tables)
+
+
+def open_snapshot(path: str, mmap: bool = True) -> Snapshot:
+    return Snapshot(path, mmap=mmap)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import db
+
+    parser = argparse.ArgumentParser(description="Export a tenant to a columnar snapshot for offline analysis")
+    parser.add_argument('tenant', help='Tenant name (e.g., southmoore)')
+    parser.add_argument('--out', default=DEFAULT_OUTPUT_DIR,
+                        help=f'Parent directory for the snapshot (default {DEFAULT_OUTPUT_DIR})')
+    args = parser.parse_args(argv)
+
+    out_dir = os.path.join(args.out, db.tenant_name(args.tenant))
+    print(f"📸 Snapshotting tenant {args.tenant} into {out_dir}")
+
+    start = time.perf_counter()
+    conn = db.connect(tenant=args.tenant)
+    try:
+        manifest = export_snapshot(conn, out_dir, tenant=db.tenant_name(args.tenant))
+    finally:
+        conn.close()
+
+    for table, info in manifest['tables'].items():
+        print(f"   {table:<25} {info['rows']:>7} rows")
+    print(f"✅ Snapshot written in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,562 @@
+"""
+Offline standings engine, cross-checked against /api/standings/session.
+
+Mirrors StandingsController.GetSessionStandings:
+
+  * the session is the latest SessionStart week at or before the selected
+    week; flights are the season's flights ordered by name and their
+    players come from that session's PlayerFlightAssignments
+  * a player's points for a matchup are SpecialPointsAwarded on special
+    weeks (halved, integer division, when absent), else 4 when absent
+    with notice, 0 when absent without notice, else PlayerXPoints
+  * players are ordered by session total (descending), then last name
+
+Points are kept as per-week deltas (player -> points) with cached running
+totals, so refreshing one week's matchups only recomputes that week and
+shifts the cached totals after it. Handicap and average columns are not
+reproduced here.
+
+Usage:
+    python3 scripts/analysis/standings-diff.py --tenant southmoore --week 11
+    python3 scripts/analysis/standings-diff.py --snapshot data/snapshots/southmoore --api http://localhost:5274/api
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# StandingsController hard-codes these rather than reading LeagueSettings
+ABSENT_WITH_NOTICE_POINTS = 4
+ABSENT_POINTS = 0
+
+API_BASE_URL = "http://localhost:5274/api"
+
+
+@dataclass
+class WeekInfo:
+    id: str
+    number: int
+    session_start: bool = False
+    special_points: Optional[int] = None
+
+
+@dataclass
+class MatchupRow:
+    player_a: str
+    player_b: str
+    a_score: Optional[int] = None
+    b_score: Optional[int] = None
+    a_points: Optional[int] = None
+    b_points: Optional[int] = None
+    a_absent: bool = False
+    b_absent: bool = False
+    a_notice: bool = False
+    b_notice: bool = False
+
+    def side(self, player_id: str) -> Optional[int]:
+        """0 for player A, 1 for player B, None if the player is not in this matchup"""
+        if self.player_a == player_id:
+            return 0
+        if self.player_b == player_id:
+            return 1
+        return None
+
+
+@dataclass
+class SeasonData:
+    """Everything the standings need for one season"""
+    season_id: str
+    weeks: List[WeekInfo]
+    players: Dict[str, Tuple[str, str]]                 # id -> (first, last)
+    flights: Dict[str, str]                             # id -> name, season flights only
+    assignments: List[Tuple[str, str, int]]             # (player, flight, session start week)
+    matchups: Dict[str, List[MatchupRow]] = field(default_factory=dict)  # by week id
+
+
+@dataclass
+class PlayerStanding:
+    id: str
+    name: str
+    session_total: int
+    this_week_points: int
+    gross_score: int
+    is_absent: bool
+    is_bye: bool
+    season_total: int = 0
+
+
+@dataclass
+class FlightStanding:
+    id: str
+    name: str
+    players: List[PlayerStanding]
+
+
+@dataclass
+class SessionStandings:
+    week_id: str
+    week_number: int
+    session_number: int
+    session_start_week: int
+    flights: List[FlightStanding]
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+@dataclass
+class Discrepancy:
+    week_number: int
+    flight: str
+    player_id: str
+    player: str
+    field: str
+    expected: object
+    actual: object
+
+
+def matchup_points(matchup: MatchupRow, side: int, special_points: Optional[int]) -> int:
+    """Points one side of a matchup contributes to the standings"""
+    absent = matchup.a_absent if side == 0 else matchup.b_absent
+    if special_points:
+        return special_points // 2 if absent else special_points
+    if absent:
+        notice = matchup.a_notice if side == 0 else matchup.b_notice
+        return ABSENT_WITH_NOTICE_POINTS if notice else ABSENT_POINTS
+    points = matchup.a_points if side == 0 else matchup.b_points
+    return points or 0
+
+
+def display_name(first: str, last: str) -> str:
+    """"First L." with the controller's JR handling"""
+    if last.upper().endswith(' JR'):
+        return f"{first} {last[:-3][:1]}. JR"
+    return f"{first} {last[:1]}."
+
+
+class StandingsEngine:
+    """
+    Session and season standings for one season, computed week by week.
+
+    `recomputed_weeks` counts week deltas computed, so callers can confirm
+    an incremental refresh touched a single week.
+    """
+
+    def __init__(self, season: SeasonData):
+        self.season = season
+        self.recomputed_weeks = 0
+        self._deltas: Dict[str, Dict[str, int]] = {}
+        self._session_totals: Dict[int, Dict[str, int]] = {}
+        self._season_totals: Dict[int, Dict[str, int]] = {}
+        self._index_weeks()
+
+    def _index_weeks(self):
+        self._weeks_by_id = {w.id: w for w in self.season.weeks}
+        self._week_ids_by_number: Dict[int, List[str]] = {}
+        for week in sorted(self.season.weeks, key=lambda w: w.number):
+            self._week_ids_by_number.setdefault(week.number, []).append(week.id)
+        self._numbers = sorted(self._week_ids_by_number)
+        self._session_starts = sorted({w.number for w in self.season.weeks if w.session_start})
+
+    def session_start(self, week_number: int) -> int:
+        """Latest SessionStart week at or before week_number (1 when there is none)"""
+        i = bisect_right(self._session_starts, week_number)
+        return self._session_starts[i - 1] if i else 1
+
+    def session_number(self, week_number: int) -> int:
+        return max(1, bisect_right(self._session_starts, week_number))
+
+    def week_delta(self, week_id: str) -> Dict[str, int]:
+        """Points each player earned in one week (computed once, then cached)"""
+        delta = self._deltas.get(week_id)
+        if delta is None:
+            week = self._weeks_by_id[week_id]
+            delta = {}
+            for m in self.season.matchups.get(week_id, ()):
+                delta[m.player_a] = delta.get(m.player_a, 0) + matchup_points(m, 0, week.special_points)
+                delta[m.player_b] = delta.get(m.player_b, 0) + matchup_points(m, 1, week.special_points)
+            self._deltas[week_id] = delta
+            self.recomputed_weeks += 1
+        return delta
+
+    def _number_delta(self, number: int) -> Dict[str, int]:
+        ids = self._week_ids_by_number.get(number, ())
+        if len(ids) == 1:
+            return self.week_delta(ids[0])
+        merged: Dict[str, int] = {}
+        for week_id in ids:
+            for player, points in self.week_delta(week_id).items():
+                merged[player] = merged.get(player, 0) + points
+        return merged
+
+    def _running(self, week_number: int, cache: Dict[int, Dict[str, int]], first: int) -> Dict[str, int]:
+        """Totals over week numbers first..week_number, extending the nearest cached prefix"""
+        numbers = [n for n in self._numbers if first <= n <= week_number]
+        start = len(numbers)
+        while start and numbers[start - 1] not in cache:
+            start -= 1
+        totals = dict(cache[numbers[start - 1]]) if start else {}
+        for n in numbers[start:]:
+            for player, points in self._number_delta(n).items():
+                totals[player] = totals.get(player, 0) + points
+            cache[n] = dict(totals)
+        return totals
+
+    def session_totals(self, week_number: int) -> Dict[str, int]:
+        return self._running(week_number, self._session_totals, self.session_start(week_number))
+
+    def season_totals(self, week_number: int) -> Dict[str, int]:
+        return self._running(week_number, self._season_totals, self._numbers[0] if self._numbers else 1)
+
+    def set_week_matchups(self, week_id: str, matchups: List[MatchupRow]):
+        """Replace one week's matchups and shift the cached totals after it"""
+        week = self._weeks_by_id[week_id]
+        old = self.week_delta(week_id)
+        self.season.matchups[week_id] = matchups
+        del self._deltas[week_id]
+        new = self.week_delta(week_id)
+
+        change = {p: new.get(p, 0) - old.get(p, 0) for p in set(old) | set(new)}
+        change = {p: d for p, d in change.items() if d}
+        if not change:
+            return
+        session_start = self.session_start(week.number)
+        next_start = bisect_right(self._session_starts, week.number)
+        session_end = self._session_starts[next_start] if next_start < len(self._session_starts) else None
+        for cache, in_scope in ((self._season_totals, lambda n: True),
+                                (self._session_totals,
+                                 lambda n: n >= session_start and (session_end is None or n < session_end))):
+            for n, totals in cache.items():
+                if n >= week.number and in_scope(n):
+                    for player, d in change.items():
+                        totals[player] = totals.get(player, 0) + d
+
+    def set_week(self, week: WeekInfo, matchups: List[MatchupRow]):
+        """Add or replace a week; a changed SessionStart/special flag drops cached totals from that week on"""
+        existing = self._weeks_by_id.get(week.id)
+        if existing and (existing.session_start, existing.special_points, existing.number) == \
+                (week.session_start, week.special_points, week.number):
+            self.set_week_matchups(week.id, matchups)
+            return
+
+        self.season.weeks = [w for w in self.season.weeks if w.id != week.id] + [week]
+        self.season.matchups[week.id] = matchups
+        self._deltas.pop(week.id, None)
+        self._index_weeks()
+        first = min(week.number, existing.number if existing else week.number)
+        for cache in (self._session_totals, self._season_totals):
+            for n in [n for n in cache if n >= first]:
+                del cache[n]
+
+    def session_standings(self, week_id: str) -> SessionStandings:
+        """Equivalent of GET /standings/session?seasonId=..&weekId=.."""
+        week = self._weeks_by_id[week_id]
+        session_start = self.session_start(week.number)
+        totals = self.session_totals(week.number)
+        season_totals = self.season_totals(week.number)
+        this_week = self.season.matchups.get(week_id, [])
+        this_week_points = self.week_delta(week_id)
+
+        flights = []
+        for flight_id, flight_name in sorted(self.season.flights.items(), key=lambda f: f[1]):
+            members = [p for p, f, s in self._session_assignments(session_start) if f == flight_id]
+            standings = []
+            for player_id in members:
+                first, last = self.season.players[player_id]
+                matchup = next((m for m in this_week if m.side(player_id) is not None), None)
+                gross, absent = 0, False
+                if matchup is not None:
+                    side = matchup.side(player_id)
+                    gross = (matchup.a_score if side == 0 else matchup.b_score) or 0
+                    absent = matchup.a_absent if side == 0 else matchup.b_absent
+                standings.append(PlayerStanding(
+                    player_id, display_name(first, last), totals.get(player_id, 0),
+                    this_week_points.get(player_id, 0), gross, absent, matchup is None,
+                    season_totals.get(player_id, 0)))
+            standings.sort(key=lambda s: (-s.session_total, self.season.players[s.id][1]))
+            flights.append(FlightStanding(flight_id, flight_name, standings))
+
+        return SessionStandings(week_id, week.number, self.session_number(week.number), session_start, flights)
+
+    def _session_assignments(self, session_start: int):
+        # Same order as the repository: flight name, then last and first name
+        rows = [(p, f, s) for p, f, s in self.season.assignments
+                if s == session_start and f in self.season.flights and p in self.season.players]
+        return sorted(rows, key=lambda r: (self.season.flights[r[1]], self.season.players[r[0]][1],
+                                           self.season.players[r[0]][0]))
+
+    def weeks(self) -> List[WeekInfo]:
+        return sorted(self.season.weeks, key=lambda w: w.number)
+
+
+def _nullable(value) -> Optional[int]:
+    value = int(value)
+    return None if value < 0 else value
+
+
+def load_season_from_snapshot(snapshot, season_id: Optional[str] = None) -> SeasonData:
+    """Build SeasonData from a glm.snapshot.Snapshot (latest season by default)"""
+    import numpy as np
+
+    seasons = snapshot['Seasons']
+    if season_id is None:
+        if not len(seasons):
+            raise ValueError("Snapshot has no seasons")
+        keys = list(zip(seasons['Year'].tolist(), seasons['SeasonNumber'].tolist()))
+        season = max(range(len(keys)), key=lambda i: keys[i])
+    else:
+        season = seasons.index_of(season_id)
+        if season < 0:
+            raise ValueError(f"Season {season_id} is not in the snapshot")
+
+    players_table = snapshot['Players']
+    first_names = players_table.text('FirstName')
+    last_names = players_table.text('LastName')
+    players = {pid: (first_names[i] or '', last_names[i] or '') for i, pid in enumerate(players_table.ids)}
+
+    weeks_table = snapshot['Weeks']
+    week_rows = np.nonzero(np.asarray(weeks_table['SeasonId']) == season)[0]
+    week_ids = weeks_table.ids
+    weeks = [WeekInfo(week_ids[i], int(weeks_table['WeekNumber'][i]), bool(weeks_table['SessionStart'][i]),
+                      _nullable(weeks_table['SpecialPointsAwarded'][i])) for i in week_rows]
+
+    flights_table = snapshot['Flights']
+    flight_names = flights_table.text('Name')
+    flight_rows = np.nonzero(np.asarray(flights_table['SeasonId']) == season)[0]
+    flights = {flights_table.ids[i]: flight_names[i] or '' for i in flight_rows}
+
+    pfa = snapshot['PlayerFlightAssignments']
+    pfa_rows = np.nonzero(np.asarray(pfa['SeasonId']) == season)[0]
+    assignments = [(players_table.ids[pfa['PlayerId'][i]], flights_table.ids[pfa['FlightId'][i]],
+                    int(pfa['SessionStartWeekNumber'][i]))
+                   for i in pfa_rows if pfa['PlayerId'][i] >= 0 and pfa['FlightId'][i] >= 0]
+
+    m = snapshot['Matchups']
+    matchups: Dict[str, List[MatchupRow]] = {}
+    in_season = np.isin(np.asarray(m['WeekId']), week_rows)
+    columns = [np.asarray(m[c])[in_season].tolist() for c in (
+        'WeekId', 'PlayerAId', 'PlayerBId', 'PlayerAScore', 'PlayerBScore', 'PlayerAPoints',
+        'PlayerBPoints', 'PlayerAAbsent', 'PlayerBAbsent', 'PlayerAAbsentWithNotice', 'PlayerBAbsentWithNotice')]
+    for week, a, b, a_score, b_score, a_points, b_points, a_abs, b_abs, a_notice, b_notice in zip(*columns):
+        if a < 0 or b < 0:
+            continue
+        matchups.setdefault(week_ids[week], []).append(MatchupRow(
+            players_table.ids[a], players_table.ids[b], _nullable(a_score), _nullable(b_score),
+            _nullable(a_points), _nullable(b_points), a_abs, b_abs, a_notice, b_notice))
+
+    return SeasonData(seasons.ids[season], weeks, players, flights, assignments, matchups)
+
+
+MATCHUP_QUERY = '''
+    SELECT m."WeekId", m."PlayerAId", m."PlayerBId", m."PlayerAScore", m."PlayerBScore",
+           m."PlayerAPoints", m."PlayerBPoints", m."PlayerAAbsent", m."PlayerBAbsent",
+           m."PlayerAAbsentWithNotice", m."PlayerBAbsentWithNotice"
+    FROM "Matchups" m
+'''
+
+
+def _matchup_row(row) -> MatchupRow:
+    return MatchupRow(str(row[1]), str(row[2]), row[3], row[4], row[5], row[6],
+                      bool(row[7]), bool(row[8]), bool(row[9]), bool(row[10]))
+
+
+def load_season(conn, season_id: Optional[str] = None) -> SeasonData:
+    """Build SeasonData straight from a tenant database (latest season by default)"""
+    with conn.cursor() as cur:
+        if season_id is None:
+            cur.execute('SELECT "Id" FROM "Seasons" ORDER BY "Year" DESC, "SeasonNumber" DESC LIMIT 1')
+            row = cur.fetchone()
+            if row is None:
+                raise ValueError("No seasons found")
+            season_id = str(row[0])
+
+        cur.execute('''
+            SELECT "Id", "WeekNumber", "SessionStart", "SpecialPointsAwarded"
+            FROM "Weeks" WHERE "SeasonId" = %s
+        ''', (season_id,))
+        weeks = [WeekInfo(str(r[0]), r[1], bool(r[2]), r[3]) for r in cur.fetchall()]
+
+        cur.execute('SELECT "Id", "FirstName", "LastName" FROM "Players"')
+        players = {str(r[0]): (r[1] or '', r[2] or '') for r in cur.fetchall()}
+
+        cur.execute('SELECT "Id", "Name" FROM "Flights" WHERE "SeasonId" = %s', (season_id,))
+        flights = {str(r[0]): r[1] or '' for r in cur.fetchall()}
+
+        cur.execute('''
+            SELECT "PlayerId", "FlightId", "SessionStartWeekNumber"
+            FROM "PlayerFlightAssignments" WHERE "SeasonId" = %s
+        ''', (season_id,))
+        assignments = [(str(r[0]), str(r[1]), r[2]) for r in cur.fetchall()]
+
+        cur.execute(MATCHUP_QUERY + '''
+            JOIN "Weeks" w ON w."Id" = m."WeekId"
+            WHERE w."SeasonId" = %s
+        ''', (season_id,))
+        matchups: Dict[str, List[MatchupRow]] = {}
+        for row in cur.fetchall():
+            matchups.setdefault(str(row[0]), []).append(_matchup_row(row))
+
+    return SeasonData(season_id, weeks, players, flights, assignments, matchups)
+
+
+def refresh_week(engine: StandingsEngine, conn, week_id: str):
+    """Reload one week (flags and matchups) from the database into the engine"""
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT "Id", "WeekNumber", "SessionStart", "SpecialPointsAwarded"
+            FROM "Weeks" WHERE "Id" = %s
+        ''', (week_id,))
+        row = cur.fetchone()
+        if row is None:
+            raise ValueError(f"Week {week_id} not found")
+        week = WeekInfo(str(row[0]), row[1], bool(row[2]), row[3])
+        cur.execute(MATCHUP_QUERY + ' WHERE m."WeekId" = %s', (week_id,))
+        matchups = [_matchup_row(r) for r in cur.fetchall()]
+    engine.set_week(week, matchups)
+
+
+def diff_session(expected: SessionStandings, actual: Dict) -> List[Discrepancy]:
+    """Compare engine standings with a /standings/session response"""
+    issues: List[Discrepancy] = []
+    week = expected.week_number
+
+    session = actual.get('session', {})
+    if session.get('startWeekNumber') not in (None, expected.session_start_week):
+        issues.append(Discrepancy(week, '', '', '', 'session.startWeekNumber',
+                                  expected.session_start_week, session.get('startWeekNumber')))
+
+    actual_flights = {str(f['id']): f for f in actual.get('flights', [])}
+    for flight in expected.flights:
+        api_flight = actual_flights.pop(flight.id, None)
+        if api_flight is None:
+            issues.append(Discrepancy(week, flight.name, '', '', 'flight', 'present', 'missing'))
+            continue
+        api_players = {str(p['id']): (i, p) for i, p in enumerate(api_flight.get('players', []))}
+        for position, player in enumerate(flight.players):
+            found = api_players.pop(player.id, None)
+            if found is None:
+                issues.append(Discrepancy(week, flight.name, player.id, player.name, 'player', 'present', 'missing'))
+                continue
+            api_position, api_player = found
+            for name, value in (('sessionTotal', player.session_total),
+                                ('thisWeekPoints', player.this_week_points),
+                                ('grossScore', player.gross_score),
+                                ('isAbsent', player.is_absent),
+                                ('isBye', player.is_bye),
+                                ('position', position)):
+                api_value = api_position if name == 'position' else api_player.get(name)
+                if api_value != value:
+                    issues.append(Discrepancy(week, flight.name, player.id, player.name, name, value, api_value))
+        for player_id, (_, api_player) in api_players.items():
+            issues.append(Discrepancy(week, flight.name, player_id, api_player.get('name', ''),
+                                      'player', 'absent', 'unexpected'))
+    for flight in actual_flights.values():
+        issues.append(Discrepancy(week, flight.get('name', ''), '', '', 'flight', 'absent', 'unexpected'))
+    return issues
+
+
+def diff_against_api(engine: StandingsEngine, base_url: str = API_BASE_URL,
+                     week_ids: Optional[Sequence[str]] = None, concurrency: int = 4,
+                     headers: Optional[Dict[str, str]] = None, cookies=None) -> List[Discrepancy]:
+    """Diff every (or the given) week's session standings against the API in parallel"""
+    from .loadtest import new_session
+
+    week_ids = list(week_ids or [w.id for w in engine.weeks()])
+    expected = {week_id: engine.session_standings(week_id) for week_id in week_ids}
+    base_url = base_url.rstrip('/')
+
+    def fetch(week_id: str) -> List[Discrepancy]:
+        session = new_session(headers or {}, cookies)
+        try:
+            response = session.get(f"{base_url}/standings/session",
+                                   params={'seasonId': engine.season.season_id, 'weekId': week_id})
+            if response.status_code != 200:
+                return [Discrepancy(expected[week_id].week_number, '', '', '', 'http', 200, response.status_code)]
+            return diff_session(expected[week_id], response.json())
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        results = list(pool.map(fetch, week_ids))
+    return [issue for issues in results for issue in issues]
+
+
+def print_standings(standings: SessionStandings):
+    print(f"\n📅 Week {standings.week_number} (session {standings.session_number}, "
+          f"started week {standings.session_start_week})")
+    for flight in standings.flights:
+        print(f"\n🏆 {flight.name}")
+        for i, p in enumerate(flight.players, 1):
+            status = " (bye)" if p.is_bye else " (absent)" if p.is_absent else ""
+            print(f"   {i:>2}. {p.name:<18} {p.session_total:>4} pts  week {p.this_week_points:>3}  "
+                  f"gross {p.gross_score:>3}  season {p.season_total:>4}{status}")
+
+
+def _report(args: argparse.Namespace, snap) -> int:
+    """Print (or diff against the API) the standings main() was asked for"""
+    engine = StandingsEngine(load_season_from_snapshot(snap, args.season_id))
+    weeks = [w for w in engine.weeks() if args.week is None or w.number == args.week]
+    if not weeks:
+        print(f"❌ No week {args.week} in season {engine.season.season_id}")
+        return 1
+
+    if not args.api:
+        all_standings = [engine.session_standings(w.id) for w in weeks]
+        if args.json:
+            print(json.dumps([s.to_dict() for s in all_standings], indent=2))
+        else:
+            for standings in all_standings:
+                print_standings(standings)
+        return 0
+
+    tenant_header = args.api_tenant or args.tenant or snap.tenant
+    headers = {'X-Tenant-Id': tenant_header} if tenant_header else {}
+    issues = diff_against_api(engine, args.api, [w.id for w in weeks], args.concurrency, headers)
+
+    if args.json:
+        print(json.dumps([asdict(i) for i in issues], indent=2, default=str))
+    else:
+        print(f"🔍 Compared {len(weeks)} week(s) of session standings against {args.api}")
+        for i in issues:
+            print(f"❌ Week {i.week_number:>2} {i.flight:<10} {i.player:<18} {i.field}: "
+                  f"expected {i.expected}, API {i.actual}")
+        if not issues:
+            print("✅ No discrepancies")
+    return 1 if issues else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from . import db, snapshot as snapshots
+
+    parser = argparse.ArgumentParser(description="Recompute session standings offline and diff them against the API")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshot', help='Snapshot directory written by snapshot-tenant.py')
+    source.add_argument('--tenant', help='Tenant to snapshot on the fly')
+    parser.add_argument('--season-id', help='Season to use (default: latest)')
+    parser.add_argument('--week', type=int, help='Only this week number')
+    parser.add_argument('--api', nargs='?', const=API_BASE_URL,
+                        help=f'Diff against the API (default URL {API_BASE_URL})')
+    parser.add_argument('--api-tenant', help='X-Tenant-Id for API requests (default: --tenant)')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--json', action='store_true', help='Print standings or discrepancies as JSON')
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        return _report(args, snapshots.open_snapshot(args.snapshot))
+    # the on-the-fly snapshot holds player names; it only lives as long as the report
+    with tempfile.TemporaryDirectory(prefix='glm-standings-') as out_dir:
+        conn = db.connect(tenant=args.tenant)
+        try:
+            snapshots.export_snapshot(conn, out_dir, tenant=db.tenant_name(args.tenant))
+        finally:
+            conn.close()
+        return _report(args, snapshots.open_snapshot(out_dir))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Precomputed stroke-allocation tables.
+
+Which holes get a stroke depends only on the handicap difference and the
+HandicapIndex order of the nine being played, so it is computed once per
+course and nine as an int8 table:
+
+    table[difference, slot] -> 1 if that hole (slot 0-8 in hole-number
+                               order) receives a stroke, else 0
+
+for differences 0..36. Allocating strokes for a whole season is then one
+fancy-index (table[strokes]) instead of ranking hole handicaps per match.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+HOLES = 9
+MAX_DIFFERENCE = 36
+FRONT, BACK = 1, 2  # Week.NineHoles
+
+
+@lru_cache(maxsize=256)
+def _cached_table(hole_handicaps: Tuple[int, ...]) -> np.ndarray:
+    order = np.argsort(np.asarray(hole_handicaps), kind='stable')
+    rank = np.argsort(order, kind='stable')  # 0 = hardest hole, ties by hole number
+    strokes = np.minimum(np.arange(MAX_DIFFERENCE + 1), HOLES)
+    table = (rank[None, :] < strokes[:, None]).astype(np.int8)
+    table.setflags(write=False)
+    return table
+
+
+def stroke_table(hole_handicaps: Sequence[int]) -> np.ndarray:
+    """(37, 9) int8 table for one nine; hole_handicaps in hole-number order"""
+    return _cached_table(tuple(int(h) for h in hole_handicaps))
+
+
+def allocate(strokes, hole_handicaps) -> np.ndarray:
+    """
+    (m, 9) strokes per hole via the tables.
+
+    hole_handicaps is (9,) for one nine or (m, 9) per match; per-match rows
+    are de-duplicated so each distinct nine builds its table once.
+    """
+    strokes = np.clip(np.asarray(strokes), 0, MAX_DIFFERENCE)
+    hole_handicaps = np.asarray(hole_handicaps)
+    if hole_handicaps.ndim == 1:
+        return stroke_table(hole_handicaps)[strokes]
+
+    nines, inverse = np.unique(hole_handicaps, axis=0, return_inverse=True)
+    stacked = np.stack([stroke_table(row) for row in nines])
+    return stacked[inverse.reshape(-1), strokes]
+
+
+class CourseStrokeTables:
+    """Front and back nine tables for one course, indexable by Week.NineHoles"""
+
+    def __init__(self, hole_handicaps: Dict[int, int], course_id: Optional[str] = None):
+        self.course_id = course_id
+        missing = [h for h in range(1, 19) if h not in hole_handicaps]
+        if missing:
+            raise ValueError(f"Course {course_id} is missing CourseHoles for holes {missing}")
+        self.front = stroke_table([hole_handicaps[h] for h in range(1, 10)])
+        self.back = stroke_table([hole_handicaps[h] for h in range(10, 19)])
+        # Index 0 is unused so NineHoles values (1 = front, 2 = back) index directly
+        self.stacked = np.stack([np.zeros_like(self.front), self.front, self.back])
+        self.stacked.setflags(write=False)
+
+    def table(self, nine: int) -> np.ndarray:
+        if nine == FRONT:
+            return self.front
+        if nine == BACK:
+            return self.back
+        raise ValueError(f"Unknown NineHoles value: {nine}")
+
+    def allocate(self, strokes, nines) -> np.ndarray:
+        """(m, 9) strokes per hole for matches played on the given nines"""
+        strokes = np.clip(np.asarray(strokes), 0, MAX_DIFFERENCE)
+        return self.stacked[np.asarray(nines), strokes]
+
+
+_course_cache: Dict[Tuple[str, str], CourseStrokeTables] = {}
+
+
+def load_course_tables(conn, course_id: Optional[str] = None, database: str = '') -> CourseStrokeTables:
+    """
+    Stroke tables for a course from "CourseHoles", cached per database
+    (or connection) and course.
+
+    Without course_id the course with the most holes is used; the backend
+    looks HoleHandicap up by hole number alone, so tenants have one course.
+    """
+    key = (database or str(id(conn)), course_id or '')
+    if key in _course_cache:
+        return _course_cache[key]
+
+    with conn.cursor() as cur:
+        if course_id is None:
+            cur.execute('''
+                SELECT "CourseId" FROM "CourseHoles"
+                GROUP BY "CourseId" ORDER BY COUNT(*) DESC, "CourseId" LIMIT 1
+            ''')
+            row = cur.fetchone()
+            if row is None:
+                raise ValueError("No CourseHoles found")
+            course_id = str(row[0])
+        cur.execute('SELECT "HoleNumber", "HandicapIndex" FROM "CourseHoles" WHERE "CourseId" = %s',
+                    (course_id,))
+        hole_handicaps = {int(number): int(index) for number, index in cur.fetchall()}
+
+    tables = CourseStrokeTables(hole_handicaps, str(course_id))
+    _course_cache[key] = tables
+    return tables
+
+
+def load_snapshot_course(snapshot) -> Tuple[CourseStrokeTables, np.ndarray]:
+    """
+    Stroke tables and a (19,) par-by-hole-number array (index 0 unused)
+    for the course with the most holes in a glm.snapshot.Snapshot.
+    """
+    holes = snapshot['CourseHoles']
+    course_ids = np.asarray(holes['CourseId'])
+    known = course_ids[course_ids >= 0]
+    if not len(known):
+        raise ValueError("Snapshot has no CourseHoles")
+    course = int(np.bincount(known).argmax())
+    on_course = course_ids == course
+    numbers = np.asarray(holes['HoleNumber'])[on_course]
+    tables = CourseStrokeTables(dict(zip(numbers.tolist(), np.asarray(holes['HandicapIndex'])[on_course].tolist())),
+                                snapshot['Courses'].ids[course])
+    pars = np.zeros(19, dtype=np.int16)
+    pars[numbers] = np.asarray(holes['Par'])[on_course]
+    return tables, pars
+
+
+def clear_cache():
+    """Forget cached course tables (e.g. after CourseHoles changed)"""
+    _course_cache.clear()
+    _cached_table.cache_clear()
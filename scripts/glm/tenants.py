@@ -0,0 +1,199 @@
+"""
+Run a query or a Python callable against every tenant database at once.
+
+Tenants are the golfdb_* databases on the server. Each tenant gets its own
+psycopg2 connection on a worker thread and asyncio bounds how many run at
+the same time, so a league-wide check costs roughly one tenant's latency
+instead of the sum of all of them.
+
+Usage:
+    python3 scripts/database/tenant-fanout.py --check health
+    python3 scripts/database/tenant-fanout.py --query 'SELECT COUNT(*) AS players FROM "Players"'
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from . import db, profiling
+
+DEFAULT_CONCURRENCY = 8
+
+# Built-in checks (name -> SQL) for --check
+CHECKS = {
+    'health': '''
+        SELECT
+            (SELECT COUNT(*) FROM "Players") AS players,
+            (SELECT COUNT(*) FROM "Seasons") AS seasons,
+            (SELECT COUNT(*) FROM "Weeks") AS weeks,
+            (SELECT COUNT(*) FROM "Matchups") AS matchups,
+            (SELECT COUNT(*) FROM "PlayerFlightAssignments") AS flight_assignments
+    ''',
+    'sessions': '''
+        SELECT s."Name" AS season, pfa."SessionStartWeekNumber" AS session_start_week,
+               COUNT(*) AS assignments
+        FROM "PlayerFlightAssignments" pfa
+        JOIN "Seasons" s ON s."Id" = pfa."SeasonId"
+        GROUP BY s."Name", s."Year", pfa."SessionStartWeekNumber"
+        ORDER BY s."Year", pfa."SessionStartWeekNumber"
+    ''',
+}
+
+TenantCallable = Callable[[Any, str], Any]
+
+
+@dataclass
+class TenantResult:
+    tenant: str
+    database: str
+    ok: bool
+    result: Any = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+
+@dataclass
+class FanOutReport:
+    results: List[TenantResult]
+    elapsed_ms: float
+
+    @property
+    def failed(self) -> List[TenantResult]:
+        return [r for r in self.results if not r.ok]
+
+    def to_dict(self) -> Dict:
+        return {
+            'elapsed_ms': round(self.elapsed_ms, 1),
+            'tenants': len(self.results),
+            'failed': len(self.failed),
+            'results': [asdict(r) for r in self.results],
+        }
+
+
+def discover_tenants(connect: Callable = db.connect) -> List[str]:
+    """Names of all tenants that have a golfdb_* database"""
+    conn = connect(database=db.MAINTENANCE_DATABASE)
+    try:
+        with conn.cursor() as cur:
+            cur.execute('''
+                SELECT datname FROM pg_database
+                WHERE datname LIKE %s AND NOT datistemplate
+                ORDER BY datname
+            ''', (db.TENANT_PREFIX.replace('_', '\\_') + '%',))
+            return [db.tenant_name(row[0]) for row in cur.fetchall()]
+    finally:
+        conn.close()
+
+
+def run_query(conn, query: str, params: Optional[Sequence] = None) -> Union[int, List[Dict]]:
+    """Execute a statement; return rows as dicts, or the rowcount for DML"""
+    with conn.cursor() as cur:
+        cur.execute(query, params)
+        if cur.description is None:
+            return cur.rowcount
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def _run_one(tenant: str, target: Union[str, TenantCallable], params: Optional[Sequence],
+             connect: Callable) -> TenantResult:
+    database = db.tenant_database(tenant)
+    start = time.perf_counter()
+    try:
+        with profiling.phase('connect'):
+            conn = connect(tenant=tenant)
+        try:
+            with profiling.phase('tenant'):
+                result = target(conn, tenant) if callable(target) else run_query(conn, target, params)
+            with profiling.phase('commit'):
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return TenantResult(tenant, database, True, result=result,
+                            elapsed_ms=(time.perf_counter() - start) * 1000)
+    except Exception as e:
+        return TenantResult(tenant, database, False, error=f"{type(e).__name__}: {e}",
+                            elapsed_ms=(time.perf_counter() - start) * 1000)
+
+
+async def fan_out(target: Union[str, TenantCallable], tenants: Optional[Sequence[str]] = None,
+                  params: Optional[Sequence] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                  connect: Callable = db.connect) -> FanOutReport:
+    """
+    Run `target` against every tenant concurrently.
+
+    `target` is either SQL (run with `params`) or a callable taking
+    (connection, tenant_name). Each tenant's work is committed on success
+    and rolled back on error; one tenant failing never stops the others.
+    """
+    start = time.perf_counter()
+    if tenants is None:
+        tenants = await asyncio.to_thread(discover_tenants, connect)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(tenant: str) -> TenantResult:
+        async with semaphore:
+            return await asyncio.to_thread(_run_one, tenant, target, params, connect)
+
+    results = await asyncio.gather(*(run(t) for t in tenants))
+    return FanOutReport(list(results), (time.perf_counter() - start) * 1000)
+
+
+def run_on_tenants(target: Union[str, TenantCallable], **options) -> FanOutReport:
+    """Blocking wrapper around fan_out() for scripts"""
+    return asyncio.run(fan_out(target, **options))
+
+
+def print_report(report: FanOutReport):
+    """Print a per-tenant summary of a fan-out run"""
+    slowest = max((r.elapsed_ms for r in report.results), default=0)
+    print(f"🏌️  Ran against {len(report.results)} tenant(s) in {report.elapsed_ms:.0f} ms "
+          f"(slowest tenant {slowest:.0f} ms)")
+
+    for r in report.results:
+        status = "✅" if r.ok else "❌"
+        print(f"\n{status} {r.tenant:<20} {r.elapsed_ms:7.0f} ms")
+        if not r.ok:
+            print(f"   {r.error}")
+        elif isinstance(r.result, list):
+            for row in r.result:
+                print("   " + ", ".join(f"{k}={v}" for k, v in row.items()))
+        else:
+            print(f"   {r.result}")
+
+    if report.failed:
+        print(f"\n⚠️  {len(report.failed)} tenant(s) failed")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run a query against every tenant database concurrently")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--query', help='SQL to run in every tenant database')
+    target.add_argument('--check', choices=sorted(CHECKS), help='Built-in check to run')
+    parser.add_argument('--tenant', action='append', dest='tenants',
+                        help='Limit to this tenant (repeatable); default is every golfdb_* database')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Maximum tenants queried at once (default {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args(argv)
+
+    report = run_on_tenants(args.query or CHECKS[args.check], tenants=args.tenants,
+                            concurrency=args.concurrency)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, default=str))
+    else:
+        print_report(report)
+    return 1 if report.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
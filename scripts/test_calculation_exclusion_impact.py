@@ -3,9 +3,14 @@
 Test script to verify that week exclusion settings are properly respected in calculations
 """
 
+import os
+import sys
 import requests
 import json
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from glm.profiling import run
+
 BASE_URL = "http://localhost:5274/api"
 
 def test_calculation_exclusion_impact():
@@ -103,4 +108,4 @@ def test_calculation_exclusion_impact():
     print("   ✅ Admin can control which weeks count for calculations")
 
 if __name__ == "__main__":
-    test_calculation_exclusion_impact()
+    sys.exit(run(lambda args: test_calculation_exclusion_impact()))
@@ -8,6 +8,10 @@ import psycopg2
 import sys
 import os
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import glm  # GLM_QUERY_LOG=1 logs every query (scripts/glm/querylog.py)
+from glm.profiling import run
+
 def test_handicap_average_consistency():
     """Test that handicap and average calculations are consistent"""
     
@@ -149,7 +153,7 @@ def test_handicap_average_consistency():
 
 if __name__ == "__main__":
     print("Testing handicap and average calculation consistency...")
-    success = test_handicap_average_consistency()
+    success = run(lambda args: test_handicap_average_consistency())
     
     if success:
         print("\n✅ Test completed successfully")
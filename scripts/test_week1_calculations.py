@@ -4,10 +4,15 @@ Test script to verify that average score calculations now use Week 1 baseline
 instead of session-based logic.
 """
 
+import os
+import sys
 import requests
 import json
 from typing import List, Dict
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from glm.profiling import run
+
 # Configuration
 API_BASE_URL = "http://localhost:5274/api"
 
@@ -114,7 +119,11 @@ def test_handicap_calculation():
     except Exception as e:
         print(f"   ⚠️  Could not test handicap endpoint: {str(e)}")
 
-if __name__ == "__main__":
+def main():
     test_average_score_calculation()
     test_handicap_calculation()
     print(f"\n✅ Test completed!")
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+Load test the standings, average-score and scorecard API endpoints (p50/p95/p99 + throughput).
+Usage: python3 load-test-api.py [--base-url http://localhost:5274/api] [--concurrency 8] [--duration 30 | --requests 500]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.loadtest import main
+from glm.profiling import run
+
+if __name__ == "__main__":
+    sys.exit(run(main))
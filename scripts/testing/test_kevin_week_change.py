@@ -3,6 +3,13 @@
 Test what happens to Kevin's average from Week 1 to Week 2
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
+
 def test_kevin_week1_to_week2():
     print("Kevin K. Week 1 to Week 2 Average Change Test")
     print("=============================================")
@@ -72,6 +79,10 @@ def test_potential_bug():
     print(f"  Math.Round(initialAverage, 2) in the middle of calculation")
     print(f"  Could cause cumulative rounding errors")
 
-if __name__ == "__main__":
+def main():
     test_kevin_week1_to_week2()
     test_potential_bug()
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
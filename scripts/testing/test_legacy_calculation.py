@@ -3,9 +3,14 @@
 Test script to debug the legacy average calculation issue.
 """
 
+import os
+import sys
 import requests
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
 BASE_URL = "http://localhost:5274"
 KEVIN_ID = "1cbaa69a-f72e-4ccd-9e6b-2ea1a501f5ee"
 SEASON_ID = "ad3e9a12-7b6c-4d84-9f7a-dac8fc9e1b36"
@@ -91,4 +96,4 @@ def main():
             print()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
@@ -3,6 +3,13 @@
 Test the SimpleAverage calculation fix for Kevin's issue
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from glm.profiling import run
+
+
 def test_simple_average_fix():
     print("Kevin K. SimpleAverage Calculation Fix Test")
     print("==========================================")
@@ -71,6 +78,10 @@ def test_legacy_vs_simple():
     
     print(f"\nThis suggests Kevin's calculation is using SimpleAverage method, not LegacyWeightedAverage")
 
-if __name__ == "__main__":
+def main():
     test_simple_average_fix()
     test_legacy_vs_simple()
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))
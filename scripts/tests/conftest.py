@@ -0,0 +1,6 @@
+"""Makes glm importable when pytest is run from scripts/ or the repo root"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
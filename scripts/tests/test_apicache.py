@@ -0,0 +1,173 @@
+"""glm.apicache: hits, revalidation, invalidation and keys, against a stub requests session"""
+
+import os
+import time
+
+import pytest
+import requests
+
+from glm.apicache import CACHE_HEADER, CachedSession, ResponseCache
+
+API = 'https://southmoore.example.com/api'
+
+
+class StubSession:
+    """Answers GETs from a queue of (status, headers, body) and records every request"""
+
+    def __init__(self):
+        self.headers = {}
+        self.replies = []
+        self.calls = []
+
+    def reply(self, status=200, body=b'[]', **headers):
+        self.replies.append((status, {k.replace('_', '-'): v for k, v in headers.items()}, body))
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.calls.append(('GET', url, dict(headers or {})))
+        status, reply_headers, body = self.replies.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.url = url
+        response.headers.update(reply_headers)
+        return response
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, dict(kwargs.get('headers') or {})))
+        response = requests.Response()
+        response.status_code = 204
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.delenv('GLM_API_CACHE', raising=False)
+    monkeypatch.delenv('GLM_API_CACHE_TTL', raising=False)
+    return CachedSession(StubSession(), ResponseCache(str(tmp_path)))
+
+
+def expire(cache):
+    for key, _, _ in cache.entries():
+        cache.update(key, dict(cache.load_meta(key), expires_at=0))
+
+
+def expires_in(cache):
+    [(key, _, _)] = cache.entries()
+    return cache.load_meta(key)['expires_at'] - time.time()
+
+
+def test_miss_then_hit(api):
+    api.session.reply(body=b'[1]', Content_Type='application/json')
+    first = api.get(f'{API}/players')
+    second = api.get(f'{API}/players')
+    assert [first.headers[CACHE_HEADER], second.headers[CACHE_HEADER]] == ['miss', 'hit']
+    assert second.json() == [1] and second.headers['Content-Type'] == 'application/json'
+    assert len(api.session.calls) == 1
+    assert 590 < expires_in(api.cache) <= 600
+
+
+def test_other_urls_and_disabled_sessions_bypass(api, tmp_path):
+    api.session.reply()
+    assert api.get(f'{API}/matchups/week/1').headers[CACHE_HEADER] == 'bypass'
+    off = CachedSession(StubSession(), ResponseCache(str(tmp_path / 'off')), enabled=False)
+    off.session.reply()
+    assert off.get(f'{API}/players').headers[CACHE_HEADER] == 'bypass'
+    assert api.cache.entries() == [] and off.cache.entries() == []
+
+
+def test_no_store_is_never_written(api):
+    api.session.reply(Cache_Control='no-store')
+    assert api.get(f'{API}/seasons').headers[CACHE_HEADER] == 'miss'
+    assert api.cache.entries() == []
+
+
+def test_stale_entries_revalidate(api):
+    api.session.reply(body=b'[1]', ETag='"v1"', Last_Modified='Tue, 01 Apr 2025 12:00:00 GMT')
+    api.get(f'{API}/seasons')
+    expire(api.cache)
+    api.session.reply(304)
+    response = api.get(f'{API}/seasons')
+    assert response.headers[CACHE_HEADER] == 'revalidated' and response.json() == [1]
+    _, _, sent = api.session.calls[-1]
+    assert sent == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Tue, 01 Apr 2025 12:00:00 GMT'}
+    assert 3590 < expires_in(api.cache) <= 3600
+
+
+def test_revalidation_keeps_the_stored_cache_control(api):
+    api.session.reply(ETag='"v1"', Cache_Control='max-age=30')
+    api.get(f'{API}/players')
+    expire(api.cache)
+    api.session.reply(304)
+    api.get(f'{API}/players')
+    # The 304 carries no Cache-Control: the stored max-age=30 applies, not the 600 s default
+    assert 20 < expires_in(api.cache) <= 30
+
+    expire(api.cache)
+    api.session.reply(304, ETag='"v2"', Cache_Control='max-age=120')
+    api.get(f'{API}/players')
+    assert 110 < expires_in(api.cache) <= 120
+    [(key, _, _)] = api.cache.entries()
+    assert api.cache.load_meta(key)['etag'] == '"v2"'
+
+
+def test_no_cache_entries_revalidate_every_time(api):
+    api.session.reply(ETag='"v1"', Cache_Control='no-cache')
+    api.get(f'{API}/players')
+    for _ in range(2):
+        api.session.reply(304)
+        assert api.get(f'{API}/players').headers[CACHE_HEADER] == 'revalidated'
+    assert len(api.session.calls) == 3
+
+
+def test_entries_are_keyed_by_authorization(api, tmp_path):
+    for token in ('Bearer alice', 'Bearer bob'):
+        api.session.reply(body=token.encode())
+        assert api.get(f'{API}/players', headers={'Authorization': token}).text == token
+    api.session.headers['Authorization'] = 'Bearer alice'
+    response = api.get(f'{API}/players')
+    assert response.headers[CACHE_HEADER] == 'hit' and response.text == 'Bearer alice'
+    assert len(api.session.calls) == 2
+
+    stored = [open(os.path.join(tmp_path, name), 'rb').read() for name in os.listdir(tmp_path)
+              if name.endswith('.json')]
+    assert len(stored) == 2 and not any(b'alice' in meta or b'bob' in meta for meta in stored)
+
+
+def test_requests_auth_objects_bypass(api):
+    api.session.reply()
+    assert api.get(f'{API}/players', auth=('admin', 'secret')).headers[CACHE_HEADER] == 'bypass'
+    assert api.cache.entries() == []
+
+
+def test_tenants_are_kept_apart_and_writes_invalidate_their_family(api):
+    for tenant in ('southmoore', 'northfield'):
+        api.session.reply()
+        api.get(f'{API}/players', headers={'X-Tenant-Id': tenant})
+        api.session.reply()
+        api.get(f'{API}/seasons', headers={'X-Tenant-Id': tenant})
+    assert api.cache.stats()['tenants'] == {'southmoore': 2, 'northfield': 2}
+
+    api.post(f'{API}/players', headers={'X-Tenant-Id': 'southmoore'}, json={})
+    assert api.cache.stats()['tenants'] == {'southmoore': 1, 'northfield': 2}
+    assert api.get(f'{API}/seasons', headers={'X-Tenant-Id': 'southmoore'}).headers[CACHE_HEADER] == 'hit'
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=3500)
+    for i, name in enumerate('abc'):
+        cache.store(name, {'url': name}, b'x' * 1000)
+        os.utime(cache._paths(name)[1], (i, i))
+    cache.touch('a')
+    cache.store('d', {'url': 'd'}, b'x' * 1000)
+    assert sorted(key for key, _, _ in cache.entries()) == ['a', 'c', 'd']
+
+
+def test_torn_entries_are_misses(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.store('k', {'url': 'u'}, b'abc')
+    with open(cache._paths('k')[1], 'wb') as f:
+        f.write(b'ab')
+    assert cache.load('k') is None
@@ -0,0 +1,87 @@
+"""glm.backfill on the SQLite fixture: incremental replays match a full replay"""
+
+import pytest
+
+from glm.backfill import backfill
+from glm.fixtures import connect_fixture, generate_league
+
+HISTORY_SQL = '''
+    SELECT "PlayerId", "WeekNumber", "AverageScore", "Handicap", "ScoreTotal", "RoundsCounted"
+    FROM "PlayerHandicapHistory" ORDER BY "PlayerId", "WeekNumber"
+'''
+
+
+@pytest.fixture
+def league_conn():
+    conn = connect_fixture()
+    league = generate_league(conn, players=12, flights=2, weeks=10, session_length=5, scored_weeks=7, seed=4)
+    conn.commit()
+    yield conn, league
+    conn.close()
+
+
+def history(conn):
+    with conn.cursor() as cur:
+        cur.execute(HISTORY_SQL)
+        return cur.fetchall()
+
+
+def test_full_replay_stops_at_the_last_played_week(league_conn):
+    conn, league = league_conn
+    summary = backfill(conn, 'fixture')
+    conn.commit()
+    assert summary.mode == 'full'
+    assert summary.players == len(league.player_ids)
+    rows = history(conn)
+    assert {week for _, week, _, _, _, _ in rows} == set(range(1, 8))
+    assert len(rows) == summary.written == len(league.player_ids) * 7
+
+
+@pytest.mark.parametrize('from_week', [2, 4, 6, 7])
+def test_incremental_replay_matches_full(league_conn, from_week):
+    conn, _ = league_conn
+    backfill(conn, 'fixture')
+    conn.commit()
+    full = history(conn)
+
+    with conn.cursor() as cur:
+        cur.execute('DELETE FROM "PlayerHandicapHistory" WHERE "WeekNumber" >= %s', (from_week,))
+    summary = backfill(conn, 'fixture', from_week=from_week)
+    conn.commit()
+    assert (summary.mode, summary.from_week) == ('incremental', from_week)
+    assert history(conn) == full
+
+
+def test_rerun_changes_nothing(league_conn):
+    conn, _ = league_conn
+    backfill(conn, 'fixture')
+    conn.commit()
+    again = backfill(conn, 'fixture', from_week=5)
+    assert again.mode == 'incremental'
+    assert (again.written, again.deleted) == (0, 0)
+
+
+def test_missing_history_table_is_an_error(league_conn):
+    conn, _ = league_conn
+    with conn.cursor() as cur:
+        cur.execute('DROP TABLE "PlayerHandicapHistory"')
+    with pytest.raises(RuntimeError, match='apply the EF Core migrations'):
+        backfill(conn, 'fixture')
+
+
+def test_session_averages_carry_the_last_average_before_each_start(league_conn):
+    conn, league = league_conn
+    summary = backfill(conn, 'fixture', session_averages=True)
+    conn.commit()
+    # Sessions start at weeks 1 and 6; week 1 carries the starting average
+    assert summary.session_averages == 2 * len(league.player_ids)
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT a."PlayerId", a."SessionInitialAverage", h."AverageScore"
+            FROM "PlayerSessionAverages" a
+            JOIN "PlayerHandicapHistory" h ON h."PlayerId" = a."PlayerId" AND h."WeekNumber" = 5
+            WHERE a."SessionStartWeekNumber" = 6
+        ''')
+        rows = cur.fetchall()
+    assert len(rows) == len(league.player_ids)
+    assert all(session == week5 for _, session, week5 in rows)
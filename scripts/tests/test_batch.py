@@ -0,0 +1,82 @@
+"""glm.batch: BatchWriter buffering, ids and constants, on the SQLite fixture"""
+
+import pytest
+
+from glm.batch import (NEW_MATCHUP_DEFAULTS, BatchWriter, _copy_value, matchup_writer, quote_identifier, stage_rows,
+                       write_rows)
+from glm.fixtures import connect_fixture, table_counts
+
+
+def test_rows_are_written_in_batches_with_ids_in_order():
+    conn = connect_fixture()
+    with BatchWriter(conn, 'Courses', ('Name', 'TotalPar'), batch_size=3) as writer:
+        ids = writer.extend((f'Course {i}', 30 + i) for i in range(7))
+        assert writer.rows_written == 6 and writer.statements == 2
+    assert (writer.rows_written, writer.statements) == (7, 3)
+    assert writer.ids == ids and len(set(ids)) == 7
+
+    with conn.cursor() as cur:
+        cur.execute('SELECT "Id", "Name", "TotalPar" FROM "Courses"')
+        stored = {row[0]: row[1:] for row in cur.fetchall()}
+    assert [stored[i] for i in ids] == [(f'Course {i}', 30 + i) for i in range(7)]
+
+
+def test_constants_and_database_keys():
+    conn = connect_fixture()
+    write_rows(conn, 'Flights', ('Name',), [('Flight 1',), ('Flight 2',)], constants={'MaxPlayers': 8})
+    assert write_rows(conn, 'Seasons', ('Id', 'Name'), [('s1', '2025')], id_column=None) == []
+    with conn.cursor() as cur:
+        cur.execute('SELECT "Name", "MaxPlayers" FROM "Flights" ORDER BY "Name"')
+        assert cur.fetchall() == [('Flight 1', 8), ('Flight 2', 8)]
+        cur.execute('SELECT "Id" FROM "Seasons"')
+        assert cur.fetchall() == [('s1',)]
+
+
+def test_an_exception_discards_queued_rows():
+    conn = connect_fixture()
+    with pytest.raises(RuntimeError):
+        with BatchWriter(conn, 'Courses', ('Name',), batch_size=10) as writer:
+            writer.add('Kept back')
+            raise RuntimeError
+    assert writer.rows_written == 0 and writer.ids == []
+    assert table_counts(conn)['Courses'] == 0
+
+
+def test_argument_checks():
+    conn = connect_fixture()
+    with pytest.raises(ValueError):
+        BatchWriter(conn, 'Courses', ('Name',), method='merge')
+    with pytest.raises(ValueError):
+        BatchWriter(conn, 'Courses', ('Name',), batch_size=0)
+    with pytest.raises(ValueError):
+        BatchWriter(conn, 'Courses', ('Name', 'TotalPar')).add('Too few')
+
+
+def test_matchup_writer_fills_new_matchup_defaults():
+    conn = connect_fixture()
+    with matchup_writer(conn) as writer:
+        matchup_id = writer.add('w1', 'a', 'b')
+    columns = ', '.join(quote_identifier(c) for c in NEW_MATCHUP_DEFAULTS)
+    with conn.cursor() as cur:
+        cur.execute(f'SELECT "WeekId", "PlayerAId", "PlayerBId", {columns} FROM "Matchups" WHERE "Id" = %s',
+                    (matchup_id,))
+        row = cur.fetchone()
+    assert row[:3] == ('w1', 'a', 'b')
+    assert [bool(v) if isinstance(d, bool) else v for v, d in zip(row[3:], NEW_MATCHUP_DEFAULTS.values())] == \
+        list(NEW_MATCHUP_DEFAULTS.values())
+
+
+def test_stage_rows_replaces_the_staging_table():
+    conn = connect_fixture()
+    columns = [('PlayerId', 'uuid'), ('Average', 'numeric')]
+    assert stage_rows(conn, 'glm_stage', columns, [('p1', 41.5), ('p2', 44.0)]) == 2
+    assert stage_rows(conn, 'glm_stage', columns, [('p3', 39.0)]) == 1
+    with conn.cursor() as cur:
+        cur.execute('SELECT "PlayerId", "Average" FROM "glm_stage"')
+        assert cur.fetchall() == [('p3', 39.0)]
+
+
+def test_copy_text_format():
+    assert [_copy_value(v) for v in (None, True, False, 3, 'a\tb\nc\\d\r')] == \
+        ['\\N', 't', 'f', '3', 'a\\tb\\nc\\\\d\\r']
+    assert quote_identifier('Odd"Name') == '"Odd""Name"'
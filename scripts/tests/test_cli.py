@@ -0,0 +1,93 @@
+"""glm.cli dispatch: usage, action lookup, default actions and help for script-backed actions"""
+
+import os
+import runpy
+import subprocess
+import sys
+
+import pytest
+
+from glm import cli
+from glm.cli import COMMANDS, SCRIPTS_DIR, main, run_action
+
+SCRIPT_ACTIONS = [(name, action_name) for name, command in COMMANDS.items()
+                  for action_name, action in command.actions.items() if not action.target.startswith('glm.')]
+
+
+def glm(*argv):
+    """Run `python3 -m glm` the way scripts/bin/glm does; (exit code, stdout, stderr)"""
+    done = subprocess.run([sys.executable, '-m', 'glm', *argv], cwd=SCRIPTS_DIR, capture_output=True, text=True,
+                          env=dict(os.environ, PYTHONPATH=SCRIPTS_DIR))
+    return done.returncode, done.stdout, done.stderr
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    calls = []
+
+    def record(prog, action, argv):
+        calls.append((prog, action.target, argv))
+        return 0
+
+    monkeypatch.setattr(cli, 'run_action', record)
+    return calls
+
+
+@pytest.mark.parametrize('argv, code', [([], 2), (['--help'], 0)])
+def test_usage(argv, code):
+    returncode, out, _ = glm(*argv)
+    assert returncode == code
+    assert out.startswith('usage: glm <command>')
+    assert all(f'  {name:<10}' in out for name in COMMANDS)
+
+
+@pytest.mark.parametrize('argv, code', [(['audit'], 2), (['audit', '-h'], 0)])
+def test_command_usage(argv, code):
+    returncode, out, _ = glm(*argv)
+    assert returncode == code
+    assert out.startswith('usage: glm audit <action>')
+    assert 'integrity' in out and 'standings' in out
+
+
+def test_unknown_command_and_action(capsys, dispatched):
+    assert main(['golf']) == 2
+    assert main(['audit', 'everything']) == 2
+    err = capsys.readouterr().err
+    assert "unknown command 'golf'" in err and "unknown action 'everything'" in err
+    assert dispatched == []
+
+
+def test_dispatch_passes_arguments_through(dispatched):
+    assert main(['audit', 'integrity', '--tenant', 'southmoore', '--format', 'jsonl']) == 0
+    assert main(['rollover', '--dry-run']) == 0
+    assert main(['rollover', 'run', '--help']) == 0
+    assert dispatched == [
+        ('glm audit integrity', 'glm.integrity', ['--tenant', 'southmoore', '--format', 'jsonl']),
+        ('glm rollover', 'glm.rollover', ['--dry-run']),
+        ('glm rollover', 'glm.rollover', ['--help'])]
+
+
+@pytest.mark.parametrize('name, action_name', SCRIPT_ACTIONS)
+def test_script_actions_answer_help_without_running(name, action_name):
+    action = COMMANDS[name].actions[action_name]
+    for flag in ('-h', '--help'):
+        # Run for real, the script would try to connect to golfdb_--help (or need a CSV) and fail
+        returncode, out, err = glm(name, action_name, 'southmoore', flag)
+        assert (returncode, err) == (0, '')
+        assert out.startswith(f'usage: glm {name} {action_name} [args...]')
+        assert action.help in out and action.target in out
+
+
+def test_script_actions_run_with_their_path_in_argv(monkeypatch):
+    seen = []
+
+    def run_path(path, run_name):
+        seen.append((path, run_name, list(sys.argv)))
+        raise SystemExit('❌ tenant required')
+
+    monkeypatch.setattr(runpy, 'run_path', run_path)
+    action = COMMANDS['tenant'].actions['admin-user']
+    assert run_action('glm tenant admin-user', action, ['southmoore']) == 1
+    path, run_name, argv = seen[0]
+    assert path.endswith(os.path.join('database', 'create-admin-user.py')) and run_name == '__main__'
+    assert argv == [path, 'southmoore']
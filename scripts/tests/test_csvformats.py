@@ -0,0 +1,142 @@
+"""glm.csvformats: layout detection and streaming records"""
+
+import io
+import os
+
+import pytest
+
+from glm.csvformats import SCORE_FORMATS, CsvFormatError, HoleScoreRecord, MatchupRecord, read_csv, split_versus
+
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+SCORES_HEADER = ('Week,Front/Back,First Name,Last Name,' + ','.join(f'Hole {n}' for n in range(1, 19))
+                 + ',Hole Total')
+
+
+def csv_text(*lines):
+    return io.StringIO('\n'.join(lines) + '\n')
+
+
+def score_row(week, nine, first, last, front=(), back=(), total=None):
+    holes = [str(h) for h in front] + [''] * (9 - len(front)) + [str(h) for h in back] + [''] * (9 - len(back))
+    total = sum(front) + sum(back) if total is None else total
+    return f'{week},{nine},{first},{last},' + ','.join(holes) + f',{total}'
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('George Hutson vs John Perry', ('George Hutson', 'John Perry')),
+    ('A. Smith VS. B. Jones', ('A. Smith', 'B. Jones')),
+    ('Al v Bo', ('Al', 'Bo')),
+    ('Al vs ', None),
+    ('Al and Bo', None),
+])
+def test_split_versus(text, expected):
+    assert split_versus(text) == expected
+
+
+def test_header_layout():
+    stream = read_csv(csv_text('Week,Player 1,Player 2,Flight', '1,John Doe,Jane Smith,A', '',
+                               '2,John Doe,,A', 'x,John Doe,Jane Smith,A', '3,Al,Bo'))
+    assert stream.format.name == 'header'
+    assert list(stream) == [MatchupRecord(2, 1, 'John Doe', 'Jane Smith', 'A'), MatchupRecord(6, 3, 'Al', 'Bo')]
+    assert [line for line, _ in stream.problems] == [4, 5]
+    assert stream.problems[0][1] == 'empty player name'
+
+
+def test_flights_layout():
+    stream = read_csv(csv_text('12,July 9,Flight 1,George Hutson vs John Perry',
+                               '12,July 9,flight 2,Al v Bo',
+                               '12,July 9,Flight 2,Al with Bo',
+                               '13,July 16,Flight 1'))
+    assert stream.format.name == 'flights'
+    assert list(stream) == [MatchupRecord(1, 12, 'George Hutson', 'John Perry', '1', 'July 9'),
+                            MatchupRecord(2, 12, 'Al', 'Bo', '2', 'July 9')]
+    assert [line for line, _ in stream.problems] == [3, 4]
+
+
+def test_records_stream_lazily():
+    lines = ['Week,Player 1,Player 2'] + [f'{i},A{i},B{i}' for i in range(1, 1001)]
+    records = iter(read_csv(csv_text(*lines)))
+    assert next(records).player1 == 'A1'
+    assert next(records).player1 == 'A2'
+
+
+def test_unrecognised_and_empty_files():
+    with pytest.raises(CsvFormatError) as error:
+        read_csv(csv_text('Date,Home,Away', '1,A,B'))
+    assert 'header: Week,Player 1,Player 2' in str(error.value)
+    with pytest.raises(CsvFormatError):
+        read_csv(csv_text('', '  ,  '))
+
+
+def test_explicit_format():
+    with pytest.raises(CsvFormatError):
+        read_csv(csv_text('Week,Player 1,Player 2'), format='tsv')
+    # Named explicitly, a layout that would not be detected still has its header checked
+    with pytest.raises(CsvFormatError):
+        list(read_csv(csv_text('Week,Home,Away', '1,A,B'), format='header'))
+
+
+def test_paths_with_a_byte_order_mark(tmp_path):
+    path = tmp_path / 'matchups.csv'
+    path.write_bytes('\ufeffWeek,Player 1,Player 2\r\n1,Al,Bo\r\n'.encode('utf-8'))
+    with read_csv(str(path)) as stream:
+        assert [(r.week, r.player1, r.player2) for r in stream] == [(1, 'Al', 'Bo')]
+    assert stream._stream.closed
+
+
+def test_week_12_matchups_file():
+    with read_csv(os.path.join(REPO, 'data', 'Matchupsfromweek12.csv')) as stream:
+        records = list(stream)
+    assert stream.format.name == 'flights' and stream.problems == []
+    assert records[0] == MatchupRecord(1, 12, 'George Hutson', 'John Perry', '1', 'July 9')
+    assert all(r.week >= 12 and r.flight for r in records)
+
+
+def test_legacy_hole_scores():
+    stream = read_csv(csv_text(SCORES_HEADER,
+                               score_row(1, 'Front', 'George', 'Hutson', front=[5, 4, 4, 6, 2, 5, 4, 5, 4]),
+                               score_row(2, 'Back', 'Jeff', 'Dilcher', back=[5, 4, 6, 6, 3, 6, 3, 7, 4]),
+                               # A 0 is a hole without a score
+                               score_row(3, '', 'Kevin', 'Kelhart JR', front=[2, 0, 2, 2, 0, 0, 0, 0, 1])),
+                      SCORE_FORMATS)
+    assert stream.format.name == 'legacy'
+    records = list(stream)
+    assert records[0] == HoleScoreRecord(2, 1, 'George', 'Hutson', 1, [5, 4, 4, 6, 2, 5, 4, 5, 4])
+    assert (records[1].first_hole, records[1].gross) == (10, 44)
+    assert records[2].holes == [2, None, 2, 2, None, None, None, None, 1] and records[2].gross == 7
+    assert stream.problems == []
+
+
+@pytest.mark.parametrize('total', [0, 41])
+def test_all_zero_rows_are_absent_players(total):
+    stream = read_csv(csv_text(SCORES_HEADER, score_row(1, 'Front', 'Steve', 'Filipovits', front=[0] * 9,
+                                                        total=total)), SCORE_FORMATS)
+    assert [(r.first_name, r.holes, r.gross) for r in stream] == [('Steve', [None] * 9, 0)]
+    assert stream.problems == []
+
+
+@pytest.mark.parametrize('row, problem', [
+    (score_row(1, 'Front', 'Al', 'Bo', front=[4] * 9, back=[4] * 9), 'expected exactly one nine of hole scores'),
+    (score_row(1, 'Front', 'Al', 'Bo'), 'no hole scores'),
+    (score_row(1, 'Back', 'Al', 'Bo', front=[4] * 9), "Front/Back is 'back' but holes 1-9 are filled in"),
+    (score_row(1, 'Front', 'Al', 'Bo', front=[4] * 8 + [-1]), 'negative hole score'),
+    (score_row(1, 'Front', 'Al', 'Bo', front=[4] * 9, total=37), 'hole sum 36 != Hole Total 37'),
+    (score_row(1, 'Front', '', '', front=[4] * 9), 'empty player name'),
+    (score_row('x', 'Front', 'Al', 'Bo', front=[4] * 9), "invalid row: invalid literal for int() with base 10: 'x'"),
+])
+def test_hole_score_problems(row, problem):
+    stream = read_csv(csv_text(SCORES_HEADER, row), SCORE_FORMATS)
+    assert list(stream) == []
+    assert stream.problems == [(2, problem)]
+
+
+def test_scores_csv_file():
+    with read_csv(os.path.join(REPO, 'backend', 'Business', 'Scores.csv'), SCORE_FORMATS) as stream:
+        records = list(stream)
+    assert stream.problems == []
+    assert len(records) == 165
+    assert records[0] == HoleScoreRecord(2, 1, 'George', 'Hutson', 1, [5, 4, 4, 6, 2, 5, 4, 5, 4])
+    absent = [r for r in records if not any(r.holes)]
+    assert absent and all(r.gross == 0 for r in absent)
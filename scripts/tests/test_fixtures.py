@@ -0,0 +1,99 @@
+"""glm.fixtures: the psycopg2-shaped SQLite connection and the synthetic league"""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from glm.fixtures import connect_fixture, generate_league, round_robin, table_counts, tenant_connector, translate_sql
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('SELECT * FROM t WHERE a = %s AND b = %s', 'SELECT * FROM t WHERE a = ? AND b = ?'),
+    ('SELECT %(season)s::uuid, %(week)s', 'SELECT :season, :week'),
+    ('SELECT ARRAY[%s]::uuid[]', 'SELECT ARRAY[?]'),
+    ('WHERE "Name" ILIKE %s', 'WHERE "Name" LIKE ?'),
+    ("WHERE x LIKE 'a%%'", "WHERE x LIKE 'a%'"),
+])
+def test_translate_sql(query, expected):
+    assert translate_sql(query) == expected
+
+
+def test_cursor_adapts_python_values():
+    conn = connect_fixture()
+    player_id = uuid.uuid4()
+    with conn.cursor() as cur:
+        cur.execute('INSERT INTO "Players" ("Id", "FirstName", "InitialAverageScore") VALUES (%s, %s, %s)',
+                    (player_id, 'Al', Decimal('42.5')))
+        cur.execute('INSERT INTO "Seasons" ("Id", "StartDate") VALUES (gen_random_uuid(), %(start)s)',
+                    {'start': date(2025, 4, 2)})
+        cur.execute('SELECT "Id", "InitialAverageScore" FROM "Players"')
+        assert cur.fetchall() == [(str(player_id), 42.5)]
+        cur.execute('SELECT "StartDate" FROM "Seasons"')
+        assert cur.fetchone() == ('2025-04-02',)
+    assert conn.statements == 4
+
+
+def test_connection_block_commits_or_rolls_back(tmp_path):
+    path = str(tmp_path / 'golfdb_test.sqlite3')
+    with connect_fixture(path) as conn, conn.cursor() as cur:
+        cur.execute('INSERT INTO "Courses" ("Id", "Name") VALUES (%s, %s)', ('c1', 'Kept'))
+    with pytest.raises(RuntimeError):
+        with conn, conn.cursor() as cur:
+            cur.execute('INSERT INTO "Courses" ("Id", "Name") VALUES (%s, %s)', ('c2', 'Dropped'))
+            raise RuntimeError
+    conn.close()
+    assert table_counts(connect_fixture(path))['Courses'] == 1
+
+
+def test_tenant_connector_opens_one_file_per_tenant(tmp_path):
+    connect = tenant_connector(str(tmp_path))
+    conn = connect(tenant='southmoore')
+    conn.close()
+    assert conn.path.endswith('golfdb_southmoore.sqlite3')
+
+
+@pytest.mark.parametrize('players', [4, 5, 8])
+def test_round_robin_meets_everyone_once(players):
+    names = [f'p{i}' for i in range(players)]
+    rounds = round_robin(names)
+    pairs = [frozenset(pair) for pairing in rounds for pair in pairing]
+    assert len(rounds) == players - 1 + players % 2
+    assert len(pairs) == len(set(pairs)) == players * (players - 1) // 2
+    for pairing in rounds:
+        seen = [p for pair in pairing for p in pair]
+        assert len(seen) == len(set(seen))
+
+
+def test_generate_league():
+    conn = connect_fixture()
+    league = generate_league(conn, players=10, flights=2, weeks=6, session_length=3, scored_weeks=4, seed=1)
+    counts = table_counts(conn)
+    assert (counts['Players'], counts['Flights'], counts['Weeks'], counts['CourseHoles']) == (10, 2, 6, 18)
+    assert league.session_starts == [1, 4]
+    # Every player is placed once per session
+    assert counts['PlayerFlightAssignments'] == 20
+    # Two flights of five play two matches a week (one bye each)
+    assert counts['Matchups'] == len(league.matchup_ids) == 6 * 2 * 2
+    assert counts['HoleScores'] == league.hole_scores == 4 * 2 * 2 * 9
+
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT COUNT(*) FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+            WHERE w."WeekNumber" > 4 AND m."PlayerAScore" IS NOT NULL
+        ''')
+        assert cur.fetchone()[0] == 0
+
+
+def test_generate_league_is_deterministic_per_seed():
+    def scores(seed):
+        conn = connect_fixture()
+        generate_league(conn, players=8, flights=2, weeks=3, seed=seed)
+        with conn.cursor() as cur:
+            cur.execute('SELECT "HoleNumber", "PlayerAScore", "PlayerBScore" FROM "HoleScores" '
+                        'ORDER BY "HoleNumber", "PlayerAScore", "PlayerBScore"')
+            return cur.fetchall()
+
+    assert scores(3) == scores(3)
+    assert scores(3) != scores(4)
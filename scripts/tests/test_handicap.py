@@ -0,0 +1,166 @@
+"""glm.handicap against AverageScoreService and HandicapService"""
+
+import random
+
+import numpy as np
+import pytest
+
+from glm import handicap
+from glm.handicap import (LEGACY_WEIGHTED, SIMPLE, LowestRounds, average_history, continue_average,
+                          current_average, differentials_to_use, handicap_from_average, lookup_boundaries,
+                          lookup_table_handicap, round_half_away, whs_history, whs_index, whs_season_history)
+
+# HandicapService.CalculateHandicapFromLookupTable's dictionary, including its 61..70 -> 18 tail
+LEGACY_TABLE = {36: 0, 37: 1, 38: 2, 39: 3, 40: 4, 41: 5, 42: 5, 43: 6, 44: 6, 45: 7, 46: 7, 47: 8,
+                48: 9, 49: 10, 50: 11, 51: 11, 52: 12, 53: 13, 54: 13, 55: 14, 56: 14, 57: 15,
+                58: 16, 59: 17, 60: 17, **{a: 18 for a in range(61, 71)}}
+
+
+def test_simple_average_handicap_rounds_away_from_zero_and_caps():
+    averages = [42.5, 42.49, 36.0, 30.0, 80.0]
+    assert handicap_from_average(averages, handicap.SIMPLE_AVERAGE).tolist() == [7, 6, 0, 0, 36]
+    # An 18-hole par is halved for nine-hole play
+    assert handicap_from_average(42.5, handicap.SIMPLE_AVERAGE, course_par=72) == 7
+
+
+def test_unknown_handicap_method():
+    with pytest.raises(ValueError):
+        handicap_from_average(40.0, 9)
+
+
+def test_round_half_away_from_zero():
+    assert round_half_away([0.5, 1.5, 2.5, -0.5, -2.5]).tolist() == [1, 2, 3, -1, -3]
+    # 2.675 is 2.67499.. as a float; Math.Round on the decimal gives 2.68
+    assert round_half_away(2.675, 2) == 2.68
+
+
+def test_simple_average_history():
+    averages, total, rounds = average_history([45.0], [[40, 0, 50]], [True, True, True], SIMPLE)
+    # (45 + 40) / 2, a week without a score changes nothing, (45 + 40 + 50) / 3
+    assert averages.tolist() == [[42.5, 42.5, 45.0]]
+    assert (total.tolist(), rounds.tolist()) == ([135.0], [3.0])
+
+
+def test_non_handicap_weeks():
+    scores, counts = [[41, 99]], [True, False]
+    simple, _, simple_rounds = average_history([45.0], scores, counts, SIMPLE)
+    assert simple.tolist() == [[43.0, 43.0]] and simple_rounds.tolist() == [2.0]
+    # LegacyWeighted adds the running average as a phantom round instead of the score
+    weighted, weighted_total, weighted_rounds = average_history([45.0], scores, counts, LEGACY_WEIGHTED)
+    assert weighted.tolist() == [[43.0, 43.0]]
+    assert (weighted_total.tolist(), weighted_rounds.tolist()) == ([129.0], [3.0])
+
+
+def test_continuing_an_average_matches_replaying_it():
+    scores, counts = [[40, 44, 0, 38], [50, 0, 47, 52]], [True, False, True, True]
+    full, total, rounds = average_history([45.0, 48.0], scores, counts, LEGACY_WEIGHTED)
+    _, head_total, head_rounds = average_history([45.0, 48.0], [s[:2] for s in scores], counts[:2], LEGACY_WEIGHTED)
+    for week in (2, 3):
+        head_total, head_rounds = continue_average(head_total, head_rounds, [s[week] for s in scores],
+                                                   counts[week], LEGACY_WEIGHTED)
+    assert (head_total.tolist(), head_rounds.tolist()) == (total.tolist(), rounds.tolist())
+    assert current_average(head_total, head_rounds).tolist() == full[:, -1].tolist()
+
+
+def test_differentials_to_use_matches_get_differentials_count():
+    expected = {0: 0, 1: 0, 2: 0, 3: 1, 5: 1, 6: 2, 8: 2, 9: 3, 11: 3, 12: 4, 14: 4, 15: 5, 16: 5,
+                17: 6, 18: 6, 19: 7, 20: 8, 40: 8}
+    assert differentials_to_use(list(expected)).tolist() == list(expected.values())
+
+
+def test_whs_index():
+    rounds = np.array([[40, 42, 44, np.nan], [38, 39, np.nan, np.nan], [45, 41, 43, 44]], dtype=float)
+    # Best one differential of three: (40 - 35) * 0.96 = 4.8 -> 5; two rounds -> 0; (41 - 35) * 0.96 = 5.76 -> 6
+    assert whs_index(rounds, [3, 2, 4]).tolist() == [5.0, 0.0, 6.0]
+
+
+def test_lowest_rounds_match_sorting():
+    rng = random.Random(5)
+    players, max_score = 6, 70
+    tree = LowestRounds(players, max_score)
+    held = [[] for _ in range(players)]
+    for _ in range(400):
+        player = rng.randrange(players)
+        if held[player] and rng.random() < 0.3:
+            score = held[player].pop(rng.randrange(len(held[player])))
+            tree.remove([player], [score])
+        else:
+            score = rng.randint(30, max_score)
+            held[player].append(score)
+            tree.add([player], [score])
+        for k in range(len(held[player]) + 1):
+            assert tree.lowest_sum([player], k)[0] == sum(sorted(held[player])[:k])
+
+
+def test_lowest_rounds_reject_scores_out_of_range():
+    tree = LowestRounds(1, 50)
+    with pytest.raises(ValueError):
+        tree.add([0], [tree.size])
+
+
+def whs_history_by_sorting(initial, scores, counts_for_handicap, course_par, course_rating, max_rounds):
+    """whs_history's rules for one player, re-sorting every round list each week"""
+    rounds, valid, history = [], initial, []
+    for score, counts in zip(scores, counts_for_handicap):
+        if counts and score > 0:
+            rounds.append(score)
+            if len(rounds) >= 3:
+                valid = float(whs_index([rounds], [len(rounds)], course_rating)[0])
+        elif not counts:
+            rounds.append(int(valid + course_par))
+        window = rounds[-max_rounds:]
+        history.append(float(whs_index([window], [len(window)], course_rating)[0]) if len(window) >= 3 else initial)
+    return history
+
+
+def test_best_k_of_last_n_matches_sorting():
+    rng = np.random.default_rng(3)
+    players, weeks, max_rounds = 12, 30, 8
+    initial = rng.integers(0, 20, players).astype(float)
+    scores = rng.integers(36, 60, (players, weeks))
+    scores[rng.random((players, weeks)) < 0.15] = 0
+    counts = rng.random(weeks) > 0.1
+
+    history = whs_history(initial, scores, counts, course_par=36, course_rating=35.0, max_rounds=max_rounds)
+    for p in range(players):
+        expected = whs_history_by_sorting(initial[p], scores[p].tolist(), counts.tolist(), 36, 35.0, max_rounds)
+        assert history[p].tolist() == expected
+
+
+
+def test_special_weeks_carry_the_previous_index():
+    scores = np.array([[40, 50, 42, 44, 41]])
+    special = [False, True, False, False, False]
+    history = whs_season_history([7.0], scores, [True] * 5, special)
+    regular = whs_history([7.0], scores[:, [0, 2, 3, 4]], [True] * 4)
+    # The special week's 50 never becomes a round; its column repeats week 1
+    assert history.tolist() == [[regular[0, 0], regular[0, 0]] + regular[0, 1:].tolist()]
+
+
+def legacy_lookup(average: float) -> int:
+    """CalculateHandicapFromLookupTable, line for line"""
+    truncated = int(average)
+    if truncated <= 36:
+        return 0
+    if truncated >= 61:
+        return 18
+    return LEGACY_TABLE.get(truncated, 18)
+
+
+def test_lookup_table_matches_the_backend():
+    averages = np.round(np.arange(30.0, 75.0, 0.01), 2)
+    expected = [legacy_lookup(a) for a in averages.tolist()]
+    assert lookup_table_handicap(averages).astype(int).tolist() == expected
+
+
+@pytest.mark.parametrize('average, expected', [(36.99, 0), (37.0, 1), (41.5, 5), (42.99, 5), (43.0, 6),
+                                               (60.99, 17), (61.0, 18), (95.0, 18), (0.0, 0)])
+def test_lookup_table_boundaries(average, expected):
+    assert handicap_from_average(average, handicap.LEGACY_LOOKUP_TABLE) == expected
+
+
+def test_lookup_boundaries_from_a_custom_table():
+    boundaries, handicaps = lookup_boundaries({37: 1, 38: 1, 39: 2}, min_average=36, max_average=40, max_handicap=3)
+    assert boundaries.tolist() == [37, 39, 40]
+    assert handicaps.tolist() == [0, 1, 2, 3]
+    assert lookup_table_handicap([36.5, 38.9, 39.0, 45.0], boundaries, handicaps).tolist() == [0, 1, 2, 3]
@@ -0,0 +1,141 @@
+"""glm.integrity on the SQLite fixture: each check flags what it should and nothing else"""
+
+import io
+import json
+
+import pytest
+
+from glm.fixtures import generate_league, tenant_connector
+from glm.integrity import CHECKS, ReportWriter, build_query, scan, scan_tenants
+
+
+@pytest.fixture
+def league_conn(tmp_path):
+    conn = tenant_connector(str(tmp_path))(tenant='fixture')
+    league = generate_league(conn, players=8, flights=2, weeks=4, session_length=2, absence_rate=0, seed=1)
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT m."Id", m."PlayerAId", w."Id" FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+            WHERE w."WeekNumber" = 1 ORDER BY m."Id" LIMIT 1
+        ''')
+        matchup = cur.fetchone()
+    yield conn, league, matchup
+    conn.close()
+
+
+def findings(conn, checks=None):
+    return [(f.check, f.week_number, f.player_id, f.expected, f.actual) for f in scan(conn, 'fixture', checks)]
+
+
+def make_absent(conn, matchup_id, points, notice=False, special=None, week_id=None):
+    with conn, conn.cursor() as cur:
+        cur.execute('DELETE FROM "HoleScores" WHERE "MatchupId" = %s', (matchup_id,))
+        cur.execute('''
+            UPDATE "Matchups" SET "PlayerAAbsent" = TRUE, "PlayerAAbsentWithNotice" = %s,
+                   "PlayerAScore" = NULL, "PlayerBScore" = NULL, "PlayerAPoints" = %s
+            WHERE "Id" = %s
+        ''', (notice, points, matchup_id))
+        if week_id is not None:
+            cur.execute('UPDATE "Weeks" SET "SpecialPointsAwarded" = %s WHERE "Id" = %s', (special, week_id))
+
+
+def test_generated_league_is_clean(league_conn):
+    conn, _, _ = league_conn
+    assert findings(conn) == []
+
+
+def test_unknown_check():
+    with pytest.raises(ValueError):
+        build_query(['absence_points', 'no_such_check'])
+    query = build_query(['duplicate_week'])
+    assert CHECKS['duplicate_week'] in query and CHECKS['absence_points'] not in query
+
+
+@pytest.mark.parametrize('notice, special, points, expected', [
+    (False, None, 0, []),
+    (False, None, 3, [('0', '3')]),
+    (True, None, 4, []),
+    (True, None, 0, [('4', '0')]),
+    (True, 10, 5, []),
+    (False, 10, 4, [('5', '4')]),
+    # A special week worth 0 still overrides the notice points (SpecialPointsAwarded.HasValue)
+    (True, 0, 0, []),
+    (True, 0, 4, [('0', '4')]),
+])
+def test_absence_points(league_conn, notice, special, points, expected):
+    conn, _, (matchup_id, player_id, week_id) = league_conn
+    make_absent(conn, matchup_id, points, notice, special, week_id)
+    assert findings(conn, ['absence_points']) == [('absence_points', 1, player_id, e, a) for e, a in expected]
+
+
+def test_absent_with_score_and_notice_without_absence(league_conn):
+    conn, _, (matchup_id, player_id, _) = league_conn
+    with conn, conn.cursor() as cur:
+        cur.execute('UPDATE "Matchups" SET "PlayerAAbsent" = TRUE, "PlayerAPoints" = 0 WHERE "Id" = %s',
+                    (matchup_id,))
+        cur.execute('SELECT "PlayerAScore" FROM "Matchups" WHERE "Id" = %s', (matchup_id,))
+        gross = cur.fetchone()[0]
+    assert findings(conn, ['absent_with_score']) == [('absent_with_score', 1, player_id, 'no score', str(gross))]
+
+    with conn, conn.cursor() as cur:
+        cur.execute('UPDATE "Matchups" SET "PlayerAAbsent" = FALSE, "PlayerAAbsentWithNotice" = TRUE '
+                    'WHERE "Id" = %s', (matchup_id,))
+    assert findings(conn, ['notice_without_absence']) == [
+        ('notice_without_absence', 1, player_id, 'absent', 'not absent')]
+
+
+def test_hole_rows(league_conn):
+    conn, _, (matchup_id, player_id, _) = league_conn
+    with conn, conn.cursor() as cur:
+        cur.execute('SELECT "PlayerAScore" FROM "Matchups" WHERE "Id" = %s', (matchup_id,))
+        gross = cur.fetchone()[0]
+        cur.execute('UPDATE "Matchups" SET "PlayerAScore" = %s WHERE "Id" = %s', (gross + 1, matchup_id))
+    assert findings(conn, ['hole_total_mismatch']) == [
+        ('hole_total_mismatch', 1, player_id, str(gross), str(gross + 1))]
+
+    checks = ['missing_hole_rows', 'wrong_nine']
+    with conn, conn.cursor() as cur:
+        cur.execute('DELETE FROM "HoleScores" WHERE "MatchupId" = %s AND "HoleNumber" = 8', (matchup_id,))
+    assert findings(conn, checks) == [('missing_hole_rows', 1, None, '9', '8')]
+
+    with conn, conn.cursor() as cur:
+        cur.execute('UPDATE "HoleScores" SET "HoleNumber" = 10 WHERE "MatchupId" = %s AND "HoleNumber" = 9',
+                    (matchup_id,))
+    assert findings(conn, checks)[1:] == [('wrong_nine', 1, None, 'holes 1-9', 'holes 1-10')]
+
+
+def test_duplicates(league_conn):
+    conn, league, (matchup_id, player_id, _) = league_conn
+    with conn, conn.cursor() as cur:
+        cur.execute('''
+            INSERT INTO "PlayerFlightAssignments" ("Id", "PlayerId", "FlightId", "SeasonId",
+                "SessionStartWeekNumber", "IsFlightLeader")
+            VALUES (gen_random_uuid(), %s, %s, %s, 1, FALSE)
+        ''', (player_id, league.flight_ids[0], league.season_id))
+        # The same pairing entered twice in week 1
+        cur.execute('INSERT INTO "Matchups" ("Id", "WeekId", "PlayerAId", "PlayerBId") '
+                    'SELECT gen_random_uuid(), "WeekId", "PlayerAId", "PlayerBId" FROM "Matchups" WHERE "Id" = %s',
+                    (matchup_id,))
+        cur.execute('INSERT INTO "Weeks" ("Id", "WeekNumber", "SeasonId") VALUES (gen_random_uuid(), 4, %s)',
+                    (league.season_id,))
+    checks = ['duplicate_flight_assignment', 'duplicate_week_assignment', 'duplicate_week']
+    assert sorted((f.check, f.week_number, f.actual) for f in scan(conn, 'fixture', checks)) == [
+        ('duplicate_flight_assignment', 1, '2 assignments'),
+        ('duplicate_week', 4, '2 weeks'),
+        ('duplicate_week_assignment', 1, '2 matchups'),
+        ('duplicate_week_assignment', 1, '2 matchups')]
+
+
+def test_scan_tenants_streams_jsonl(league_conn, tmp_path):
+    conn, _, (matchup_id, player_id, _) = league_conn
+    make_absent(conn, matchup_id, 3)
+    stream = io.StringIO()
+    writer = ReportWriter(stream, 'jsonl')
+    report = scan_tenants(writer, ['fixture'], list(CHECKS), concurrency=1,
+                          connect=tenant_connector(str(tmp_path)))
+    assert not report.failed
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(r['tenant'], r['check'], r['player_id'], r['actual']) for r in rows] == [
+        ('fixture', 'absence_points', player_id, '3')]
+    assert rows[0]['player']
+    assert dict(writer.counts) == {('fixture', 'absence_points'): 1}
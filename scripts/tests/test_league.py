@@ -0,0 +1,161 @@
+"""glm.league: interning, lookups and the database, snapshot, API and template loaders"""
+
+import pytest
+
+from glm.fixtures import connect_fixture, generate_league
+from glm.league import NULL, League
+from glm.snapshot import export_snapshot
+
+
+def small_league():
+    league = League('s1')
+    al, bo, cy = (league.add_player(f'p{i}', first, 'Smith') for i, first in enumerate(('Al', 'Bo', 'Cy')))
+    w1, w2 = league.add_week('w1', 1, session_start=True), league.add_week('w2', 2)
+    flight = league.add_flight('f1', 'Flight 1')
+    league.add_matchup(w1, al, bo, 40, 44, 14, 8)
+    league.add_matchup(w2, al, cy, None, 41, None, 16, flight=flight)
+    league.add_matchup(w2, bo, al)
+    for position, player in ((2, al), (None, cy), (1, bo)):
+        league.assign(player, flight, 1, position, leader=player == al)
+    return league
+
+
+def test_records_are_interned():
+    league = League()
+    assert league.add_player('p1', 'Al', 'Bo') == league.add_player('p1', 'Changed', 'Name') == 0
+    assert league.add_player(None, 'Al', 'Bo') == league.add_player(None, 'Al', 'Bo') == 1
+    assert league.add_player(None, 'Player', '3', key='Flight 1#3') != league.add_player(None, 'Player', '3',
+                                                                                          key='Flight 2#3')
+    assert league.add_week(None, 4) == league.add_week(None, 4) and league.add_week('w4', 4) == 1
+    assert league.week_by_number(4).index == 0
+    assert league.add_flight(None, 'Flight 1') == league.add_flight(None, 'Flight 1') == 0
+
+
+def test_lookups():
+    league = small_league()
+    assert league.player('p2').name == 'Cy Smith'
+    assert league.player_by_name('Bo Smith').index == 1 and league.player_by_name('Nobody') is None
+    # A player added after the first name lookup is still found
+    league.add_player('p3', 'Di', 'Jones')
+    assert league.player_by_name('Di Jones').index == 3
+    assert league.week_by_number(2).id == 'w2' and league.week_by_number(3) is None
+    assert league.matchups_in_week(1) == [1, 2] and league.matchups_in_week(1, flight=0) == [1]
+    assert league.roster(0, 1) == [1, 0, 2]
+    assert (league.position_of(0, 0), league.position_of(2, 0), league.position_of(0, 5)) == (2, None, None)
+    assert list(league.assignments.leader) == [1, 0, 0]
+
+
+def test_matchup_columns():
+    league = small_league()
+    m = league.matchups
+    assert (list(m.a_score), list(m.b_points), list(m.flight)) == ([40, NULL, NULL], [8, 16, NULL], [NULL, 0, NULL])
+    assert league.pairings() == {(0, 1): [1, 2], (0, 2): [2]}
+    assert [list(row) for row in league.pair_counts()] == [[0, 2, 1], [2, 0, 0], [1, 0, 0]]
+    assert list(league.games_per_player()) == [3, 2, 1]
+    assert [(w.number, a.name, b.name) for w, a, b in league.iter_matchups()][0] == (1, 'Al Smith', 'Bo Smith')
+    assert league.nbytes() == 3 * (4 * 4 + 4 * 2) + 3 * (4 + 4 + 2 + 2 + 1)
+    # The week index is rebuilt when matchups are added after a lookup
+    league.add_matchup(0, 2, 1)
+    assert league.matchups_in_week(0) == [0, 3]
+
+
+@pytest.fixture
+def fixture_db():
+    conn = connect_fixture()
+    league = generate_league(conn, players=12, flights=2, weeks=6, session_length=3, scored_weeks=4,
+                             absence_rate=0.1, seed=11)
+    return conn, league
+
+
+def test_from_db(fixture_db):
+    conn, synthetic = fixture_db
+    league = League.from_db(conn)
+    assert league.season_id == synthetic.season_id
+    assert len(league.players) == 12 and [w.number for w in league.weeks] == list(range(1, 7))
+    assert sorted(league.matchups.ids) == sorted(synthetic.matchup_ids)
+    assert [f.name for f in league.flights] == ['Flight 1', 'Flight 2']
+    assert len(league.assignments) == 12 * 2
+    names = [(p.last_name, p.first_name) for p in league.players]
+    assert names == sorted(names)
+    # Matchups are ordered by week number
+    assert list(league.matchups.week) == sorted(league.matchups.week)
+    assert all(league.matchups.a_score[row] == NULL for row in league.matchups_in_week(5))
+
+    early = League.from_db(conn, max_week=2)
+    assert len(early.weeks) == 2 and len(early.matchups) == 2 * len(league.matchups_in_week(0))
+
+
+def test_from_snapshot_matches_from_db(fixture_db, tmp_path):
+    conn, _ = fixture_db
+    export_snapshot(conn, str(tmp_path))
+    expected, league = League.from_db(conn), League.from_snapshot(str(tmp_path))
+    assert league.season_id == expected.season_id
+    assert [p.id for p in league.players] == [p.id for p in expected.players]
+    assert [(w.id, w.number, w.session_start) for w in league.weeks] == \
+        [(w.id, w.number, w.session_start) for w in expected.weeks]
+    for column in ('ids', 'week', 'a', 'b', 'a_score', 'b_score', 'a_points', 'b_points'):
+        assert list(getattr(league.matchups, column)) == list(getattr(expected.matchups, column)), column
+    assert sorted(zip(league.assignments.player, league.assignments.session)) == \
+        sorted(zip(expected.assignments.player, expected.assignments.session))
+
+
+class StubResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class StubSession:
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers))
+        return StubResponse(self.routes[url.split('/api', 1)[1]])
+
+
+def test_from_api():
+    routes = {
+        '/seasons': [{'id': 's1', 'year': 2024, 'seasonNumber': 1}, {'id': 's2', 'year': 2025, 'seasonNumber': 1}],
+        '/players': [{'id': 'p2', 'firstName': 'Al', 'lastName': 'Zed'},
+                     {'id': 'p1', 'firstName': 'Bo', 'lastName': 'Ames'}],
+        '/weeks/season/s2': [{'id': 'w2', 'weekNumber': 2}, {'id': 'w1', 'weekNumber': 1, 'sessionStart': True}],
+        '/flights/season/s2': [{'id': 'f1', 'name': 'Flight 1'}],
+        '/matchups/season/s2': [
+            {'id': 'm2', 'weekId': 'w2', 'playerAId': 'p2', 'playerBId': 'p1', 'playerAScore': 40},
+            {'id': 'm1', 'weekId': 'w1', 'playerAId': 'p2', 'playerBId': 'p1'},
+            {'id': 'm0', 'weekId': 'w-other-season', 'playerAId': 'p1', 'playerBId': 'p2'}],
+        '/player-flight-assignments': [
+            {'playerId': 'p1', 'flightId': 'f1', 'seasonId': 's2', 'sessionStartWeekNumber': 1},
+            {'playerId': 'p1', 'flightId': 'f0', 'seasonId': 's1', 'sessionStartWeekNumber': 1}],
+    }
+    session = StubSession(routes)
+    league = League.from_api('http://localhost:5274/api/', tenant='southmoore', session=session)
+    assert league.season_id == 's2'
+    assert [p.id for p in league.players] == ['p1', 'p2']
+    assert [w.number for w in league.weeks] == [1, 2] and league.weeks[0].session_start
+    assert (league.matchups.ids, list(league.matchups.a_score)) == (['m1', 'm2'], [NULL, 40])
+    assert league.roster(0, 1) == [0]
+    assert all(headers == {'X-Tenant-Id': 'southmoore'} for _, headers in session.requests)
+
+
+def test_from_template():
+    flights = {'Flight 1': {1: 'Al Smith', 2: 'Bo Jones', 3: 'Cy Lee'}, 'Flight 2': {1: 'Al Smith', 2: 'Di Park'}}
+    schedule = [{'week': 15, 'date': 'July 30', 'matchups': ['1 vs 2', '3 vs 4']},
+                {'week': 16, 'matchups': ['1 vs 3', '2 vs 4']}]
+    league = League.from_template(flights, schedule)
+    # Namesakes in different flights and vacant seats (created as the schedule reaches them) are separate players
+    assert [p.name for p in league.players] == ['Al Smith', 'Bo Jones', 'Cy Lee', 'Al Smith', 'Di Park',
+                                                'Player 4', 'Player 3', 'Player 4']
+    assert [w.number for w in league.weeks] == [15, 16] and league.weeks[0].session_start
+    assert league.roster(1, 15) == [3, 4, 6, 7]
+    assert [(league.players[a].name, league.players[b].name)
+            for a, b in zip(league.matchups.a, league.matchups.b)][:2] == [('Al Smith', 'Bo Jones'),
+                                                                           ('Cy Lee', 'Player 4')]
+    assert list(league.matchups.flight) == [0, 0, 1, 1] * 2
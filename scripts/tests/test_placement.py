@@ -0,0 +1,121 @@
+"""glm.placement: flight sizes, ranking, tiered and balanced placement, and snapshots with many flights"""
+
+import pytest
+
+from glm import snapshot as snapshots
+from glm.fixtures import connect_fixture, generate_league
+from glm.placement import (Candidate, apply_movers, balanced, flight_order, flight_sizes, load_candidates, place,
+                           rank, tiered)
+
+
+def candidate(i, average, previous_flight=None, points=0, leader=False):
+    return Candidate(f'p{i:02}', 'Player', f'{i:02}', average, round(average - 36), points, previous_flight, leader)
+
+
+FLIGHTS = [('f1', 'Flight 1'), ('f2', 'Flight 2'), ('f3', 'Flight 3')]
+
+
+def test_flight_sizes():
+    assert flight_sizes(26, flights=3) == [9, 9, 8]
+    assert flight_sizes(26, flight_size=8) == [7, 7, 6, 6]
+    assert flight_sizes(26, sizes=[8, 8, 10]) == [8, 8, 10]
+    assert flight_sizes(3, flights=5) == [1, 1, 1]
+    with pytest.raises(ValueError):
+        flight_sizes(26, sizes=[8, 8, 8])
+    with pytest.raises(ValueError):
+        flight_sizes(26)
+
+
+def test_flight_order_compares_numbers_as_numbers():
+    names = ['Flight 10', 'Flight 2', 'Flight 1', 'Flight 11', 'Flight 9']
+    assert sorted(names, key=flight_order) == ['Flight 1', 'Flight 2', 'Flight 9', 'Flight 10', 'Flight 11']
+    assert sorted(['B Flight', 'a flight', 'C Flight'], key=flight_order) == ['a flight', 'B Flight', 'C Flight']
+
+
+def test_rank_by_average_breaks_ties_on_name():
+    candidates = [candidate(3, 44.0), candidate(1, 44.0), candidate(2, 41.5)]
+    assert rank(candidates) == [2, 1, 0]
+
+
+def test_rank_by_standings_puts_unplaced_players_last():
+    candidates = [candidate(0, 40.0, previous_flight=1, points=30), candidate(1, 50.0, previous_flight=0, points=10),
+                  candidate(2, 38.0), candidate(3, 49.0, previous_flight=0, points=25)]
+    assert rank(candidates, 'standings') == [3, 1, 0, 2]
+    with pytest.raises(ValueError):
+        rank(candidates, 'handicap')
+
+
+def test_movers_swap_across_neighbouring_flights():
+    candidates = [candidate(i, 40.0 + i, previous_flight=i // 3) for i in range(9)]
+    order = apply_movers(rank(candidates, 'standings'), candidates, 1)
+    assert order == [0, 1, 3, 2, 4, 6, 5, 7, 8]
+
+
+def test_tiered_fills_flights_strongest_first():
+    assert tiered([5, 4, 3, 2, 1], [2, 2, 1]) == [[5, 4], [3, 2], [1]]
+
+
+def test_balanced_evens_out_flight_means():
+    strength = [36.0, 37.0, 40.0, 41.0, 44.0, 45.0, 50.0, 60.0, 61.0]
+    groups = balanced(list(range(9)), strength, [3, 3, 3])
+    means = [sum(strength[i] for i in g) / len(g) for g in groups]
+    assert sorted(i for g in groups for i in g) == list(range(9))
+    assert max(means) - min(means) < 1.0
+
+
+def test_place_keeps_previous_leaders_in_their_flight():
+    candidates = [candidate(0, 40.0, previous_flight=0), candidate(1, 41.0, previous_flight=0, leader=True),
+                  candidate(2, 45.0, previous_flight=1, leader=True), candidate(3, 46.0, previous_flight=0)]
+    placements = place(candidates, FLIGHTS, [2, 2], leader='keep')
+    assert [(p.player_id, p.flight, p.position, p.is_leader) for p in placements] == [
+        ('p00', 'Flight 1', 1, False), ('p01', 'Flight 1', 2, True),
+        ('p02', 'Flight 2', 1, True), ('p03', 'Flight 2', 2, False)]
+    assert not any(p.is_leader for p in place(candidates, FLIGHTS, [2, 2], leader='none'))
+
+
+def test_place_needs_enough_flights():
+    with pytest.raises(ValueError):
+        place([candidate(i, 40.0) for i in range(4)], FLIGHTS, [1, 1, 1, 1])
+
+
+@pytest.fixture
+def twelve_flights(tmp_path):
+    conn = connect_fixture()
+    league = generate_league(conn, players=36, flights=12, weeks=4, session_length=2, scored_weeks=2, seed=9)
+    snapshots.export_snapshot(conn, str(tmp_path), tenant='fixture')
+    return conn, league, snapshots.open_snapshot(str(tmp_path))
+
+
+def test_load_candidates_orders_ten_or_more_flights_by_number(twelve_flights):
+    conn, league, snap = twelve_flights
+    season_id, candidates, flights = load_candidates(snap, 3)
+    assert season_id == league.season_id
+    assert [name for _, name in flights] == [f'Flight {i}' for i in range(1, 13)]
+    assert [flight_id for flight_id, _ in flights] == league.flight_ids
+
+    with conn.cursor() as cur:
+        cur.execute('SELECT "PlayerId", "FlightId" FROM "PlayerFlightAssignments" '
+                    'WHERE "SessionStartWeekNumber" = 1')
+        previous = dict(cur.fetchall())
+    assert len(candidates) == 36
+    for c in candidates:
+        assert flights[c.previous_flight][0] == previous[c.id]
+
+
+def test_tiered_placement_over_twelve_flights(twelve_flights):
+    _, _, snap = twelve_flights
+    _, candidates, flights = load_candidates(snap, 3)
+    sizes = flight_sizes(len(candidates), sizes=[2] + [3] * 10 + [4])
+    placements = place(candidates, flights, sizes)
+
+    by_flight = {}
+    for p in placements:
+        by_flight.setdefault(p.flight, []).append(p.average)
+    assert list(by_flight) == [f'Flight {i}' for i in range(1, 13)]
+    assert [len(by_flight[f'Flight {i}']) for i in range(1, 13)] == sizes
+    # Every flight is at least as strong as the next, Flight 9 included
+    for stronger, weaker in zip(list(by_flight.values()), list(by_flight.values())[1:]):
+        assert max(stronger) <= min(weaker)
+    leaders = [p for p in placements if p.is_leader]
+    assert [p.flight for p in leaders] == list(by_flight)
+    assert all(p.position == 1 for p in leaders)
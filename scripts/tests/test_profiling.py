@@ -0,0 +1,131 @@
+"""glm.profiling: switch parsing, phase timings and the run report"""
+
+import io
+import json
+import sys
+import threading
+
+import pytest
+
+from glm import profiling
+from glm.profiling import DEFAULT_MEMORY_TOP, DEFAULT_PROFILE_TOP, Timings, execute, parse_switches, print_report
+
+
+def test_switches_are_stripped_anywhere_before_a_bare_dash_dash():
+    options, rest = parse_switches(['import', '--timings', 'scores', '--profile=40', '--profile-sort', 'tottime',
+                                    'southmoore', '--diagnostics-out=runs.jsonl', '--', '--timings'])
+    assert rest == ['import', 'scores', 'southmoore', '--', '--timings']
+    assert (options.timings, options.profile_top, options.profile_sort) == (True, 40, 'tottime')
+    assert (options.diagnostics_out, options.memory_top, options.profile_out) == ('runs.jsonl', None, None)
+    assert options.enabled
+
+
+def test_defaults_and_disabled():
+    options, rest = parse_switches(['--profile', '--trace-memory', '--profile-out', 'x.pstats', '-n'])
+    assert (options.profile_top, options.memory_top, options.profile_out) == \
+        (DEFAULT_PROFILE_TOP, DEFAULT_MEMORY_TOP, 'x.pstats')
+    assert rest == ['-n']
+    options, rest = parse_switches(['--tenant', 'southmoore', '--profiles'])
+    assert not options.enabled and rest == ['--tenant', 'southmoore', '--profiles']
+    # --diagnostics-out alone still records the run
+    assert parse_switches(['--diagnostics-out', '-'])[0].enabled
+
+
+@pytest.mark.parametrize('argv, message', [
+    (['--profile-out'], '--profile-out needs a value'),
+    (['--profile-sort=fastest'], '--profile-sort must be one of'),
+    (['--timings=1'], '--timings takes no value'),
+    (['--trace-memory=lots'], "--trace-memory=N needs a number, got 'lots'"),
+])
+def test_bad_switches(argv, message):
+    with pytest.raises(SystemExit) as error:
+        parse_switches(argv)
+    assert str(error.value).startswith(message)
+
+
+def test_nested_phases_and_worker_threads():
+    timings = Timings()
+
+    def tenant():
+        with timings.phase('tenant'):
+            pass
+
+    with timings.phase('fan out'):
+        with timings.phase('load'):
+            pass
+        workers = [threading.Thread(target=tenant) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    # Worker threads have their own phase stack, so their blocks are summed under their own name
+    assert [(p['phase'], p['calls']) for p in timings.summary()] == \
+        [('fan out', 1), ('fan out/load', 1), ('tenant', 3)]
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    printed = []
+    monkeypatch.setattr(profiling, 'print_report', printed.append)
+    return printed
+
+
+def command(args):
+    with profiling.phase('parse'):
+        pass
+    with profiling.phase('write'):
+        with profiling.phase('rows'):
+            pass
+    return len(args)
+
+
+def test_execute_reports_timings(reports, tmp_path):
+    options, rest = parse_switches(['--timings', f'--diagnostics-out={tmp_path}/runs.jsonl', 'a', 'b'])
+    assert execute(options, command, rest, 'import scores') == 2
+    [report] = reports
+    assert (report['command'], report['argv'], report['exit_code'], report['error']) == \
+        ('import scores', ['a', 'b'], 2, None)
+    assert [p['phase'] for p in report['timings']] == ['parse', 'write', 'write/rows']
+    assert 'profile' not in report and 'memory' not in report
+    assert json.loads((tmp_path / 'runs.jsonl').read_text())['timings'] == report['timings']
+    # Phases outside a --timings run are plain blocks
+    assert profiling._timings is None
+    assert command([]) == 0
+
+
+def test_execute_profiles_and_traces_memory(reports, tmp_path):
+    stats = tmp_path / 'run.pstats'
+    options, rest = parse_switches(['--profile=5', '--trace-memory=3', '--profile-out', str(stats)])
+    execute(options, lambda args: sum(range(10000)) and 0, rest, 'sum')
+    [report] = reports
+    assert report['profile']['stats_file'] == str(stats) and stats.exists()
+    assert len(report['profile']['top']) <= 5 and report['profile']['sort'] == 'cumulative'
+    assert len(report['memory']['top']) <= 3 and report['memory']['peak_bytes'] >= report['memory']['current_bytes']
+
+
+def test_failures_are_reported_and_raised(reports):
+    options, _ = parse_switches(['--timings'])
+
+    def fail(args):
+        raise RuntimeError('no tenant')
+
+    with pytest.raises(RuntimeError):
+        execute(options, fail, [], 'broken')
+    with pytest.raises(SystemExit):
+        execute(options, lambda args: sys.exit(3), [], 'exits')
+    assert [(r['exit_code'], r['error']) for r in reports] == [(1, 'RuntimeError: no tenant'), (3, None)]
+
+
+def test_disabled_runs_main_directly(reports):
+    options, rest = parse_switches(['x'])
+    assert execute(options, lambda args: None, rest, 'plain') == 0
+    assert reports == []
+
+
+def test_print_report():
+    stream = io.StringIO()
+    print_report({'command': 'glm', 'wall_ms': 200.0, 'exit_code': 0,
+                  'timings': [{'phase': 'load', 'calls': 2, 'wall_ms': 50.0}]}, stream)
+    text = stream.getvalue()
+    assert 'glm: 200.0 ms wall, exit 0' in text
+    assert 'load' in text and '25.0%' in text
@@ -0,0 +1,127 @@
+"""glm.querylog: statement shapes, per-phase statistics and N+1 flags around a fixture connection"""
+
+import io
+import json
+import threading
+
+import pytest
+
+from glm import querylog
+from glm.batch import write_rows
+from glm.fixtures import connect_fixture
+from glm.querylog import InstrumentedConnection, QueryLog, instrument, normalize
+
+
+@pytest.mark.parametrize('query, shape', [
+    ('SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = 3', 'SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = ?'),
+    ("SELECT * FROM t WHERE name = 'O''Brien' AND x = 2.5", 'SELECT * FROM t WHERE name = ? AND x = ?'),
+    ('SELECT * FROM t WHERE a = %s AND b = %(week)s AND c = $1', 'SELECT * FROM t WHERE a = ? AND b = ? AND c = ?'),
+    ('SELECT * FROM t WHERE "Id" IN (%s, %s, %s)', 'SELECT * FROM t WHERE "Id" IN (?...)'),
+    ('INSERT INTO t VALUES (1, 2), (3, 4), (5, 6)', 'INSERT INTO t VALUES (?...), ...'),
+    ('SELECT 1 -- why\n  FROM /* all */ t', 'SELECT ? FROM t'),
+    ('SELECT "Hole 18" FROM "Table2"', 'SELECT "Hole 18" FROM "Table2"'),
+    (b'SELECT 7', 'SELECT ?'),
+])
+def test_normalize(query, shape):
+    assert normalize(query) == shape
+
+
+@pytest.fixture
+def logged():
+    log = QueryLog(repeat_threshold=3)
+    conn = connect_fixture()
+    with conn, conn.cursor() as cur:
+        for week in range(1, 5):
+            cur.execute('INSERT INTO "Weeks" ("Id", "WeekNumber") VALUES (%s, %s)', (f'w{week}', week))
+    return log, InstrumentedConnection(conn, log)
+
+
+def test_statements_are_grouped_by_phase_and_shape(logged):
+    log, conn = logged
+    with log.phase('load'), conn.cursor() as cur:
+        for week in (1, 2):
+            cur.execute('SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = %s', (week,))
+    with conn.cursor() as cur:
+        cur.execute('UPDATE "Weeks" SET "Name" = %s WHERE "WeekNumber" > %s', ('x', 1))
+
+    stats = log.stats
+    select = stats[('load', 'SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = ?')]
+    update = stats[('main', 'UPDATE "Weeks" SET "Name" = ? WHERE "WeekNumber" > ?')]
+    assert (select.calls, select.repeated) == (2, False)
+    assert (update.calls, update.rows) == (1, 3)
+    summary = log.summary()
+    assert summary['statements'] == 3 and summary['phases'] == ['load', 'main']
+
+
+def test_repeated_single_statements_are_flagged(logged):
+    log, conn = logged
+    with log.phase('insert matchups'), conn.cursor() as cur:
+        for week in range(1, 5):
+            cur.execute('SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = %s', (week,))
+            cur.executemany('UPDATE "Weeks" SET "Name" = %s WHERE "Id" = %s', [('a', 'w1'), ('b', 'w2')])
+    assert log.summary()['repeated'] == [
+        {'phase': 'insert matchups', 'shape': 'SELECT "Id" FROM "Weeks" WHERE "WeekNumber" = ?', 'calls': 4}]
+
+    out = io.StringIO()
+    log.print_table(out)
+    err = out.getvalue()
+    assert "Possible N+1 in 'insert matchups': ran 4 times" in err
+    assert err.count('⚠️') == 2
+
+
+def test_batched_values_are_not_flagged():
+    log = QueryLog(repeat_threshold=2)
+    for _ in range(3):
+        log.record('INSERT INTO t VALUES (%s, %s), (%s, %s)', 1.0, 2)
+    assert log.summary()['repeated'] == []
+
+
+def test_errors_are_recorded_and_raised(logged):
+    log, conn = logged
+    with pytest.raises(Exception):
+        with conn.cursor() as cur:
+            cur.execute('SELECT * FROM "NoSuchTable"')
+    [stats] = log.stats.values()
+    assert (stats.calls, stats.errors) == (1, 1)
+
+
+def test_phases_are_per_thread():
+    log = QueryLog()
+    seen = []
+    with log.phase('outer'):
+        with log.phase('inner'):
+            worker = threading.Thread(target=lambda: seen.append(log.current_phase))
+            worker.start()
+            worker.join()
+            seen.append(log.current_phase)
+        seen.append(log.current_phase)
+    assert seen == ['main', 'inner', 'outer'] and log.current_phase == 'main'
+
+
+def test_batch_writer_through_an_instrumented_connection(logged):
+    log, conn = logged
+    with log.phase('write'):
+        write_rows(conn, 'Courses', ('Name',), [(f'Course {i}',) for i in range(10)], batch_size=4)
+    [stats] = log.stats.values()
+    assert (stats.phase, stats.calls, stats.repeated) == ('write', 3, False)
+
+
+def test_report_to_a_file(logged, tmp_path):
+    log, conn = logged
+    with conn.cursor() as cur:
+        cur.execute('SELECT COUNT(*) FROM "Weeks"')
+    path = tmp_path / 'queries.json'
+    log.report(str(path))
+    report = json.loads(path.read_text())
+    assert report['statements'] == 1 and report['queries'][0]['shape'] == 'SELECT COUNT(*) FROM "Weeks"'
+
+
+def test_nothing_is_wrapped_when_off(monkeypatch):
+    monkeypatch.setattr(querylog, '_log', None)
+    conn = connect_fixture()
+    assert instrument(conn) is conn
+    with querylog.phase('ignored'):
+        pass
+    monkeypatch.setattr(querylog, '_log', QueryLog())
+    wrapped = instrument(conn)
+    assert isinstance(wrapped, InstrumentedConnection) and instrument(wrapped) is wrapped
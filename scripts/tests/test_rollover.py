@@ -0,0 +1,103 @@
+"""glm.rollover on the SQLite fixture: copying and reseeding a session's flights"""
+
+from collections import Counter
+
+import pytest
+
+from glm.fixtures import connect_fixture, generate_league
+from glm.placement import existing_assignments
+from glm.rollover import diff, reseed, resolve_sessions, rollover
+
+FLIGHT_SIZES_SQL = '''
+    SELECT f."Name", COUNT(*) FROM "PlayerFlightAssignments" a JOIN "Flights" f ON f."Id" = a."FlightId"
+    WHERE a."SessionStartWeekNumber" = %s GROUP BY f."Name"
+'''
+
+
+@pytest.fixture
+def league_conn():
+    conn = connect_fixture()
+    # Sessions start at weeks 1, 3 and 5; week 5 has no assignments yet
+    league = generate_league(conn, players=36, flights=12, weeks=6, session_length=2, scored_weeks=4, seed=2)
+    with conn, conn.cursor() as cur:
+        cur.execute('DELETE FROM "PlayerFlightAssignments" WHERE "SessionStartWeekNumber" = 5')
+    return conn, league
+
+
+def flight_sizes(conn, session_start):
+    with conn.cursor() as cur:
+        cur.execute(FLIGHT_SIZES_SQL, (session_start,))
+        return dict(cur.fetchall())
+
+
+def test_resolve_sessions(league_conn):
+    conn, league = league_conn
+    assert resolve_sessions(conn, league.season_id) == (3, 5)
+    assert resolve_sessions(conn, league.season_id, source=1) == (1, 3)
+    assert resolve_sessions(conn, league.season_id, target=3) == (1, 3)
+    assert resolve_sessions(conn, league.season_id, source=5) == (None, None)
+
+
+def test_copy_into_the_next_session(league_conn):
+    conn, league = league_conn
+    result = rollover(conn, 'fixture')
+    conn.commit()
+    assert (result.season_id, result.source, result.target, result.status) == (league.season_id, 3, 5, 'copied')
+    assert result.written == 36 and len(result.changes) == 36
+    assert {c.kind for c in result.changes} == {'new'}
+    assert existing_assignments(conn, league.season_id, 5) == existing_assignments(conn, league.season_id, 3)
+
+
+def test_existing_target_is_skipped_unless_replaced(league_conn):
+    conn, league = league_conn
+    skipped = rollover(conn, 'fixture', source=1, target=3)
+    assert skipped.status == 'skipped' and skipped.written == 0
+    assert skipped.unchanged + len(skipped.changes) == 36
+
+    dry = rollover(conn, 'fixture', source=1, target=3, replace=True, dry_run=True)
+    assert dry.status == 'copied' and dry.written == 0
+    assert existing_assignments(conn, league.season_id, 3) != existing_assignments(conn, league.season_id, 1)
+
+    replaced = rollover(conn, 'fixture', source=1, target=3, replace=True)
+    conn.commit()
+    assert (replaced.replaced, replaced.written) == (36, 36)
+    assert existing_assignments(conn, league.season_id, 3) == existing_assignments(conn, league.season_id, 1)
+
+
+def test_reseed_keeps_source_sizes_across_twelve_flights(league_conn):
+    conn, league = league_conn
+    # Make Flight 2 and Flight 10 uneven so the sizes have to land on the right flights
+    flight_2, flight_10 = league.flight_ids[1], league.flight_ids[9]
+    with conn, conn.cursor() as cur:
+        cur.execute('SELECT "PlayerId" FROM "PlayerFlightAssignments" '
+                    'WHERE "SessionStartWeekNumber" = 3 AND "FlightId" = %s ORDER BY "PlayerId" LIMIT 2',
+                    (flight_2,))
+        for (player_id,) in cur.fetchall():
+            cur.execute('UPDATE "PlayerFlightAssignments" SET "FlightId" = %s, "IsFlightLeader" = FALSE '
+                        'WHERE "SessionStartWeekNumber" = 3 AND "PlayerId" = %s', (flight_10, player_id))
+    source_sizes = flight_sizes(conn, 3)
+    assert (source_sizes['Flight 2'], source_sizes['Flight 10']) == (1, 5)
+
+    placements = reseed(conn, 'fixture', league.season_id, 3, 5)
+    flights = list(dict.fromkeys(p.flight for p in placements))
+    assert flights == [f'Flight {i}' for i in range(1, 13)]
+    assert Counter(p.flight for p in placements) == source_sizes
+    averages = {f: [p.average for p in placements if p.flight == f] for f in flights}
+    for stronger, weaker in zip(flights, flights[1:]):
+        assert max(averages[stronger]) <= min(averages[weaker])
+
+    result = rollover(conn, 'fixture', reseed_by='average')
+    conn.commit()
+    assert (result.status, result.written) == ('reseeded', 36)
+    assert flight_sizes(conn, 5) == source_sizes
+    assert existing_assignments(conn, league.season_id, 5) == \
+        {p.player_id: (p.flight_id, p.is_leader) for p in placements}
+
+
+def test_diff():
+    planned = {'a': ('f1', True), 'b': ('f2', False), 'c': ('f1', False), 'e': ('f3', False)}
+    existing = {'a': ('f1', False), 'b': ('f1', False), 'c': ('f1', False), 'd': ('f2', False)}
+    changes, unchanged = diff(planned, existing)
+    assert [(c.player_id, c.kind) for c in changes] == [('a', 'leader'), ('b', 'moved'), ('d', 'dropped'),
+                                                         ('e', 'new')]
+    assert unchanged == 1
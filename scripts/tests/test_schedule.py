@@ -0,0 +1,138 @@
+"""glm.schedule: template parsing and validation, byes, and expanding a fixture session"""
+
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from glm.fixtures import connect_fixture, generate_league
+from glm.schedule import (EIGHT_PLAYER, FlightPositions, SessionWeek, TemplateError, build_template,
+                          circle_template, existing_matchups, expand, load_session, parse_pairing, templates_for,
+                          write_matchups)
+
+
+def flight(name, size):
+    return FlightPositions(name, name, [f'{name}-{i}' for i in range(1, size + 1)], [f'P{i}' for i in range(size)])
+
+
+def meetings(template):
+    return Counter(tuple(sorted(int(p) for p in pair)) for pair in template.pairs.reshape(-1, 2))
+
+
+@pytest.mark.parametrize('pairing, expected', [('1 vs 2', (1, 2)), ('3 v 8', (3, 8)), (' 4-7 ', (4, 7)),
+                                               ('5 VS. 6', (5, 6)), ([2, 1], (2, 1))])
+def test_parse_pairing(pairing, expected):
+    assert parse_pairing(pairing) == expected
+
+
+def test_unparseable_pairing():
+    with pytest.raises(TemplateError):
+        parse_pairing('1 and 2')
+
+
+def test_eight_player_template_is_a_round_robin():
+    template = build_template(EIGHT_PLAYER)
+    assert (template.positions, template.weeks) == (8, 7)
+    assert template.repeated_pairings() == []
+    assert set(meetings(template)) == set(combinations(range(1, 9), 2))
+
+
+@pytest.mark.parametrize('weeks, problem', [
+    ([["1 vs 2", "3 vs 2"]], "Week 1: missing [4], repeated [2]"),
+    ([["1 vs 2", "3 vs 4"], ["1 vs 5", "2 vs 3"]], "Week 2: missing [4], out of range [5]"),
+    ([["1 vs 2", "3 vs 4"], ["1 vs 2"]], "Weeks have different numbers of pairings: [1, 2]"),
+    ([], "Template has no weeks"),
+])
+def test_invalid_templates(weeks, problem):
+    with pytest.raises(TemplateError) as error:
+        build_template(weeks)
+    assert error.value.problems == [problem]
+
+
+def test_repeated_pairings_are_reported():
+    template = build_template([["1 vs 2", "3 vs 4"], ["2 vs 1", "4 vs 3"], ["1 vs 3", "2 vs 4"]])
+    assert template.repeated_pairings() == [(1, 2), (3, 4)]
+
+
+def test_circle_template():
+    template = circle_template(6)
+    assert (template.positions, template.weeks) == (6, 5)
+    assert set(meetings(template)) == set(combinations(range(1, 7), 2))
+    assert circle_template(6, weeks=2).weeks == 2
+    with pytest.raises(TemplateError):
+        circle_template(5)
+
+
+def test_odd_flights_get_a_bye():
+    weeks = [SessionWeek(f'w{i}', i) for i in range(1, 6)]
+    five = flight('A', 5)
+    matchups = expand(templates_for([five]), [five], weeks)
+    assert Counter(week for week, _, _ in matchups) == {w.id: 2 for w in weeks}
+    # Everyone sits out exactly once and meets everyone else once
+    played = Counter(p for _, a, b in matchups for p in (a, b))
+    assert played == {p: 4 for p in five.player_ids}
+    assert set(frozenset((a, b)) for _, a, b in matchups) == set(map(frozenset, combinations(five.player_ids, 2)))
+
+
+def test_expand_maps_positions_and_cycles_the_template():
+    template = build_template(EIGHT_PLAYER)
+    flights = [flight('A', 8), flight('B', 7), flight('C', 4)]
+    templates = templates_for(flights, template)
+    assert templates[8] is template and templates[7] is template and templates[4].positions == 4
+
+    weeks = [SessionWeek(f'w{i}', i) for i in range(1, 10)]
+    matchups = expand(templates, flights, weeks)
+    assert ('w1', 'A-1', 'A-2') in matchups and ('w1', 'A-3', 'A-8') in matchups
+    # Week 8 repeats week 1; the 7-player flight loses the pairing with position 8
+    assert [(a, b) for w, a, b in matchups if w == 'w8' and a.startswith('B')] == \
+        [('B-1', 'B-2'), ('B-4', 'B-7'), ('B-5', 'B-6')]
+    assert len(matchups) == 9 * (4 + 3 + 2)
+
+
+def test_sizes_without_a_template():
+    with pytest.raises(TemplateError):
+        expand({8: build_template(EIGHT_PLAYER)}, [flight('A', 6)], [SessionWeek('w1', 1)])
+
+
+@pytest.fixture
+def league_conn():
+    conn = connect_fixture()
+    league = generate_league(conn, players=15, flights=2, weeks=6, session_length=3, scored_weeks=3, seed=7)
+    return conn, league
+
+
+def test_load_and_write_a_session(league_conn):
+    conn, league = league_conn
+    season_id, flights, weeks = load_session(conn, 4)
+    assert season_id == league.season_id
+    assert [w.number for w in weeks] == [4, 5, 6]
+    assert sorted(len(f.player_ids) for f in flights) == [7, 8]
+    with conn.cursor() as cur:
+        cur.execute('SELECT "PlayerId", "HandicapAtAssignment" FROM "PlayerFlightAssignments" '
+                    'WHERE "SessionStartWeekNumber" = 4')
+        handicap = dict(cur.fetchall())
+    for f in flights:
+        assert [handicap[p] for p in f.player_ids] == sorted(handicap[p] for p in f.player_ids)
+
+    assert existing_matchups(conn, season_id, weeks) == (len(league.matchup_ids) - 3 * (4 + 3), 0)
+    matchups = expand(templates_for(flights, build_template(EIGHT_PLAYER)), flights, weeks)
+    deleted, written = write_matchups(conn, season_id, weeks, matchups, replace=True)
+    conn.commit()
+    assert (deleted, written) == (3 * (4 + 3), 3 * (4 + 3))
+    assert existing_matchups(conn, season_id, weeks) == (21, 0)
+
+    _, _, played = load_session(conn, 1)
+    assert existing_matchups(conn, season_id, played)[1] > 0
+
+
+def test_positions_file_overrides_the_order(league_conn):
+    conn, _ = league_conn
+    _, flights, _ = load_session(conn, 4)
+    first = flights[0]
+    reversed_names = list(reversed(first.names))
+    _, reordered, _ = load_session(conn, 4, positions={first.name: reversed_names})
+    assert reordered[0].names == reversed_names
+    assert reordered[0].player_ids == list(reversed(first.player_ids))
+
+    with pytest.raises(ValueError):
+        load_session(conn, 4, positions={first.name: reversed_names[:-1] + ['Nobody Here']})
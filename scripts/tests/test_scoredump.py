@@ -0,0 +1,124 @@
+"""glm.scoredump: streaming the API dump, interning players and round-tripping the normalized form"""
+
+import io
+import json
+import os
+
+import numpy as np
+import pytest
+
+from glm.scoredump import (FORMAT, NULL, ScoreDump, ScoreDumpError, _read_values, export, iter_entries, load,
+                           main)
+
+REPO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DUMP = os.path.join(REPO, 'data', 'analysis', 'score_entries_data.json')
+
+
+def entry(n, player, week, score=40, points=14):
+    record = {'id': f'e{n}', 'playerId': player['id'], 'weekId': week, 'pointsEarned': points, 'player': player}
+    if score is not None:
+        record['score'] = score
+    return record
+
+
+AL = {'id': 'p1', 'firstName': 'Al', 'lastName': 'Bo'}
+CY = {'id': 'p2', 'firstName': 'Cy', 'lastName': 'Do'}
+ENTRIES = [entry(1, AL, 'w1'), entry(2, CY, 'w1', 45, 8), entry(3, AL, 'w2', None, None), entry(4, CY, 'w2', 39, 0)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 64 * 1024])
+def test_values_stream_across_chunk_edges(chunk_size):
+    text = ' [ {"a": "x]y"} ,12345, "s,t" ,[1,[2]], null, 1.5e3 ]  '
+    assert list(_read_values(io.StringIO(text), chunk_size)) == [{'a': 'x]y'}, 12345, 's,t', [1, [2]], None, 1500.0]
+
+
+@pytest.mark.parametrize('text, message', [
+    ('{"id": 1}', 'expected a JSON array'),
+    ('[{"id": 1} {"id": 2}]', "expected ',' between entries"),
+    ('[{"id": 1},', 'unterminated JSON array'),
+])
+def test_malformed_arrays(text, message):
+    with pytest.raises(ScoreDumpError) as error:
+        list(_read_values(io.StringIO(text), 4))
+    assert str(error.value).startswith(message)
+
+
+def test_players_and_weeks_are_interned():
+    dump = ScoreDump.from_entries(ENTRIES)
+    assert len(dump) == 4 and dump.players == [AL, CY] and dump.week_ids == ['w1', 'w2']
+    assert (dump.player.tolist(), dump.week.tolist()) == ([0, 1, 0, 1], [0, 0, 1, 1])
+    assert (dump.score.tolist(), dump.points.tolist()) == ([40, 45, NULL, 39], [14, 8, NULL, 0])
+    assert dump.player_name(1) == 'Cy Do' and dump.nbytes() == 4 * (4 + 4 + 2 + 2)
+    assert list(dump.records()) == ENTRIES
+
+
+def test_player_copies():
+    changed = dict(AL, currentHandicap=6)
+    dump = ScoreDump.from_entries([{'id': 'e1', 'playerId': 'p1', 'weekId': 'w1', 'score': 40},
+                                   entry(2, AL, 'w2'), entry(3, changed, 'w3')])
+    # A bare playerId is a placeholder until an entry carries the player; later differing copies are counted
+    assert dump.players == [AL] and dump.player_conflicts == 1
+    assert dump.player_name(0) == 'Al Bo'
+    with pytest.raises(ScoreDumpError):
+        ScoreDump.from_entries([{'id': 'e9', 'score': 40}])
+
+
+def test_columns_share_the_array_buffers():
+    dump = ScoreDump.from_entries(ENTRIES)
+    columns = dump.columns()
+    assert columns['score'].dtype == np.int16 and columns['player'].dtype == np.int32
+    assert columns['points'].tolist() == [14, 8, NULL, 0]
+    assert ScoreDump().columns()['week'].size == 0
+
+
+def test_export_and_load_round_trip(tmp_path):
+    source = tmp_path / 'dump.json'
+    source.write_text(json.dumps(ENTRIES))
+    dump = load(str(source), chunk_size=16)
+    path = tmp_path / 'out' / 'normalized.json'
+    assert export(dump, str(path)) == path.stat().st_size
+    assert not (tmp_path / 'out' / 'normalized.json.tmp').exists()
+
+    normalized = json.loads(path.read_text())
+    assert (normalized['format'], normalized['weeks']) == (FORMAT, ['w1', 'w2'])
+    assert normalized['entries']['score'] == [40, 45, None, 39]
+    assert list(load(str(path)).records()) == ENTRIES
+
+
+@pytest.mark.parametrize('change, message', [
+    ({'format': 'other'}, 'not a glm-score-entries file'),
+    ({'version': 2}, 'unsupported glm-score-entries version 2'),
+])
+def test_normalized_header_is_checked(change, message):
+    data = dict(ScoreDump.from_entries(ENTRIES).to_normalized(), **change)
+    with pytest.raises(ScoreDumpError) as error:
+        ScoreDump.from_normalized(data)
+    assert str(error.value) == message
+
+
+def test_ragged_columns():
+    data = ScoreDump.from_entries(ENTRIES).to_normalized()
+    data['entries']['points'].pop()
+    with pytest.raises(ScoreDumpError):
+        ScoreDump.from_normalized(data)
+
+
+def test_the_api_dump():
+    with open(DUMP) as f:
+        expected = json.load(f)
+    assert list(iter_entries(DUMP, chunk_size=1000)) == expected
+    dump = load(DUMP)
+    assert len(dump) == len(expected) and dump.player_conflicts == 0
+    assert len(dump.players) == len({e['playerId'] for e in expected})
+    assert list(dump.records()) == expected
+
+
+def test_main_writes_and_verifies(tmp_path, capsys):
+    out = tmp_path / 'normalized.json'
+    assert main([DUMP, '--out', str(out), '--verify']) == 0
+    assert 'Verified: normalized file reloads to the same entries' in capsys.readouterr().out
+    assert out.stat().st_size < os.path.getsize(DUMP)
+
+    bad = tmp_path / 'bad.json'
+    bad.write_text('"scores"')
+    assert main([str(bad)]) == 1
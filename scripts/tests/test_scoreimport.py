@@ -0,0 +1,135 @@
+"""glm.scoreimport on the SQLite fixture: pairing rows into matchups and replacing hole scores"""
+
+import io
+
+import pytest
+
+from glm.csvformats import SCORE_FORMATS, HoleScoreRecord, read_csv
+from glm.fixtures import SOUTHMOORE_HOLES, connect_fixture, generate_league
+from glm.scoreimport import course_holes, import_scores, normalize_name, player_index
+
+
+@pytest.fixture
+def league_conn():
+    conn = connect_fixture()
+    # Two weeks of unscored matchups: 8 players in two flights, two matches per flight a week
+    league = generate_league(conn, players=8, flights=2, weeks=2, scored_weeks=0, seed=3)
+    with conn.cursor() as cur:
+        cur.execute('''
+            SELECT w."WeekNumber", m."Id", pa."FirstName", pa."LastName", pb."FirstName", pb."LastName"
+            FROM "Matchups" m JOIN "Weeks" w ON w."Id" = m."WeekId"
+            JOIN "Players" pa ON pa."Id" = m."PlayerAId" JOIN "Players" pb ON pb."Id" = m."PlayerBId"
+            ORDER BY w."WeekNumber", m."Id"
+        ''')
+        matchups = cur.fetchall()
+    return conn, league, matchups
+
+
+def card(line, week, first, last, base, first_hole=1):
+    return HoleScoreRecord(line, week, first, last, first_hole, [base + h % 3 for h in range(9)])
+
+
+def matchup(conn, matchup_id):
+    with conn.cursor() as cur:
+        cur.execute('SELECT "PlayerAScore", "PlayerBScore" FROM "Matchups" WHERE "Id" = %s', (matchup_id,))
+        gross = cur.fetchone()
+        cur.execute('SELECT "HoleNumber", "Par", "HoleHandicap", "PlayerAScore", "PlayerBScore" FROM "HoleScores" '
+                    'WHERE "MatchupId" = %s ORDER BY "HoleNumber"', (matchup_id,))
+        return gross, cur.fetchall()
+
+
+def test_normalize_name():
+    assert normalize_name('  Kevin ', 'Kelhart  JR.') == normalize_name('kevin kelhart', 'jr') == 'kevin kelhart jr'
+    assert normalize_name(None, "O'Brien") == 'obrien'
+
+
+def test_import_a_week(league_conn):
+    conn, league, matchups = league_conn
+    week_1 = [m for m in matchups if m[0] == 1]
+    records = []
+    for i, (_, _, a_first, a_last, b_first, b_last) in enumerate(week_1):
+        records += [card(2 * i + 2, 1, a_first, a_last, 4), card(2 * i + 3, 1, b_first.upper(), b_last + '.', 5)]
+
+    result = import_scores(conn, records, league.season_id, batch_size=5)
+    conn.commit()
+    assert (result.rows, result.scorecards, result.matchups, result.problems) == (8, 8, 4, [])
+    assert (result.hole_rows, result.replaced_holes) == (36, 0)
+    assert (result.score_entries, result.replaced_entries) == (8, 0)
+
+    (gross, holes) = matchup(conn, week_1[0][1])
+    assert gross == (45, 54)
+    pars = {number: (par, handicap) for number, par, _, handicap in SOUTHMOORE_HOLES}
+    assert [(h[0], h[1], h[2]) for h in holes] == [(n,) + pars[n] for n in range(1, 10)]
+    assert [h[3] for h in holes] == [4, 5, 6] * 3 and [h[4] for h in holes] == [5, 6, 7] * 3
+
+    # A second file with only player A's corrected card keeps B's holes and total
+    _, matchup_id, a_first, a_last, _, _ = week_1[0]
+    again = import_scores(conn, [card(2, 1, a_first, a_last, 3)], league.season_id)
+    conn.commit()
+    assert (again.replaced_holes, again.replaced_entries, again.score_entries) == (9, 1, 1)
+    gross, holes = matchup(conn, matchup_id)
+    assert gross == (36, 54)
+    assert [h[4] for h in holes] == [5, 6, 7] * 3
+
+
+def test_rows_that_cannot_be_placed(league_conn):
+    conn, league, matchups = league_conn
+    _, _, a_first, a_last, b_first, b_last = matchups[0]
+    with conn, conn.cursor() as cur:
+        cur.execute('INSERT INTO "Players" ("Id", "FirstName", "LastName") VALUES (gen_random_uuid(), %s, %s)',
+                    (b_first, b_last))
+    records = [
+        card(2, 1, 'Nobody', 'Here', 4),
+        card(3, 1, b_first, b_last, 4),
+        card(4, 7, a_first, a_last, 4),
+        card(5, 1, a_first, a_last, 4),
+        card(6, 1, a_first, a_last, 5),
+        HoleScoreRecord(7, 2, a_first, a_last, 1, [None] * 9),
+    ]
+    result = import_scores(conn, records, league.season_id)
+    assert (result.rows, result.scorecards, result.empty) == (6, 1, 1)
+    assert [problem for _, problem in result.problems] == [
+        "Player 'Nobody Here' not found",
+        f"Player '{b_first} {b_last}' matches 2 players",
+        'Week 7 has no matchups in the season',
+        f"Duplicate week 1 row for '{a_first} {a_last}'"]
+
+
+def test_opponents_must_play_the_same_nine(league_conn):
+    conn, league, matchups = league_conn
+    _, _, a_first, a_last, b_first, b_last = matchups[0]
+    result = import_scores(conn, [card(2, 1, a_first, a_last, 4), card(3, 1, b_first, b_last, 4, first_hole=10)],
+                           league.season_id)
+    assert result.scorecards == 1
+    assert result.problems == [(3, f"'{b_first} {b_last}' played holes 10-18 but the opponent played 1-9")]
+
+
+def test_import_from_a_csv_stream(league_conn):
+    conn, league, matchups = league_conn
+    _, matchup_id, a_first, a_last, b_first, b_last = matchups[0]
+    header = 'Week,Front/Back,First Name,Last Name,' + ','.join(f'Hole {n}' for n in range(1, 19)) + ',Hole Total'
+    text = '\n'.join([header,
+                      f'1,Front,{a_first},{a_last},' + ','.join(['4'] * 9) + ',' * 9 + ',36',
+                      # Absent: every hole 0, so nothing is written for this player
+                      f'1,Front,{b_first},{b_last},' + ','.join(['0'] * 9) + ',' * 9 + ',0']) + '\n'
+    with read_csv(io.StringIO(text), SCORE_FORMATS) as records:
+        result = import_scores(conn, records, league.season_id)
+    assert (result.rows, result.empty, result.scorecards, result.score_entries) == (2, 1, 1, 1)
+    gross, holes = matchup(conn, matchup_id)
+    assert gross == (36, None)
+    assert [(h[3], h[4]) for h in holes] == [(4, None)] * 9
+
+
+def test_player_index_groups_duplicate_names():
+    conn = connect_fixture()
+    with conn, conn.cursor() as cur:
+        for player_id in ('p1', 'p2', 'p3'):
+            cur.execute('INSERT INTO "Players" ("Id", "FirstName", "LastName") VALUES (%s, %s, %s)',
+                        (player_id, 'Al', 'Bo' if player_id != 'p3' else 'Cy'))
+    assert player_index(conn) == {'al bo': ['p1', 'p2'], 'al cy': ['p3']}
+
+
+def test_course_holes_must_be_complete():
+    conn = connect_fixture()
+    with pytest.raises(ValueError):
+        course_holes(conn)
@@ -0,0 +1,106 @@
+"""glm.scoring against MatchPlayScoringService.CalculateMatchPlayResult"""
+
+import random
+
+from glm.fixtures import SOUTHMOORE_HOLES
+from glm.scoring import PointsRules, hole_arrays, score_match, score_matches, stroke_counts
+
+HOLE_HANDICAPS = {hole: handicap for hole, _, _, handicap in SOUTHMOORE_HOLES}
+FRONT_HANDICAPS = [HOLE_HANDICAPS[h] for h in range(1, 10)]     # 3 5 17 7 13 1 15 9 11
+BACK_HANDICAPS = [HOLE_HANDICAPS[h] for h in range(10, 19)]     # 4 14 18 16 6 2 12 10 8
+
+
+def test_stroke_counts_round_like_math_round():
+    strokes, a_receives = stroke_counts([10.5, 11.5, 10.3, 6.8, 4.0, 25.0], [8.0, 8.0, 6.8, 10.3, 4.0, 3.0])
+    # Banker's rounding: 2.5 -> 2, 3.5 -> 4 (also through float noise); more than nine strokes is nine
+    assert strokes.tolist() == [2, 4, 4, 4, 0, 9]
+    assert a_receives.tolist() == [True, True, True, False, False, True]
+
+
+def test_known_scorecard():
+    # A (12) gets three strokes from B (9) on holes 6, 1 and 2
+    a = [5, 5, 4, 6, 4, 6, 5, 5, 5]
+    b = [4, 5, 3, 5, 4, 5, 5, 4, 5]
+    result = score_match(a, b, 12, 9, FRONT_HANDICAPS)
+    assert result['PlayerAMatchPoints'] == [1, 2, 0, 0, 1, 1, 1, 0, 1]
+    assert result['PlayerBMatchPoints'] == [1, 0, 2, 2, 1, 1, 1, 2, 1]
+    assert (result['PlayerAHolePoints'], result['PlayerBHolePoints']) == (7, 11)
+    # Net 42 against 40: B takes the match bonus
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (7, 13)
+    assert (result['PlayerAMatchWin'], result['PlayerBMatchWin']) == (False, True)
+
+
+def test_halved_match_gives_both_the_tie_points():
+    scores = [4, 4, 3, 5, 3, 5, 4, 4, 4]
+    result = score_match(scores, scores, 6, 6, FRONT_HANDICAPS)
+    assert result['PlayerAMatchPoints'] == [1] * 9
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (10, 10)
+    assert not result['PlayerAMatchWin'] and not result['PlayerBMatchWin']
+
+
+def test_strokes_halve_holes_the_receiver_lost_on_gross():
+    # B (14) gets five strokes on holes 6, 1, 2, 4 and 8 and nets 38 to A's 37
+    a = [4, 4, 3, 5, 4, 5, 4, 4, 4]
+    b = [5, 5, 3, 6, 5, 6, 4, 5, 4]
+    result = score_match(a, b, 9, 14, FRONT_HANDICAPS)
+    assert result['PlayerAMatchPoints'] == [1, 1, 1, 1, 2, 1, 1, 1, 1]
+    assert result['PlayerBMatchPoints'] == [1, 1, 1, 1, 0, 1, 1, 1, 1]
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (12, 8)
+    assert result['PlayerAMatchWin']
+
+
+def test_holes_missing_a_score_are_skipped():
+    a = [5, None, 4, 6, 4, 6, 5, 5, 5]
+    b = [4, 5, 3, 5, 4, 5, 5, 4, None]
+    result = score_match(a, b, 12, 9, FRONT_HANDICAPS)
+    assert result['PlayerAMatchPoints'] == [1, 0, 0, 0, 1, 1, 1, 0, 0]
+    assert result['PlayerBMatchPoints'] == [1, 0, 2, 2, 1, 1, 1, 2, 0]
+    # Net 33 against 30 over the seven completed holes; hole 2's stroke is lost
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (4, 12)
+
+
+def test_no_completed_holes_means_no_points():
+    result = score_match([4] * 9, [None] * 9, 10, 2, FRONT_HANDICAPS)
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (0, 0)
+    assert not result['PlayerAMatchWin'] and not result['PlayerBMatchWin']
+
+
+def test_league_settings_point_values():
+    rules = PointsRules.from_settings({'HoleWinPoints': 1, 'HoleHalvePoints': 0, 'MatchWinBonus': 3,
+                                       'MatchTiePoints': 2})
+    a = [5, 5, 4, 6, 4, 6, 5, 5, 5]
+    b = [4, 5, 3, 5, 4, 5, 5, 4, 5]
+    result = score_match(a, b, 12, 9, FRONT_HANDICAPS, rules)
+    assert (result['PlayerAHolePoints'], result['PlayerBHolePoints']) == (1, 3)
+    assert (result['PlayerAPoints'], result['PlayerBPoints']) == (1, 6)
+
+
+def test_vectorized_scoring_matches_single_matches():
+    rng = random.Random(11)
+    matches = []
+    for _ in range(200):
+        def card():
+            return [None if rng.random() < 0.05 else rng.randint(3, 8) for _ in range(9)]
+        matches.append((card(), card(), rng.randint(0, 40) / 2, rng.randint(0, 40) / 2,
+                        FRONT_HANDICAPS if rng.random() < 0.5 else BACK_HANDICAPS))
+
+    def row(card):
+        return [-1 if s is None else s for s in card]
+
+    results = score_matches([row(a) for a, _, _, _, _ in matches], [row(b) for _, b, _, _, _ in matches],
+                            [h for _, _, h, _, _ in matches], [h for _, _, _, h, _ in matches],
+                            [nine for _, _, _, _, nine in matches])
+    for i, (a, b, handicap_a, handicap_b, nine) in enumerate(matches):
+        single = score_match(a, b, handicap_a, handicap_b, nine)
+        assert results.a_hole_points[i].tolist() == single['PlayerAMatchPoints']
+        assert results.b_hole_points[i].tolist() == single['PlayerBMatchPoints']
+        assert (int(results.a_points[i]), int(results.b_points[i])) == \
+            (single['PlayerAPoints'], single['PlayerBPoints'])
+
+
+def test_hole_arrays_pivot_back_nine_rows_into_slots():
+    a, b, handicaps = hole_arrays([0, 0, 1], [10, 18, 1], [4, 8, 3], [5, 6, 4], [4, 7, 5], matches=2)
+    assert a[0].tolist() == [5, -1, -1, -1, -1, -1, -1, -1, 6]
+    assert b[1].tolist() == [5] + [-1] * 8
+    assert handicaps[0, 0] == 4 and handicaps[0, 1] == 99
+    assert a.shape == (2, 9)
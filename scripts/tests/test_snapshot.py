@@ -0,0 +1,104 @@
+"""glm.snapshot: export the SQLite fixture, read it back column by column"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from glm.fixtures import LAST_NAMES, connect_fixture, generate_league, table_counts
+from glm.snapshot import NULL, TABLES, export_snapshot, open_snapshot
+
+
+@pytest.fixture
+def exported(tmp_path):
+    conn = connect_fixture()
+    league = generate_league(conn, players=8, flights=2, weeks=4, session_length=2, scored_weeks=3,
+                             absence_rate=0.2, seed=5)
+    manifest = export_snapshot(conn, str(tmp_path), tenant='golfdb_fixture')
+    return conn, league, manifest, open_snapshot(str(tmp_path))
+
+
+def test_manifest_and_row_counts(exported):
+    conn, _, manifest, snap = exported
+    counts = table_counts(conn)
+    assert snap.tenant == 'golfdb_fixture'
+    assert snap.tables == [table for table, _ in TABLES]
+    assert {table: len(snap[table]) for table in snap.tables} == {table: counts[table] for table in snap.tables}
+    assert manifest['tables']['Matchups']['columns']['PlayerAId'] == \
+        {'kind': 'ref', 'dtype': 'int32', 'references': 'Players'}
+
+
+def test_foreign_keys_are_row_numbers(exported):
+    conn, _, _, snap = exported
+    matchups, players, weeks = snap['Matchups'], snap['Players'], snap['Weeks']
+    with conn.cursor() as cur:
+        cur.execute('SELECT m."Id", m."PlayerAId", w."WeekNumber" FROM "Matchups" m '
+                    'JOIN "Weeks" w ON w."Id" = m."WeekId"')
+        expected = {m: (p, week) for m, p, week in cur.fetchall()}
+    for row, matchup_id in enumerate(matchups.ids):
+        player_row = matchups['PlayerAId'][row]
+        week_row = matchups['WeekId'][row]
+        assert (players.ids[player_row], int(weeks['WeekNumber'][week_row])) == expected[matchup_id]
+        assert matchups.index_of(matchup_id) == row
+    assert matchups.index_of('not-a-matchup') == NULL
+
+
+def test_column_kinds(exported):
+    conn, league, _, snap = exported
+    players, matchups, weeks = snap['Players'], snap['Matchups'], snap['Weeks']
+    assert players.text('LastName')[players.index_of(league.player_ids[0])] == LAST_NAMES[0]
+    assert len(players.dictionary('LastName')) == 8
+
+    # Unscored and absent sides have no gross score: -1, not 0
+    scores = np.asarray(matchups['PlayerAScore'])
+    absent = np.asarray(matchups['PlayerAAbsent'])
+    assert scores.dtype == np.int16 and absent.dtype == np.bool_
+    with conn.cursor() as cur:
+        cur.execute('SELECT COUNT(*) FROM "Matchups" WHERE "PlayerAScore" IS NULL')
+        assert int((scores == NULL).sum()) == cur.fetchone()[0] > 0
+    assert np.all(scores[absent] == NULL)
+
+    assert weeks['Date'].dtype == np.dtype('datetime64[s]')
+    first = weeks.index_of(league.week_ids[1])
+    assert str(weeks['Date'][first]) == '2025-04-02T00:00:00'
+    assert int(weeks['SpecialPointsAwarded'][first]) == NULL
+    assert np.isnan(snap['Courses']['CourseRating']).sum() == 0
+
+
+def test_columns_are_memory_mapped_read_only(exported):
+    _, _, _, snap = exported
+    column = snap['HoleScores']['PlayerAScore']
+    assert isinstance(column, np.memmap)
+    with pytest.raises(ValueError):
+        column[0] = 1
+    with pytest.raises(KeyError):
+        snap['HoleScores']['Putts']
+
+
+def test_dangling_references_are_null(tmp_path):
+    conn = connect_fixture()
+    with conn, conn.cursor() as cur:
+        cur.execute('INSERT INTO "Players" ("Id", "FirstName") VALUES (%s, %s)', ('p1', 'Al'))
+        cur.execute('INSERT INTO "PlayerSeasonRecords" ("Id", "PlayerId", "SeasonId") VALUES (%s, %s, %s)',
+                    ('r1', 'p1', 'deleted-season'))
+    export_snapshot(conn, str(tmp_path), tables=['Seasons', 'Players', 'PlayerSeasonRecords'])
+    records = open_snapshot(str(tmp_path))['PlayerSeasonRecords']
+    assert (int(records['PlayerId'][0]), int(records['SeasonId'][0])) == (0, NULL)
+
+
+def test_partial_exports_need_their_referenced_tables(tmp_path):
+    conn = connect_fixture()
+    with pytest.raises(ValueError):
+        export_snapshot(conn, str(tmp_path), tables=['Matchups'])
+    assert list(export_snapshot(conn, str(tmp_path), tables=['Players'])['tables']) == ['Players']
+
+
+def test_unknown_format_version(exported, tmp_path):
+    path = os.path.join(str(tmp_path), 'manifest.json')
+    with open(path) as f:
+        manifest = json.load(f)
+    with open(path, 'w') as f:
+        json.dump(dict(manifest, format=99), f)
+    with pytest.raises(ValueError):
+        open_snapshot(str(tmp_path))
@@ -0,0 +1,116 @@
+"""glm.standings against StandingsController.GetSessionStandings"""
+
+import copy
+
+import pytest
+
+from glm.standings import (MatchupRow, SeasonData, StandingsEngine, WeekInfo, diff_session, display_name,
+                           matchup_points)
+
+PLAYERS = {'a': ('Al', 'Adams'), 'b': ('Bo', 'Baker'), 'c': ('Cy', 'Clark'), 'd': ('Di', 'Davis'),
+           'e': ('Ed', 'Evans')}
+
+
+def season() -> SeasonData:
+    """Two sessions of one flight: week 2 is a 7-point special week, week 3 starts session two"""
+    weeks = [WeekInfo('w1', 1, session_start=True), WeekInfo('w2', 2, special_points=7),
+             WeekInfo('w3', 3, session_start=True)]
+    assignments = [(p, 'f1', 1) for p in 'abcd'] + [(p, 'f1', 3) for p in 'abcde']
+    matchups = {
+        'w1': [MatchupRow('a', 'b', 40, 44, 13, 7),
+               MatchupRow('c', 'd', None, 41, None, 12, a_absent=True, a_notice=True)],
+        'w2': [MatchupRow('a', 'c', None, 45, None, 9, a_absent=True),
+               MatchupRow('b', 'd', 43, 42, 15, 5)],
+        'w3': [MatchupRow('a', 'd', 41, 42, 10, 10),
+               MatchupRow('b', 'c', None, 39, None, 16, a_absent=True)],
+    }
+    return SeasonData('s1', weeks, dict(PLAYERS), {'f1': 'Flight 1'}, assignments, matchups)
+
+
+def totals(standings):
+    return [(p.id, p.session_total) for p in standings.flights[0].players]
+
+
+@pytest.mark.parametrize('row, side, special, expected', [
+    (MatchupRow('a', 'b', 40, 44, 13, 7), 0, None, 13),
+    (MatchupRow('a', 'b', None, 44, None, 7, a_absent=True, a_notice=True), 0, None, 4),
+    (MatchupRow('a', 'b', None, 44, 11, 7, a_absent=True), 0, None, 0),
+    (MatchupRow('a', 'b', 40, 44, 13, 7), 1, 7, 7),
+    (MatchupRow('a', 'b', 40, None, 13, None, b_absent=True, b_notice=True), 1, 7, 3),
+    (MatchupRow('a', 'b', 40, None, 13, None, b_absent=True), 1, 8, 4),
+    (MatchupRow('a', 'b'), 0, None, 0),
+])
+def test_matchup_points(row, side, special, expected):
+    assert matchup_points(row, side, special) == expected
+
+
+def test_display_name():
+    assert display_name('Bill', 'Stein') == 'Bill S.'
+    assert display_name('Dave', 'Hall JR') == 'Dave H. JR'
+
+
+def test_absence_and_special_week_points_in_the_session():
+    engine = StandingsEngine(season())
+    week2 = engine.session_standings('w2')
+    # a: 13 + 7 // 2, b: 7 + 7, c: 4 (notice) + 7, d: 12 + 7
+    assert totals(week2) == [('d', 19), ('a', 16), ('b', 14), ('c', 11)]
+    assert [p.this_week_points for p in week2.flights[0].players] == [7, 3, 7, 7]
+    assert (week2.session_number, week2.session_start_week) == (1, 1)
+
+
+def test_new_session_resets_totals_and_orders_ties_by_last_name():
+    standings = StandingsEngine(season()).session_standings('w3')
+    assert (standings.session_number, standings.session_start_week) == (2, 3)
+    assert totals(standings) == [('c', 16), ('a', 10), ('d', 10), ('b', 0), ('e', 0)]
+    players = {p.id: p for p in standings.flights[0].players}
+    assert players['b'].is_absent and not players['b'].is_bye
+    assert players['e'].is_bye and players['e'].gross_score == 0
+    assert players['a'].gross_score == 41
+    assert {p: s.season_total for p, s in players.items()} == {'a': 26, 'b': 14, 'c': 27, 'd': 29, 'e': 0}
+
+
+def test_changing_one_week_only_recomputes_that_week():
+    engine = StandingsEngine(season())
+    for week in ('w1', 'w2', 'w3'):
+        engine.session_standings(week)
+    computed = engine.recomputed_weeks
+
+    changed = [MatchupRow('a', 'b', 44, 40, 6, 14), MatchupRow('c', 'd', 40, 41, 11, 9)]
+    engine.set_week_matchups('w1', changed)
+    assert engine.recomputed_weeks == computed + 1
+
+    expected = season()
+    expected.matchups['w1'] = copy.deepcopy(changed)
+    fresh = StandingsEngine(expected)
+    for week in ('w1', 'w2', 'w3'):
+        assert engine.session_standings(week) == fresh.session_standings(week)
+
+
+def test_dropping_a_special_week_uses_match_points():
+    engine = StandingsEngine(season())
+    engine.session_standings('w3')
+    engine.set_week(WeekInfo('w2', 2), season().matchups['w2'])
+
+    expected = season()
+    expected.weeks[1] = WeekInfo('w2', 2)
+    week2 = engine.session_standings('w2')
+    assert week2 == StandingsEngine(expected).session_standings('w2')
+    # a was absent without notice; everyone else keeps their match points
+    assert totals(week2) == [('b', 22), ('d', 17), ('a', 13), ('c', 13)]
+
+
+def test_diff_session_reports_field_and_order_differences():
+    standings = StandingsEngine(season()).session_standings('w3')
+    api = {'session': {'startWeekNumber': 3}, 'flights': [{'id': 'f1', 'name': 'Flight 1', 'players': [
+        {'id': p.id, 'name': p.name, 'sessionTotal': p.session_total, 'thisWeekPoints': p.this_week_points,
+         'grossScore': p.gross_score, 'isAbsent': p.is_absent, 'isBye': p.is_bye}
+        for p in standings.flights[0].players]}]}
+    assert diff_session(standings, api) == []
+
+    players = api['flights'][0]['players']
+    players[0]['sessionTotal'] = 15
+    players[1], players[2] = players[2], players[1]
+    players.append({'id': 'x', 'name': 'Stray P.'})
+    issues = {(i.player_id, i.field): (i.expected, i.actual) for i in diff_session(standings, api)}
+    assert issues == {('c', 'sessionTotal'): (16, 15), ('a', 'position'): (1, 2), ('d', 'position'): (2, 1),
+                      ('x', 'player'): ('absent', 'unexpected')}
@@ -0,0 +1,55 @@
+"""glm.strokes: the per-course, per-nine stroke-allocation tables"""
+
+import pytest
+
+from glm.fixtures import SOUTHMOORE_HOLES
+from glm.strokes import BACK, FRONT, CourseStrokeTables, allocate, stroke_table
+
+HOLE_HANDICAPS = {hole: handicap for hole, _, _, handicap in SOUTHMOORE_HOLES}
+FRONT_HANDICAPS = [HOLE_HANDICAPS[h] for h in range(1, 10)]     # 3 5 17 7 13 1 15 9 11
+BACK_HANDICAPS = [HOLE_HANDICAPS[h] for h in range(10, 19)]     # 4 14 18 16 6 2 12 10 8
+
+
+def test_strokes_go_to_the_hardest_holes_of_the_nine():
+    table = stroke_table(FRONT_HANDICAPS)
+    assert table.shape == (37, 9)
+    assert table[0].tolist() == [0] * 9
+    # Holes 6, 1 and 2 are the three hardest on the front
+    assert table[3].tolist() == [1, 1, 0, 0, 0, 1, 0, 0, 0]
+    assert table[8].tolist() == [1, 1, 0, 1, 1, 1, 1, 1, 1]
+
+
+def test_strokes_are_capped_at_one_per_hole():
+    table = stroke_table(FRONT_HANDICAPS)
+    assert table[9].tolist() == [1] * 9
+    assert table[36].tolist() == [1] * 9
+
+
+def test_back_nine_uses_its_own_ranking():
+    tables = CourseStrokeTables(HOLE_HANDICAPS)
+    # Holes 15 and 10 are the two hardest on the back
+    assert tables.allocate([2], [BACK]).tolist() == [[1, 0, 0, 0, 0, 1, 0, 0, 0]]
+    assert tables.allocate([2], [FRONT]).tolist() == [[1, 0, 0, 0, 0, 1, 0, 0, 0]]
+    assert tables.table(BACK).tolist() == stroke_table(BACK_HANDICAPS).tolist()
+
+
+def test_course_tables_need_all_eighteen_holes():
+    with pytest.raises(ValueError, match='missing CourseHoles'):
+        CourseStrokeTables({h: HOLE_HANDICAPS[h] for h in range(1, 10)})
+
+
+def test_allocate_per_match_nines():
+    strokes = [0, 2, 12, 2]
+    nines = [FRONT_HANDICAPS, FRONT_HANDICAPS, BACK_HANDICAPS, BACK_HANDICAPS]
+    rows = allocate(strokes, nines).tolist()
+    assert rows[0] == [0] * 9
+    assert rows[1] == [1, 0, 0, 0, 0, 1, 0, 0, 0]
+    assert rows[2] == [1] * 9
+    assert rows[3] == [1, 0, 0, 0, 0, 1, 0, 0, 0]
+    # Negative differences clip to no strokes
+    assert allocate([-3], FRONT_HANDICAPS).tolist() == [[0] * 9]
+
+
+def test_tables_are_read_only():
+    with pytest.raises(ValueError):
+        stroke_table(FRONT_HANDICAPS)[0, 0] = 1
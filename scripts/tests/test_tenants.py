@@ -0,0 +1,72 @@
+"""glm.tenants: fanning a query or callable out over per-tenant fixture databases"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from glm.fixtures import generate_league, tenant_connector
+from glm.tenants import CHECKS, fan_out, run_on_tenants, run_query
+
+TENANTS = ['eastside', 'southmoore', 'westwood']
+
+
+@pytest.fixture
+def connect(tmp_path):
+    connect = tenant_connector(str(tmp_path))
+    for players, tenant in zip((4, 8, 12), TENANTS):
+        conn = connect(tenant=tenant)
+        generate_league(conn, players=players, flights=1, weeks=2, session_length=2, scored_weeks=1,
+                        seed=players)
+        conn.close()
+    return connect
+
+
+def test_health_check_on_every_tenant(connect):
+    report = run_on_tenants(CHECKS['health'], tenants=TENANTS, connect=connect, concurrency=2)
+    assert [(r.tenant, r.database, r.ok) for r in report.results] == \
+        [(t, f'golfdb_{t}', True) for t in TENANTS]
+    assert [r.result[0]['players'] for r in report.results] == [4, 8, 12]
+    summary = report.to_dict()
+    assert (summary['tenants'], summary['failed']) == (3, 0)
+
+
+def test_one_failing_tenant_is_rolled_back(connect):
+    def rename_then_fail(conn, tenant):
+        updated = run_query(conn, 'UPDATE "Players" SET "FirstName" = %s', ('Renamed',))
+        if tenant == 'southmoore':
+            raise RuntimeError('bad data')
+        return updated
+
+    report = run_on_tenants(rename_then_fail, tenants=TENANTS, connect=connect)
+    assert [r.result for r in report.results] == [4, None, 12]
+    [failed] = report.failed
+    assert (failed.tenant, failed.error) == ('southmoore', 'RuntimeError: bad data')
+
+    names = run_on_tenants('SELECT DISTINCT "FirstName" AS name FROM "Players"', tenants=TENANTS,
+                           connect=connect)
+    assert [len(r.result) == 1 and r.result[0]['name'] == 'Renamed' for r in names.results] == [True, False, True]
+
+
+def test_concurrency_is_bounded(connect):
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def slow(conn, tenant):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    run_on_tenants(slow, tenants=TENANTS * 2, connect=connect, concurrency=2)
+    assert peak[0] == 2
+
+
+def test_connection_failures_are_reported():
+    def connect(tenant=None, **_):
+        raise ConnectionError(f'database "golfdb_{tenant}" does not exist')
+
+    report = asyncio.run(fan_out('SELECT 1', tenants=['nowhere'], connect=connect))
+    assert not report.results[0].ok and report.results[0].error.startswith('ConnectionError')
@@ -4,11 +4,16 @@ Script to update player emails from a provided email list.
 Matches players by name and updates their emails via the API.
 """
 
+import os
+import sys
 import json
 import re
 import requests
 from typing import Dict, List, Optional
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from glm.profiling import run
+
 # API configuration
 API_BASE_URL = "http://localhost:5274"
 PLAYERS_ENDPOINT = f"{API_BASE_URL}/api/players"
@@ -223,4 +228,4 @@ def main():
     print(f"\n🎉 Update complete! Successfully updated {success_count}/{len(matches)} players.")
 
 if __name__ == "__main__":
-    main()
+    sys.exit(run(lambda args: main()))
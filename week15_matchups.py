@@ -3,6 +3,13 @@
 Generate matchups for Week 15 and subsequent weeks based on the schedule
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from glm.league import League
+from glm.profiling import run
+
 # Player data from the file - organized by flight with positions 1-8 in each flight
 flights = {
     "Flight 1": {
@@ -61,41 +68,37 @@ schedule = [
     {"week": 21, "date": "9/17", "matchups": ["1 vs 7", "2 vs 6", "3 vs 5", "4 vs 8"]}
 ]
 
-def create_flight_matchups(flight_name, week_data):
-    """Create matchups for a specific flight based on the schedule"""
+def create_flight_matchups(league, flight, week):
+    """Matchups of one flight in one week of the league, as position/name dicts"""
     matchups = []
-    flight_players = flights[flight_name]
     
-    for matchup_str in week_data["matchups"]:
-        # Parse "1 vs 2" format
-        parts = matchup_str.split(" vs ")
-        player1_pos = int(parts[0])
-        player2_pos = int(parts[1])
-        
-        player1_name = flight_players.get(player1_pos, f"Player {player1_pos}")
-        player2_name = flight_players.get(player2_pos, f"Player {player2_pos}")
+    for row in league.matchups_in_week(week.index, flight.index):
+        player1, player2 = league.matchups.a[row], league.matchups.b[row]
+        player1_pos = league.position_of(player1, flight.index)
+        player2_pos = league.position_of(player2, flight.index)
         
         matchups.append({
-            "player1": {"position": player1_pos, "name": player1_name},
-            "player2": {"position": player2_pos, "name": player2_name}
+            "player1": {"position": player1_pos, "name": league.players[player1].name},
+            "player2": {"position": player2_pos, "name": league.players[player2].name}
         })
     
     return matchups
 
 def generate_all_matchups():
     """Generate matchups for all weeks and all flights"""
+    league = League.from_template(flights, schedule)
     all_matchups = []
     
-    for week_data in schedule:
+    for week in league.weeks:
         week_matchups = {
-            "week": week_data["week"],
-            "date": week_data["date"],
+            "week": week.number,
+            "date": week.date,
             "flights": {}
         }
         
         # Generate matchups for each flight using positions 1-8
-        for flight_name in flights.keys():
-            week_matchups["flights"][flight_name] = create_flight_matchups(flight_name, week_data)
+        for flight in league.flights:
+            week_matchups["flights"][flight.name] = create_flight_matchups(league, flight, week)
         
         all_matchups.append(week_matchups)
     
@@ -116,7 +119,7 @@ def print_matchups(matchups):
                 p2 = matchup["player2"]
                 print(f"  Matchup {i}: {p1['name']} (pos {p1['position']}) vs {p2['name']} (pos {p2['position']})")
 
-if __name__ == "__main__":
+def main():
     print("GOLF LEAGUE MATCHUPS - SESSION 3")
     print("Starting from Week 15")
     
@@ -125,3 +128,7 @@ if __name__ == "__main__":
     
     print(f"\n\nTotal weeks: {len(matchups)}")
     print("Total matchups per week: 16 (4 per flight x 4 flights)")
+
+
+if __name__ == "__main__":
+    sys.exit(run(lambda args: main()))